@@ -11,7 +11,6 @@ This is mainly useful to compare cdefer.Deferred to defer.Deferred
 from timer import timeit
 
 from twisted.internet import defer
-from twisted.python.compat import range
 
 benchmarkFuncs = []
 
@@ -177,6 +176,99 @@ def pauseUnpause(n):
 pauseUnpause = benchmarkNFunc(20, ns)(pauseUnpause)
 
 
+def _identity(result):
+    return result
+
+
+def singleCallback():
+    """
+    Create a deferred, add one callback to it and give it a result: the
+    life of most deferreds.
+    """
+    d = defer.Deferred()
+    d.addCallback(_identity)
+    d.callback(1)
+
+
+singleCallback = benchmarkFunc(100000)(singleCallback)
+
+
+def chainDeferreds(n):
+    """
+    Chain the given number of deferreds, each waiting on the next through a
+    callback which returns it, and then give the last one a result.
+    """
+    first = last = defer.Deferred()
+    for i in range(n):
+        following = defer.Deferred()
+        last.addCallback(lambda ignored, following=following: following)
+        last = following
+    first.callback(None)
+    last.callback(1)
+
+
+chainDeferreds = benchmarkNFunc(20, ns)(chainDeferreds)
+
+
+def inlineCallbacksRoundTrip(n):
+    """
+    Run an L{defer.inlineCallbacks} generator which waits on the given number
+    of deferreds in turn, each given a result after it is yielded.
+    """
+    waiting = []
+
+    @defer.inlineCallbacks
+    def consume():
+        for i in range(n):
+            d = defer.Deferred()
+            waiting.append(d)
+            yield d
+
+    done = consume()
+    while waiting:
+        waiting.pop().callback(None)
+    done.addErrback(lambda failure: None)
+
+
+inlineCallbacksRoundTrip = benchmarkNFunc(20, ns)(inlineCallbacksRoundTrip)
+
+
+def awaitFiredDeferreds(n):
+    """
+    Run a coroutine which awaits the given number of deferreds which already
+    have results.
+    """
+
+    async def consume():
+        for i in range(n):
+            await defer.succeed(i)
+
+    defer.Deferred.fromCoroutine(consume())
+
+
+awaitFiredDeferreds = benchmarkNFunc(20, ns)(awaitFiredDeferreds)
+
+
+def awaitChain(n):
+    """
+    Run a chain of the given depth of coroutines, each awaiting the next
+    through L{defer.Deferred.fromCoroutine}, where the last awaits a deferred
+    which is given a result afterwards.
+    """
+    bottom = defer.Deferred()
+
+    async def level(depth):
+        if depth:
+            return await defer.Deferred.fromCoroutine(level(depth - 1))
+        return await bottom
+
+    defer.Deferred.fromCoroutine(level(n))
+    bottom.callback(None)
+
+
+awaitChain = benchmarkNFunc(20, [10, 100])(awaitChain)
+
+
 def benchmark():
     """
     Run all of the benchmarks registered in the benchmarkFuncs list
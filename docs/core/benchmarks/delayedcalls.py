@@ -0,0 +1,115 @@
+# Copyright (c) Twisted Matrix Laboratories.
+# See LICENSE for details.
+
+"""
+Compare the throughput of scheduling, cancelling, and running timed calls with
+the reactor's default heap and with its timer wheel.
+"""
+
+import random
+from time import perf_counter
+
+from twisted.internet.base import ReactorBase
+
+
+class BenchmarkReactor(ReactorBase):
+    """
+    A reactor which does no I/O and whose clock only moves when told to.
+    """
+
+    now = 0.0
+
+    def installWaker(self):
+        pass
+
+    def seconds(self):
+        return self.now
+
+
+def buildReactor(useWheel):
+    reactor = BenchmarkReactor()
+    if useWheel:
+        reactor.useTimerWheel()
+    return reactor
+
+
+def schedule(reactor, n):
+    """
+    Schedule C{n} calls with timeouts like those of idle connections.
+    """
+    delays = [random.uniform(30, 90) for _ in range(n)]
+    start = perf_counter()
+    calls = [reactor.callLater(delay, lambda: None) for delay in delays]
+    # The heap only inserts new calls when the reactor next looks at it.
+    reactor.timeout()
+    return perf_counter() - start, calls
+
+
+def cancel(reactor, calls):
+    """
+    Cancel every call, then let the reactor catch up.
+    """
+    start = perf_counter()
+    for call in calls:
+        call.cancel()
+    reactor.runUntilCurrent()
+    return perf_counter() - start
+
+
+def reset(reactor, calls):
+    """
+    Reset every call to a little earlier than it was scheduled, as when an
+    idle timeout is shortened.
+    """
+    start = perf_counter()
+    for call in calls:
+        call.reset(random.uniform(1, 30))
+    reactor.timeout()
+    return perf_counter() - start
+
+
+def fire(reactor, calls):
+    """
+    Run every call, advancing the clock a second at a time.
+    """
+    start = perf_counter()
+    for _ in range(91):
+        reactor.now += 1.0
+        reactor.runUntilCurrent()
+    return perf_counter() - start
+
+
+def main():
+    random.seed(0)
+    print(
+        f"{'pending':>9} {'backend':>7} {'schedule':>10} {'cancel':>10} "
+        f"{'reset':>10} {'fire':>10}   (calls/second)"
+    )
+    for n in (10**4, 10**5, 10**6):
+        for useWheel in (False, True):
+            name = "wheel" if useWheel else "heap"
+
+            reactor = buildReactor(useWheel)
+            scheduleTime, calls = schedule(reactor, n)
+            cancelTime = cancel(reactor, calls)
+
+            # The heap finds a call linearly when it is moved sooner, so only
+            # try a sample of resets with it.
+            reactor = buildReactor(useWheel)
+            _, calls = schedule(reactor, n)
+            resetCalls = calls if useWheel else calls[:1000]
+            resetTime = reset(reactor, resetCalls)
+
+            reactor = buildReactor(useWheel)
+            _, calls = schedule(reactor, n)
+            fireTime = fire(reactor, calls)
+
+            print(
+                f"{n:>9} {name:>7} {n / scheduleTime:>10.0f} "
+                f"{n / cancelTime:>10.0f} {len(resetCalls) / resetTime:>10.0f} "
+                f"{n / fireTime:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Copyright (c) Twisted Matrix Laboratories.
+# See LICENSE for details.
+
+"""
+Measure how long L{twisted.names.authority.BindAuthority} takes to load a
+large zone file, and how many queries a second it then answers for names
+with records, names matched by a wildcard, names below a delegation and names
+which do not exist.
+
+Usage: dnszone.py [number of names]
+"""
+
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+from twisted.names import dns
+from twisted.names.authority import BindAuthority
+
+ORIGIN = "example.com."
+
+
+def writeZone(path, names):
+    """
+    Write a zone of C{names} hosts with an address and a text record each,
+    plus a delegation and a wildcard.
+    """
+    with open(path, "w") as f:
+        f.write(f"$ORIGIN {ORIGIN}\n$TTL 3600\n")
+        f.write(
+            "@ IN SOA ns1.example.com. hostmaster.example.com. "
+            "1 7200 3600 1209600 3600\n"
+        )
+        f.write("@ IN NS ns1.example.com.\n")
+        f.write("ns1 IN A 192.0.2.1\n")
+        f.write("sub IN NS ns.sub.example.com.\n")
+        f.write("ns.sub IN A 192.0.2.2\n")
+        f.write("*.wild IN A 192.0.2.3\n")
+        for i in range(names):
+            f.write(f"host{i} IN A 10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}\n")
+            f.write(f"host{i} IN TXT host{i}\n")
+
+
+def lookups(authority, names, count):
+    """
+    Look up the addresses of C{names}, C{count} times in all.
+
+    @return: The number of lookups a second.
+    """
+    names = [dns.domainString(name) for name in names]
+    start = perf_counter()
+    for i in range(count):
+        authority._lookup(names[i % len(names)], dns.IN, dns.A).addErrback(
+            lambda f: None
+        )
+    return count / (perf_counter() - start)
+
+
+def main():
+    names = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "example.com")
+        writeZone(path, names)
+        start = perf_counter()
+        authority = BindAuthority(path.encode("utf-8"))
+        elapsed = perf_counter() - start
+    print(f"loaded {names * 2 + 6} records in {elapsed:.2f} seconds")
+    count = 100000
+    step = max(1, names // 1000)
+    for kind, queried in [
+        ("hosts", [f"host{i}.example.com" for i in range(0, names, step)]),
+        ("wildcard", [f"x{i}.wild.example.com" for i in range(1000)]),
+        ("delegation", [f"x{i}.sub.example.com" for i in range(1000)]),
+        ("missing", [f"x{i}.example.com" for i in range(1000)]),
+    ]:
+        print(f"{kind:>10} {lookups(authority, queried, count):>10.0f} lookups/second")
+
+
+if __name__ == "__main__":
+    main()
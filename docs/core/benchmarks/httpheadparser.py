@@ -0,0 +1,78 @@
+# Copyright (c) Twisted Matrix Laboratories.
+# See LICENSE for details.
+
+"""
+Compare the request throughput of L{twisted.web.http.HTTPChannel}, which
+parses request heads line by line, and the channel built by
+C{HTTPFactory(fastHeadParser=True)}, which parses each head in one pass, for
+pipelined small requests.
+"""
+
+from time import perf_counter
+
+from twisted.internet.testing import StringTransport
+from twisted.web.http import HTTPChannel, Request, _FastHeadHTTPChannel
+
+REQUEST = (
+    b"GET /api/v1/items?page=2 HTTP/1.1\r\n"
+    b"Host: api.example.com\r\n"
+    b"User-Agent: benchmark/1.0\r\n"
+    b"Accept: application/json\r\n"
+    b"Accept-Encoding: gzip, deflate\r\n"
+    b"Accept-Language: en-US,en;q=0.9\r\n"
+    b"Authorization: Bearer 0123456789abcdef\r\n"
+    b"Cookie: session=abcdef; theme=dark\r\n"
+    b"X-Request-Id: 5f1c2e9a\r\n"
+    b"\r\n"
+)
+
+
+class EmptyResponse(Request):
+    """
+    A request which is answered with an empty response as soon as it has been
+    received.
+    """
+
+    def process(self):
+        self.setHeader(b"content-length", b"0")
+        self.finish()
+
+
+def run(channelFactory, requests, pipelined, chunkSize):
+    """
+    Deliver C{requests} pipelined requests to a new channel, C{pipelined} at a
+    time, in chunks of C{chunkSize} bytes.
+
+    @return: The number of seconds taken.
+    """
+    channel = channelFactory()
+    channel.requestFactory = EmptyResponse
+    transport = StringTransport()
+    channel.makeConnection(transport)
+    data = REQUEST * pipelined
+    chunks = [data[i : i + chunkSize] for i in range(0, len(data), chunkSize)]
+    start = perf_counter()
+    for _ in range(requests // pipelined):
+        for chunk in chunks:
+            channel.dataReceived(chunk)
+        transport.clear()
+    elapsed = perf_counter() - start
+    channel.connectionLost(None)
+    return elapsed
+
+
+def main():
+    requests = 20000
+    print(
+        f"{'pipelined':>9} {'chunk':>6} {'lines':>10} {'one pass':>10}   (requests/second)"
+    )
+    for pipelined, chunkSize in [(1, 65536), (16, 65536), (16, 1024), (64, 65536)]:
+        results = [
+            requests / run(channelFactory, requests, pipelined, chunkSize)
+            for channelFactory in (HTTPChannel, _FastHeadHTTPChannel)
+        ]
+        print(f"{pipelined:>9} {chunkSize:>6} {results[0]:>10.0f} {results[1]:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# Copyright (c) Twisted Matrix Laboratories.
+# See LICENSE for details.
+
+"""
+Compare the throughput of a TCP transport's write buffer when queued data is
+joined into one buffer before each send and when it is sent with vectored
+(scatter-gather) writes.
+"""
+
+import socket
+from time import perf_counter
+
+from twisted.internet.protocol import Protocol
+from twisted.internet.tcp import Connection
+
+
+class NoReactor:
+    """
+    Just enough of a reactor for a L{Connection} whose writes are driven by
+    hand.
+    """
+
+    def addWriter(self, writer):
+        pass
+
+    def removeWriter(self, writer):
+        pass
+
+    def addReader(self, reader):
+        pass
+
+    def removeReader(self, reader):
+        pass
+
+
+def connect(vectored):
+    """
+    Make a connected L{Connection} and the socket at the other end of it.
+    """
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    ours = socket.create_connection(listener.getsockname())
+    theirs, _ = listener.accept()
+    listener.close()
+    theirs.setblocking(False)
+    connection = Connection(ours, Protocol(), reactor=NoReactor())
+    connection.connected = True
+    connection._vectoredWrites = vectored
+    return connection, theirs
+
+
+def drain(skt):
+    """
+    Read everything available from C{skt}.
+    """
+    received = 0
+    while True:
+        try:
+            data = skt.recv(2**20)
+        except BlockingIOError:
+            return received
+        received += len(data)
+
+
+def run(vectored, chunks, rounds):
+    """
+    Write C{chunks} with C{writeSequence} C{rounds} times, flushing them
+    through the connection each time.
+
+    @return: The number of seconds taken.
+    """
+    connection, other = connect(vectored)
+    total = sum(map(len, chunks))
+    start = perf_counter()
+    for _ in range(rounds):
+        connection.writeSequence(chunks)
+        received = 0
+        while received < total:
+            connection.doWrite()
+            received += drain(other)
+    elapsed = perf_counter() - start
+    connection.socket.close()
+    other.close()
+    return elapsed
+
+
+def chunked(bodySize, count):
+    """
+    Make the chunks which L{twisted.web.http.Request.write} produces for
+    C{count} writes of C{bodySize} bytes with chunked transfer encoding.
+    """
+    body = b"x" * bodySize
+    return [b"%x\r\n" % (bodySize,), body, b"\r\n"] * count
+
+
+def main():
+    workloads = [
+        ("many small writes", [b"x" * 64] * 4096),
+        ("chunked 4KiB", chunked(4096, 64)),
+        ("chunked 64KiB", chunked(2**16, 16)),
+        ("large writes", [b"x" * 2**20] * 4),
+    ]
+    print(f"{'workload':>18} {'joined':>10} {'vectored':>10}   (MiB/second)")
+    for name, chunks in workloads:
+        total = sum(map(len, chunks))
+        rounds = max(1, 2**28 // total)
+        results = []
+        for vectored in (False, True):
+            elapsed = run(vectored, chunks, rounds)
+            results.append(total * rounds / elapsed / 2**20)
+        print(f"{name:>18} {results[0]:>10.0f} {results[1]:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,8 +8,10 @@ workers.
 """
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import deque
-from typing import Callable, Optional, Set
+from time import perf_counter
+from typing import Callable, List, Optional, Set, Tuple
 
 from zope.interface import implementer
 
@@ -18,6 +20,57 @@ from ._convenience import Quit
 from ._ithreads import IExclusiveWorker
 
 
+class Histogram:
+    """
+    A distribution of durations, counted in buckets whose upper bounds double
+    from 10 microseconds to about 42 seconds, with one more bucket for
+    anything longer.
+
+    @ivar bounds: The upper bound, in seconds, of every bucket but the last.
+    @type bounds: L{tuple} of L{float}
+
+    @ivar counts: The number of durations recorded in each bucket; the
+        duration counted in C{counts[i]} is at most C{bounds[i]} and more than
+        C{bounds[i - 1]}.
+    @type counts: L{list} of L{int}
+
+    @ivar count: The number of durations recorded.
+    @type count: L{int}
+
+    @ivar total: The sum of the durations recorded, in seconds.
+    @type total: L{float}
+    """
+
+    bounds: Tuple[float, ...] = tuple(0.00001 * 2**i for i in range(23))
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, duration: float) -> None:
+        """
+        Count a duration.
+
+        @param duration: The duration, in seconds.
+        """
+        self.counts[bisect_left(self.bounds, duration)] += 1
+        self.count += 1
+        self.total += duration
+
+    def copy(self) -> Histogram:
+        """
+        Take a snapshot of this histogram.
+
+        @return: A new L{Histogram} with the same counts as this one.
+        """
+        copied = Histogram()
+        copied.counts = self.counts[:]
+        copied.count = self.count
+        copied.total = self.total
+        return copied
+
+
 class Statistics:
     """
     Statistics about a L{Team}'s current activity.
@@ -32,14 +85,28 @@ class Statistics:
         which have not yet been sent to a worker to be performed because not
         enough workers are available.
     @type backloggedWorkCount: L{int}
+
+    @ivar waitTimes: How long completed work items waited between being passed
+        to L{Team.do} and starting to run in a worker.
+    @type waitTimes: L{Histogram}
+
+    @ivar runTimes: How long completed work items took to run in a worker.
+    @type runTimes: L{Histogram}
     """
 
     def __init__(
-        self, idleWorkerCount: int, busyWorkerCount: int, backloggedWorkCount: int
+        self,
+        idleWorkerCount: int,
+        busyWorkerCount: int,
+        backloggedWorkCount: int,
+        waitTimes: Optional[Histogram] = None,
+        runTimes: Optional[Histogram] = None,
     ) -> None:
         self.idleWorkerCount = idleWorkerCount
         self.busyWorkerCount = busyWorkerCount
         self.backloggedWorkCount = backloggedWorkCount
+        self.waitTimes = Histogram() if waitTimes is None else waitTimes
+        self.runTimes = Histogram() if runTimes is None else runTimes
 
 
 @implementer(IWorker)
@@ -64,7 +131,15 @@ class Team:
     @ivar _busyCount: the number of workers currently busy.
 
     @ivar _pending: a C{deque} of tasks - that is, 0-argument callables passed
-        to L{Team.do} - that are outstanding.
+        to L{Team.do} - that are outstanding, each paired with the time it was
+        passed to L{Team.do}.
+
+    @ivar _clock: a 0-argument callable returning the current time in seconds,
+        used to measure how long tasks wait and run.
+
+    @ivar _waitTimes: a L{Histogram} of how long tasks waited for a worker.
+
+    @ivar _runTimes: a L{Histogram} of how long tasks ran in a worker.
 
     @ivar _shouldQuitCoordinator: A flag indicating that the coordinator should
         be quit at the next available opportunity.  Unlike L{Team._quit}, this
@@ -79,6 +154,7 @@ class Team:
         coordinator: IExclusiveWorker,
         createWorker: Callable[[], Optional[IWorker]],
         logException: Callable[[], None],
+        clock: Callable[[], float] = perf_counter,
     ):
         """
         @param coordinator: an L{IExclusiveWorker} which will coordinate access
@@ -93,18 +169,24 @@ class Team:
 
         @param logException: A 0-argument callable called in an exception
             context when the work passed to C{do} raises an exception.
+
+        @param clock: A 0-argument callable returning the current time in
+            seconds, used to measure how long work waits and runs.
         """
         self._quit = Quit()
         self._coordinator = coordinator
         self._createWorker = createWorker
         self._logException = logException
+        self._clock = clock
 
         # Don't touch these except from the coordinator.
         self._idle: Set[IWorker] = set()
         self._busyCount = 0
-        self._pending: "deque[Callable[..., object]]" = deque()
+        self._pending: "deque[Tuple[Callable[..., object], float]]" = deque()
         self._shouldQuitCoordinator = False
         self._toShrink = 0
+        self._waitTimes = Histogram()
+        self._runTimes = Histogram()
 
     def statistics(self) -> Statistics:
         """
@@ -112,7 +194,13 @@ class Team:
 
         @return: a L{Statistics} describing the current state of this L{Team}.
         """
-        return Statistics(len(self._idle), self._busyCount, len(self._pending))
+        return Statistics(
+            len(self._idle),
+            self._busyCount,
+            len(self._pending),
+            self._waitTimes.copy(),
+            self._runTimes.copy(),
+        )
 
     def grow(self, n: int) -> None:
         """
@@ -165,9 +253,10 @@ class Team:
         @param task: the callable to run
         """
         self._quit.check()
-        self._coordinator.do(lambda: self._coordinateThisTask(task))
+        enqueued = self._clock()
+        self._coordinator.do(lambda: self._coordinateThisTask(task, enqueued))
 
-    def _coordinateThisTask(self, task: Callable[..., object]) -> None:
+    def _coordinateThisTask(self, task: Callable[..., object], enqueued: float) -> None:
         """
         Select a worker to dispatch to, either an idle one or a new one, and
         perform it.
@@ -176,25 +265,31 @@ class Team:
 
         @param task: the task to dispatch
         @type task: 0-argument callable
+
+        @param enqueued: the time at which C{task} was passed to L{Team.do}.
         """
         worker = self._idle.pop() if self._idle else self._createWorker()
         if worker is None:
             # The createWorker method may return None if we're out of resources
             # to create workers.
-            self._pending.append(task)
+            self._pending.append((task, enqueued))
             return
         not_none_worker = worker
         self._busyCount += 1
 
         @worker.do
         def doWork() -> None:
+            started = self._clock()
             try:
                 task()
             except BaseException:
                 self._logException()
+            finished = self._clock()
 
             @self._coordinator.do
             def idleAndPending() -> None:
+                self._waitTimes.record(started - enqueued)
+                self._runTimes.record(finished - started)
                 self._busyCount -= 1
                 self._recycleWorker(not_none_worker)
 
@@ -211,7 +306,7 @@ class Team:
         if self._pending:
             # Re-try the first enqueued thing.
             # (Explicitly do _not_ honor _quit.)
-            self._coordinateThisTask(self._pending.popleft())
+            self._coordinateThisTask(*self._pending.popleft())
         elif self._shouldQuitCoordinator:
             self._quitIdlers()
         elif self._toShrink > 0:
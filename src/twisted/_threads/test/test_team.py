@@ -11,6 +11,7 @@ from twisted.python.context import call, get
 from twisted.python.failure import Failure
 from twisted.trial.unittest import SynchronousTestCase
 from .. import AlreadyQuit, IWorker, Team, createMemoryWorker
+from .._team import Histogram
 
 
 class ContextualWorker(proxyForInterface(IWorker, "_realWorker")):  # type: ignore[misc]
@@ -76,7 +77,10 @@ class TeamTests(SynchronousTestCase):
         def logException():
             self.failures.append(Failure())
 
-        self.team = Team(coordinator, createWorker, logException)
+        self.now = 0.0
+        self.team = Team(
+            coordinator, createWorker, logException, clock=lambda: self.now
+        )
 
     def coordinate(self):
         """
@@ -131,6 +135,44 @@ class TeamTests(SynchronousTestCase):
         self.assertEqual(stats.busyWorkerCount, 0)
         self.assertEqual(stats.backloggedWorkCount, 0)
 
+    def test_latencyStatistics(self):
+        """
+        L{Team.statistics} reports how long completed work waited for a worker
+        and how long it ran, as L{Histogram}s.
+        """
+
+        def slow():
+            self.now += 3.0
+
+        self.team.do(slow)
+        self.now = 2.0
+        self.coordinate()
+        stats = self.team.statistics()
+        self.assertEqual((stats.waitTimes.count, stats.runTimes.count), (0, 0))
+        self.performAllOutstandingWork()
+        stats = self.team.statistics()
+        self.assertEqual((stats.waitTimes.count, stats.waitTimes.total), (1, 2.0))
+        self.assertEqual((stats.runTimes.count, stats.runTimes.total), (1, 3.0))
+
+    def test_backloggedWaitTime(self):
+        """
+        The wait time of work which could not be given to a worker straight
+        away includes the time it spent in the backlog.
+        """
+        self.noMoreWorkers = lambda: len(self.allWorkersEver) >= 1
+
+        def slow():
+            self.now += 1.0
+
+        self.team.do(slow)
+        self.team.do(slow)
+        self.coordinate()
+        self.assertEqual(self.team.statistics().backloggedWorkCount, 1)
+        self.performAllOutstandingWork()
+        stats = self.team.statistics()
+        self.assertEqual((stats.waitTimes.count, stats.waitTimes.total), (2, 1.0))
+        self.assertEqual((stats.runTimes.count, stats.runTimes.total), (2, 2.0))
+
     def test_growCreatesIdleWorkers(self):
         """
         L{Team.grow} increases the number of available idle workers.
@@ -279,3 +321,39 @@ class TeamTests(SynchronousTestCase):
         self.team.shrink(7)
         self.performAllOutstandingWork()
         self.assertEqual(len(self.allUnquitWorkers), 3)
+
+
+class HistogramTests(SynchronousTestCase):
+    """
+    Tests for L{Histogram}.
+    """
+
+    def test_record(self):
+        """
+        L{Histogram.record} counts a duration in the first bucket whose bound
+        is at least that duration, or in the last bucket if it is longer than
+        every bound.
+        """
+        histogram = Histogram()
+        histogram.record(0.0)
+        histogram.record(Histogram.bounds[0])
+        histogram.record(Histogram.bounds[3] * 0.9)
+        histogram.record(Histogram.bounds[-1] * 2)
+        expected = [0] * (len(Histogram.bounds) + 1)
+        expected[0] = 2
+        expected[3] = 1
+        expected[-1] = 1
+        self.assertEqual(histogram.counts, expected)
+        self.assertEqual(histogram.count, 4)
+
+    def test_copy(self):
+        """
+        L{Histogram.copy} returns a histogram with the same counts, which does
+        not change when the original does.
+        """
+        histogram = Histogram()
+        histogram.record(0.5)
+        copied = histogram.copy()
+        histogram.record(0.5)
+        self.assertEqual((copied.count, copied.total), (1, 0.5))
+        self.assertEqual(sum(copied.counts), 1)
@@ -50,6 +50,7 @@ class TwistOptions(Options):
         self["reactorName"] = self.defaultReactorName
         self["logLevel"] = self.defaultLogLevel
         self["logFile"] = stdout
+        self["workers"] = 0
         # An empty long description is explicitly set here as otherwise
         # when executing from distributed trial twisted.python.usage will
         # pull the description from `__main__` which is another entry point.
@@ -151,6 +152,23 @@ class TwistOptions(Options):
 
     _update_doc(opt_log_format)
 
+    def opt_workers(self, count: str) -> None:
+        """
+        Run the plugin in this many worker processes, restarting any which
+        exit and restarting them all, one at a time, on SIGHUP.  Listening
+        ports must allow this, e.g. "tcp:8080:reuseport=yes".
+        (default: run the plugin in this process)
+        """
+        try:
+            workers = int(count)
+        except ValueError:
+            workers = 0
+        if workers < 1:
+            raise UsageError(f"Invalid number of workers: {count}")
+        self["workers"] = workers
+
+    _update_doc(opt_workers)
+
     def selectDefaultLogObserver(self) -> None:
         """
         Set C{fileLogObserverFactory} to the default appropriate for the
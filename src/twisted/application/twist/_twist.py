@@ -6,6 +6,8 @@
 Run a Twisted application.
 """
 
+import os
+import signal
 import sys
 from typing import Sequence
 
@@ -16,6 +18,7 @@ from ..runner._exit import ExitStatus, exit
 from ..runner._runner import Runner
 from ..service import Application, IService, IServiceMaker
 from ._options import TwistOptions
+from ._workers import WORKER_ENVIRONMENT, WorkerMonitor
 
 
 class Twist:
@@ -56,6 +59,42 @@ class Twist:
 
         return IService(application)
 
+    @staticmethod
+    def workersService(
+        reactor: IReactorCore, options: TwistOptions, argv: Sequence[str]
+    ) -> IService:
+        """
+        Create a service which runs the application in worker processes.
+
+        Each worker runs C{twist} again with the same arguments, and with
+        L{WORKER_ENVIRONMENT} set in its environment so that it runs the
+        application itself.
+
+        @param reactor: The reactor to run the workers with.
+        @param options: The parsed command line options.
+        @param argv: The command line arguments.
+        @return: The service.
+        """
+        monitor = WorkerMonitor(
+            reactor,
+            options["workers"],
+            [sys.executable, "-m", "twisted", *argv[1:]],
+            os.environ,
+        )
+        application = Application("twist")
+        monitor.setServiceParent(application)
+
+        if hasattr(signal, "SIGHUP"):
+
+            def restartAll(signum: int, frame: object) -> None:
+                # Signal handlers may run at any point, so leave the restart
+                # to the reactor.
+                reactor.callFromThread(monitor.restartAll)  # type: ignore[attr-defined]
+
+            signal.signal(signal.SIGHUP, restartAll)
+
+        return IService(application)
+
     @staticmethod
     def startService(reactor: IReactorCore, service: IService) -> None:
         """
@@ -105,10 +144,13 @@ class Twist:
         # and Twist.options() will exit the runner, so we'll never get here.
         subCommand = options.subCommand
         assert subCommand is not None
-        service = cls.service(
-            plugin=options.plugins[subCommand],
-            options=options.subOptions,
-        )
+        if options["workers"] and WORKER_ENVIRONMENT not in os.environ:
+            service = cls.workersService(reactor, options, argv)
+        else:
+            service = cls.service(
+                plugin=options.plugins[subCommand],
+                options=options.subOptions,
+            )
 
         cls.startService(reactor, service)
         cls.run(options)
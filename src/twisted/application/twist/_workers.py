@@ -0,0 +1,128 @@
+# -*- test-case-name: twisted.application.twist.test.test_workers -*-
+# Copyright (c) Twisted Matrix Laboratories.
+# See LICENSE for details.
+
+"""
+Supervision of C{twist} worker processes.
+
+C{twist --workers N} runs N copies of itself, each running the plugin with its
+own reactor.  The plugin's listening ports should set C{SO_REUSEPORT} (for
+example, C{tcp:8080:reuseport=yes}) so that every worker can listen on the
+same port and the kernel can distribute connections between them.
+"""
+
+from typing import Dict, List, Mapping, Sequence
+
+from twisted.internet.defer import Deferred, gatherResults, succeed
+from twisted.internet.task import deferLater
+from twisted.runner.procmon import ProcessMonitor
+
+#: The environment variable which tells a C{twist} process that it is a
+#: worker, and which worker it is.
+WORKER_ENVIRONMENT = "TWIST_WORKER"
+
+
+class WorkerMonitor(ProcessMonitor):
+    """
+    A L{ProcessMonitor} which runs C{twist} workers.
+
+    Unlike a plain L{ProcessMonitor}, stopping it waits for the workers to
+    exit, so that the reactor does not shut down under them, and
+    L{WorkerMonitor.restartAll} restarts the workers one at a time, so that
+    the others keep serving while each one restarts.
+
+    @ivar _exitWaiters: L{Deferred}s to fire when each named process exits.
+    """
+
+    def __init__(
+        self,
+        reactor,
+        count: int,
+        command: Sequence[str],
+        environment: Mapping[str, str],
+    ) -> None:
+        """
+        @param reactor: An L{IReactorProcess} and L{IReactorTime} provider to
+            run the workers with.
+        @param count: The number of workers.
+        @param command: The executable and arguments to run each worker with.
+        @param environment: The environment to run each worker in, to which
+            L{WORKER_ENVIRONMENT} is added.
+        """
+        ProcessMonitor.__init__(self, reactor)
+        self._exitWaiters: Dict[str, List[Deferred[None]]] = {}
+        for index in range(count):
+            env = dict(environment)
+            env[WORKER_ENVIRONMENT] = str(index)
+            self.addProcess(_workerName(index), list(command), env=env)
+
+    def _whenExited(self, name: str) -> "Deferred[None]":
+        """
+        @return: A L{Deferred} which fires when the named process has exited,
+            or which has already fired if it is not running.
+        """
+        if name not in self.protocols:
+            return succeed(None)
+        d: Deferred[None] = Deferred()
+        self._exitWaiters.setdefault(name, []).append(d)
+        return d
+
+    def connectionLost(self, name: str) -> None:
+        ProcessMonitor.connectionLost(self, name)
+        for d in self._exitWaiters.pop(name, []):
+            d.callback(None)
+
+    def stopService(self) -> "Deferred[None]":
+        """
+        Stop all of the workers.
+
+        @return: A L{Deferred} which fires when they have all exited.
+        """
+        exited = [self._whenExited(name) for name in self.protocols]
+        ProcessMonitor.stopService(self)
+        return gatherResults(exited).addCallback(lambda ignored: None)
+
+    def restartWorker(self, name: str) -> "Deferred[None]":
+        """
+        Stop a worker, which is restarted when it exits.
+
+        @param name: The name of the worker.
+
+        @return: A L{Deferred} which fires when it has exited.
+        """
+        exited = self._whenExited(name)
+        self.stopProcess(name)
+        return exited
+
+    def restartAll(self) -> "Deferred[None]":
+        """
+        Restart every worker, one at a time, giving each replacement
+        C{threshold} seconds to start before stopping the next worker.
+
+        @return: A L{Deferred} which fires when they have all been restarted.
+        """
+        self.log.info("Restarting {count} workers", count=len(self._processes))
+        d: Deferred[None] = succeed(None)
+        for name in list(self._processes):
+            d.addCallback(self._restartIfRunning, name)
+        return d
+
+    def _restartIfRunning(self, ignored: object, name: str) -> "Deferred[None]":
+        """
+        Restart a worker for L{WorkerMonitor.restartAll}, unless the service
+        has been stopped in the meantime.
+        """
+        if not self.running:
+            return succeed(None)
+        d = self.restartWorker(name)
+        d.addCallback(
+            lambda ignored: deferLater(self._reactor, self.threshold, lambda: None)
+        )
+        return d
+
+
+def _workerName(index: int) -> str:
+    """
+    @return: The name of the worker process with the given index.
+    """
+    return f"worker-{index}"
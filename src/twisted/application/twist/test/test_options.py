@@ -155,6 +155,33 @@ class OptionsTests(twisted.trial.unittest.TestCase):
 
         self.assertRaises(UsageError, options.opt_log_level, "cheese")
 
+    def test_workersDefault(self) -> None:
+        """
+        By default, L{TwistOptions} runs the plugin without workers.
+        """
+        options = TwistOptions()
+
+        self.assertEqual(options["workers"], 0)
+
+    def test_workersValid(self) -> None:
+        """
+        L{TwistOptions.opt_workers} sets the number of workers.
+        """
+        options = TwistOptions()
+        options.opt_workers("4")
+
+        self.assertEqual(options["workers"], 4)
+
+    def test_workersInvalid(self) -> None:
+        """
+        L{TwistOptions.opt_workers} with anything other than a positive
+        integer raises L{UsageError}.
+        """
+        options = TwistOptions()
+
+        for count in ("0", "-1", "many"):
+            self.assertRaises(UsageError, options.opt_workers, count)
+
     def _testLogFile(self, name: str, expectedStream: TextIO) -> None:
         """
         Set log file name and check the selected output stream.
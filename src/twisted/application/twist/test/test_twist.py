@@ -5,6 +5,9 @@
 Tests for L{twisted.application.twist._twist}.
 """
 
+import os
+import signal
+import sys
 from sys import stdout
 from typing import Any, Dict, List
 
@@ -20,6 +23,7 @@ from ...service import IService, MultiService
 from ...twist import _twist
 from .._options import TwistOptions
 from .._twist import Twist
+from .._workers import WORKER_ENVIRONMENT, WorkerMonitor
 
 
 class TwistTests(twisted.trial.unittest.TestCase):
@@ -184,6 +188,60 @@ class TwistTests(twisted.trial.unittest.TestCase):
         )
         self.assertEqual(runners[0].runs, 1)
 
+    def test_mainWorkers(self) -> None:
+        """
+        L{Twist.main} given C{--workers} runs a L{WorkerMonitor} which runs
+        C{twist} again with the same arguments in that many processes, and
+        which restarts them when C{SIGHUP} is received.
+        """
+        self.patch(os, "environ", {})
+        handlers: Dict[int, object] = {}
+        self.patch(signal, "signal", handlers.__setitem__)
+        started: List[IService] = []
+        self.patch(
+            Twist,
+            "startService",
+            staticmethod(lambda reactor, service: started.append(service)),
+        )
+        self.patch(Twist, "run", staticmethod(lambda options: None))
+
+        Twist.main(["twist", "--workers=2", "web"])
+
+        [service] = started
+        [monitor] = list(service)
+        self.assertIsInstance(monitor, WorkerMonitor)
+        command = [sys.executable, "-m", "twisted", "--workers=2", "web"]
+        self.assertEqual(
+            {
+                "worker-0": (command, {WORKER_ENVIRONMENT: "0"}),
+                "worker-1": (command, {WORKER_ENVIRONMENT: "1"}),
+            },
+            {
+                name: (process.args, process.env)
+                for name, process in monitor._processes.items()
+            },
+        )
+        self.assertIn(signal.SIGHUP, handlers)
+
+    def test_mainInWorker(self) -> None:
+        """
+        L{Twist.main} given C{--workers} in a worker process runs the plugin
+        itself.
+        """
+        self.patch(os, "environ", {WORKER_ENVIRONMENT: "1"})
+        started: List[IService] = []
+        self.patch(
+            Twist,
+            "startService",
+            staticmethod(lambda reactor, service: started.append(service)),
+        )
+        self.patch(Twist, "run", staticmethod(lambda options: None))
+
+        Twist.main(["twist", "--workers=2", "web"])
+
+        [service] = started
+        self.assertNotIsInstance(list(service)[0], WorkerMonitor)
+
 
 class TwistExitTests(twisted.trial.unittest.TestCase):
     """
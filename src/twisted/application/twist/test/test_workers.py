@@ -0,0 +1,136 @@
+# Copyright (c) Twisted Matrix Laboratories.
+# See LICENSE for details.
+
+"""
+Tests for L{twisted.application.twist._workers}.
+"""
+
+from typing import List
+
+import twisted.trial.unittest
+from twisted.runner.test.test_procmon import DummyProcessReactor
+from .._workers import WORKER_ENVIRONMENT, WorkerMonitor
+
+
+class WorkerMonitorTests(twisted.trial.unittest.TestCase):
+    """
+    Tests for L{WorkerMonitor}.
+    """
+
+    def setUp(self) -> None:
+        self.reactor = DummyProcessReactor()
+        self.monitor = WorkerMonitor(
+            self.reactor, 3, ["python", "-m", "twisted", "web"], {"HOME": "/"}
+        )
+
+    def test_startService(self) -> None:
+        """
+        L{WorkerMonitor.startService} starts the given number of worker
+        processes, each running the given command, with its index in
+        L{WORKER_ENVIRONMENT}.
+        """
+        self.monitor.startService()
+        self.assertEqual(
+            [
+                (
+                    "python",
+                    ["python", "-m", "twisted", "web"],
+                    {"HOME": "/", WORKER_ENVIRONMENT: str(index)},
+                )
+                for index in range(3)
+            ],
+            [
+                (process._executable, process._args, process._environment)
+                for process in self.reactor.spawnedProcesses
+            ],
+        )
+
+    def test_workerRestarted(self) -> None:
+        """
+        A worker which exits while the service is running is restarted.
+        """
+        self.monitor.startService()
+        self.reactor.advance(self.monitor.threshold)
+        self.reactor.spawnedProcesses[1].processEnded(1)
+        self.reactor.advance(0)
+        self.assertEqual(4, len(self.reactor.spawnedProcesses))
+        self.assertEqual(
+            "1", self.reactor.spawnedProcesses[-1]._environment[WORKER_ENVIRONMENT]
+        )
+
+    def test_stopServiceWaits(self) -> None:
+        """
+        The L{Deferred} returned by L{WorkerMonitor.stopService} fires once
+        every worker has exited.
+        """
+        self.monitor.startService()
+        stopped: List[None] = []
+        self.monitor.stopService().addCallback(stopped.append)
+        self.assertEqual([], stopped)
+        # DummyProcess exits one second after it is sent SIGTERM.
+        self.reactor.advance(1)
+        self.assertEqual([None], stopped)
+        self.assertEqual(3, len(self.reactor.spawnedProcesses))
+
+    def test_stopServiceNotRunning(self) -> None:
+        """
+        L{WorkerMonitor.stopService} returns a L{Deferred} which has already
+        fired if no worker is running.
+        """
+        self.monitor.startService()
+        self.reactor.advance(self.monitor.threshold)
+        for process in self.reactor.spawnedProcesses:
+            process.processEnded(0)
+        self.successResultOf(self.monitor.stopService())
+
+    def test_restartAll(self) -> None:
+        """
+        L{WorkerMonitor.restartAll} restarts the workers one at a time,
+        waiting C{threshold} seconds after each one has been restarted before
+        stopping the next.
+        """
+        self.monitor.startService()
+        self.reactor.advance(self.monitor.threshold)
+        d = self.monitor.restartAll()
+        processes = self.reactor.spawnedProcesses
+
+        # The first worker has been asked to exit, and does so.
+        self.assertEqual(3, len(processes))
+        self.reactor.advance(1)
+        self.assertEqual(4, len(processes))
+        self.assertIsNone(processes[0].pid)
+        self.assertIsNotNone(processes[1].pid)
+
+        # The second is only stopped after its replacement has had time to
+        # start.
+        self.reactor.advance(self.monitor.threshold)
+        self.reactor.advance(1)
+        self.assertEqual(5, len(processes))
+        self.assertIsNone(processes[1].pid)
+        self.assertIsNotNone(processes[2].pid)
+
+        self.reactor.advance(self.monitor.threshold)
+        self.reactor.advance(1)
+        self.reactor.advance(self.monitor.threshold)
+        self.assertEqual(6, len(processes))
+        self.successResultOf(d)
+        self.assertEqual(
+            ["0", "1", "2"],
+            [process._environment[WORKER_ENVIRONMENT] for process in processes[3:]],
+        )
+
+    def test_restartAllStopsWhenStopped(self) -> None:
+        """
+        L{WorkerMonitor.restartAll} restarts no more workers once the service
+        has been stopped.
+        """
+        self.monitor.startService()
+        self.reactor.advance(self.monitor.threshold)
+        d = self.monitor.restartAll()
+        self.reactor.advance(1)
+        self.assertEqual(4, len(self.reactor.spawnedProcesses))
+        self.monitor.stopService()
+        self.reactor.advance(self.monitor.threshold)
+        self.reactor.advance(1)
+        self.successResultOf(d)
+        self.assertEqual(4, len(self.reactor.spawnedProcesses))
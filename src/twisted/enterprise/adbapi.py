@@ -7,9 +7,14 @@ An asynchronous mapping to U{DB-API
 2.0<http://www.python.org/topics/database/DatabaseAPI-2.0.html>}.
 """
 
+from collections import deque
+from queue import Queue
+from time import monotonic
 
 from twisted.internet import threads
+from twisted.internet.defer import CancelledError, Deferred, fail
 from twisted.python import log, reflect
+from twisted.python.failure import Failure
 
 
 class ConnectionLost(Exception):
@@ -123,6 +128,112 @@ class Transaction:
         return getattr(self._cursor, name)
 
 
+class _QueryStream:
+    """
+    The asynchronous iterator returned by L{ConnectionPool.runQueryStream}.
+
+    The interaction running the query waits in its thread for batches to be
+    asked for, and fetches one for each request, so no more rows are held in
+    memory than the consumer has asked for.
+
+    @ivar _reactor: The reactor batches are delivered to.
+
+    @ivar _requests: A L{Queue} of requests for the interaction: C{True} to
+        fetch another batch, C{False} to stop.
+
+    @ivar _waiting: The L{Deferred}s returned by C{__anext__} which have not
+        been given a batch yet.
+
+    @ivar _failure: The L{Failure} of the query, if it failed before any
+        consumer was waiting for it.
+
+    @ivar _done: Whether the interaction has delivered its last batch, or
+        failed.
+
+    @ivar _stopped: Whether the consumer stopped the iteration with
+        L{_QueryStream.cancel}.
+    """
+
+    def __init__(self, reactor):
+        self._reactor = reactor
+        self._requests = Queue()
+        self._waiting = deque()
+        self._failure = None
+        self._done = False
+        self._stopped = False
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        """
+        Get the next batch of rows.
+
+        @return: A L{Deferred} which fires with a non-empty L{list} of rows, or
+            fails with the error raised by the query, or with
+            L{StopAsyncIteration} when there are no more rows.  Cancelling it
+            cancels the whole iteration, as L{_QueryStream.cancel} does.
+        """
+        if self._failure is not None:
+            failure, self._failure = self._failure, None
+            return fail(failure)
+        if self._done or self._stopped:
+            return fail(StopAsyncIteration())
+        d = Deferred(lambda d: self.cancel())
+        self._waiting.append(d)
+        self._requests.put(True)
+        return d
+
+    def cancel(self):
+        """
+        Stop the iteration: the interaction fetches no more rows and gives
+        its connection back to the pool, and every L{Deferred} waiting for a
+        batch fails with L{CancelledError}.
+        """
+        if self._stopped:
+            return
+        self._stopped = True
+        self._requests.put(False)
+        while self._waiting:
+            self._waiting.popleft().errback(CancelledError())
+
+    def _run(self, trans, batchSize, *args, **kw):
+        """
+        Run the query and fetch a batch of its rows for every request, until
+        there are no more or the consumer stops.  This runs in a thread.
+        """
+        callFromThread = self._reactor.callFromThread
+        try:
+            trans.execute(*args, **kw)
+            while self._requests.get():
+                rows = trans.fetchmany(batchSize)
+                if rows:
+                    callFromThread(self._batchReceived, list(rows))
+                if len(rows) < batchSize:
+                    break
+        except BaseException:
+            callFromThread(self._failed, Failure())
+            raise
+        callFromThread(self._finished)
+
+    def _batchReceived(self, rows):
+        if self._waiting:
+            self._waiting.popleft().callback(rows)
+
+    def _failed(self, failure):
+        self._done = True
+        if self._waiting:
+            self._waiting.popleft().errback(failure)
+        elif not self._stopped:
+            self._failure = failure
+        self._finished()
+
+    def _finished(self):
+        self._done = True
+        while self._waiting:
+            self._waiting.popleft().errback(StopAsyncIteration())
+
+
 class ConnectionPool:
     """
     Represent a pool of connections to a DB-API 2.0 compliant database.
@@ -141,9 +252,19 @@ class ConnectionPool:
     @ivar _reactor: The reactor which will be used to schedule startup and
         shutdown events.
     @type _reactor: L{IReactorCore} provider
+
+    @ivar _connectionTimes: A L{dict} mapping the thread ids in C{connections}
+        to a two-element L{list}: when the thread's connection was opened, and
+        when it was last used.
+
+    @ivar _seconds: A 0-argument callable returning the current time in
+        seconds, used to measure connections' age and idle time.
     """
 
-    CP_ARGS = "min max name noisy openfun reconnect good_sql".split()
+    CP_ARGS = (
+        "min max name noisy openfun reconnect good_sql "
+        "max_age idle_timeout ping_interval"
+    ).split()
 
     noisy = False  # If true, generate informational log messages
     min = 3  # Minimum number of connections in pool
@@ -152,10 +273,14 @@ class ConnectionPool:
     openfun = None  # A function to call on new connections
     reconnect = False  # Reconnect when connections fail
     good_sql = "select 1"  # A query which should always succeed
+    max_age = None  # Seconds after which a connection is replaced
+    idle_timeout = None  # Seconds unused after which a connection is replaced
+    ping_interval = None  # Seconds unused after which good_sql checks one
 
     running = False  # True when the pool is operating
     connectionFactory = Connection
     transactionFactory = Transaction
+    _seconds = staticmethod(monotonic)
 
     # Initialize this to None so it's available in close() even if start()
     # never runs.
@@ -195,6 +320,18 @@ class ConnectionPool:
         @keyword cp_reactor: use this reactor instead of the global reactor
             (added in Twisted 10.2).
         @type cp_reactor: L{IReactorCore} provider
+
+        @keyword cp_max_age: the number of seconds after which a connection is
+            closed and replaced when it is next used, so that connections do
+            not outlive a database failover (default L{None}, never)
+
+        @keyword cp_idle_timeout: the number of seconds a connection may go
+            unused before it is closed and replaced when it is next used
+            (default L{None}, forever)
+
+        @keyword cp_ping_interval: the number of seconds a connection may go
+            unused before C{cp_good_sql} is run on it when it is next used, to
+            replace it if it has failed (default L{None}, never)
         """
         self.dbapiName = dbapiName
         self.dbapi = reflect.namedModule(dbapiName)
@@ -224,6 +361,8 @@ class ConnectionPool:
 
         # All connections, hashed on thread id
         self.connections = {}
+        self._connectionTimes = {}
+        self._streams = set()
 
         # These are optional so import them here
         from twisted.python import threadable, threadpool
@@ -288,6 +427,8 @@ class ConnectionPool:
             except BaseException:
                 log.err(None, "Rollback failed")
             raise
+        finally:
+            self._connectionUsed()
 
     def runInteraction(self, interaction, *args, **kw):
         """
@@ -367,6 +508,66 @@ class ConnectionPool:
         """
         return self.runInteraction(self._runOperation, *args, **kw)
 
+    def runOperationMany(self, *args, **kw):
+        """
+        Execute an SQL statement once for each of a sequence of parameters,
+        in one transaction, and return L{None}.
+
+        The C{*args} and C{**kw} arguments will be passed to the DB-API
+        cursor's 'executemany' method: typically an SQL statement and a
+        sequence of parameters for it.  If it raises an exception, the
+        transaction will be rolled back and a L{Failure} returned.
+
+        @return: a L{Deferred} which will fire with L{None} or a
+            L{twisted.python.failure.Failure}.
+        """
+        return self.runInteraction(self._runOperationMany, *args, **kw)
+
+    def runQueryStream(self, *args, batchSize=1000, **kw):
+        """
+        Execute an SQL query and return its rows in batches, as they are
+        asked for.
+
+        The C{*args} and C{**kw} arguments will be passed to the DB-API
+        cursor's 'execute' method, as for L{ConnectionPool.runQuery}, and
+        batches are fetched with its 'fetchmany' method.
+
+        The query holds a connection, and a thread, until its last batch has
+        been taken or the returned iterator is cancelled, so every batch
+        should be consumed promptly::
+
+            async for rows in pool.runQueryStream("select * from t"):
+                ...
+
+        @param batchSize: the most rows to fetch in one batch.
+
+        @return: an asynchronous iterator whose C{__anext__} returns a
+            L{Deferred} firing with the next batch, a L{list} of rows, and
+            which has a C{cancel} method to stop it early.
+        """
+        stream = _QueryStream(self._reactor)
+        self._streams.add(stream)
+
+        def done(result):
+            # The stream has already been given any failure.
+            self._streams.discard(stream)
+
+        self.runInteraction(stream._run, batchSize, *args, **kw).addBoth(done)
+        return stream
+
+    def statistics(self):
+        """
+        Describe the current state of the threads, and so the connections, in
+        this pool.
+
+        Each thread has its own connection, so the C{waitTimes} of the result
+        measure how long interactions waited for a connection.
+
+        @return: The L{twisted.python.threadpool.ThreadPool.statistics} of
+            this pool's threads.
+        """
+        return self.threadpool.statistics()
+
     def close(self):
         """
         Close all pool connections and shutdown the pool.
@@ -384,11 +585,14 @@ class ConnectionPool:
         This should only be called by the shutdown trigger.
         """
         self.shutdownID = None
+        for stream in list(self._streams):
+            stream.cancel()
         self.threadpool.stop()
         self.running = False
         for conn in self.connections.values():
             self._close(conn)
         self.connections.clear()
+        self._connectionTimes.clear()
 
     def connect(self):
         """
@@ -404,6 +608,12 @@ class ConnectionPool:
 
         tid = self.threadID()
         conn = self.connections.get(tid)
+        if conn is not None and (
+            self.max_age is not None
+            or self.idle_timeout is not None
+            or self.ping_interval is not None
+        ):
+            conn = self._checkConnection(tid, conn)
         if conn is None:
             if self.noisy:
                 log.msg(f"adbapi connecting: {self.dbapiName}")
@@ -411,8 +621,69 @@ class ConnectionPool:
             if self.openfun is not None:
                 self.openfun(conn)
             self.connections[tid] = conn
+            now = self._seconds()
+            self._connectionTimes[tid] = [now, now]
         return conn
 
+    def _checkConnection(self, tid, conn):
+        """
+        Close a thread's connection if it is too old, has been idle too long
+        or fails C{good_sql}.
+
+        @param tid: The id of the thread using the connection.
+
+        @param conn: The thread's DB-API connection.
+
+        @return: C{conn}, or L{None} if it was closed.
+        """
+        opened, lastUsed = self._connectionTimes[tid]
+        now = self._seconds()
+        if self.max_age is not None and now - opened > self.max_age:
+            reason = "too old"
+        elif self.idle_timeout is not None and now - lastUsed > self.idle_timeout:
+            reason = "idle"
+        elif self.ping_interval is not None and now - lastUsed > self.ping_interval:
+            if self._ping(conn):
+                self._connectionTimes[tid][1] = now
+                return conn
+            reason = "failed"
+        else:
+            return conn
+        if self.noisy:
+            log.msg(f"adbapi replacing {reason} connection: {self.dbapiName}")
+        self._close(conn)
+        del self.connections[tid]
+        del self._connectionTimes[tid]
+        return None
+
+    def _ping(self, conn):
+        """
+        Check that a connection works by running C{good_sql} on it.
+
+        @param conn: A DB-API connection.
+
+        @return: Whether C{good_sql} succeeded.
+        """
+        try:
+            curs = conn.cursor()
+            curs.execute(self.good_sql)
+            curs.close()
+            conn.commit()
+        except BaseException:
+            return False
+        return True
+
+    def _connectionUsed(self):
+        """
+        Note that the current thread has finished using its connection, if
+        it has one and its idle time matters.
+        """
+        if self.idle_timeout is None and self.ping_interval is None:
+            return
+        times = self._connectionTimes.get(self.threadID())
+        if times is not None:
+            times[1] = self._seconds()
+
     def disconnect(self, conn):
         """
         Disconnect a database connection associated with this pool.
@@ -427,6 +698,7 @@ class ConnectionPool:
         if conn is not None:
             self._close(conn)
             del self.connections[tid]
+            self._connectionTimes.pop(tid, None)
 
     def _close(self, conn):
         if self.noisy:
@@ -450,6 +722,8 @@ class ConnectionPool:
             except BaseException:
                 log.err(None, "Rollback failed")
             raise
+        finally:
+            self._connectionUsed()
 
     def _runQuery(self, trans, *args, **kw):
         trans.execute(*args, **kw)
@@ -458,6 +732,9 @@ class ConnectionPool:
     def _runOperation(self, trans, *args, **kw):
         trans.execute(*args, **kw)
 
+    def _runOperationMany(self, trans, *args, **kw):
+        trans.executemany(*args, **kw)
+
     def __getstate__(self):
         return {
             "dbapiName": self.dbapiName,
@@ -466,6 +743,9 @@ class ConnectionPool:
             "noisy": self.noisy,
             "reconnect": self.reconnect,
             "good_sql": self.good_sql,
+            "max_age": self.max_age,
+            "idle_timeout": self.idle_timeout,
+            "ping_interval": self.ping_interval,
             "connargs": self.connargs,
             "connkw": self.connkw,
         }
@@ -135,7 +135,9 @@ def startTLS(transport, contextFactory, normal, bypass):
     transport.getHandle = tlsProtocol.getHandle
     transport.getPeerCertificate = tlsProtocol.getPeerCertificate
 
-    # Mark the transport as secure.
+    # Mark the transport as secure.  This also stops it from providing any
+    # other interfaces it provided directly, such as ISendfileTransport, whose
+    # data would not pass through the TLS layer.
     directlyProvides(transport, ISSLTransport)
 
     # Remember we did this so that write and writeSequence can send the
@@ -0,0 +1,159 @@
+# -*- test-case-name: twisted.internet.test.test_processpool -*-
+# Copyright (c) Twisted Matrix Laboratories.
+# See LICENSE for details.
+
+"""
+The L{AMP} commands spoken between a L{twisted.internet.processpool.ProcessPool}
+and its worker processes, and the main executable entry point for the workers.
+
+A worker reads commands from its standard input and writes responses to its
+standard output.  Anything the work itself prints goes to standard error.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import sys
+import traceback
+from typing import Any, Callable, Dict
+
+from twisted.internet.protocol import FileWrapper
+from twisted.protocols.amp import (
+    AMP,
+    MAX_VALUE_LENGTH,
+    Argument,
+    Boolean,
+    Command,
+    Integer,
+    Unicode,
+)
+
+try:
+    import resource as _resource
+except ImportError:
+    _resource = None  # type: ignore[assignment]
+
+
+class _Chunked(Argument):
+    """
+    An argument holding L{bytes} of any length, which is split across as many
+    keys as it takes to keep every value shorter than L{MAX_VALUE_LENGTH}.
+    """
+
+    def toBox(self, name, strings, objects, proto):
+        data = objects.pop(name.decode("ascii"))
+        strings[name] = data[:MAX_VALUE_LENGTH]
+        for i, start in enumerate(range(MAX_VALUE_LENGTH, len(data), MAX_VALUE_LENGTH)):
+            strings[b"%s.%d" % (name, i)] = data[start : start + MAX_VALUE_LENGTH]
+
+    def fromBox(self, name, strings, objects, proto):
+        chunks = [strings.pop(name)]
+        i = 0
+        while (key := b"%s.%d" % (name, i)) in strings:
+            chunks.append(strings.pop(key))
+            i += 1
+        objects[name.decode("ascii")] = b"".join(chunks)
+
+
+class Call(Command):
+    """
+    Call a function in the worker.
+
+    C{call} is the pickled C{(f, args, kwargs)} to call.  If C{success} is
+    true, C{result} is the pickled return value; otherwise it is the pickled
+    exception, and C{traceback} describes where it was raised.  C{memory} is
+    the most memory, in bytes, the worker has used so far, or 0 if that is
+    not known.
+    """
+
+    arguments = [(b"call", _Chunked())]
+    response = [
+        (b"success", Boolean()),
+        (b"result", _Chunked()),
+        (b"traceback", Unicode()),
+        (b"memory", Integer()),
+    ]
+
+
+def _peakMemory() -> int:
+    """
+    Find out the most memory this process has used so far.
+
+    @return: The peak resident set size of this process, in bytes, or 0 if it
+        cannot be determined on this platform.
+    """
+    if _resource is None:
+        return 0
+    peak = _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak
+    return peak * 1024
+
+
+class WorkerProtocol(AMP):
+    """
+    The protocol run by a worker process, calling the functions it is sent.
+    """
+
+    @Call.responder
+    def call(self, call: bytes) -> Dict[str, Any]:
+        """
+        Unpickle a function and its arguments, call it and pickle what it
+        returns or raises.
+        """
+        success = True
+        tb = ""
+        try:
+            f: Callable[..., object]
+            f, args, kwargs = pickle.loads(call)
+            result = f(*args, **kwargs)
+        except BaseException as e:
+            success = False
+            tb = traceback.format_exc()
+            result = e
+        try:
+            pickled = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+        except BaseException as e:
+            if success:
+                tb = traceback.format_exc()
+            success = False
+            pickled = pickle.dumps(
+                RuntimeError(f"Could not pickle {result!r}: {e!r}"),
+                pickle.HIGHEST_PROTOCOL,
+            )
+        return {
+            "success": success,
+            "result": pickled,
+            "traceback": tb,
+            "memory": _peakMemory(),
+        }
+
+
+def main() -> None:
+    """
+    Main function to be run if __name__ == "__main__".
+
+    Serve L{Call}s read from standard input until it is closed.
+    """
+    # Keep the protocol to ourselves: whatever the work prints goes to
+    # standard error, and anything it reads comes from nowhere.
+    protocolIn = os.fdopen(os.dup(0), "rb", 0)
+    protocolOut = os.fdopen(os.dup(1), "wb")
+    os.dup2(2, 1)
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+
+    protocol = WorkerProtocol()
+    protocol.makeConnection(FileWrapper(protocolOut))
+    while True:
+        data = protocolIn.read(MAX_VALUE_LENGTH)
+        if not data:
+            break
+        protocol.dataReceived(data)
+        protocolOut.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+# -*- test-case-name: twisted.internet.test.test_timerwheel -*-
+# Copyright (c) Twisted Matrix Laboratories.
+# See LICENSE for details.
+
+"""
+A hierarchical timing wheel for scheduling L{DelayedCall}s.
+
+L{ReactorBase} keeps its timed calls in a binary heap by default.  That makes
+scheduling a call O(log n) and moving a call sooner O(n), and it leaves
+cancelled calls in the heap until they are lazily compacted away.  Programs
+which keep very large numbers of mostly-cancelled timeouts (for example, one
+idle timeout per connection which is reset on every read) can instead ask the
+reactor to use a L{TimerWheel}, which makes adding, removing, and
+rescheduling a call O(1).
+"""
+
+from operator import attrgetter
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from twisted.internet.base import DelayedCall
+
+# This module exports nothing public, it's for internal Twisted use only.
+__all__: List[str] = []
+
+_Bucket = Dict["DelayedCall", None]
+
+_byTime = attrgetter("time")
+
+
+class TimerWheel:
+    """
+    A hierarchical timing wheel of L{DelayedCall}s, ordered by their C{time}
+    attribute.
+
+    Time is divided into ticks of C{resolution} seconds.  The wheel has
+    C{levels} levels of C{2 ** slotBits} buckets each.  A call due within
+    C{2 ** slotBits} ticks of the current tick is kept in a level 0 bucket for
+    its exact tick.  Calls further in the future are kept in a coarser bucket
+    at a higher level and are redistributed ("cascaded") towards level 0 as
+    the current tick reaches the start of their bucket.  Calls beyond the
+    range of the highest level are kept in an overflow bucket which is
+    redistributed each time the whole wheel wraps around.
+
+    Each bucket is a C{dict} (used as an insertion-ordered set) and each call
+    remembers the bucket it is in, so adding or removing a call only ever
+    touches one bucket.
+
+    Like the reactor's heap, the wheel does not look at C{delayed_time};
+    callers are expected to reschedule calls which have been delayed when
+    they come due.
+
+    @ivar resolution: The length of one tick, in seconds.
+
+    @ivar _tick: The current tick.  Every level 0 bucket holds calls for a
+        tick in the range C{[_tick, _tick + 2 ** slotBits)}.
+
+    @ivar _levels: A list of C{levels} lists of buckets.
+
+    @ivar _counts: The number of calls in each level, followed by the number
+        of calls in C{_overflow}.
+
+    @ivar _overflow: The bucket of calls beyond the range of the highest
+        level.
+
+    @ivar _earliest: A cached lower bound on the C{time} of the earliest call
+        in the wheel, or L{None} if it must be recomputed.
+    """
+
+    def __init__(
+        self,
+        now: float,
+        resolution: float = 0.001,
+        slotBits: int = 8,
+        levels: int = 4,
+    ) -> None:
+        """
+        @param now: The current time, in seconds.
+        @param resolution: The length of one tick, in seconds.
+        @param slotBits: The base 2 logarithm of the number of buckets at
+            each level.
+        @param levels: The number of levels.
+        """
+        self.resolution = resolution
+        self._ticksPerSecond = 1 / resolution
+        self._bits = slotBits
+        self._mask = (1 << slotBits) - 1
+        self._levels: List[List[_Bucket]] = [
+            [{} for _ in range(1 << slotBits)] for _ in range(levels)
+        ]
+        self._levelCount = levels
+        self._overflow: _Bucket = {}
+        self._counts = [0] * (levels + 1)
+        self._span = 1 << (slotBits * levels)
+        self._tick = self._tickFor(now)
+        self._length = 0
+        self._earliest: Optional[float] = None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator["DelayedCall"]:
+        for level in self._levels:
+            for bucket in level:
+                yield from bucket
+        yield from self._overflow
+
+    def _tickFor(self, when: float) -> int:
+        """
+        Find the tick in which a point in time falls.
+        """
+        return int(when * self._ticksPerSecond)
+
+    def add(self, call: "DelayedCall") -> None:
+        """
+        Add a call to the wheel, in the bucket appropriate for its time
+        relative to the current tick.
+
+        @param call: A call which is not already in the wheel.
+        """
+        bits = self._bits
+        current = self._tick
+        tick = int(call.time * self._ticksPerSecond)
+        delta = tick - current
+        if delta <= 0:
+            level = 0
+            bucket = self._levels[0][current & self._mask]
+        else:
+            level = (delta.bit_length() - 1) // bits
+            if level < self._levelCount:
+                bucket = self._levels[level][(tick >> (bits * level)) & self._mask]
+            else:
+                level = self._levelCount
+                bucket = self._overflow
+        bucket[call] = None
+        self._counts[level] += 1
+        self._length += 1
+        call._timerWheelBucket = bucket
+        call._timerWheelLevel = level
+        if self._earliest is not None and call.time < self._earliest:
+            self._earliest = call.time
+
+    def remove(self, call: "DelayedCall") -> None:
+        """
+        Remove a call from the wheel, if it is in it.
+
+        @param call: The call to remove.
+        """
+        bucket = call._timerWheelBucket
+        if bucket is not None:
+            del bucket[call]
+            self._counts[call._timerWheelLevel] -= 1
+            self._length -= 1
+            call._timerWheelBucket = None
+
+    def reschedule(self, call: "DelayedCall") -> None:
+        """
+        Move a call to the bucket for its current C{time}, adding it to the
+        wheel if it is not already in it.
+
+        @param call: The call to move.
+        """
+        self.remove(call)
+        self.add(call)
+
+    def _take(self, bucket: _Bucket, calls: List["DelayedCall"]) -> None:
+        """
+        Remove some calls from a bucket.
+        """
+        for call in calls:
+            del bucket[call]
+            call._timerWheelBucket = None
+        self._counts[calls[0]._timerWheelLevel] -= len(calls)
+        self._length -= len(calls)
+
+    def _cascade(self, tick: int) -> None:
+        """
+        Redistribute the buckets which start at C{tick}, which has just become
+        the current tick.
+        """
+        bits = self._bits
+        for level in range(1, self._levelCount):
+            shift = bits * level
+            if tick & ((1 << shift) - 1):
+                return
+            bucket = self._levels[level][(tick >> shift) & self._mask]
+            if bucket:
+                calls = list(bucket)
+                self._take(bucket, calls)
+                for call in calls:
+                    self.add(call)
+        if not tick & (self._span - 1) and self._overflow:
+            calls = list(self._overflow)
+            self._take(self._overflow, calls)
+            for call in calls:
+                self.add(call)
+
+    def popDue(self, now: float) -> List["DelayedCall"]:
+        """
+        Advance the wheel to C{now} and remove every call which is due.
+
+        @param now: The current time, in seconds.
+
+        @return: The calls with a C{time} no later than C{now}, ordered by
+            C{time}.
+        """
+        target = self._tickFor(now)
+        tick = self._tick
+        mask = self._mask
+        counts = self._counts
+        level0 = self._levels[0]
+        due: List["DelayedCall"] = []
+        while True:
+            bucket = level0[tick & mask]
+            if bucket:
+                if tick < target:
+                    calls = list(bucket)
+                else:
+                    calls = [call for call in bucket if call.time <= now]
+                if calls:
+                    self._take(bucket, calls)
+                    due.extend(calls)
+            if tick >= target:
+                break
+            if counts[0]:
+                tick += 1
+                if not tick & mask:
+                    self._tick = tick
+                    self._cascade(tick)
+            else:
+                # Nothing can come due before the next non-empty level
+                # cascades, so skip straight to that point.
+                level = 1
+                while level < self._levelCount and not counts[level]:
+                    level += 1
+                shift = self._bits * level
+                boundary = ((tick >> shift) + 1) << shift
+                if boundary > target:
+                    tick = target
+                else:
+                    tick = self._tick = boundary
+                    self._cascade(tick)
+        self._tick = tick
+        self._earliest = None
+        due.sort(key=_byTime)
+        return due
+
+    def nextTime(self) -> Optional[float]:
+        """
+        Find a time at which L{TimerWheel.popDue} should next be called.
+
+        @return: A time no later than the C{time} of the earliest call in the
+            wheel, or L{None} if the wheel is empty.
+        """
+        if not self._length:
+            return None
+        if self._earliest is None:
+            self._earliest = self._computeEarliest()
+        return self._earliest
+
+    def _computeEarliest(self) -> float:
+        """
+        Compute a lower bound on the C{time} of the earliest call in a
+        non-empty wheel.
+        """
+        bits = self._bits
+        mask = self._mask
+        tick = self._tick
+        # Calls in a higher level may be due before those in a lower level,
+        # if they were placed when the current tick was further in the past.
+        # So look at the first non-empty bucket in every level.  In level 0
+        # that bucket holds calls for a single tick; in other levels, use the
+        # time at which it will be cascaded.
+        candidates = []
+        if self._counts[0]:
+            level0 = self._levels[0]
+            for offset in range(mask + 1):
+                bucket = level0[(tick + offset) & mask]
+                if bucket:
+                    candidates.append(min(call.time for call in bucket))
+                    break
+        for level in range(1, self._levelCount):
+            if not self._counts[level]:
+                continue
+            shift = bits * level
+            block = tick >> shift
+            buckets = self._levels[level]
+            for offset in range(1, mask + 2):
+                if buckets[(block + offset) & mask]:
+                    candidates.append(((block + offset) << shift) * self.resolution)
+                    break
+        if self._overflow:
+            # Overflow calls are redistributed when the wheel next wraps.
+            start = ((tick // self._span) + 1) * self._span
+            candidates.append(start * self.resolution)
+        return min(candidates)
@@ -7,12 +7,15 @@ Support for generic select()able objects.
 """
 
 
+import os
+from collections import deque
 from socket import AF_INET, AF_INET6, inet_pton
-from typing import Iterable, List, Optional
+from typing import Deque, Iterable, List, Optional, Sequence, Union
 
 from zope.interface import implementer
 
-from twisted.internet import interfaces, main
+from twisted.internet import error, interfaces, main
+from twisted.internet.defer import Deferred, fail
 from twisted.python import failure, reflect
 
 # Twisted Imports
@@ -30,6 +33,72 @@ def _concatenate(bObj, offset, bArray):
     return b"".join([memoryview(bObj)[offset:]] + bArray)
 
 
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    # POSIX only guarantees 16, but this is only used where sendmsg is
+    # available, and everywhere that has it allows at least 1024.
+    _IOV_MAX = 1024
+
+# Chunks shorter than this are joined together before being queued for a
+# vectored write: copying them is cheaper than having the kernel handle each
+# as a separate entry in the I/O vector.
+_SMALL_WRITE = 16 * 1024
+
+
+def _coalesce(chunks: List[bytes]) -> List[bytes]:
+    """
+    Join each run of consecutive small chunks into a single chunk, leaving
+    larger chunks alone.
+
+    @param chunks: The chunks of data to coalesce.
+
+    @return: The same data, in at most as many chunks.
+    """
+    if max(map(len, chunks)) < _SMALL_WRITE:
+        return [b"".join(chunks)]
+    result = []
+    run: List[bytes] = []
+    for chunk in chunks:
+        if len(chunk) < _SMALL_WRITE:
+            run.append(chunk)
+        else:
+            if run:
+                result.append(b"".join(run))
+                run = []
+            result.append(chunk)
+    if run:
+        result.append(b"".join(run))
+    return result
+
+
+class _FileRegion:
+    """
+    Part of a file, queued in L{FileDescriptor._writeQueue} to be sent with
+    L{FileDescriptor._writeSomeFile}.
+
+    @ivar fileno: The file descriptor of the file.
+
+    @ivar offset: The offset in the file of the next byte to send.
+
+    @ivar remaining: The number of bytes left to send.
+
+    @ivar count: The total number of bytes to send.
+
+    @ivar deferred: The L{Deferred} to fire with C{count} once all of the
+        bytes have been sent.
+    """
+
+    __slots__ = ("fileno", "offset", "remaining", "count", "deferred")
+
+    def __init__(self, fileno: int, offset: int, count: int) -> None:
+        self.fileno = fileno
+        self.offset = offset
+        self.remaining = count
+        self.count = count
+        self.deferred: Deferred[int] = Deferred()
+
+
 class _ConsumerMixin:
     """
     L{IConsumer} implementations can mix this in to get C{registerProducer} and
@@ -163,6 +232,16 @@ class FileDescriptor(_ConsumerMixin, _LogOwner):
     This is an abstract superclass of all objects which may be notified when
     they are readable or writable; e.g. they have a file-descriptor that is
     valid to be passed to select(2).
+
+    @cvar _vectoredWrites: If C{True}, L{doWrite} keeps the data waiting to
+        be written as a queue of separate chunks and sends several of them at
+        a time with L{_writeSomeVector}, instead of joining them into
+        C{dataBuffer} and sending that with L{writeSomeData}.
+
+    @ivar _writeQueue: The chunks of data waiting to be written, when
+        C{_vectoredWrites} is C{True}.
+
+    @ivar _writeQueueLen: The total length of the chunks in C{_writeQueue}.
     """
 
     connected = 0
@@ -175,6 +254,8 @@ class FileDescriptor(_ConsumerMixin, _LogOwner):
 
     SEND_LIMIT = 128 * 1024
 
+    _vectoredWrites = False
+
     def __init__(self, reactor: Optional[interfaces.IReactorFDSet] = None):
         """
         @param reactor: An L{IReactorFDSet} provider which this descriptor will
@@ -189,6 +270,8 @@ class FileDescriptor(_ConsumerMixin, _LogOwner):
         # will be added to dataBuffer in doWrite
         self._tempDataBuffer: List[bytes] = []
         self._tempDataLen = 0
+        self._writeQueue: Deque[Union[bytes, memoryview, _FileRegion]] = deque()
+        self._writeQueueLen = 0
 
     def connectionLost(self, reason):
         """The connection was lost.
@@ -202,6 +285,13 @@ class FileDescriptor(_ConsumerMixin, _LogOwner):
         """
         self.disconnected = 1
         self.connected = 0
+        if self._writeQueue:
+            regions = [
+                chunk for chunk in self._writeQueue if chunk.__class__ is _FileRegion
+            ]
+            for region in regions:
+                self._writeQueue.remove(region)
+                region.deferred.errback(reason)
         if self.producer is not None:
             self.producer.stopProducing()
             self.producer = None
@@ -222,6 +312,24 @@ class FileDescriptor(_ConsumerMixin, _LogOwner):
             "%s does not implement writeSomeData" % reflect.qual(self.__class__)
         )
 
+    def _writeSomeVector(self, vector: Sequence[Union[bytes, memoryview]]) -> int:
+        """
+        Write as much as possible of the given chunks of data, in order,
+        immediately.
+
+        This is used instead of L{writeSomeData} when C{_vectoredWrites} is
+        C{True}.  Subclasses which enable that should override it to hand the
+        chunks to something like C{sendmsg} or C{writev}, which can write them
+        all without first copying them into one buffer; this implementation
+        joins them and calls L{writeSomeData}.
+
+        @param vector: The chunks of data to write.
+
+        @return: The total number of bytes written, or an exception, as for
+            L{writeSomeData}.
+        """
+        return self.writeSomeData(b"".join(vector))
+
     def doRead(self):
         """
         Called when data is available for reading.
@@ -242,6 +350,8 @@ class FileDescriptor(_ConsumerMixin, _LogOwner):
 
         @see: L{twisted.internet.interfaces.IWriteDescriptor.doWrite}.
         """
+        if self._vectoredWrites:
+            return self._doWriteVector()
         if len(self.dataBuffer) - self.offset < self.SEND_LIMIT:
             # If there is currently less than SEND_LIMIT bytes left to send
             # in the string, extend it with the array data.
@@ -269,27 +379,154 @@ class FileDescriptor(_ConsumerMixin, _LogOwner):
         if self.offset == len(self.dataBuffer) and not self._tempDataLen:
             self.dataBuffer = b""
             self.offset = 0
-            # stop writing.
-            self.stopWriting()
-            # If I've got a producer who is supposed to supply me with data,
-            if self.producer is not None and (
-                (not self.streamingProducer) or self.producerPaused
-            ):
-                # tell them to supply some more.
-                self.producerPaused = False
-                self.producer.resumeProducing()
-            elif self.disconnecting:
-                # But if I was previously asked to let the connection die, do
-                # so.
-                return self._postLoseConnection()
-            elif self._writeDisconnecting:
-                # I was previously asked to half-close the connection.  We
-                # set _writeDisconnected before calling handler, in case the
-                # handler calls loseConnection(), which will want to check for
-                # this attribute.
-                self._writeDisconnected = True
-                result = self._closeWriteConnection()
-                return result
+            return self._writeBufferEmptied()
+        return None
+
+    def _doWriteVector(self):
+        """
+        Like L{doWrite}, but write several queued chunks at once with
+        L{_writeSomeVector}, without joining them.
+        """
+        queue = self._writeQueue
+        if self._tempDataBuffer:
+            self._queueTempData()
+        if queue and queue[0].__class__ is _FileRegion:
+            return self._doWriteFile(queue[0])
+
+        # Send as much data as you can, but no more than SEND_LIMIT bytes or
+        # _IOV_MAX chunks at a time, and nothing after a file.
+        vector = []
+        size = 0
+        for chunk in queue:
+            if chunk.__class__ is _FileRegion:
+                break
+            vector.append(chunk)
+            size += len(chunk)
+            if size >= self.SEND_LIMIT or len(vector) == _IOV_MAX:
+                break
+        l = self._writeSomeVector(vector)
+
+        if isinstance(l, Exception) or l < 0:
+            return l
+        self._writeQueueLen -= l
+        # Drop the chunks which were written completely, and the written part
+        # of the first one which was not.
+        while l:
+            chunk = queue[0]
+            if l < len(chunk):
+                queue[0] = memoryview(chunk)[l:]
+                break
+            queue.popleft()
+            l -= len(chunk)
+        # If there is nothing left to send,
+        if not queue and not self._tempDataLen:
+            return self._writeBufferEmptied()
+        return None
+
+    def _queueTempData(self):
+        """
+        Move the data in C{_tempDataBuffer} to the end of C{_writeQueue}.
+        """
+        self._writeQueue.extend(_coalesce(self._tempDataBuffer))
+        self._writeQueueLen += self._tempDataLen
+        self._tempDataBuffer = []
+        self._tempDataLen = 0
+
+    def _writeFile(self, fileno: int, offset: int, count: int) -> Deferred[int]:
+        """
+        Queue part of a file to be sent with L{_writeSomeFile}, after all of
+        the data already written.  This is only supported when
+        C{_vectoredWrites} is C{True}.
+
+        @param fileno: The file descriptor of the file.
+
+        @param offset: The offset in the file of the first byte to send.
+
+        @param count: The number of bytes to send.
+
+        @return: A L{Deferred} which fires with C{count} once all of the bytes
+            have been sent, or fails with the reason the connection was lost
+            if that happens first.
+        """
+        if not self.connected or self._writeDisconnected:
+            return fail(error.ConnectionDone())
+        region = _FileRegion(fileno, offset, count)
+        if not count:
+            region.deferred.callback(0)
+            return region.deferred
+        if self._tempDataBuffer:
+            self._queueTempData()
+        self._writeQueue.append(region)
+        self.startWriting()
+        return region.deferred
+
+    def _writeSomeFile(self, fileno: int, offset: int, count: int) -> int:
+        """
+        Write as much as possible of part of a file, immediately.
+
+        Subclasses which can send files should override this.
+
+        @param fileno: The file descriptor of the file.
+
+        @param offset: The offset in the file of the first byte to send.
+
+        @param count: The number of bytes to send.
+
+        @return: The number of bytes written, or an exception, as for
+            L{writeSomeData}.
+        """
+        raise NotImplementedError(
+            "%s does not implement _writeSomeFile" % reflect.qual(self.__class__)
+        )
+
+    def _doWriteFile(self, region):
+        """
+        Like L{doWrite}, but send part of a file which has reached the front
+        of C{_writeQueue}.
+
+        @param region: The L{_FileRegion} at the front of the queue.
+        """
+        l = self._writeSomeFile(region.fileno, region.offset, region.remaining)
+        if isinstance(l, Exception) or l < 0:
+            return l
+        region.offset += l
+        region.remaining -= l
+        if region.remaining:
+            return None
+        self._writeQueue.popleft()
+        region.deferred.callback(region.count)
+        # If there is nothing left to send,
+        if not self._writeQueue and not self._tempDataLen:
+            return self._writeBufferEmptied()
+        return None
+
+    def _writeBufferEmptied(self):
+        """
+        Called by L{doWrite} when all of the buffered data has been written.
+
+        @return: The value for L{doWrite} to return.
+        """
+        # stop writing.
+        self.stopWriting()
+        # If I've got a producer who is supposed to supply me with data,
+        if self.producer is not None and (
+            (not self.streamingProducer) or self.producerPaused
+        ):
+            # tell them to supply some more.
+            self.producerPaused = False
+            self.producer.resumeProducing()
+        elif self.disconnecting:
+            # But if I was previously asked to let the connection die, do
+            # so.
+            return self._postLoseConnection()
+        elif self._writeDisconnecting:
+            # I was previously asked to half-close the connection.  We
+            # set _writeDisconnected before calling handler, in case the
+            # handler calls loseConnection(), which will want to check for
+            # this attribute.
+            self._writeDisconnected = True
+            result = self._closeWriteConnection()
+            return result
         return None
 
     def _postLoseConnection(self):
@@ -331,7 +568,10 @@ class FileDescriptor(_ConsumerMixin, _LogOwner):
 
         @return: C{True} if it is full, C{False} otherwise.
         """
-        return len(self.dataBuffer) + self._tempDataLen > self.bufferSize
+        return (
+            len(self.dataBuffer) + self._writeQueueLen + self._tempDataLen
+            > self.bufferSize
+        )
 
     def _maybePauseProducer(self):
         """
@@ -366,13 +606,13 @@ class FileDescriptor(_ConsumerMixin, _LogOwner):
         """
         Reliably write a sequence of data.
 
-        Currently, this is a convenience method roughly equivalent to::
+        This is roughly equivalent to::
 
             for chunk in iovec:
                 fd.write(chunk)
 
-        It may have a more efficient implementation at a later time or in a
-        different reactor.
+        but when C{_vectoredWrites} is set, large chunks are then sent as
+        they are, without being copied into a single buffer first.
 
         As with the C{write()} method, if a buffer size limit is reached and a
         streaming producer is registered, it will be paused until the buffered
@@ -383,8 +623,7 @@ class FileDescriptor(_ConsumerMixin, _LogOwner):
         if not self.connected or not iovec or self._writeDisconnected:
             return
         self._tempDataBuffer.extend(iovec)
-        for i in iovec:
-            self._tempDataLen += len(i)
+        self._tempDataLen += sum(map(len, iovec))
         self._maybePauseProducer()
         self.startWriting()
 
@@ -60,6 +60,7 @@ from twisted.python import log, reflect
 from twisted.python.failure import Failure
 from twisted.python.runtime import platform, seconds as runtimeSeconds
 from ._signals import SignalHandling, _WithoutSignalHandling, _WithSignalHandling
+from ._timerwheel import TimerWheel
 
 if TYPE_CHECKING:
     from twisted.internet.tcp import Client
@@ -84,6 +85,11 @@ class DelayedCall:
     # In debug mode, the call stack at the time of instantiation.
     creator: Optional[Sequence[str]] = None
 
+    # The bucket holding this call and the level of that bucket, while this
+    # call is scheduled in a reactor's TimerWheel.
+    _timerWheelBucket: Optional[Dict["DelayedCall", None]] = None
+    _timerWheelLevel = 0
+
     def __init__(
         self,
         time: float,
@@ -610,6 +616,14 @@ class ReactorBase(PluggableResolverMixin):
     usingThreads = False
     _exitSignal = None
 
+    # The timer wheel holding timed calls, if useTimerWheel has been called.
+    # Otherwise, timed calls are kept in the _pendingTimedCalls heap.
+    _timerWheel: Optional[TimerWheel] = None
+
+    # The calls taken from the timer wheel by the current runUntilCurrent
+    # which may not have been run yet.
+    _dueTimedCalls: Sequence[DelayedCall] = ()
+
     # Set to something meaningful between startRunning and shortly before run
     # returns.  We don't know the value to be used by `run` until that method
     # itself is called and we learn the value of installSignalHandlers.
@@ -975,10 +989,45 @@ class ReactorBase(PluggableResolverMixin):
             self._moveCallLaterSooner,
             seconds=self.seconds,
         )
-        self._newTimedCalls.append(delayedCall)
+        if self._timerWheel is not None:
+            self._timerWheel.add(delayedCall)
+        else:
+            self._newTimedCalls.append(delayedCall)
         return delayedCall
 
+    def useTimerWheel(self, resolution: float = 0.001) -> None:
+        """
+        Keep timed calls in a hierarchical timer wheel rather than a heap.
+
+        With a timer wheel, scheduling, cancelling, and rescheduling a
+        L{DelayedCall} take constant time regardless of how many calls are
+        pending, at the cost of a little bookkeeping each time the reactor
+        wakes up.  This suits programs which keep a very large number of
+        timeouts which are usually cancelled or reset before they fire.
+
+        Calls which are already pending are moved into the wheel.  Calls
+        still fire in order of their scheduled time, and no earlier than
+        that time.
+
+        @param resolution: The granularity, in seconds, with which the wheel
+            divides time.  It does not affect when calls fire, only how the
+            wheel's buckets are laid out.
+        """
+        if self._timerWheel is not None:
+            return
+        wheel = TimerWheel(self.seconds(), resolution)
+        for call in self._pendingTimedCalls + self._newTimedCalls:
+            if not call.cancelled:
+                wheel.add(call)
+        self._pendingTimedCalls = []
+        self._newTimedCalls = []
+        self._cancellations = 0
+        self._timerWheel = wheel
+
     def _moveCallLaterSooner(self, delayedCall: DelayedCall) -> None:
+        if self._timerWheel is not None:
+            self._timerWheel.reschedule(delayedCall)
+            return
         # Linear time find: slow.
         heap = self._pendingTimedCalls
         try:
@@ -999,12 +1048,21 @@ class ReactorBase(PluggableResolverMixin):
             pass
 
     def _cancelCallLater(self, delayedCall: DelayedCall) -> None:
-        self._cancellations += 1
+        if self._timerWheel is not None:
+            self._timerWheel.remove(delayedCall)
+        else:
+            self._cancellations += 1
 
     def getDelayedCalls(self) -> Sequence[IDelayedCall]:
         """
         See L{twisted.internet.interfaces.IReactorTime.getDelayedCalls}
         """
+        if self._timerWheel is not None:
+            return list(self._timerWheel) + [
+                x
+                for x in self._dueTimedCalls
+                if x.active() and x._timerWheelBucket is None
+            ]
         return [
             x
             for x in (self._pendingTimedCalls + self._newTimedCalls)
@@ -1028,13 +1086,20 @@ class ReactorBase(PluggableResolverMixin):
 
         @return: The maximum number of seconds the reactor may sleep.
         """
-        # insert new delayed calls to make sure to include them in timeout value
-        self._insertNewDelayedCalls()
+        if self._timerWheel is not None:
+            nextTime = self._timerWheel.nextTime()
+            if nextTime is None:
+                return None
+            delay = nextTime - self.seconds()
+        else:
+            # insert new delayed calls to make sure to include them in timeout
+            # value
+            self._insertNewDelayedCalls()
 
-        if not self._pendingTimedCalls:
-            return None
+            if not self._pendingTimedCalls:
+                return None
 
-        delay = self._pendingTimedCalls[0].time - self.seconds()
+            delay = self._pendingTimedCalls[0].time - self.seconds()
 
         # Pick a somewhat arbitrary maximum possible value for the timeout.
         # This value is 2 ** 31 / 1000, which is the number of seconds which can
@@ -1048,28 +1113,30 @@ class ReactorBase(PluggableResolverMixin):
         # maximum (platform-imposed) interval.
         return max(0, min(longest, delay))
 
-    def runUntilCurrent(self) -> None:
+    def _runDelayedCall(self, call: DelayedCall) -> None:
         """
-        Run all pending timed calls.
+        Run a timed call which has come due, logging any exception it raises.
         """
-        if self.threadCallQueue:
-            # Keep track of how many calls we actually make, as we're
-            # making them, in case another call is added to the queue
-            # while we're in this loop.
-            count = 0
-            total = len(self.threadCallQueue)
-            for f, a, kw in self.threadCallQueue:
-                try:
-                    f(*a, **kw)
-                except BaseException:
-                    log.err()
-                count += 1
-                if count == total:
-                    break
-            del self.threadCallQueue[:count]
-            if self.threadCallQueue:
-                self.wakeUp()
+        try:
+            call.called = 1
+            call.func(*call.args, **call.kw)
+        except BaseException:
+            log.err()
+            if call.creator is not None:
+                e = "\n"
+                e += (
+                    " C: previous exception occurred in "
+                    + "a DelayedCall created here:\n"
+                )
+                e += " C:"
+                e += "".join(call.creator).rstrip().replace("\n", "\n C:")
+                e += "\n"
+                log.msg(e)
 
+    def _runTimedCallsHeap(self) -> None:
+        """
+        Run the timed calls in C{_pendingTimedCalls} which have come due.
+        """
         # insert new delayed calls now
         self._insertNewDelayedCalls()
 
@@ -1085,21 +1152,7 @@ class ReactorBase(PluggableResolverMixin):
                 heappush(self._pendingTimedCalls, call)
                 continue
 
-            try:
-                call.called = 1
-                call.func(*call.args, **call.kw)
-            except BaseException:
-                log.err()
-                if call.creator is not None:
-                    e = "\n"
-                    e += (
-                        " C: previous exception occurred in "
-                        + "a DelayedCall created here:\n"
-                    )
-                    e += " C:"
-                    e += "".join(call.creator).rstrip().replace("\n", "\n C:")
-                    e += "\n"
-                    log.msg(e)
+            self._runDelayedCall(call)
 
         if (
             self._cancellations > 50
@@ -1111,6 +1164,54 @@ class ReactorBase(PluggableResolverMixin):
             ]
             heapify(self._pendingTimedCalls)
 
+    def _runTimerWheel(self, wheel: TimerWheel) -> None:
+        """
+        Run the timed calls in a timer wheel which have come due.
+        """
+        self._dueTimedCalls = due = wheel.popDue(self.seconds())
+        try:
+            for call in due:
+                # An earlier call in this batch may have cancelled this one, or
+                # rescheduled it back into the wheel.
+                if call.cancelled or call._timerWheelBucket is not None:
+                    continue
+
+                if call.delayed_time > 0.0:
+                    call.activate_delay()
+                    wheel.add(call)
+                    continue
+
+                self._runDelayedCall(call)
+        finally:
+            self._dueTimedCalls = ()
+
+    def runUntilCurrent(self) -> None:
+        """
+        Run all pending timed calls.
+        """
+        if self.threadCallQueue:
+            # Keep track of how many calls we actually make, as we're
+            # making them, in case another call is added to the queue
+            # while we're in this loop.
+            count = 0
+            total = len(self.threadCallQueue)
+            for f, a, kw in self.threadCallQueue:
+                try:
+                    f(*a, **kw)
+                except BaseException:
+                    log.err()
+                count += 1
+                if count == total:
+                    break
+            del self.threadCallQueue[:count]
+            if self.threadCallQueue:
+                self.wakeUp()
+
+        if self._timerWheel is not None:
+            self._runTimerWheel(self._timerWheel)
+        else:
+            self._runTimedCallsHeap()
+
         if self._justStopped:
             self._justStopped = False
             self.fireSystemEvent("shutdown")
@@ -14,6 +14,7 @@ import traceback
 import warnings
 from abc import ABC, abstractmethod
 from asyncio import AbstractEventLoop, Future, iscoroutine
+from collections import deque
 from contextvars import Context as _Context, copy_context as _copy_context
 from enum import Enum
 from functools import wraps
@@ -22,9 +23,13 @@ from types import CoroutineType, GeneratorType, MappingProxyType, TracebackType
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterable,
+    AsyncIterator,
     Awaitable,
     Callable,
     Coroutine,
+    Deque,
+    Dict,
     Generator,
     Generic,
     Iterable,
@@ -339,6 +344,11 @@ _CallbackChain = Tuple[
 
 _NONE_KWARGS: _CallbackKeywordArguments = MappingProxyType({})
 
+# The chain entries for the errback added by Deferred.addCallback and the
+# callback added by Deferred.addErrback, shared by every Deferred.
+_FAILTHRU_ENTRY = (_failthru, (), _NONE_KWARGS)
+_PASSTHRU_ENTRY = (passthru, (), _NONE_KWARGS)
+
 
 _SelfResultT = TypeVar("_SelfResultT")
 _NextResultT = TypeVar("_NextResultT")
@@ -423,21 +433,37 @@ class Deferred(Awaitable[_SelfResultT]):
         L{None}.
     """
 
-    called = False
-    paused = 0
+    # Deferreds are created in very large numbers, so the attributes which
+    # every one of them uses are kept in slots.  Rarely set attributes keep
+    # class defaults and, like anything else code sets on an individual
+    # instance (such as debug), go in its __dict__ if they are set.
+    __slots__ = (
+        "callbacks",
+        "result",
+        "called",
+        "paused",
+        "_canceller",
+        "_runningCallbacks",
+        "_chainedTo",
+        "__dict__",
+        "__weakref__",
+    )
+
+    called: bool
+    paused: int
     _debugInfo: Optional[DebugInfo] = None
     _suppressAlreadyCalled = False
 
     # Are we currently running a user-installed callback?  Meant to prevent
     # recursive running of callbacks when a reentrant call to add a callback is
     # used.
-    _runningCallbacks = False
+    _runningCallbacks: bool
 
     # Keep this class attribute for now, for compatibility with code that
     # sets it directly.
     debug = False
 
-    _chainedTo: "Optional[Deferred[Any]]" = None
+    _chainedTo: "Optional[Deferred[Any]]"
 
     def __init__(
         self, canceller: Optional[Callable[["Deferred[Any]"], None]] = None
@@ -467,6 +493,10 @@ class Deferred(Awaitable[_SelfResultT]):
         """
         self.callbacks: List[_CallbackChain] = []
         self._canceller = canceller
+        self.called = False
+        self.paused = 0
+        self._runningCallbacks = False
+        self._chainedTo = None
         if self.debug:
             self._debugInfo = DebugInfo()
             self._debugInfo.creator = traceback.format_stack()[:-1]
@@ -617,7 +647,16 @@ class Deferred(Awaitable[_SelfResultT]):
         # Implementation Note: Any annotations for brevity; the overloads above
         # handle specifying the actual signature, and there's nothing worth
         # type-checking in this implementation.
-        return self.addCallbacks(callback, callbackArgs=args, callbackKeywords=kwargs)
+
+        # This is by far the most common way of adding to the chain, so it
+        # appends directly rather than going through addCallbacks, and shares
+        # one errback entry.
+        self.callbacks.append(
+            ((callback, args, kwargs or _NONE_KWARGS), _FAILTHRU_ENTRY)
+        )
+        if self.called:
+            self._runCallbacks()
+        return self
 
     @overload
     def addErrback(
@@ -653,9 +692,12 @@ class Deferred(Awaitable[_SelfResultT]):
         See L{addCallbacks}.
         """
         # See implementation note in addCallbacks about Any arguments
-        return self.addCallbacks(
-            passthru, errback, errbackArgs=args, errbackKeywords=kwargs
+        self.callbacks.append(
+            (_PASSTHRU_ENTRY, (errback, args, kwargs or _NONE_KWARGS))
         )
+        if self.called:
+            self._runCallbacks()
+        return self
 
     @overload
     def addBoth(
@@ -1071,9 +1113,16 @@ class Deferred(Awaitable[_SelfResultT]):
                         #    instead, but we don't want to do that attribute
                         #    lookup in this hot code path, so we ignore the mypy
                         #    complaint here.
-                        current.result = callback(  # type: ignore[misc]
-                            current.result, *args, **kwargs
-                        )
+                        if args or kwargs:
+                            current.result = callback(  # type: ignore[misc]
+                                current.result, *args, **kwargs
+                            )
+                        else:
+                            # Most callbacks take no extra arguments; calling
+                            # them directly avoids building new ones.
+                            current.result = callback(  # type: ignore[misc]
+                                current.result
+                            )
 
                         if current.result is current:
                             warnAboutFunction(
@@ -1710,6 +1759,316 @@ def race(ds: Sequence[Deferred[_T]]) -> Deferred[tuple[int, _T]]:
     return final_result
 
 
+class _DeferredMap(Generic[_T]):
+    """
+    The asynchronous iterator returned by L{deferredMap}.
+
+    A slot is taken when an operation is started and given back when its
+    result is taken by the consumer, so at most C{concurrency} results are
+    either being computed or waiting to be consumed at any time.
+
+    @ivar _source: The iterator, or asynchronous iterator, of arguments.
+    @ivar _isAsync: Whether C{_source} is an asynchronous iterator.
+    @ivar _free: The number of operations which may still be started.
+    @ivar _started: The number of operations started so far, which is also
+        the index of the next one.
+    @ivar _running: The L{Deferred}s of operations which have not completed,
+        by index.
+    @ivar _pulling: The L{Deferred} for the next item of an asynchronous
+        C{_source}, if one has been asked for and has not arrived yet.
+    @ivar _results: The results of completed operations which have not been
+        consumed yet, by index, when C{ordered}.
+    @ivar _completed: The same, in the order they completed, when not
+        C{ordered}.
+    @ivar _nextIndex: The index of the next result to consume, when
+        C{ordered}.
+    @ivar _waiting: The L{Deferred}s returned by C{__anext__} which have not
+        been given a result yet.
+    @ivar _exhausted: Whether no more operations will be started, because
+        C{_source} is exhausted, an operation has failed or iteration was
+        stopped.
+    @ivar _stopped: Whether iteration was stopped, by L{_DeferredMap.cancel}
+        or by giving the consumer a failure.
+    @ivar _pumping: Whether L{_DeferredMap._pump} is running, so that
+        re-entering it only has it go round again.
+    """
+
+    def __init__(
+        self,
+        f: Callable[[Any], object],
+        iterable: Union[Iterable[Any], AsyncIterable[Any]],
+        concurrency: int,
+        ordered: bool,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("deferredMap requires concurrency >= 1")
+        self._f = f
+        self._isAsync = isinstance(iterable, AsyncIterable)
+        if self._isAsync:
+            self._source: Any = cast(AsyncIterable[Any], iterable).__aiter__()
+        else:
+            self._source = iter(cast(Iterable[Any], iterable))
+        self._ordered = ordered
+        self._free = concurrency
+        self._started = 0
+        self._running: Dict[int, Deferred[Any]] = {}
+        self._pulling: Optional[Deferred[Any]] = None
+        self._results: Dict[int, Union[_T, Failure]] = {}
+        self._completed: Deque[Union[_T, Failure]] = deque()
+        self._nextIndex = 0
+        self._waiting: Deque[Deferred[_T]] = deque()
+        self._exhausted = False
+        self._stopped = False
+        self._pumping = False
+        self._pumpAgain = False
+        self._pump()
+
+    def __aiter__(self) -> _DeferredMap[_T]:
+        return self
+
+    def __anext__(self) -> Deferred[_T]:
+        """
+        Get the next result.
+
+        @return: A L{Deferred} which fires with the next result, or fails
+            with the failure of the operation in its place, or with
+            L{StopAsyncIteration} when there are no more results.  Cancelling
+            it cancels the whole iteration, as L{_DeferredMap.cancel} does.
+        """
+        d: Deferred[_T] = Deferred(self._cancelNext)
+        self._waiting.append(d)
+        self._pump()
+        return d
+
+    def cancel(self) -> None:
+        """
+        Stop the iteration: start no more operations, cancel those which are
+        running, discard results which have not been consumed and fail every
+        L{Deferred} waiting for a result with L{CancelledError}.  Any later
+        C{__anext__} fails with L{StopAsyncIteration}.
+        """
+        self._stop()
+        while self._waiting:
+            self._waiting.popleft().errback(CancelledError())
+
+    def _cancelNext(self, d: Deferred[_T]) -> None:
+        """
+        Cancel the whole iteration when a L{Deferred} returned by
+        C{__anext__} is cancelled.
+        """
+        self.cancel()
+
+    def _stop(self) -> None:
+        """
+        Start no more operations, cancel those which are running and discard
+        the results which have not been consumed.
+        """
+        self._exhausted = True
+        self._stopped = True
+        self._results.clear()
+        self._completed.clear()
+        running = list(self._running.values())
+        self._running.clear()
+        for d in running:
+            d.cancel()
+        if self._pulling is not None:
+            pulling, self._pulling = self._pulling, None
+            pulling.cancel()
+
+    def _pump(self) -> None:
+        """
+        Give results to waiting consumers and start operations until neither
+        can make progress.
+
+        Operations completing and consumers asking for more while this runs
+        only make it go round again, which keeps the stack flat however many
+        operations complete synchronously.
+        """
+        if self._pumping:
+            self._pumpAgain = True
+            return
+        self._pumping = True
+        try:
+            self._pumpAgain = True
+            while self._pumpAgain:
+                self._pumpAgain = False
+                self._deliver()
+                self._startOperations()
+        finally:
+            self._pumping = False
+
+    def _deliver(self) -> None:
+        """
+        Give available results to waiting consumers, and tell them when there
+        will be no more.
+        """
+        while self._waiting:
+            result: Union[_T, Failure]
+            if self._ordered:
+                if self._nextIndex not in self._results:
+                    break
+                result = self._results.pop(self._nextIndex)
+                self._nextIndex += 1
+            elif self._completed:
+                result = self._completed.popleft()
+            else:
+                break
+            self._free += 1
+            if isinstance(result, Failure):
+                self._stop()
+                self._waiting.popleft().errback(result)
+            else:
+                self._waiting.popleft().callback(result)
+        if (
+            self._exhausted
+            and self._pulling is None
+            and not self._running
+            and not self._results
+            and not self._completed
+        ):
+            while self._waiting:
+                self._waiting.popleft().errback(StopAsyncIteration())
+
+    def _startOperations(self) -> None:
+        """
+        Start operations on the next items from the source while there are
+        free slots.
+        """
+        while self._free and not self._exhausted and self._pulling is None:
+            if self._isAsync:
+                pulling = Deferred.fromCoroutine(_nextAsync(self._source))
+                if not pulling.called:
+                    self._pulling = pulling
+                pulling.addCallbacks(self._pulled, self._pullFailed)
+                continue
+            try:
+                item = next(self._source)
+            except StopIteration:
+                self._exhausted = True
+            except BaseException:
+                self._sourceFailed(Failure())
+            else:
+                self._start(item)
+
+    def _pulled(self, item: object) -> None:
+        """
+        Start an operation on an item from an asynchronous source.
+        """
+        if self._stopped:
+            return
+        self._pulling = None
+        self._start(item)
+        self._pump()
+
+    def _pullFailed(self, reason: Failure) -> None:
+        """
+        Stop at the end of an asynchronous source, or when getting an item from
+        it failed.
+        """
+        if self._stopped:
+            return
+        self._pulling = None
+        if reason.check(StopAsyncIteration):
+            self._exhausted = True
+        else:
+            self._sourceFailed(reason)
+        self._pump()
+
+    def _sourceFailed(self, reason: Failure) -> None:
+        """
+        Give the failure to get an item from the source to the consumer in
+        place of a result, and start no more operations.
+        """
+        self._exhausted = True
+        self._free -= 1
+        if self._ordered:
+            self._results[self._started] = reason
+        else:
+            self._completed.append(reason)
+        self._started += 1
+
+    def _start(self, item: object) -> None:
+        """
+        Start the operation on one item.
+        """
+        self._free -= 1
+        index = self._started
+        self._started += 1
+        d = maybeDeferred(self._f, item)
+        if not d.called:
+            self._running[index] = d
+        d.addBoth(self._finished, index)
+
+    def _finished(self, result: Union[_T, Failure], index: int) -> None:
+        """
+        Keep the result of an operation for the consumer.
+        """
+        if self._stopped:
+            # Cancelled by _stop, and nobody wants the result any more.
+            return
+        self._running.pop(index, None)
+        if isinstance(result, Failure):
+            # Start no more operations once one fails.
+            self._exhausted = True
+        if self._ordered:
+            self._results[index] = result
+        else:
+            self._completed.append(result)
+        self._pump()
+
+
+async def _nextAsync(iterator: AsyncIterator[_T]) -> _T:
+    """
+    Get the next item from an asynchronous iterator, whatever kind of
+    awaitable its C{__anext__} returns.
+    """
+    return await iterator.__anext__()
+
+
+def deferredMap(
+    f: Callable[[Any], Union[Deferred[_T], Coroutine[Deferred[Any], Any, _T], _T]],
+    iterable: Union[Iterable[Any], AsyncIterable[Any]],
+    concurrency: int,
+    ordered: bool = True,
+) -> _DeferredMap[_T]:
+    """
+    Call a function on each item of an iterable, with a bounded number of
+    calls in progress at once, and iterate asynchronously over the results::
+
+        async def fetchAll(agent, urls):
+            async for response in deferredMap(
+                lambda url: agent.request(b"GET", url), urls, concurrency=50
+            ):
+                ...
+
+    Unlike L{gatherResults}, items are taken from C{iterable} only as there is
+    room for another call, so it may be a generator of any length.  A call
+    keeps its place until its result has been consumed, so a slow consumer
+    holds up new calls rather than letting results pile up.
+
+    @param f: The function to call with each item.  It may return a
+        L{Deferred}, a coroutine or a plain value, as for L{maybeDeferred}.
+
+    @param iterable: The items, as an iterable or an asynchronous iterable.
+
+    @param concurrency: At most this many calls may be in progress, or have
+        results which have not been consumed yet, at once.
+
+    @param ordered: If C{True}, give the results in the order of the items.
+        Otherwise, give them in the order the calls complete.
+
+    @raise ValueError: If C{concurrency} is less than 1.
+
+    @return: An asynchronous iterator whose C{__anext__} returns a L{Deferred}
+        for the next result.  If a call fails, its failure is given in place
+        of its result and the iteration ends there: no more calls are made
+        and those in progress are cancelled.  Cancelling a L{Deferred} from
+        C{__anext__}, or calling the iterator's C{cancel} method, does the
+        same.
+    """
+    return _DeferredMap(f, iterable, concurrency, ordered)
+
+
 # Constants for use with DeferredList
 SUCCESS = True
 FAILURE = False
@@ -1912,15 +2271,24 @@ class _CancellationStatus(Generic[_SelfResultT]):
         invocation has finished.
     @ivar waitingOn: the L{Deferred} being waited upon (which
         L{_inlineCallbacks} must fill out before returning)
+    @ivar waiting: Whether L{_inlineCallbacks} is still waiting for the
+        result of the L{Deferred} it has just added C{resume} to.
+    @ivar result: That result, if it arrived while L{_inlineCallbacks} was
+        still waiting for it.
+    @ivar resume: The callback and errback pair which resumes the generator,
+        added to each L{Deferred} it yields.  It is made once for the whole
+        invocation rather than by L{Deferred.addBoth} for each yield.
     """
 
     deferred: Deferred[_SelfResultT]
     waitingOn: Optional[Deferred[_SelfResultT]] = None
+    waiting: bool = True
+    result: object = None
+    resume: Optional[_CallbackChain] = None
 
 
 def _gotResultInlineCallbacks(
     r: object,
-    waiting: List[Any],
     gen: Union[
         Generator[Deferred[Any], Any, _T],
         Coroutine[Deferred[Any], Any, _T],
@@ -1932,15 +2300,14 @@ def _gotResultInlineCallbacks(
     Helper for L{_inlineCallbacks} to handle a nested L{Deferred} firing.
 
     @param r: The result of the L{Deferred}
-    @param waiting: Whether the L{_inlineCallbacks} was waiting, and the result.
     @param gen: a generator object returned by calling a function or method
         decorated with C{@}L{inlineCallbacks}
     @param status: a L{_CancellationStatus} tracking the current status of C{gen}
     @param context: the contextvars context to run `gen` in
     """
-    if waiting[0]:
-        waiting[0] = False
-        waiting[1] = r
+    if status.waiting:
+        status.waiting = False
+        status.result = r
     else:
         _inlineCallbacks(r, gen, status, context)
 
@@ -1977,11 +2344,11 @@ def _inlineCallbacks(
     """
     # This function is complicated by the need to prevent unbounded recursion
     # arising from repeatedly yielding immediately ready deferreds.  This while
-    # loop and the waiting variable solve that by manually unfolding the
+    # loop and status.waiting solve that by manually unfolding the
     # recursion.
 
-    # waiting for result?  # result
-    waiting: List[Any] = [True, None]
+    status.waiting = True
+    status.result = None
 
     stopIteration: bool = False
     callbackValue: Any = None
@@ -2076,10 +2443,13 @@ def _inlineCallbacks(
             callbackValue = e.value
 
         except BaseException:
+            # Break the reference cycle through status.resume.
+            status.resume = None
             status.deferred.errback()
             return
 
         if stopIteration:
+            status.resume = None
             # Call the callback outside of the exception handler to avoid inappropriate/confusing
             # "During handling of the above exception, another exception occurred:" if the callback
             # itself throws an exception.
@@ -2088,22 +2458,47 @@ def _inlineCallbacks(
 
         if isinstance(result, Deferred):
             # a deferred was yielded, get the result.
-            result.addBoth(_gotResultInlineCallbacks, waiting, gen, status, context)
-            if waiting[0]:
+            if (
+                result.called
+                and not result.paused
+                and not result.callbacks
+                and not result._runningCallbacks
+            ):
+                # It already has a result and nothing else to do with it, so
+                # take that result and resume the generator straight away, as
+                # adding _gotResultInlineCallbacks to its callbacks would.
+                awaited = result
+                result = awaited.result
+                awaited.result = None
+                if awaited._debugInfo is not None:
+                    awaited._debugInfo.failResult = None
+                continue
+
+            if status.resume is None:
+                resume = (
+                    _gotResultInlineCallbacks,
+                    (gen, status, context),
+                    _NONE_KWARGS,
+                )
+                status.resume = (resume, resume)
+            result.callbacks.append(status.resume)
+            if result.called:
+                result._runCallbacks()
+            if status.waiting:
                 # Haven't called back yet, set flag so that we get reinvoked
                 # and return from the loop
-                waiting[0] = False
+                status.waiting = False
                 status.waitingOn = result
                 return
 
-            result = waiting[1]
+            result = status.result
             # Reset waiting to initial values for next loop.  gotResult uses
             # waiting, but this isn't a problem because gotResult is only
             # executed once, and if it hasn't been executed yet, the return
             # branch above would have been taken.
 
-            waiting[0] = True
-            waiting[1] = None
+            status.waiting = True
+            status.result = None
 
 
 def _addCancelCallbackToDeferred(
@@ -2682,6 +3077,7 @@ __all__ = [
     "AlreadyCalledError",
     "TimeoutError",
     "gatherResults",
+    "deferredMap",
     "maybeDeferred",
     "ensureDeferred",
     "waitForDeferred",
@@ -20,7 +20,7 @@ import warnings
 from typing import Optional, Sequence, Type
 from unicodedata import normalize
 
-from zope.interface import directlyProvides, implementer, provider
+from zope.interface import alsoProvides, implementer, provider
 
 from constantly import NamedConstant, Names
 from incremental import Version
@@ -124,9 +124,10 @@ class _WrappingProtocol(Protocol):
             interfaces.IHalfCloseableProtocol,
             interfaces.IFileDescriptorReceiver,
             interfaces.IHandshakeListener,
+            interfaces.IBufferedProtocol,
         ]:
             if iface.providedBy(self._wrappedProtocol):
-                directlyProvides(self, iface)
+                alsoProvides(self, iface)
 
     def logPrefix(self):
         """
@@ -183,6 +184,20 @@ class _WrappingProtocol(Protocol):
         """
         self._wrappedProtocol.handshakeCompleted()
 
+    def getBuffer(self, sizeHint):
+        """
+        Proxy L{interfaces.IBufferedProtocol.getBuffer} to our
+        C{self._wrappedProtocol}.
+        """
+        return self._wrappedProtocol.getBuffer(sizeHint)
+
+    def bufferUpdated(self, nbytes):
+        """
+        Proxy L{interfaces.IBufferedProtocol.bufferUpdated} to our
+        C{self._wrappedProtocol}.
+        """
+        self._wrappedProtocol.bufferUpdated(nbytes)
+
 
 class _WrappingFactory(ClientFactory):
     """
@@ -487,9 +502,12 @@ class _TCPServerEndpoint:
     A TCP server endpoint interface
     """
 
-    def __init__(self, reactor, port, backlog, interface):
+    _addressFamily = socket.AF_INET
+
+    def __init__(self, reactor, port, backlog, interface, reusePort=False):
         """
-        @param reactor: An L{IReactorTCP} provider.
+        @param reactor: An L{IReactorTCP} provider.  If C{reusePort} is true,
+            it must also provide L{IReactorSocket}.
 
         @param port: The port number used for listening
         @type port: int
@@ -499,17 +517,26 @@ class _TCPServerEndpoint:
 
         @param interface: The hostname to bind to
         @type interface: str
+
+        @param reusePort: Whether to set C{SO_REUSEPORT} on the listening
+            socket, so that other processes (or other endpoints in this one)
+            can listen on the same port and have incoming connections
+            distributed between them by the kernel.
+        @type reusePort: bool
         """
         self._reactor = reactor
         self._port = port
         self._backlog = backlog
         self._interface = interface
+        self._reusePort = reusePort
 
     def listen(self, protocolFactory):
         """
         Implement L{IStreamServerEndpoint.listen} to listen on a TCP
         socket
         """
+        if self._reusePort:
+            return defer.execute(self._listenReusingPort, protocolFactory)
         return defer.execute(
             self._reactor.listenTCP,
             self._port,
@@ -518,15 +545,64 @@ class _TCPServerEndpoint:
             interface=self._interface,
         )
 
+    def _listenReusingPort(self, protocolFactory):
+        """
+        Listen on a socket with C{SO_REUSEPORT} set.
+
+        L{IReactorTCP.listenTCP} has no way to set socket options before the
+        socket is bound, so make the listening socket here and give it to the
+        reactor with L{IReactorSocket.adoptStreamPort}.
+
+        @param protocolFactory: The factory to build protocols with.
+
+        @return: The L{IListeningPort} for the socket.
+
+        @raise error.CannotListenError: The socket could not be bound, or the
+            platform does not support C{SO_REUSEPORT}.
+        """
+        reusePort = getattr(socket, "SO_REUSEPORT", None)
+        if reusePort is None:
+            raise error.CannotListenError(
+                self._interface, self._port, "SO_REUSEPORT is not supported"
+            )
+        family = self._addressFamily
+        interface = self._interface
+        if isIPv6Address(interface):
+            family = socket.AF_INET6
+        elif isIPAddress(interface):
+            family = socket.AF_INET
+        skt = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            try:
+                if family == socket.AF_INET6:
+                    # Resolve the interface to an address with a scope ID, as
+                    # tcp.Port does.
+                    address = socket.getaddrinfo(
+                        interface, self._port, family, socket.SOCK_STREAM
+                    )[0][4]
+                else:
+                    address = (interface, self._port)
+                skt.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                skt.setsockopt(socket.SOL_SOCKET, reusePort, 1)
+                skt.bind(address)
+                skt.listen(self._backlog)
+                skt.setblocking(False)
+            except OSError as e:
+                raise error.CannotListenError(interface, self._port, e)
+            return self._reactor.adoptStreamPort(skt.fileno(), family, protocolFactory)
+        finally:
+            skt.close()
+
 
 class TCP4ServerEndpoint(_TCPServerEndpoint):
     """
     Implements TCP server endpoint with an IPv4 configuration
     """
 
-    def __init__(self, reactor, port, backlog=50, interface=""):
+    def __init__(self, reactor, port, backlog=50, interface="", reusePort=False):
         """
-        @param reactor: An L{IReactorTCP} provider.
+        @param reactor: An L{IReactorTCP} provider.  If C{reusePort} is true,
+            it must also provide L{IReactorSocket}.
 
         @param port: The port number used for listening
         @type port: int
@@ -536,8 +612,12 @@ class TCP4ServerEndpoint(_TCPServerEndpoint):
 
         @param interface: The hostname to bind to, defaults to '' (all)
         @type interface: str
+
+        @param reusePort: Whether to set C{SO_REUSEPORT} on the listening
+            socket, so that several processes can listen on the same port.
+        @type reusePort: bool
         """
-        _TCPServerEndpoint.__init__(self, reactor, port, backlog, interface)
+        _TCPServerEndpoint.__init__(self, reactor, port, backlog, interface, reusePort)
 
 
 class TCP6ServerEndpoint(_TCPServerEndpoint):
@@ -545,9 +625,12 @@ class TCP6ServerEndpoint(_TCPServerEndpoint):
     Implements TCP server endpoint with an IPv6 configuration
     """
 
-    def __init__(self, reactor, port, backlog=50, interface="::"):
+    _addressFamily = socket.AF_INET6
+
+    def __init__(self, reactor, port, backlog=50, interface="::", reusePort=False):
         """
-        @param reactor: An L{IReactorTCP} provider.
+        @param reactor: An L{IReactorTCP} provider.  If C{reusePort} is true,
+            it must also provide L{IReactorSocket}.
 
         @param port: The port number used for listening
         @type port: int
@@ -557,8 +640,12 @@ class TCP6ServerEndpoint(_TCPServerEndpoint):
 
         @param interface: The hostname to bind to, defaults to C{::} (all)
         @type interface: str
+
+        @param reusePort: Whether to set C{SO_REUSEPORT} on the listening
+            socket, so that several processes can listen on the same port.
+        @type reusePort: bool
         """
-        _TCPServerEndpoint.__init__(self, reactor, port, backlog, interface)
+        _TCPServerEndpoint.__init__(self, reactor, port, backlog, interface, reusePort)
 
 
 @implementer(interfaces.IStreamClientEndpoint)
@@ -1320,7 +1407,21 @@ class AdoptedStreamServerEndpoint:
         return defer.succeed(port)
 
 
-def _parseTCP(factory, port, interface="", backlog=50):
+def _parseYesNo(name, value):
+    """
+    Convert a C{yes} or C{no} endpoint description argument to a L{bool}.
+
+    @param name: The name of the argument, for the error message.
+    @param value: The value of the argument.
+
+    @raise ValueError: C{value} is neither C{yes} nor C{no}.
+    """
+    if value in ("yes", "no"):
+        return value == "yes"
+    raise ValueError(f"{name} must be 'yes' or 'no', not {value!r}")
+
+
+def _parseTCP(factory, port, interface="", backlog=50, reuseport="no"):
     """
     Internal parser function for L{_parseServer} to convert the string
     arguments for a TCP(IPv4) stream endpoint into the structured arguments.
@@ -1338,11 +1439,18 @@ def _parseTCP(factory, port, interface="", backlog=50):
     @param backlog: the length of the listen queue
     @type backlog: C{str}
 
+    @param reuseport: C{"yes"} to set C{SO_REUSEPORT} on the listening socket.
+    @type reuseport: C{str}
+
     @return: a 2-tuple of (args, kwargs), describing  the parameters to
         L{IReactorTCP.listenTCP} (or, modulo argument 2, the factory, arguments
-        to L{TCP4ServerEndpoint}.
+        to L{TCP4ServerEndpoint}.  C{reusePort} is only included if it is
+        true, since L{IReactorTCP.listenTCP} does not accept it.
     """
-    return (int(port), factory), {"interface": interface, "backlog": int(backlog)}
+    kwargs = {"interface": interface, "backlog": int(backlog)}
+    if _parseYesNo("reuseport", reuseport):
+        kwargs["reusePort"] = True
+    return (int(port), factory), kwargs
 
 
 def _parseUNIX(factory, address, mode="666", backlog=50, lockfile=True):
@@ -1574,7 +1682,7 @@ class _TCP6ServerParser:
         "tcp6"  # Used in _parseServer to identify the plugin with the endpoint type
     )
 
-    def _parseServer(self, reactor, port, backlog=50, interface="::"):
+    def _parseServer(self, reactor, port, backlog=50, interface="::", reuseport="no"):
         """
         Internal parser function for L{_parseServer} to convert the string
         arguments into structured arguments for the L{TCP6ServerEndpoint}
@@ -1589,10 +1697,15 @@ class _TCP6ServerParser:
 
         @param interface: The hostname to bind to
         @type interface: str
+
+        @param reuseport: C{"yes"} to set C{SO_REUSEPORT} on the listening
+            socket.
+        @type reuseport: str
         """
         port = int(port)
         backlog = int(backlog)
-        return TCP6ServerEndpoint(reactor, port, backlog, interface)
+        reusePort = _parseYesNo("reuseport", reuseport)
+        return TCP6ServerEndpoint(reactor, port, backlog, interface, reusePort)
 
     def parseStreamServer(self, reactor, *args, **kwargs):
         # Redirects to another function (self._parseServer), tricks zope.interface
@@ -1756,6 +1869,12 @@ def serverFromString(reactor, description):
 
         serverFromString(reactor, "tcp:80:interface=127.0.0.1")
 
+    TCP server endpoints also accept C{reuseport=yes} to set C{SO_REUSEPORT}
+    on the listening socket, so that several processes (such as the workers
+    started by C{twist --workers}) can listen on the same port::
+
+        serverFromString(reactor, "tcp:80:reuseport=yes")
+
     SSL server endpoints may be specified with the 'ssl' prefix, and the
     private key and certificate files may be specified by the C{privateKey} and
     C{certKey} arguments::
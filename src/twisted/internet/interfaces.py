@@ -9,6 +9,7 @@ Maintainer: Itamar Shtull-Trauring
 from __future__ import annotations
 
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
     AnyStr,
@@ -1884,6 +1885,71 @@ class IProtocol(Interface):
         """
 
 
+class IBufferedProtocol(IProtocol):
+    """
+    A protocol which provides its own buffers for received data to be read
+    into, rather than being given a new L{bytes} for each read.
+
+    Transports which support this interface read directly into the buffer
+    returned by L{IBufferedProtocol.getBuffer} and then call
+    L{IBufferedProtocol.bufferUpdated}, instead of calling
+    L{IProtocol.dataReceived}.  This lets protocols which receive a lot of
+    data reuse a preallocated buffer and parse it in place.  Transports which
+    do not support it call L{IProtocol.dataReceived} as usual, so providers
+    must implement that too.
+
+    TCP, UNIX stream, and TLS transports support this interface.
+    """
+
+    def getBuffer(sizeHint: int) -> Union[bytearray, memoryview]:
+        """
+        Called to get a buffer to read the next received data into.
+
+        @param sizeHint: The number of bytes the transport would like to be
+            able to read.  The buffer may be smaller or larger than this, but
+            must not be empty.
+
+        @return: A writable buffer.  The transport writes received data at
+            its start, and does not keep a reference to it after
+            L{IBufferedProtocol.bufferUpdated} is called.
+        """
+
+    def bufferUpdated(nbytes: int) -> None:
+        """
+        Called when some data has been read into the buffer returned by the
+        last call to L{IBufferedProtocol.getBuffer}.
+
+        @param nbytes: The number of bytes written at the start of the buffer.
+            This is always at least one.
+        """
+
+
+class IBatchDatagramProtocol(Interface):
+    """
+    A datagram protocol which can handle many received datagrams in one call.
+
+    Transports which support this interface read as many datagrams as are
+    waiting, up to a limit, into a buffer which they reuse, and then pass them
+    all to L{IBatchDatagramProtocol.datagramsReceived}, instead of calling
+    C{datagramReceived} once for each.  Transports which do not support it
+    call C{datagramReceived} as usual, so providers must implement that too.
+
+    POSIX UDP ports support this interface.
+    """
+
+    def datagramsReceived(datagrams: List[Tuple[memoryview, Any]]) -> None:
+        """
+        Called when one or more datagrams have been received.
+
+        @param datagrams: A list of C{(datagram, address)} pairs, in the order
+            in which the datagrams were received.  Each datagram is a
+            L{memoryview} of the transport's read buffer, which is only valid
+            until this method returns; use L{bytes} to copy any that must be
+            kept.  The addresses are as they would be passed to
+            C{datagramReceived}.
+        """
+
+
 class IProcessProtocol(Interface):
     """
     Interface for process-related event handlers.
@@ -2175,6 +2241,37 @@ class ITCPTransport(ITransport):
         """
 
 
+class ISendfileTransport(ITransport):
+    """
+    A transport which can send the contents of a file directly from the
+    kernel, with C{sendfile(2)} or similar, instead of having it read into
+    memory and passed to L{ITransport.write}.
+
+    Transports only provide this interface while they can send files this
+    way; for example, a TCP connection stops providing it once TLS is started
+    on it, since the file's contents must then be encrypted.
+    """
+
+    def sendfile(file: IO[bytes], offset: int, count: int) -> "Deferred[int]":
+        """
+        Send part of a file, after all of the data already written.
+
+        Data written after calling this is sent after the file.
+
+        @param file: The file to send from.  It must have a C{fileno} method
+            and stay open until the returned L{Deferred} fires.  Its current
+            position is neither used nor changed.
+
+        @param offset: The offset in the file of the first byte to send.
+
+        @param count: The number of bytes to send.  If the file turns out to
+            be shorter than C{offset + count} bytes, the connection is lost.
+
+        @return: A L{Deferred} which fires with C{count} once all of the bytes
+            have been sent, or fails if the connection is lost first.
+        """
+
+
 class IUNIXTransport(ITransport):
     """
     Transport for stream-oriented unix domain connections.
@@ -2532,6 +2629,27 @@ class IUDPTransport(Interface):
         """
 
 
+class IBatchUDPTransport(IUDPTransport):
+    """
+    A UDP transport which can send many datagrams in one call.
+    """
+
+    def writeBatch(
+        datagrams: Iterable[Tuple[bytes, Optional[Tuple[str, int]]]]
+    ) -> None:
+        """
+        Write several datagrams, each as L{IUDPTransport.write} would.
+
+        @param datagrams: C{(datagram, address)} pairs.  As with
+            L{IUDPTransport.write}, each address is mandatory in
+            non-connected mode and must be the connected address or L{None}
+            in connected mode.
+
+        @raise twisted.internet.error.MessageLengthError: One of the datagrams
+            was too long.  It and the datagrams after it were not sent.
+        """
+
+
 class IUNIXDatagramTransport(Interface):
     """
     Transport for UDP PacketProtocols.
@@ -0,0 +1,455 @@
+# -*- test-case-name: twisted.internet.test.test_processpool -*-
+# Copyright (c) Twisted Matrix Laboratories.
+# See LICENSE for details.
+
+"""
+Running functions in a pool of worker processes.
+
+This is the counterpart of L{twisted.internet.threads.deferToThread} for work
+which needs a CPU to itself, such as encoding, compression or cryptography,
+and so cannot run in parallel with the reactor in a thread.
+
+The function to call, its arguments and its result are sent between processes
+with L{pickle}, so they must be picklable.  In particular, the function must
+be importable by name in the worker, so it cannot be a lambda, a nested
+function, or a function defined in a C{__main__} module.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import sys
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Set, TypeVar
+
+from typing_extensions import ParamSpec
+
+from twisted.internet._processworker import Call
+from twisted.internet.address import _ProcessAddress
+from twisted.internet.defer import Deferred, fail, succeed
+from twisted.internet.error import ProcessExitedAlready
+from twisted.internet.interfaces import IReactorProcess
+from twisted.internet.protocol import ProcessProtocol
+from twisted.logger import Logger
+from twisted.protocols.amp import AMP
+from twisted.python.failure import Failure
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+class ProcessPoolStopped(Exception):
+    """
+    A function was passed to a L{ProcessPool} which had been stopped.
+    """
+
+
+class RemoteTraceback(Exception):
+    """
+    The traceback of an exception raised in a worker process, set as the
+    C{__cause__} of the exception when it is raised again in the parent.
+    """
+
+    def __str__(self) -> str:
+        return "\n" + self.args[0]
+
+
+class _Task:
+    """
+    A function waiting to be called, or being called, in a worker.
+
+    @ivar payload: The pickled C{(f, args, kwargs)} to call.
+
+    @ivar deferred: The L{Deferred} which fires with the result.  Cancelling
+        it passes this task to the C{cancel} given to L{_Task.__init__}.
+
+    @ivar worker: The L{_Worker} calling the function, or L{None} if it is
+        still waiting for one.
+    """
+
+    def __init__(self, payload: bytes, cancel: Callable[[_Task], None]) -> None:
+        self.payload = payload
+        self.deferred: Deferred[Any] = Deferred(lambda d: cancel(self))
+        self.worker: Optional[_Worker] = None
+
+
+class _WorkerTransport:
+    """
+    A transport for the L{AMP} connection to a worker, over its standard
+    input.
+
+    @ivar _transport: The worker's L{IProcessTransport}.
+    """
+
+    def __init__(self, transport: Any) -> None:
+        self._transport = transport
+
+    def write(self, data: bytes) -> None:
+        self._transport.writeToChild(0, data)
+
+    def writeSequence(self, sequence: List[bytes]) -> None:
+        self._transport.writeToChild(0, b"".join(sequence))
+
+    def loseConnection(self) -> None:
+        self._transport.loseConnection()
+
+    def getHost(self) -> _ProcessAddress:
+        return _ProcessAddress()
+
+    def getPeer(self) -> _ProcessAddress:
+        return _ProcessAddress()
+
+
+class _Worker(ProcessProtocol):
+    """
+    The parent's side of a worker process.
+
+    @ivar _pool: The L{ProcessPool} this worker belongs to.
+
+    @ivar _amp: The L{AMP} connection to the worker.
+
+    @ivar completed: The number of functions the worker has called.
+
+    @ivar task: The L{_Task} the worker is calling, if any.
+    """
+
+    def __init__(self, pool: ProcessPool) -> None:
+        self._pool = pool
+        self._amp = AMP()
+        self.completed = 0
+        self.task: Optional[_Task] = None
+
+    def connectionMade(self) -> None:
+        self._amp.makeConnection(_WorkerTransport(self.transport))
+
+    def childDataReceived(self, childFD: int, data: bytes) -> None:
+        if childFD == 1:
+            self._amp.dataReceived(data)
+        else:
+            self._pool._log.warn(
+                "Process pool worker {pid} wrote: {output}",
+                pid=self.transport.pid,
+                output=data.decode("utf-8", "replace").rstrip(),
+            )
+
+    def processEnded(self, reason: Failure) -> None:
+        self._amp.connectionLost(reason)
+        self._pool._workerEnded(self)
+
+    def run(self, task: _Task) -> None:
+        """
+        Call the function in the worker.
+
+        @param task: The L{_Task} to run.
+        """
+        self.task = task
+        task.worker = self
+        d = self._amp.callRemote(Call, call=task.payload)
+        d.addCallbacks(self._succeeded, self._failed)
+
+    def _succeeded(self, response: dict) -> None:
+        task, self.task = self.task, None
+        self.completed += 1
+        self._pool._taskDone(self, task, response)
+
+    def _failed(self, reason: Failure) -> None:
+        task, self.task = self.task, None
+        if task is not None and not task.deferred.called:
+            task.deferred.errback(reason)
+
+    def retire(self) -> None:
+        """
+        Let the worker exit once it has read everything sent to it.
+        """
+        self.transport.closeChildFD(0)
+
+    def kill(self) -> None:
+        """
+        Make the worker exit straight away.
+        """
+        try:
+            self.transport.signalProcess("KILL")
+        except ProcessExitedAlready:
+            pass
+
+
+class ProcessPool:
+    """
+    A pool of worker processes, each calling one function at a time.
+
+    Workers are started as they are needed, up to C{size} of them, and exit
+    when the pool is stopped.
+
+    @ivar size: The most workers to run at once.
+    @type size: L{int}
+
+    @ivar maxTasksPerWorker: The number of functions a worker calls before it
+        is replaced by a new one, or L{None} to never replace workers for
+        that reason.
+    @type maxTasksPerWorker: L{int} or L{None}
+
+    @ivar maxMemory: The most memory, in bytes, a worker may have used before
+        it is replaced by a new one once it finishes its function, or L{None}
+        to never replace workers for that reason.
+    @type maxMemory: L{int} or L{None}
+
+    @ivar _pending: The L{_Task}s waiting for a worker, oldest first.
+
+    @ivar _workers: The workers which are calling functions or waiting to.
+
+    @ivar _idle: The workers waiting to call a function.
+
+    @ivar _exiting: The workers which have been told to exit but have not yet
+        done so.
+
+    @ivar _stopping: Whether L{ProcessPool.stop} has been called.
+
+    @ivar _stopWaiters: The L{Deferred}s returned by L{ProcessPool.stop} which
+        have not yet fired.
+    """
+
+    _log = Logger()
+
+    def __init__(
+        self,
+        reactor: IReactorProcess,
+        size: Optional[int] = None,
+        maxTasksPerWorker: Optional[int] = None,
+        maxMemory: Optional[int] = None,
+    ) -> None:
+        """
+        @param reactor: The reactor to start the worker processes with.
+
+        @param size: The value for L{ProcessPool.size}, or L{None} for the
+            number of CPUs.
+
+        @param maxTasksPerWorker: The value for
+            L{ProcessPool.maxTasksPerWorker}.
+
+        @param maxMemory: The value for L{ProcessPool.maxMemory}.
+        """
+        if size is None:
+            size = os.cpu_count() or 1
+        assert size > 0, "size is not positive"
+        self._reactor = reactor
+        self.size = size
+        self.maxTasksPerWorker = maxTasksPerWorker
+        self.maxMemory = maxMemory
+        self._pending: Deque[_Task] = deque()
+        self._workers: Set[_Worker] = set()
+        self._idle: List[_Worker] = []
+        self._exiting: Set[_Worker] = set()
+        self._stopping = False
+        self._stopWaiters: List[Deferred[None]] = []
+
+    def callInProcess(
+        self, f: Callable[_P, _R], *args: _P.args, **kwargs: _P.kwargs
+    ) -> Deferred[_R]:
+        """
+        Call C{f} in a worker process.
+
+        Cancelling the returned L{Deferred} before a worker has started
+        calling C{f} keeps it from being called; cancelling it afterwards
+        kills the worker.
+
+        @param f: The function to call.
+        @param args: positional arguments to pass to f.
+        @param kwargs: keyword arguments to pass to f.
+
+        @return: A L{Deferred} which fires with the result of C{f}, or fails
+            with the exception it raised, whose C{__cause__} is a
+            L{RemoteTraceback}.  It fails with L{ProcessPoolStopped} if this
+            pool has been stopped, and with the reason the worker exited if
+            it exits before C{f} returns.
+        """
+        if self._stopping:
+            return fail(ProcessPoolStopped())
+        try:
+            payload = pickle.dumps((f, args, kwargs), pickle.HIGHEST_PROTOCOL)
+        except BaseException:
+            return fail()
+        task = _Task(payload, self._cancel)
+        self._pending.append(task)
+        self._dispatch()
+        return task.deferred
+
+    def stop(self) -> Deferred[None]:
+        """
+        Stop accepting functions, and make every worker exit once the
+        functions already passed to L{ProcessPool.callInProcess} have been
+        called.
+
+        @return: A L{Deferred} which fires when every worker has exited.
+        """
+        self._stopping = True
+        d: Deferred[None] = Deferred()
+        self._stopWaiters.append(d)
+        if not self._pending:
+            while self._idle:
+                self._retire(self._idle.pop())
+        self._checkStopped()
+        return d
+
+    def _dispatch(self) -> None:
+        """
+        Give pending functions to idle workers, starting new workers as
+        needed.
+        """
+        while self._pending and (self._idle or len(self._workers) < self.size):
+            worker = self._idle.pop() if self._idle else self._spawn()
+            worker.run(self._pending.popleft())
+
+    def _spawn(self) -> _Worker:
+        """
+        Start a new worker process.
+
+        @return: The L{_Worker} talking to the new process.
+        """
+        worker = _Worker(self)
+        env = os.environ.copy()
+        # Let the worker import everything the parent can.
+        env["PYTHONPATH"] = os.pathsep.join(sys.path)
+        args = [sys.executable, "-m", "twisted.internet._processworker"]
+        self._reactor.spawnProcess(worker, sys.executable, args, env=env)
+        self._workers.add(worker)
+        return worker
+
+    def _retire(self, worker: _Worker) -> None:
+        """
+        Tell a worker to exit once it has read everything sent to it.
+
+        @param worker: The L{_Worker} to retire.
+        """
+        self._workers.discard(worker)
+        self._exiting.add(worker)
+        worker.retire()
+
+    def _taskDone(self, worker: _Worker, task: _Task, response: dict) -> None:
+        """
+        Deliver the result of a function, and either give the worker that
+        called it more work or retire it.
+
+        @param worker: The L{_Worker} which called the function.
+
+        @param task: The L{_Task} describing the function.
+
+        @param response: The response to the L{Call} command.
+        """
+        if worker in self._workers:
+            if (
+                self.maxTasksPerWorker is not None
+                and worker.completed >= self.maxTasksPerWorker
+            ) or (self.maxMemory is not None and response["memory"] > self.maxMemory):
+                self._retire(worker)
+            elif self._stopping and not self._pending:
+                self._retire(worker)
+            else:
+                self._idle.append(worker)
+        self._dispatch()
+        if task.deferred.called:
+            # It was cancelled, and the response was already on its way.
+            return
+        try:
+            result = pickle.loads(response["result"])
+        except BaseException:
+            task.deferred.errback()
+            return
+        if response["success"]:
+            task.deferred.callback(result)
+        else:
+            if response["traceback"]:
+                result.__cause__ = RemoteTraceback(response["traceback"])
+            task.deferred.errback(Failure(result))
+
+    def _cancel(self, task: _Task) -> None:
+        """
+        Keep a function from being called, or kill the worker calling it.
+
+        @param task: The L{_Task} describing the function.
+        """
+        if task.worker is None:
+            self._pending.remove(task)
+            return
+        worker = task.worker
+        self._workers.discard(worker)
+        self._exiting.add(worker)
+        worker.kill()
+        self._dispatch()
+
+    def _workerEnded(self, worker: _Worker) -> None:
+        """
+        Forget about a worker process which has exited, starting another in
+        its place if there are functions waiting.
+
+        @param worker: The L{_Worker} whose process exited.
+        """
+        self._workers.discard(worker)
+        self._exiting.discard(worker)
+        if worker in self._idle:
+            self._idle.remove(worker)
+        self._dispatch()
+        self._checkStopped()
+
+    def _checkStopped(self) -> None:
+        """
+        Fire the L{Deferred}s returned by L{ProcessPool.stop} if every worker
+        has exited.
+        """
+        if self._stopping and not (self._pending or self._workers or self._exiting):
+            waiters, self._stopWaiters = self._stopWaiters, []
+            for d in waiters:
+                d.callback(None)
+
+
+_defaultPool: Optional[ProcessPool] = None
+
+
+def deferToProcess(
+    f: Callable[_P, _R], *args: _P.args, **kwargs: _P.kwargs
+) -> Deferred[_R]:
+    """
+    Call a function in a worker process and return the result as a Deferred.
+
+    The worker belongs to a L{ProcessPool} with a worker for each CPU, which
+    is started when first needed and stopped when the reactor shuts down.
+
+    @param f: The function to call.
+    @param args: positional arguments to pass to f.
+    @param kwargs: keyword arguments to pass to f.
+
+    @return: A Deferred which fires a callback with the result of f, or an
+        errback with a L{twisted.python.failure.Failure} if f throws an
+        exception.  See L{ProcessPool.callInProcess}.
+    """
+    global _defaultPool
+    if _defaultPool is None:
+        from twisted.internet import reactor
+
+        _defaultPool = ProcessPool(reactor)  # type: ignore[arg-type]
+        reactor.addSystemEventTrigger(  # type: ignore[attr-defined]
+            "during", "shutdown", _stopDefaultPool
+        )
+    return _defaultPool.callInProcess(f, *args, **kwargs)
+
+
+def _stopDefaultPool() -> Deferred[None]:
+    """
+    Stop the pool used by L{deferToProcess}, so that the next call starts a
+    new one.
+
+    @return: A L{Deferred} which fires when the pool has stopped.
+    """
+    global _defaultPool
+    pool, _defaultPool = _defaultPool, None
+    if pool is None:
+        return succeed(None)
+    return pool.stop()
+
+
+__all__ = [
+    "ProcessPool",
+    "ProcessPoolStopped",
+    "RemoteTraceback",
+    "deferToProcess",
+]
@@ -16,16 +16,18 @@ import struct
 import sys
 from typing import Callable, ClassVar, List, Optional, Union
 
-from zope.interface import Interface, implementer
+from zope.interface import Interface, alsoProvides, implementer
 
 import attr
 import typing_extensions
 
 from twisted.internet.interfaces import (
+    IBufferedProtocol,
     IHalfCloseableProtocol,
     IListeningPort,
     IProtocol,
     IReactorTCP,
+    ISendfileTransport,
     ISystemHandle,
     ITCPTransport,
 )
@@ -220,12 +222,30 @@ class Connection(
     @type logstr: C{str}
     """
 
+    # Where sockets support sendmsg, write queued data with it instead of
+    # joining it into one buffer first.
+    _vectoredWrites = hasattr(socket.socket, "sendmsg")
+
+    # Whether connections provide ISendfileTransport, sending files with
+    # os.sendfile.  That relies on the write queue used for vectored writes.
+    _sendfileSupported = _vectoredWrites and hasattr(os, "sendfile")
+
+    # The most to ask os.sendfile to send at once.  The kernel does the
+    # copying, so this can be larger than SEND_LIMIT without holding up the
+    # reactor for longer.
+    _sendfileLimit = 2**20
+
     def __init__(self, skt, protocol, reactor=None):
         abstract.FileDescriptor.__init__(self, reactor=reactor)
         self.socket = skt
         self.socket.setblocking(0)
         self.fileno = skt.fileno
         self.protocol = protocol
+        if self._sendfileSupported:
+            # This is provided by the instance rather than the class so that
+            # starting TLS, which replaces the interfaces the instance
+            # provides, also stops it from being provided.
+            alsoProvides(self, ISendfileTransport)
 
     def getHandle(self):
         """Return the socket for this connection."""
@@ -238,7 +258,12 @@ class Connection(
         calls self.dataReceived(data) to process it.  If the connection is not
         lost through an error in the physical recv(), this function will return
         the result of the dataReceived call.
+
+        If the protocol provides L{IBufferedProtocol}, this instead reads
+        directly into the buffer it provides; see L{_doReadInto}.
         """
+        if IBufferedProtocol.providedBy(self.protocol):
+            return self._doReadInto(self.protocol)
         try:
             data = self.socket.recv(self.bufferSize)
         except OSError as se:
@@ -249,6 +274,29 @@ class Connection(
 
         return self._dataReceived(data)
 
+    def _doReadInto(self, protocol):
+        """
+        Read available data into the buffer of an L{IBufferedProtocol}.
+
+        @param protocol: The protocol to deliver the data to.
+
+        @return: L{main.CONNECTION_DONE} if the connection was closed by the
+            peer, L{main.CONNECTION_LOST} if it was lost through an error, or
+            L{None} otherwise.
+        """
+        buffer = protocol.getBuffer(self.bufferSize)
+        try:
+            count = self.socket.recv_into(buffer)
+        except OSError as se:
+            if se.args[0] == EWOULDBLOCK:
+                return
+            else:
+                return main.CONNECTION_LOST
+
+        if not count:
+            return main.CONNECTION_DONE
+        protocol.bufferUpdated(count)
+
     def _dataReceived(self, data):
         if not data:
             return main.CONNECTION_DONE
@@ -285,6 +333,53 @@ class Connection(
             else:
                 return main.CONNECTION_LOST
 
+    def _writeSomeVector(self, vector):
+        """
+        Write as much as possible of the given chunks of data to this TCP
+        connection with a single C{sendmsg} call.
+
+        @see: L{abstract.FileDescriptor._writeSomeVector}
+        """
+        try:
+            return untilConcludes(self.socket.sendmsg, vector)
+        except OSError as se:
+            if se.args[0] in (EWOULDBLOCK, ENOBUFS):
+                return 0
+            else:
+                return main.CONNECTION_LOST
+
+    def sendfile(self, file, offset, count):
+        """
+        Send part of a file with C{os.sendfile}.
+
+        @see: L{ISendfileTransport.sendfile}
+        """
+        return self._writeFile(file.fileno(), offset, count)
+
+    def _writeSomeFile(self, fileno, offset, count):
+        """
+        Send as much as possible of part of a file to this TCP connection with
+        a single C{os.sendfile} call.
+
+        @see: L{abstract.FileDescriptor._writeSomeFile}
+        """
+        try:
+            sent = untilConcludes(
+                os.sendfile,
+                self.socket.fileno(),
+                fileno,
+                offset,
+                min(count, self._sendfileLimit),
+            )
+        except OSError as se:
+            if se.args[0] in (EWOULDBLOCK, ENOBUFS):
+                return 0
+            else:
+                return main.CONNECTION_LOST
+        if not sent:
+            return error.ConnectionLost("File ended before it could all be sent.")
+        return sent
+
     def _closeWriteConnection(self):
         try:
             self.socket.shutdown(1)
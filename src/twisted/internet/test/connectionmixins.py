@@ -12,10 +12,11 @@ from gc import collect
 from typing import Optional
 from weakref import ref
 
+from zope.interface import implementer
 from zope.interface.verify import verifyObject
 
 from twisted.internet.defer import Deferred, gatherResults
-from twisted.internet.interfaces import IConnector, IReactorFDSet
+from twisted.internet.interfaces import IBufferedProtocol, IConnector, IReactorFDSet
 from twisted.internet.protocol import ClientFactory, Protocol, ServerFactory
 from twisted.internet.test.reactormixins import needsRunningReactor
 from twisted.python import context, log
@@ -309,6 +310,44 @@ class ConnectionTestsMixin:
         self.assertIn("Custom Client", client.system)
         self.assertIn("Custom Server", server.system)
 
+    def test_bufferedProtocol(self):
+        """
+        A protocol which provides L{IBufferedProtocol} has the bytes it is sent
+        written into the buffers it provides, and is told how many there are
+        through L{IBufferedProtocol.bufferUpdated}, instead of being passed them
+        through C{dataReceived}.
+        """
+        payload = b"x" * 100000
+
+        class SendingProtocol(ConnectableProtocol):
+            def connectionMade(self):
+                self.transport.write(payload)
+                self.transport.loseConnection()
+
+        @implementer(IBufferedProtocol)
+        class BufferedProtocol(ConnectableProtocol):
+            def __init__(self):
+                self.received = bytearray()
+                self.dataReceivedCalls = 0
+
+            def getBuffer(self, sizeHint):
+                self.buffer = bytearray(sizeHint)
+                return self.buffer
+
+            def bufferUpdated(self, nbytes):
+                self.received += self.buffer[:nbytes]
+                if len(self.received) == len(payload):
+                    self.transport.loseConnection()
+
+            def dataReceived(self, data):
+                self.dataReceivedCalls += 1
+
+        server = SendingProtocol()
+        client = BufferedProtocol()
+        runProtocolsWithReactor(self, server, client, self.endpoints)
+        self.assertEqual(bytes(client.received), payload)
+        self.assertEqual(client.dataReceivedCalls, 0)
+
     def test_writeAfterDisconnect(self):
         """
         After a connection is disconnected, L{ITransport.write} and
@@ -470,3 +470,183 @@ class ReactorBaseSignalTests(TestCase):
         reactor = TestSpySignalCapturingReactor()
         reactor.sigBreak(signal.SIGBREAK, None)
         self.assertEquals(signal.SIGBREAK, reactor._exitSignal)
+
+
+class TimerWheelReactor(ReactorBase):
+    """
+    A L{ReactorBase} with a controllable clock which keeps its timed calls in a
+    timer wheel.
+    """
+
+    now = 1000.0
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.useTimerWheel()
+
+    def installWaker(self):
+        """
+        Required method, unused.
+        """
+
+    def seconds(self) -> float:  # type: ignore[override]
+        return self.now
+
+
+class ReactorBaseTimerWheelTests(TestCase):
+    """
+    Tests for the timed call methods of L{ReactorBase} after
+    L{ReactorBase.useTimerWheel} has been called.
+    """
+
+    def setUp(self):
+        self.reactor = TimerWheelReactor()
+        self.calls = []
+
+    def advance(self, amount):
+        """
+        Move the reactor's clock forward and run the calls which are due.
+        """
+        self.reactor.now += amount
+        self.reactor.runUntilCurrent()
+
+    def test_callLater(self):
+        """
+        Timed calls run in order of their scheduled time once it has passed.
+        """
+        self.reactor.callLater(2, self.calls.append, "b")
+        self.reactor.callLater(1, self.calls.append, "a")
+        self.reactor.callLater(300, self.calls.append, "c")
+        self.advance(0.5)
+        self.assertEqual(self.calls, [])
+        self.advance(2)
+        self.assertEqual(self.calls, ["a", "b"])
+        self.advance(300)
+        self.assertEqual(self.calls, ["a", "b", "c"])
+
+    def test_timeout(self):
+        """
+        L{ReactorBase.timeout} is the delay until the earliest timed call, or
+        L{None} if there are none.
+        """
+        self.assertIsNone(self.reactor.timeout())
+        self.reactor.callLater(5, lambda: None)
+        call = self.reactor.callLater(0.125, lambda: None)
+        self.assertEqual(self.reactor.timeout(), 0.125)
+        call.cancel()
+        self.assertLessEqual(self.reactor.timeout(), 5)
+
+    def test_cancel(self):
+        """
+        A cancelled call does not run and is no longer in
+        L{ReactorBase.getDelayedCalls}.
+        """
+        kept = self.reactor.callLater(1, self.calls.append, "kept")
+        cancelled = self.reactor.callLater(1, self.calls.append, "cancelled")
+        cancelled.cancel()
+        self.assertEqual(self.reactor.getDelayedCalls(), [kept])
+        self.advance(1)
+        self.assertEqual(self.calls, ["kept"])
+        self.assertEqual(self.reactor.getDelayedCalls(), [])
+
+    def test_cancelFromEarlierCall(self):
+        """
+        A call due at the same time as an earlier call which cancels it does
+        not run.
+        """
+        self.reactor.callLater(1, lambda: later.cancel())
+        later = self.reactor.callLater(1.5, self.calls.append, "later")
+        self.advance(2)
+        self.assertEqual(self.calls, [])
+
+    def test_getDelayedCallsFromCall(self):
+        """
+        Calls which are due but have not run yet are still included in
+        L{ReactorBase.getDelayedCalls} when called from a timed call.
+        """
+        first = self.reactor.callLater(
+            1, lambda: self.calls.append(self.reactor.getDelayedCalls())
+        )
+        second = self.reactor.callLater(1.5, lambda: None)
+        third = self.reactor.callLater(10, lambda: None)
+        self.advance(2)
+        self.assertEqual([set(self.calls[0])], [{second, third}])
+        self.assertFalse(first.active())
+
+    def test_resetSooner(self):
+        """
+        Resetting a call to an earlier time runs it at that time.
+        """
+        call = self.reactor.callLater(100, self.calls.append, "reset")
+        call.reset(0.125)
+        self.assertEqual(self.reactor.timeout(), 0.125)
+        self.advance(0.125)
+        self.assertEqual(self.calls, ["reset"])
+
+    def test_resetLater(self):
+        """
+        Resetting a call to a later time runs it at that time, and not before.
+        """
+        call = self.reactor.callLater(1, self.calls.append, "reset")
+        call.reset(10)
+        self.advance(5)
+        self.assertEqual(self.calls, [])
+        self.assertTrue(call.active())
+        self.advance(5)
+        self.assertEqual(self.calls, ["reset"])
+
+    def test_delay(self):
+        """
+        Delaying a call runs it at its later time.
+        """
+        call = self.reactor.callLater(1, self.calls.append, "delay")
+        call.delay(2)
+        self.advance(2)
+        self.assertEqual(self.calls, [])
+        self.advance(1)
+        self.assertEqual(self.calls, ["delay"])
+
+    def test_resetFromEarlierCall(self):
+        """
+        A call due at the same time as an earlier call which reschedules it
+        runs at its new time.
+        """
+        self.reactor.callLater(1, lambda: later.reset(5))
+        later = self.reactor.callLater(1.5, self.calls.append, "later")
+        self.advance(2)
+        self.assertEqual(self.calls, [])
+        self.advance(5)
+        self.assertEqual(self.calls, ["later"])
+
+    def test_callLaterFromCall(self):
+        """
+        A call scheduled with no delay by a timed call runs on the next
+        iteration rather than the current one.
+        """
+        self.reactor.callLater(
+            1, lambda: self.reactor.callLater(0, self.calls.append, "inner")
+        )
+        self.advance(1)
+        self.assertEqual(self.calls, [])
+        self.assertEqual(self.reactor.timeout(), 0)
+        self.advance(0)
+        self.assertEqual(self.calls, ["inner"])
+
+    def test_existingCalls(self):
+        """
+        Calls scheduled before L{ReactorBase.useTimerWheel} is called are moved
+        into the timer wheel.
+        """
+        reactor = TimerWheelReactor.__new__(TimerWheelReactor)
+        ReactorBase.__init__(reactor)
+        first = reactor.callLater(1, self.calls.append, "first")
+        cancelled = reactor.callLater(1, self.calls.append, "cancelled")
+        cancelled.cancel()
+        reactor.runUntilCurrent()
+        second = reactor.callLater(2, self.calls.append, "second")
+        reactor.useTimerWheel()
+        self.assertEqual(set(reactor.getDelayedCalls()), {first, second})
+        reactor.now += 2
+        reactor.runUntilCurrent()
+        self.assertEqual(self.calls, ["first", "second"])
+        self.assertEqual(reactor.getDelayedCalls(), [])
@@ -7,6 +7,7 @@ L{IReactorSSL}, and L{IReactorUNIX} interfaces found in
 L{twisted.internet.endpoints}.
 """
 
+import socket
 from errno import EPERM
 from socket import AF_INET, AF_INET6, IPPROTO_TCP, SOCK_STREAM, AddressFamily, gaierror
 from types import FunctionType
@@ -205,6 +206,35 @@ class TestHandshakeListener(TestProtocol):
         self.handshakeCompletedCalls += 1
 
 
+@implementer(interfaces.IBufferedProtocol)
+class TestBufferedProtocol(TestProtocol):
+    """
+    A Protocol that implements L{IBufferedProtocol} and records the data
+    written into the buffers it provides.
+
+    @ivar received: The bytes written into buffers so far.
+    @type received: L{bytearray}
+    """
+
+    def __init__(self):
+        TestProtocol.__init__(self)
+        self.received = bytearray()
+        self._buffer = bytearray()
+
+    def getBuffer(self, sizeHint):
+        """
+        Provide a new buffer of C{sizeHint} bytes.
+        """
+        self._buffer = bytearray(sizeHint)
+        return self._buffer
+
+    def bufferUpdated(self, nbytes):
+        """
+        Record the first C{nbytes} bytes of the last buffer provided.
+        """
+        self.received += self._buffer[:nbytes]
+
+
 class TestFactory(ClientFactory):
     """
     Simple factory to be used both when connecting and listening. It contains
@@ -482,6 +512,46 @@ class WrappingFactoryTests(unittest.TestCase):
         wrapped.handshakeCompleted()
         self.assertEqual(listener.handshakeCompletedCalls, 1)
 
+    def test_wrappingProtocolBufferedProtocol(self):
+        """
+        Our L{_WrappingProtocol} should be an L{IBufferedProtocol} if the
+        C{wrappedProtocol} is, and should proxy C{getBuffer} and
+        C{bufferUpdated} to it.
+        """
+        buffered = TestBufferedProtocol()
+        wrapped = endpoints._WrappingProtocol(None, buffered)
+        self.assertTrue(interfaces.IBufferedProtocol.providedBy(wrapped))
+        buffer = wrapped.getBuffer(10)
+        buffer[:3] = b"abc"
+        wrapped.bufferUpdated(3)
+        self.assertEqual(buffered.received, b"abc")
+
+    def test_wrappingProtocolNotBufferedProtocol(self):
+        """
+        Our L{_WrappingProtocol} should not provide L{IBufferedProtocol} if the
+        C{wrappedProtocol} doesn't.
+        """
+        p = endpoints._WrappingProtocol(None, TestProtocol())
+        self.assertFalse(interfaces.IBufferedProtocol.providedBy(p))
+
+    def test_wrappingProtocolSeveralInterfaces(self):
+        """
+        Our L{_WrappingProtocol} provides every optional protocol interface
+        the C{wrappedProtocol} does.
+        """
+
+        @implementer(interfaces.IHalfCloseableProtocol)
+        class BufferedHalfCloseable(TestBufferedProtocol):
+            def readConnectionLost(self):
+                pass
+
+            def writeConnectionLost(self):
+                pass
+
+        p = endpoints._WrappingProtocol(None, BufferedHalfCloseable())
+        self.assertTrue(interfaces.IBufferedProtocol.providedBy(p))
+        self.assertTrue(interfaces.IHalfCloseableProtocol.providedBy(p))
+
 
 class ClientEndpointTestCaseMixin:
     """
@@ -1386,6 +1456,55 @@ class TCP4EndpointsTests(EndpointTestCaseMixin, unittest.TestCase):
         )
 
 
+@skipIf(not hasattr(socket, "SO_REUSEPORT"), "SO_REUSEPORT is not supported")
+class TCPServerEndpointReusePortTests(unittest.TestCase):
+    """
+    Tests for TCP server endpoints with C{reusePort} set.
+    """
+
+    def test_adoptsSocket(self):
+        """
+        A TCP server endpoint with C{reusePort} set makes a listening socket
+        itself and gives it to the reactor with
+        L{IReactorSocket.adoptStreamPort}.
+        """
+        mreactor = MemoryReactor()
+        endpoint = endpoints.TCP4ServerEndpoint(mreactor, 0, reusePort=True)
+        factory = Factory()
+        self.successResultOf(endpoint.listen(factory))
+        self.assertEqual([], mreactor.tcpServers)
+        [(fileno, addressFamily, adoptedFactory)] = mreactor.adoptedPorts
+        self.assertEqual((AF_INET, factory), (addressFamily, adoptedFactory))
+
+    def test_sharedPort(self):
+        """
+        Several TCP server endpoints with C{reusePort} set can listen on the
+        same port, but one without it cannot.
+        """
+        first = self.successResultOf(
+            endpoints.TCP4ServerEndpoint(
+                reactor, 0, interface="127.0.0.1", reusePort=True
+            ).listen(Factory())
+        )
+        self.addCleanup(first.stopListening)
+        portNumber = first.getHost().port
+
+        second = self.successResultOf(
+            endpoints.TCP4ServerEndpoint(
+                reactor, portNumber, interface="127.0.0.1", reusePort=True
+            ).listen(Factory())
+        )
+        self.addCleanup(second.stopListening)
+        self.assertEqual(portNumber, second.getHost().port)
+
+        self.failureResultOf(
+            endpoints.TCP4ServerEndpoint(
+                reactor, portNumber, interface="127.0.0.1"
+            ).listen(Factory()),
+            error.CannotListenError,
+        )
+
+
 class TCP6EndpointsTests(EndpointTestCaseMixin, unittest.TestCase):
     """
     Tests for TCP IPv6 Endpoints.
@@ -3105,6 +3224,27 @@ class ServerStringTests(unittest.TestCase):
         self.assertEqual(server._port, 1234)
         self.assertEqual(server._backlog, 12)
         self.assertEqual(server._interface, "10.0.0.1")
+        self.assertFalse(server._reusePort)
+
+    def test_tcpReusePort(self):
+        """
+        When passed a TCP strports description with C{reuseport=yes},
+        L{endpoints.serverFromString} returns a L{TCP4ServerEndpoint} which
+        sets C{SO_REUSEPORT}.
+        """
+        server = endpoints.serverFromString(object(), "tcp:1234:reuseport=yes")
+        self.assertTrue(server._reusePort)
+        server = endpoints.serverFromString(object(), "tcp:1234:reuseport=no")
+        self.assertFalse(server._reusePort)
+
+    def test_tcpReusePortInvalid(self):
+        """
+        L{endpoints.serverFromString} raises L{ValueError} if C{reuseport} is
+        given any value but C{yes} or C{no}.
+        """
+        self.assertRaises(
+            ValueError, endpoints.serverFromString, object(), "tcp:1234:reuseport=1"
+        )
 
     @skipIf(skipSSL, skipSSLReason)
     def test_ssl(self):
@@ -3936,6 +4076,15 @@ class TCP6ServerEndpointPluginTests(unittest.TestCase):
         self.assertEqual(ep._port, 8080)
         self.assertEqual(ep._backlog, 12)
         self.assertEqual(ep._interface, "::1")
+        self.assertFalse(ep._reusePort)
+
+    def test_stringDescriptionReusePort(self):
+        """
+        L{serverFromString} returns a L{TCP6ServerEndpoint} which sets
+        C{SO_REUSEPORT} if the description includes C{reuseport=yes}.
+        """
+        ep = endpoints.serverFromString(MemoryReactor(), "tcp6:8080:reuseport=yes")
+        self.assertTrue(ep._reusePort)
 
 
 class StandardIOEndpointPluginTests(unittest.TestCase):
@@ -8,8 +8,10 @@ Whitebox tests for L{twisted.internet.abstract.FileDescriptor}.
 
 from zope.interface.verify import verifyClass
 
+from twisted.internet import abstract, error, main
 from twisted.internet.abstract import FileDescriptor
 from twisted.internet.interfaces import IPushProducer
+from twisted.python.failure import Failure
 from twisted.trial.unittest import SynchronousTestCase
 
 
@@ -50,6 +52,45 @@ class MemoryFile(FileDescriptor):
         return acceptLength
 
 
+class VectorMemoryFile(MemoryFile):
+    """
+    A L{MemoryFile} which writes with L{FileDescriptor._writeSomeVector}.
+
+    @ivar vectors: A C{list} of the lists of chunks passed to
+        C{_writeSomeVector}.
+
+    @ivar files: A C{dict} mapping file descriptors to the contents of the
+        files to which they refer, for C{_writeSomeFile}.
+    """
+
+    _vectoredWrites = True
+
+    def __init__(self):
+        MemoryFile.__init__(self)
+        self.vectors = []
+        self.files = {}
+
+    def _writeSomeVector(self, vector):
+        """
+        Record C{vector}, then copy at most C{self._freeSpace} bytes from it
+        into C{self._written}.
+
+        @return: A C{int} indicating how many bytes were copied from
+            C{vector}.
+        """
+        self.vectors.append([bytes(chunk) for chunk in vector])
+        return self.writeSomeData(b"".join(vector))
+
+    def _writeSomeFile(self, fileno, offset, count):
+        """
+        Copy at most C{self._freeSpace} bytes from C{self.files[fileno]} into
+        C{self._written}.
+
+        @return: A C{int} indicating how many bytes were copied.
+        """
+        return self.writeSomeData(self.files[fileno][offset : offset + count])
+
+
 class FileDescriptorTests(SynchronousTestCase):
     """
     Tests for L{FileDescriptor}.
@@ -92,3 +133,159 @@ class WriteDescriptorTests(SynchronousTestCase):
         descriptor = MemoryFile()
         descriptor.write(b"hello, world")
         self.assertIsNone(descriptor.doWrite())
+
+
+class VectoredWriteTests(SynchronousTestCase):
+    """
+    Tests for L{FileDescriptor.doWrite} when C{_vectoredWrites} is set.
+    """
+
+    def test_chunksNotJoined(self):
+        """
+        Chunks of data at least as long as
+        L{twisted.internet.abstract._SMALL_WRITE} are passed to
+        C{_writeSomeVector} separately, without being joined.
+        """
+        large = [b"a" * abstract._SMALL_WRITE, b"b" * abstract._SMALL_WRITE]
+        descriptor = VectorMemoryFile()
+        descriptor._freeSpace = 10**6
+        descriptor.writeSequence(large)
+        self.assertIsNone(descriptor.doWrite())
+        self.assertEqual(descriptor.vectors, [large])
+        self.assertEqual(b"".join(descriptor._written), b"".join(large))
+
+    def test_smallChunksCoalesced(self):
+        """
+        Consecutive chunks shorter than L{twisted.internet.abstract._SMALL_WRITE}
+        are joined into one chunk.
+        """
+        large = b"x" * abstract._SMALL_WRITE
+        descriptor = VectorMemoryFile()
+        descriptor._freeSpace = 10**6
+        descriptor.writeSequence([b"5\r\n", b"hello", b"\r\n", large, b"0\r\n"])
+        descriptor.doWrite()
+        descriptor.writeSequence([b"a", b"b"])
+        descriptor.doWrite()
+        self.assertEqual(
+            descriptor.vectors,
+            [[b"5\r\nhello\r\n", large, b"0\r\n"], [b"ab"]],
+        )
+
+    def test_partialWrite(self):
+        """
+        When only part of the data is written, the rest is written by later
+        calls to L{FileDescriptor.doWrite}, starting where the last one left
+        off.
+        """
+        size = abstract._SMALL_WRITE
+        chunks = [b"a" * size, b"b" * size, b"c" * size]
+        descriptor = VectorMemoryFile()
+        descriptor.writeSequence(chunks)
+        descriptor._freeSpace = size + 500
+        descriptor.doWrite()
+        self.assertEqual(descriptor._writeQueueLen, size * 2 - 500)
+        descriptor._freeSpace = 10**6
+        descriptor.doWrite()
+        self.assertEqual(descriptor.vectors[-1], [b"b" * (size - 500), b"c" * size])
+        self.assertEqual(b"".join(descriptor._written), b"".join(chunks))
+        self.assertEqual(descriptor._writeQueueLen, 0)
+        self.assertEqual(len(descriptor._writeQueue), 0)
+
+    def test_vectorLimits(self):
+        """
+        No more than L{twisted.internet.abstract._IOV_MAX} chunks, and not
+        many more than C{SEND_LIMIT} bytes, are passed to C{_writeSomeVector}
+        at a time.
+        """
+        self.patch(abstract, "_IOV_MAX", 3)
+        chunk = b"x" * abstract._SMALL_WRITE
+        descriptor = VectorMemoryFile()
+        descriptor.SEND_LIMIT = abstract._SMALL_WRITE * 2
+        descriptor._freeSpace = 10**6
+        descriptor.writeSequence([chunk] * 5)
+        descriptor.doWrite()
+        self.assertEqual(len(descriptor.vectors[-1]), 2)
+        self.patch(abstract, "_IOV_MAX", 1)
+        descriptor.doWrite()
+        self.assertEqual(len(descriptor.vectors[-1]), 1)
+
+    def test_sendBufferFull(self):
+        """
+        Data queued for a vectored write counts towards filling the send
+        buffer.
+        """
+        descriptor = VectorMemoryFile()
+        descriptor.bufferSize = 10
+        descriptor.write(b"x" * 11)
+        descriptor.doWrite()
+        self.assertEqual(descriptor._tempDataLen, 0)
+        self.assertTrue(descriptor._isSendBufferFull())
+
+    def test_emptiedLosesConnection(self):
+        """
+        Once all of the queued data has been written,
+        L{FileDescriptor.doWrite} finishes a pending C{loseConnection}.
+        """
+        descriptor = VectorMemoryFile()
+        descriptor.stopReading = lambda: None
+        descriptor.write(b"hello")
+        descriptor.loseConnection()
+        self.assertIsNone(descriptor.doWrite())
+        descriptor._freeSpace = 5
+        self.assertIs(descriptor.doWrite(), main.CONNECTION_DONE)
+
+
+class WriteFileTests(SynchronousTestCase):
+    """
+    Tests for L{FileDescriptor._writeFile}.
+    """
+
+    def setUp(self):
+        self.descriptor = VectorMemoryFile()
+        self.descriptor.files[7] = b"0123456789"
+
+    def test_order(self):
+        """
+        The part of the file is written after the data written before it and
+        before the data written after it, and the L{Deferred} fires with the
+        number of bytes written from the file once they all have been.
+        """
+        results = []
+        self.descriptor.write(b"before")
+        self.descriptor._writeFile(7, 2, 6).addCallback(results.append)
+        self.descriptor.write(b"after")
+        self.descriptor._freeSpace = 9
+        self.descriptor.doWrite()
+        self.descriptor.doWrite()
+        self.assertEqual(results, [])
+        self.descriptor._freeSpace = 100
+        self.descriptor.doWrite()
+        self.assertEqual(results, [6])
+        self.descriptor.doWrite()
+        self.assertEqual(b"".join(self.descriptor._written), b"before234567after")
+
+    def test_empty(self):
+        """
+        Writing no bytes of a file succeeds immediately.
+        """
+        d = self.descriptor._writeFile(7, 0, 0)
+        self.assertEqual(self.successResultOf(d), 0)
+
+    def test_notConnected(self):
+        """
+        Writing part of a file when not connected fails immediately.
+        """
+        self.descriptor.connected = False
+        d = self.descriptor._writeFile(7, 0, 10)
+        self.failureResultOf(d, error.ConnectionDone)
+
+    def test_connectionLost(self):
+        """
+        If the connection is lost before a part of a file has been written,
+        the L{Deferred} fails with the reason.
+        """
+        self.descriptor.stopReading = lambda: None
+        d = self.descriptor._writeFile(7, 0, 10)
+        self.descriptor.connectionLost(Failure(error.ConnectionLost()))
+        self.failureResultOf(d, error.ConnectionLost)
+        self.assertEqual(len(self.descriptor._writeQueue), 0)
@@ -0,0 +1,270 @@
+# Copyright (c) Twisted Matrix Laboratories.
+# See LICENSE for details.
+
+"""
+Tests for L{twisted.internet.processpool}.
+"""
+
+
+import os
+import pickle
+import time
+from unittest import skipIf
+
+from twisted.internet import defer, interfaces, processpool, reactor
+from twisted.internet.error import ProcessTerminated
+from twisted.internet.processpool import (
+    ProcessPool,
+    ProcessPoolStopped,
+    RemoteTraceback,
+    deferToProcess,
+)
+from twisted.trial.unittest import TestCase
+
+
+def add(x, y=5):
+    """
+    Add two numbers, in a worker.
+    """
+    return x + y
+
+
+def fail(message):
+    """
+    Raise an exception, in a worker.
+    """
+    raise ValueError(message)
+
+
+def printAndReturn(value):
+    """
+    Print something before returning C{value}, in a worker.
+    """
+    print("some output")
+    return value
+
+
+def unpicklableResult():
+    """
+    Return something which cannot be pickled, in a worker.
+    """
+    return lambda: None
+
+
+def exitWorker():
+    """
+    Make the worker exit.
+    """
+    os._exit(1)
+
+
+@skipIf(
+    not interfaces.IReactorProcess(reactor, None),
+    "No process support, nothing to test here.",
+)
+class ProcessPoolTests(TestCase):
+    """
+    Tests for L{ProcessPool}.
+    """
+
+    def pool(self, **kwargs):
+        """
+        Create a L{ProcessPool} which is stopped when the test is done.
+
+        @param kwargs: Arguments for L{ProcessPool}.
+
+        @return: The new L{ProcessPool}.
+        """
+        pool = ProcessPool(reactor, **kwargs)
+        self.addCleanup(pool.stop)
+        return pool
+
+    @defer.inlineCallbacks
+    def test_result(self):
+        """
+        L{ProcessPool.callInProcess} calls the function passed in a worker
+        process, with the arguments given, and fires with its result.
+        """
+        pool = self.pool(size=2)
+        result = yield pool.callInProcess(add, 3, y=4)
+        self.assertEqual(result, 7)
+        pid = yield pool.callInProcess(os.getpid)
+        self.assertNotEqual(pid, os.getpid())
+
+    @defer.inlineCallbacks
+    def test_largeArgumentsAndResult(self):
+        """
+        Arguments and results too big for a single L{AMP} value are sent in
+        pieces.
+        """
+        data = os.urandom(300000)
+        result = yield self.pool(size=1).callInProcess(add, data, data)
+        self.assertEqual(result, data + data)
+
+    @defer.inlineCallbacks
+    def test_exception(self):
+        """
+        If the function raises an exception, the L{Deferred} fails with it,
+        caused by a L{RemoteTraceback} describing where it was raised.
+        """
+        d = self.pool(size=1).callInProcess(fail, "oops")
+        e = yield self.assertFailure(d, ValueError)
+        self.assertEqual(e.args, ("oops",))
+        self.assertIsInstance(e.__cause__, RemoteTraceback)
+        self.assertIn("in fail", str(e.__cause__))
+
+    def test_unpicklableFunction(self):
+        """
+        A function which cannot be pickled fails straight away.
+        """
+        d = self.pool(size=1).callInProcess(lambda: None)
+        self.failureResultOf(d, pickle.PicklingError, AttributeError)
+
+    def test_unpicklableResult(self):
+        """
+        A result which cannot be pickled fails with L{RuntimeError}.
+        """
+        d = self.pool(size=1).callInProcess(unpicklableResult)
+        return self.assertFailure(d, RuntimeError)
+
+    @defer.inlineCallbacks
+    def test_output(self):
+        """
+        Output printed by the function is logged rather than mixed up with
+        the results.
+        """
+        result = yield self.pool(size=1).callInProcess(printAndReturn, 42)
+        self.assertEqual(result, 42)
+
+    @defer.inlineCallbacks
+    def test_concurrency(self):
+        """
+        Up to C{size} workers call functions at the same time.
+        """
+        pool = self.pool(size=2)
+        results = yield defer.gatherResults(
+            [pool.callInProcess(time.sleep, 0.2) for i in range(4)]
+        )
+        self.assertEqual(results, [None] * 4)
+        self.assertEqual(len(pool._workers), 2)
+
+    @defer.inlineCallbacks
+    def test_maxTasksPerWorker(self):
+        """
+        A worker is replaced once it has called C{maxTasksPerWorker}
+        functions.
+        """
+        pool = self.pool(size=1, maxTasksPerWorker=2)
+        pids = []
+        for i in range(4):
+            pids.append((yield pool.callInProcess(os.getpid)))
+        self.assertEqual(pids[0], pids[1])
+        self.assertEqual(pids[2], pids[3])
+        self.assertNotEqual(pids[1], pids[2])
+
+    @defer.inlineCallbacks
+    def test_maxMemory(self):
+        """
+        A worker is replaced once it has used more than C{maxMemory} bytes.
+        """
+        pool = self.pool(size=1, maxMemory=1)
+        first = yield pool.callInProcess(os.getpid)
+        second = yield pool.callInProcess(os.getpid)
+        self.assertNotEqual(first, second)
+
+    @defer.inlineCallbacks
+    def test_cancelPending(self):
+        """
+        Cancelling the L{Deferred} for a function which is waiting for a
+        worker keeps it from being called.
+        """
+        pool = self.pool(size=1)
+        first = pool.callInProcess(time.sleep, 0.2)
+        second = pool.callInProcess(exitWorker)
+        second.cancel()
+        self.failureResultOf(second, defer.CancelledError)
+        yield first
+        self.assertEqual((yield pool.callInProcess(add, 1)), 6)
+
+    @defer.inlineCallbacks
+    def test_cancelRunning(self):
+        """
+        Cancelling the L{Deferred} for a function which a worker is calling
+        kills the worker, and another is started for the next function.
+        """
+        pool = self.pool(size=1)
+        d = pool.callInProcess(time.sleep, 60)
+        d.cancel()
+        self.failureResultOf(d, defer.CancelledError)
+        self.assertEqual((yield pool.callInProcess(add, 1)), 6)
+
+    @defer.inlineCallbacks
+    def test_cancelResponseInFlight(self):
+        """
+        If the response for a function arrives after its L{Deferred} has been
+        cancelled, it is ignored.
+        """
+        pool = self.pool(size=1)
+        d = pool.callInProcess(time.sleep, 60)
+        [worker] = pool._workers
+        d.cancel()
+        self.failureResultOf(d, defer.CancelledError)
+        worker._succeeded(
+            {
+                "success": True,
+                "result": pickle.dumps(None),
+                "traceback": "",
+                "memory": 0,
+            }
+        )
+        self.assertEqual((yield pool.callInProcess(add, 1)), 6)
+
+    @defer.inlineCallbacks
+    def test_workerExits(self):
+        """
+        If a worker exits while calling a function, the L{Deferred} fails
+        with the reason, and another worker is started for the next function.
+        """
+        pool = self.pool(size=1)
+        yield self.assertFailure(pool.callInProcess(exitWorker), ProcessTerminated)
+        self.assertEqual((yield pool.callInProcess(add, 1)), 6)
+
+    @defer.inlineCallbacks
+    def test_stop(self):
+        """
+        L{ProcessPool.stop} lets the functions already passed finish, makes
+        every worker exit and then fires; functions passed afterwards fail
+        with L{ProcessPoolStopped}.
+        """
+        pool = ProcessPool(reactor, size=1)
+        results = [pool.callInProcess(add, i) for i in range(3)]
+        yield pool.stop()
+        self.assertEqual(
+            [self.successResultOf(d) for d in results],
+            [5, 6, 7],
+        )
+        self.assertEqual((pool._workers, pool._exiting), (set(), set()))
+        self.failureResultOf(pool.callInProcess(add, 1), ProcessPoolStopped)
+
+
+@skipIf(
+    not interfaces.IReactorProcess(reactor, None),
+    "No process support, nothing to test here.",
+)
+class DeferToProcessTests(TestCase):
+    """
+    Tests for L{deferToProcess}.
+    """
+
+    @defer.inlineCallbacks
+    def test_deferToProcess(self):
+        """
+        L{deferToProcess} calls the function in a worker of a pool shared by
+        every call.
+        """
+        self.addCleanup(processpool._stopDefaultPool)
+        self.assertEqual((yield deferToProcess(add, 1, y=2)), 3)
+        pool = processpool._defaultPool
+        self.assertIsInstance(pool, ProcessPool)
+        self.assertEqual((yield deferToProcess(add, 2)), 7)
+        self.assertIs(processpool._defaultPool, pool)
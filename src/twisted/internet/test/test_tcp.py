@@ -21,6 +21,7 @@ from zope.interface.verify import verifyClass, verifyObject
 
 import attr
 
+from twisted.internet import main
 from twisted.internet.address import IPv4Address, IPv6Address
 from twisted.internet.defer import (
     Deferred,
@@ -43,6 +44,7 @@ from twisted.internet.error import (
     UserError,
 )
 from twisted.internet.interfaces import (
+    IBufferedProtocol,
     IConnector,
     IHalfCloseableProtocol,
     ILoggingContext,
@@ -53,6 +55,7 @@ from twisted.internet.interfaces import (
     IReactorTCP,
     IReactorTime,
     IResolverSimple,
+    ISendfileTransport,
     ITLSTransport,
 )
 from twisted.internet.protocol import ClientFactory, Protocol, ServerFactory
@@ -85,6 +88,7 @@ from twisted.internet.testing import MemoryReactor, StringTransport
 from twisted.logger import Logger
 from twisted.python import log
 from twisted.python.failure import Failure
+from twisted.python.filepath import FilePath
 from twisted.python.runtime import platform
 from twisted.test.test_tcp import (
     ClientStartStopFactory,
@@ -189,6 +193,16 @@ class FakeSocket:
     def recv(self, size):
         return self.data
 
+    def recv_into(self, buffer):
+        """
+        Copy C{self.data} into C{buffer}.
+
+        @return: The number of bytes copied.
+        """
+        count = min(len(buffer), len(self.data))
+        buffer[:count] = self.data[:count]
+        return count
+
     def send(self, bytes):
         """
         I{Send} all of C{bytes} by accumulating it into C{self.sendBuffer}.
@@ -372,6 +386,47 @@ class TCPConnectionTests(TestCase):
     Whitebox tests for L{twisted.internet.tcp.Connection}.
     """
 
+    def test_doReadBufferedProtocol(self):
+        """
+        When the protocol provides L{IBufferedProtocol},
+        L{Connection.doRead} reads into the buffer returned by its
+        C{getBuffer} and passes the number of bytes read to its
+        C{bufferUpdated}.
+        """
+
+        @implementer(IBufferedProtocol)
+        class BufferedProtocol(Protocol):
+            def getBuffer(self, sizeHint):
+                self.sizeHint = sizeHint
+                self.buffer = bytearray(sizeHint)
+                return self.buffer
+
+            def bufferUpdated(self, nbytes):
+                self.received = bytes(self.buffer[:nbytes])
+
+        protocol = BufferedProtocol()
+        conn = Connection(FakeSocket(b"someData"), protocol)
+        self.assertIsNone(conn.doRead())
+        self.assertEqual(protocol.sizeHint, conn.bufferSize)
+        self.assertEqual(protocol.received, b"someData")
+
+    def test_doReadBufferedProtocolConnectionDone(self):
+        """
+        When no bytes are read into the buffer of an L{IBufferedProtocol},
+        L{Connection.doRead} reports that the connection is done.
+        """
+
+        @implementer(IBufferedProtocol)
+        class BufferedProtocol(Protocol):
+            def getBuffer(self, sizeHint):
+                return bytearray(sizeHint)
+
+            def bufferUpdated(self, nbytes):
+                raise AssertionError("bufferUpdated must not be called")
+
+        conn = Connection(FakeSocket(b""), BufferedProtocol())
+        self.assertIs(conn.doRead(), main.CONNECTION_DONE)
+
     def test_doReadWarningIsRaised(self):
         """
         When an L{IProtocol} implementation that returns a value from its
@@ -401,6 +456,27 @@ class TCPConnectionTests(TestCase):
         conn = Connection(skt, protocol)
         self.assertFalse(conn.TLS)
 
+    @skipIf(not Connection._sendfileSupported, "os.sendfile is not available")
+    def test_providesSendfileTransport(self):
+        """
+        L{Connection} instances provide L{ISendfileTransport} where
+        C{os.sendfile} is available.
+        """
+        conn = Connection(FakeSocket(b""), FakeProtocol())
+        self.assertTrue(verifyObject(ISendfileTransport, conn))
+
+    @skipIf(not Connection._sendfileSupported, "os.sendfile is not available")
+    @skipIf(not useSSL, "No SSL support available")
+    def test_noSendfileAfterStartTLS(self):
+        """
+        A L{Connection} does not provide L{ISendfileTransport} once TLS has
+        been started on it.
+        """
+        conn = Connection(FakeSocket(b""), FakeProtocol(), reactor=_FakeFDSetReactor())
+        conn._tlsClientDefault = True
+        conn.startTLS(ClientContextFactory(), True)
+        self.assertFalse(ISendfileTransport.providedBy(conn))
+
     @skipIf(not useSSL, "No SSL support available")
     def test_tlsAfterStartTLS(self):
         """
@@ -2062,6 +2138,75 @@ class TCPConnectionTestsBuilder(ReactorBuilder):
         # If test fails, reactor won't stop and we'll hit timeout:
         runProtocolsWithReactor(self, ListenerProtocol(), Client(), TCPCreator())
 
+    def test_sendfile(self):
+        """
+        L{ISendfileTransport.sendfile} sends the requested part of a file
+        after any data already written and before any data written later, and
+        its L{Deferred} fires with the number of bytes sent.
+        """
+        path = FilePath(self.mktemp())
+        contents = bytes(range(256)) * 4096
+        path.setContent(contents)
+        results = []
+
+        class Sender(ConnectableProtocol):
+            def connectionMade(self):
+                if not ISendfileTransport.providedBy(self.transport):
+                    results.append(None)
+                    self.transport.loseConnection()
+                    return
+                self.file = path.open()
+                self.transport.write(b"before")
+                d = self.transport.sendfile(self.file, 100, len(contents) - 200)
+                d.addCallback(results.append)
+                d.addCallback(lambda ignored: self.file.close())
+                self.transport.write(b"after")
+                self.transport.loseConnection()
+
+        class Receiver(ConnectableProtocol):
+            received = b""
+
+            def dataReceived(self, data):
+                self.received += data
+
+        receiver = Receiver()
+        runProtocolsWithReactor(self, Sender(), receiver, TCPCreator())
+        if results == [None]:
+            raise SkipTest("This reactor's TCP transport cannot send files.")
+        self.assertEqual(results, [len(contents) - 200])
+        self.assertEqual(receiver.received, b"before" + contents[100:-100] + b"after")
+
+    def test_sendfileConnectionLost(self):
+        """
+        If the connection is lost before all of a file is sent, the
+        L{Deferred} returned by L{ISendfileTransport.sendfile} fails.
+        """
+        path = FilePath(self.mktemp())
+        path.setContent(b"x" * 2**24)
+        results = []
+
+        class Sender(ConnectableProtocol):
+            def connectionMade(self):
+                if not ISendfileTransport.providedBy(self.transport):
+                    results.append(None)
+                    self.transport.loseConnection()
+                    return
+                self.file = path.open()
+                d = self.transport.sendfile(self.file, 0, 2**24)
+                d.addBoth(results.append)
+                d.addBoth(lambda ignored: self.file.close())
+
+        class Aborter(ConnectableProtocol):
+            def dataReceived(self, data):
+                self.transport.abortConnection()
+
+        runProtocolsWithReactor(self, Sender(), Aborter(), TCPCreator())
+        if results == [None]:
+            raise SkipTest("This reactor's TCP transport cannot send files.")
+        [result] = results
+        self.assertIsInstance(result, Failure)
+        result.trap(ConnectionLost)
+
 
 class WriteSequenceTestsMixin:
     """
@@ -0,0 +1,182 @@
+# Copyright (c) Twisted Matrix Laboratories.
+# See LICENSE for details.
+
+"""
+Tests for L{twisted.internet._timerwheel}.
+"""
+
+from typing import List
+
+from twisted.internet._timerwheel import TimerWheel
+from twisted.internet.base import DelayedCall
+from twisted.trial.unittest import SynchronousTestCase
+
+
+def makeCall(time: float) -> DelayedCall:
+    """
+    Make a L{DelayedCall} scheduled for the given time which is not associated
+    with any reactor.
+    """
+    return DelayedCall(time, lambda: None, (), {}, lambda c: None, lambda c: None)
+
+
+class TimerWheelTests(SynchronousTestCase):
+    """
+    Tests for L{TimerWheel}.
+    """
+
+    def setUp(self) -> None:
+        # A small wheel, so that tests exercise cascading between levels and
+        # the overflow bucket: level 0 covers 4 ticks, level 1 covers 16
+        # ticks, and anything 16 or more ticks away overflows.
+        self.wheel = TimerWheel(100.0, resolution=1.0, slotBits=2, levels=2)
+
+    def popTimes(self, now: float) -> List[float]:
+        """
+        Pop the calls due at C{now} and return their times.
+        """
+        return [call.time for call in self.wheel.popDue(now)]
+
+    def test_empty(self) -> None:
+        """
+        An empty wheel has no length, no calls, and no next time.
+        """
+        self.assertEqual(len(self.wheel), 0)
+        self.assertEqual(list(self.wheel), [])
+        self.assertIsNone(self.wheel.nextTime())
+        self.assertEqual(self.wheel.popDue(1000.0), [])
+
+    def test_add(self) -> None:
+        """
+        Calls added to the wheel are counted and iterated over.
+        """
+        calls = [makeCall(t) for t in (100.5, 103.0, 110.0, 1000.0)]
+        for call in calls:
+            self.wheel.add(call)
+        self.assertEqual(len(self.wheel), 4)
+        self.assertEqual(set(self.wheel), set(calls))
+
+    def test_popDueOrder(self) -> None:
+        """
+        L{TimerWheel.popDue} returns every call with a time no later than the
+        given time, from every level, ordered by time.
+        """
+        for t in (1000.0, 110.0, 100.75, 100.25, 103.0, 150.0):
+            self.wheel.add(makeCall(t))
+        self.assertEqual(self.popTimes(100.5), [100.25])
+        self.assertEqual(self.popTimes(120.0), [100.75, 103.0, 110.0])
+        self.assertEqual(self.popTimes(999.0), [150.0])
+        self.assertEqual(self.popTimes(2000.0), [1000.0])
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_sameTimeInsertionOrder(self) -> None:
+        """
+        Calls for the same time are returned in the order they were added.
+        """
+        calls = [makeCall(105.0) for _ in range(5)]
+        for call in calls:
+            self.wheel.add(call)
+        self.assertEqual(self.wheel.popDue(105.0), calls)
+
+    def test_past(self) -> None:
+        """
+        A call for a time before the wheel's current tick is due immediately.
+        """
+        self.wheel.popDue(200.0)
+        call = makeCall(150.0)
+        self.wheel.add(call)
+        self.assertEqual(self.wheel.nextTime(), 150.0)
+        self.assertEqual(self.wheel.popDue(200.0), [call])
+
+    def test_remove(self) -> None:
+        """
+        A removed call is not returned by L{TimerWheel.popDue}, and removing it
+        again does nothing.
+        """
+        kept = makeCall(101.0)
+        removed = makeCall(102.0)
+        overflowed = makeCall(5000.0)
+        for call in kept, removed, overflowed:
+            self.wheel.add(call)
+        self.wheel.remove(removed)
+        self.wheel.remove(overflowed)
+        self.wheel.remove(removed)
+        self.assertEqual(len(self.wheel), 1)
+        self.assertEqual(self.wheel.popDue(10000.0), [kept])
+
+    def test_reschedule(self) -> None:
+        """
+        L{TimerWheel.reschedule} moves a call in the wheel to the bucket for
+        its new time.
+        """
+        call = makeCall(1000.0)
+        self.wheel.add(call)
+        call.time = 102.0
+        self.wheel.reschedule(call)
+        self.assertEqual(len(self.wheel), 1)
+        self.assertEqual(self.wheel.popDue(102.0), [call])
+
+    def test_rescheduleNotInWheel(self) -> None:
+        """
+        L{TimerWheel.reschedule} adds a call which is not in the wheel.
+        """
+        call = makeCall(102.0)
+        self.wheel.reschedule(call)
+        self.assertEqual(len(self.wheel), 1)
+        self.assertEqual(self.wheel.popDue(102.0), [call])
+
+    def test_nextTimeLevelZero(self) -> None:
+        """
+        L{TimerWheel.nextTime} returns the exact time of the earliest call when
+        it is close enough to be in level 0.
+        """
+        self.wheel.add(makeCall(102.5))
+        self.wheel.add(makeCall(101.25))
+        self.assertEqual(self.wheel.nextTime(), 101.25)
+
+    def test_nextTimeHigherLevel(self) -> None:
+        """
+        L{TimerWheel.nextTime} returns no later than the time of the earliest
+        call when it is in a higher level or the overflow bucket, and popping
+        at that time moves the wheel closer to the call.
+        """
+        self.wheel.add(makeCall(1000.0))
+        while True:
+            nextTime = self.wheel.nextTime()
+            assert nextTime is not None
+            self.assertLessEqual(nextTime, 1000.0)
+            if self.wheel.popDue(nextTime):
+                break
+        self.assertEqual(nextTime, 1000.0)
+
+    def test_nextTimeAfterAdd(self) -> None:
+        """
+        L{TimerWheel.nextTime} accounts for calls added after it was last
+        computed.
+        """
+        self.wheel.add(makeCall(110.0))
+        self.wheel.nextTime()
+        self.wheel.add(makeCall(100.5))
+        self.assertEqual(self.wheel.nextTime(), 100.5)
+
+    def test_nextTimeStaleHigherLevel(self) -> None:
+        """
+        A call placed in a higher level can become due before calls in level
+        0, and L{TimerWheel.nextTime} still accounts for it.
+        """
+        self.wheel.add(makeCall(107.0))
+        self.wheel.popDue(105.5)
+        self.wheel.add(makeCall(108.0))
+        nextTime = self.wheel.nextTime()
+        assert nextTime is not None
+        self.assertLessEqual(nextTime, 107.0)
+        self.assertEqual(self.popTimes(108.0), [107.0, 108.0])
+
+    def test_longJump(self) -> None:
+        """
+        Popping far in the future does not lose any calls.
+        """
+        times = [100.0 + 3**i for i in range(12)]
+        for t in times:
+            self.wheel.add(makeCall(t))
+        self.assertEqual(self.popTimes(times[-1]), times)
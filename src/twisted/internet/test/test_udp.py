@@ -16,6 +16,8 @@ from twisted.internet import defer, error
 from twisted.internet.address import IPv4Address, IPv6Address
 from twisted.internet.defer import Deferred, maybeDeferred
 from twisted.internet.interfaces import (
+    IBatchDatagramProtocol,
+    IBatchUDPTransport,
     IListeningPort,
     ILoggingContext,
     IReactorSocket,
@@ -253,6 +255,65 @@ class UDPPortTestsMixin:
         port.writeSequence(dataToWrite, ("127.0.0.1", address.port))
         self.runReactor(reactor)
 
+    def test_batches(self):
+        """
+        L{IBatchUDPTransport.writeBatch} sends each of the datagrams it is
+        given, and a protocol which provides L{IBatchDatagramProtocol} is
+        given them with C{datagramsReceived}, as L{memoryview}s.
+        """
+
+        @implementer(IBatchDatagramProtocol)
+        class BatchDatagramProtocol(DatagramProtocol):
+            def __init__(self, expected):
+                self.expected = expected
+                self.received = []
+                self.defer = Deferred()
+
+            def datagramsReceived(self, datagrams):
+                for data, addr in datagrams:
+                    self.received.append((type(data), bytes(data), addr))
+                if len(self.received) == self.expected:
+                    self.defer.callback(None)
+
+        reactor = self.buildReactor()
+        protocol = BatchDatagramProtocol(3)
+        port = self.getListeningPort(reactor, protocol, interface="127.0.0.1")
+        sender = self.getListeningPort(
+            reactor, DatagramProtocol(), interface="127.0.0.1"
+        )
+        if not IBatchUDPTransport.providedBy(sender):
+            raise SkipTest(f"{sender} does not provide IBatchUDPTransport")
+        senderAddress = ("127.0.0.1", sender.getHost().port)
+        destination = ("127.0.0.1", port.getHost().port)
+        datagrams = [b"one", b"", b"three"]
+
+        def received(ignored):
+            self.assertEqual(
+                [(memoryview, datagram, senderAddress) for datagram in datagrams],
+                protocol.received,
+            )
+
+        protocol.defer.addCallback(received)
+        protocol.defer.addErrback(err)
+        protocol.defer.addCallback(lambda ignored: reactor.stop())
+        sender.writeBatch([(datagram, destination) for datagram in datagrams])
+        self.runReactor(reactor)
+
+    def test_writeBatchToHostnameRaisesInvalidAddressError(self):
+        """
+        L{IBatchUDPTransport.writeBatch} raises L{error.InvalidAddressError}
+        if one of the addresses is a hostname rather than an IP address.
+        """
+        reactor = self.buildReactor()
+        port = self.getListeningPort(reactor, DatagramProtocol())
+        if not IBatchUDPTransport.providedBy(port):
+            raise SkipTest(f"{port} does not provide IBatchUDPTransport")
+        self.assertRaises(
+            error.InvalidAddressError,
+            port.writeBatch,
+            [(b"spam", ("127.0.0.1", 1)), (b"eggs", ("example.invalid", 1))],
+        )
+
     def test_str(self):
         """
         C{str()} on the listening port object includes the port number.
@@ -42,7 +42,10 @@ def deferToThreadPool(
         invoked.
 
     @param threadpool: An object which supports the C{callInThreadWithCallback}
-        method of C{twisted.python.threadpool.ThreadPool}.
+        method of C{twisted.python.threadpool.ThreadPool}.  If its
+        C{batchResults} attribute is true, the result is delivered to the
+        reactor together with those of any other work which completes before
+        the reactor runs.
 
     @param f: The function to call.
     @param args: positional arguments to pass to f.
@@ -54,6 +57,18 @@ def deferToThreadPool(
     """
     d: defer.Deferred[_R] = defer.Deferred()
 
+    if getattr(threadpool, "batchResults", False):
+        deliver = threadpool._resultBatch(reactor).deliver
+
+        def onBatchedResult(success: bool, result: _R | BaseException) -> None:
+            if success:
+                deliver(d.callback, result)
+            else:
+                deliver(d.errback, result)
+
+        threadpool.callInThreadWithCallback(onBatchedResult, f, *args, **kwargs)
+        return d
+
     def onResult(success: bool, result: _R | BaseException) -> None:
         if success:
             reactor.callFromThread(d.callback, result)
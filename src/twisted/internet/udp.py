@@ -60,7 +60,7 @@ from twisted.python import failure, log
 
 
 @implementer(
-    interfaces.IListeningPort, interfaces.IUDPTransport, interfaces.ISystemHandle
+    interfaces.IListeningPort, interfaces.IBatchUDPTransport, interfaces.ISystemHandle
 )
 class Port(base.BasePort):
     """
@@ -79,6 +79,13 @@ class Port(base.BasePort):
         was created and initialized outside of the reactor and will be used to
         listen for connections (instead of a new socket being created by this
         L{Port}).
+
+    @ivar _batchReads: Whether the protocol provides
+        L{interfaces.IBatchDatagramProtocol}, so that datagrams are passed to
+        it in batches.
+
+    @ivar _readView: A L{memoryview} of the buffer which batches of datagrams
+        are read into, or L{None} if it has not been allocated yet.
     """
 
     addressFamily = socket.AF_INET
@@ -87,6 +94,8 @@ class Port(base.BasePort):
 
     _realPortNumber: Optional[int] = None
     _preexistingSocket = None
+    _batchReads = False
+    _readView: Optional[memoryview] = None
 
     def __init__(self, port, proto, interface="", maxPacketSize=8192, reactor=None):
         """
@@ -220,6 +229,7 @@ class Port(base.BasePort):
         self.fileno = self.socket.fileno
 
     def _connectToProtocol(self):
+        self._batchReads = interfaces.IBatchDatagramProtocol.providedBy(self.protocol)
         self.protocol.makeConnection(self)
         self.startReading()
 
@@ -227,6 +237,8 @@ class Port(base.BasePort):
         """
         Called when my socket is ready for reading.
         """
+        if self._batchReads:
+            return self._doReadBatch()
         read = 0
         while read < self.maxThroughput:
             try:
@@ -255,6 +267,51 @@ class Port(base.BasePort):
                 except BaseException:
                     log.err()
 
+    def _doReadBatch(self):
+        """
+        Read as many datagrams as are waiting, up to C{maxThroughput} bytes of
+        them, into one buffer and pass them to the protocol's
+        C{datagramsReceived} together.
+
+        The buffer is reused by every call, so no memory is allocated for the
+        datagrams themselves.
+        """
+        size = self.maxPacketSize
+        limit = self.maxThroughput
+        view = self._readView
+        if view is None or len(view) < limit + size:
+            view = self._readView = memoryview(bytearray(limit + size))
+        recvfrom_into = self.socket.recvfrom_into
+        ipv6 = self.addressFamily == socket.AF_INET6
+        datagrams = []
+        offset = 0
+        refused = False
+        try:
+            while offset < limit:
+                try:
+                    nbytes, addr = recvfrom_into(view[offset : offset + size])
+                except OSError as se:
+                    no = se.args[0]
+                    if no in _sockErrReadIgnore:
+                        break
+                    if no in _sockErrReadRefuse:
+                        refused = bool(self._connectedAddr)
+                        break
+                    raise
+                if ipv6:
+                    # See doRead.
+                    addr = addr[:2]
+                datagrams.append((view[offset : offset + nbytes], addr))
+                offset += nbytes
+        finally:
+            if datagrams:
+                try:
+                    self.protocol.datagramsReceived(datagrams)
+                except BaseException:
+                    log.err()
+        if refused:
+            self.protocol.connectionRefused()
+
     def write(self, datagram, addr=None):
         """
         Write a datagram.
@@ -283,24 +340,7 @@ class Port(base.BasePort):
                     raise
         else:
             assert addr != None
-            if (
-                not abstract.isIPAddress(addr[0])
-                and not abstract.isIPv6Address(addr[0])
-                and addr[0] != "<broadcast>"
-            ):
-                raise error.InvalidAddressError(
-                    addr[0], "write() only accepts IP addresses, not hostnames"
-                )
-            if (
-                abstract.isIPAddress(addr[0]) or addr[0] == "<broadcast>"
-            ) and self.addressFamily == socket.AF_INET6:
-                raise error.InvalidAddressError(
-                    addr[0], "IPv6 port write() called with IPv4 or broadcast address"
-                )
-            if abstract.isIPv6Address(addr[0]) and self.addressFamily == socket.AF_INET:
-                raise error.InvalidAddressError(
-                    addr[0], "IPv4 port write() called with IPv6 address"
-                )
+            self._checkAddress(addr)
             try:
                 return self.socket.sendto(datagram, addr)
             except OSError as se:
@@ -317,6 +357,78 @@ class Port(base.BasePort):
                 else:
                     raise
 
+    def _checkAddress(self, addr):
+        """
+        Check that datagrams can be sent to an address from this port.
+
+        @param addr: A C{(host, port)} tuple.
+
+        @raise error.InvalidAddressError: C{host} is not an IP address of this
+            port's address family.
+        """
+        if (
+            not abstract.isIPAddress(addr[0])
+            and not abstract.isIPv6Address(addr[0])
+            and addr[0] != "<broadcast>"
+        ):
+            raise error.InvalidAddressError(
+                addr[0], "write() only accepts IP addresses, not hostnames"
+            )
+        if (
+            abstract.isIPAddress(addr[0]) or addr[0] == "<broadcast>"
+        ) and self.addressFamily == socket.AF_INET6:
+            raise error.InvalidAddressError(
+                addr[0], "IPv6 port write() called with IPv4 or broadcast address"
+            )
+        if abstract.isIPv6Address(addr[0]) and self.addressFamily == socket.AF_INET:
+            raise error.InvalidAddressError(
+                addr[0], "IPv4 port write() called with IPv6 address"
+            )
+
+    def writeBatch(self, datagrams):
+        """
+        Write several datagrams.
+
+        Each host is only checked once per batch, and errors are handled as
+        by L{Port.write}.
+
+        @param datagrams: An iterable of C{(datagram, addr)} pairs, with
+            C{datagram} and C{addr} as for L{Port.write}.
+        """
+        connectedAddr = self._connectedAddr
+        if connectedAddr:
+            send = self.socket.send
+        else:
+            sendto = self.socket.sendto
+            checked = set()
+        for datagram, addr in datagrams:
+            if connectedAddr:
+                assert addr in (None, connectedAddr)
+            else:
+                assert addr != None
+                if addr[0] not in checked:
+                    self._checkAddress(addr)
+                    checked.add(addr[0])
+            while True:
+                try:
+                    if connectedAddr:
+                        send(datagram)
+                    else:
+                        sendto(datagram, addr)
+                except OSError as se:
+                    no = se.args[0]
+                    if no == EINTR:
+                        continue
+                    elif no == EMSGSIZE:
+                        raise error.MessageLengthError("message too long")
+                    elif no == ECONNREFUSED:
+                        # As in write, this is only reported in connected mode.
+                        if connectedAddr:
+                            self.protocol.connectionRefused()
+                    else:
+                        raise
+                break
+
     def writeSequence(self, seq, addr):
         """
         Write a datagram constructed from an iterable of L{bytes}.
@@ -372,6 +484,7 @@ class Port(base.BasePort):
         """
         log.msg("(UDP Port %s Closed)" % self._realPortNumber)
         self._realPortNumber = None
+        self._readView = None
         self.maxThroughput = -1
         base.BasePort.connectionLost(self, reason)
         self.protocol.doStop()
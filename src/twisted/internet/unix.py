@@ -69,6 +69,10 @@ class _SendmsgMixin:
     _writeSomeDataBase: Optional[Type[FileDescriptor]] = None
     _fileDescriptorBufferSize = 64
 
+    # File descriptors can only be sent along with bytes from the write
+    # buffer, not with bytes sent straight from a file.
+    _sendfileSupported = False
+
     def __init__(self):
         self._sendmsgQueue = []
 
@@ -151,6 +155,17 @@ class _SendmsgMixin:
         except TypeError:
             return result
 
+    def _writeSomeVector(self, vector):
+        """
+        Send as much of the chunks in C{vector} as possible.  If there are any
+        pending file descriptors, join the chunks and send them with
+        L{writeSomeData}, which sends the file descriptors along with the
+        first bytes.
+        """
+        if self._sendmsgQueue:
+            return self.writeSomeData(b"".join(vector))
+        return self._writeSomeDataBase._writeSomeVector(self, vector)
+
     def doRead(self):
         """
         Calls {IProtocol.dataReceived} with all available data and
@@ -161,7 +176,12 @@ class _SendmsgMixin:
         dispatches the data to protocol callbacks to be handled.  If the
         connection is not lost through an error in the underlying recvmsg(),
         this function will return the result of the dataReceived call.
+
+        If the protocol provides L{interfaces.IBufferedProtocol}, the data is
+        instead read directly into the buffer it provides.
         """
+        if interfaces.IBufferedProtocol.providedBy(self.protocol):
+            return self._doReadInto(self.protocol)
         try:
             data, ancillary, flags = untilConcludes(
                 sendmsg.recvmsg, self.socket, self.bufferSize
@@ -172,6 +192,43 @@ class _SendmsgMixin:
             else:
                 return main.CONNECTION_LOST
 
+        self._ancillaryDataReceived(ancillary)
+        return self._dataReceived(data)
+
+    def _doReadInto(self, protocol):
+        """
+        Read available data into the buffer of an
+        L{interfaces.IBufferedProtocol}, dispatching any received file
+        descriptors first.
+
+        @param protocol: The protocol to deliver the data to.
+
+        @return: L{main.CONNECTION_DONE} if the connection was closed by the
+            peer, L{main.CONNECTION_LOST} if it was lost through an error, or
+            L{None} otherwise.
+        """
+        buffer = protocol.getBuffer(self.bufferSize)
+        try:
+            count, ancillary, flags, address = untilConcludes(
+                self.socket.recvmsg_into, [buffer], socket.CMSG_SPACE(4096)
+            )
+        except OSError as se:
+            if se.args[0] == EWOULDBLOCK:
+                return
+            else:
+                return main.CONNECTION_LOST
+
+        self._ancillaryDataReceived(ancillary)
+        if not count:
+            return main.CONNECTION_DONE
+        protocol.bufferUpdated(count)
+
+    def _ancillaryDataReceived(self, ancillary):
+        """
+        Dispatch the ancillary data received along with some stream data.
+
+        @param ancillary: A L{list} of C{(level, type, data)} L{tuple}s.
+        """
         for cmsgLevel, cmsgType, cmsgData in ancillary:
             if cmsgLevel == socket.SOL_SOCKET and cmsgType == sendmsg.SCM_RIGHTS:
                 self._ancillaryLevelSOLSOCKETTypeSCMRIGHTS(cmsgData)
@@ -190,8 +247,6 @@ class _SendmsgMixin:
                     cmsgType=cmsgType,
                 )
 
-        return self._dataReceived(data)
-
     def _ancillaryLevelSOLSOCKETTypeSCMRIGHTS(self, cmsgData):
         """
         Processes ancillary data with level SOL_SOCKET and type SCM_RIGHTS,
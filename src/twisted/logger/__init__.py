@@ -63,6 +63,7 @@ __all__ = [
     "LimitedHistoryLogObserver",
     # From ._file
     "FileLogObserver",
+    "ThreadedFileLogObserver",
     "textFileLogObserver",
     # From ._filter
     "PredicateResult",
@@ -108,7 +109,7 @@ from ._observer import LogPublisher
 
 from ._buffer import LimitedHistoryLogObserver
 
-from ._file import FileLogObserver, textFileLogObserver
+from ._file import FileLogObserver, ThreadedFileLogObserver, textFileLogObserver
 
 from ._filter import (
     PredicateResult,
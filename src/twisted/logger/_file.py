@@ -6,7 +6,10 @@
 File log observer.
 """
 
-from typing import IO, Any, Callable, Optional
+from collections import deque
+from queue import Queue
+from threading import Condition, Lock, Thread
+from typing import IO, TYPE_CHECKING, Any, Callable, Deque, Iterable, Optional
 
 from zope.interface import implementer
 
@@ -14,6 +17,12 @@ from twisted.python.compat import ioType
 from ._format import formatEventAsClassicLogText, formatTime, timeFormatRFC3339
 from ._interfaces import ILogObserver, LogEvent
 
+if TYPE_CHECKING:
+    from twisted._threads import IWorker
+    from twisted.internet.interfaces import IReactorCore
+
+_DEFAULT_BUFFER_SIZE = 16 * 1024
+
 
 @implementer(ILogObserver)
 class FileLogObserver:
@@ -53,6 +62,162 @@ class FileLogObserver:
             self._outFile.flush()
 
 
+def _startDaemonThread(target: Callable[[], None]) -> None:
+    """
+    Start a daemon thread for the worker of a L{ThreadedFileLogObserver}.
+
+    @param target: The function to run in the thread.
+    """
+    Thread(target=target, name="twisted.logger writer", daemon=True).start()
+
+
+@implementer(ILogObserver)
+class ThreadedFileLogObserver:
+    """
+    Log observer that writes to a file-like object from a worker thread.
+
+    Events are kept in a buffer of a fixed size, and formatted and written in
+    batches by the worker, with one C{write()} and one C{flush()} per batch,
+    so that a slow file does not hold up the thread which emits them.  As
+    they are formatted later, events should not be changed once emitted.
+
+    Events still in the buffer are written by L{ThreadedFileLogObserver.stop},
+    which is called when the reactor shuts down, if one is given.  After that,
+    events are written as they are observed, as L{FileLogObserver} does.
+
+    @ivar dropped: The number of events which were not written, because the
+        buffer was full or they could not be formatted or written.
+    """
+
+    def __init__(
+        self,
+        outFile: IO[Any],
+        formatEvent: Callable[[LogEvent], Optional[str]],
+        bufferSize: int = _DEFAULT_BUFFER_SIZE,
+        blockWhenFull: bool = False,
+        reactor: Optional["IReactorCore"] = None,
+        worker: Optional["IWorker"] = None,
+    ) -> None:
+        """
+        @param outFile: A file-like object.  Ideally one should be passed which
+            accepts text data.  Otherwise, UTF-8 L{bytes} will be used.
+        @param formatEvent: A callable that formats an event.
+        @param bufferSize: The maximum number of events waiting to be written.
+        @param blockWhenFull: What to do with an event when the buffer is
+            full: if C{True}, wait for the worker to make room for it;
+            otherwise, make room by dropping the oldest event.
+        @param reactor: If not L{None}, a reactor whose shutdown stops this
+            observer.
+        @param worker: The worker to format and write events with.  By
+            default, a L{ThreadWorker} with a daemon thread of its own.
+        """
+        if ioType(outFile) is not str:
+            self._encoding: Optional[str] = "utf-8"
+        else:
+            self._encoding = None
+
+        self._outFile = outFile
+        self.formatEvent = formatEvent
+        self.dropped = 0
+
+        self._bufferSize = bufferSize
+        self._blockWhenFull = blockWhenFull
+        self._buffer: Deque[LogEvent] = deque(maxlen=bufferSize)
+        # _lock guards the buffer and the flags below; _writeLock is held
+        # while taking a batch out of the buffer and writing it, so batches
+        # are written in order whichever thread writes them.
+        self._lock = Lock()
+        self._notFull = Condition(self._lock)
+        self._writeLock = Lock()
+        self._scheduled = False
+        self._stopped = False
+
+        if worker is None:
+            # twisted._threads logs through this package, so it can only be
+            # imported once this package has been.
+            from twisted._threads import ThreadWorker
+
+            worker = ThreadWorker(_startDaemonThread, Queue())
+        self._worker = worker
+        if reactor is not None:
+            reactor.addSystemEventTrigger("after", "shutdown", self.stop)
+
+    def __call__(self, event: LogEvent) -> None:
+        """
+        Add an event to the buffer, and have the worker write it.
+
+        @param event: An event.
+        """
+        with self._lock:
+            if self._blockWhenFull:
+                while len(self._buffer) >= self._bufferSize and not self._stopped:
+                    self._notFull.wait()
+            if not self._stopped:
+                if len(self._buffer) >= self._bufferSize:
+                    self.dropped += 1
+                self._buffer.append(event)
+                if not self._scheduled:
+                    self._scheduled = True
+                    self._worker.do(self._writeBuffer)
+                return
+        with self._writeLock:
+            self._write([event])
+
+    def _writeBuffer(self) -> None:
+        """
+        Write every event in the buffer.
+        """
+        with self._writeLock:
+            with self._lock:
+                events = list(self._buffer)
+                self._buffer.clear()
+                self._scheduled = False
+                self._notFull.notify_all()
+            self._write(events)
+
+    def _write(self, events: Iterable[LogEvent]) -> None:
+        """
+        Format some events and write them out at once.
+
+        @param events: The events to write.
+        """
+        texts = []
+        failed = 0
+        for event in events:
+            try:
+                text = self.formatEvent(event)
+            except BaseException:
+                failed += 1
+            else:
+                if text:
+                    texts.append(text)
+        if texts:
+            output = "".join(texts)
+            try:
+                if self._encoding is None:
+                    self._outFile.write(output)
+                else:
+                    self._outFile.write(output.encode(self._encoding))
+                self._outFile.flush()
+            except BaseException:
+                failed += len(texts)
+        if failed:
+            with self._lock:
+                self.dropped += failed
+
+    def stop(self) -> None:
+        """
+        Write the events in the buffer and stop the worker.
+        """
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            self._notFull.notify_all()
+        self._writeBuffer()
+        self._worker.quit()
+
+
 def textFileLogObserver(
     outFile: IO[Any], timeFormat: Optional[str] = timeFormatRFC3339
 ) -> FileLogObserver:
@@ -7,7 +7,7 @@ Filtering log observer.
 """
 
 from functools import partial
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Optional
 
 from zope.interface import Interface, implementer
 
@@ -15,7 +15,12 @@ from constantly import NamedConstant, Names
 
 from ._interfaces import ILogObserver, LogEvent
 from ._levels import InvalidLogLevelError, LogLevel
-from ._observer import bitbucketLogObserver
+from ._observer import (
+    _MAX_CACHED_LEVELS,
+    _minimumLevel,
+    _observersChanged,
+    bitbucketLogObserver,
+)
 
 
 class PredicateResult(Names):
@@ -110,7 +115,8 @@ class FilteringLogObserver:
             forward events when C{predictates} yield a negative result.
         """
         self._observer = observer
-        self._shouldLogEvent = partial(shouldLogEvent, list(predicates))
+        self._predicates = list(predicates)
+        self._shouldLogEvent = partial(shouldLogEvent, self._predicates)
         self._negativeObserver = negativeObserver
 
     def __call__(self, event: LogEvent) -> None:
@@ -124,6 +130,35 @@ class FilteringLogObserver:
         else:
             self._negativeObserver(event)
 
+    def _minimumLevel(self, namespace: str) -> Optional[NamedConstant]:
+        """
+        Find the lowest level of the events from a namespace which this
+        observer may do anything with.
+
+        Only the L{LogLevelFilterPredicate}s before any other predicate are
+        considered, since another predicate may have an event logged whatever
+        its level.
+
+        @see: L{twisted.logger._observer._minimumLevel}
+
+        @param namespace: A logging namespace.
+
+        @return: That level, or L{None} if this observer ignores every event
+            from the namespace.
+        """
+        lowest = _minimumLevel(self._observer, namespace)
+        for predicate in self._predicates:
+            if type(predicate) is not LogLevelFilterPredicate:
+                break
+            level = predicate.logLevelForNamespace(namespace)
+            if lowest is not None and lowest < level:
+                lowest = level
+
+        negative = _minimumLevel(self._negativeObserver, namespace)
+        if negative is not None and (lowest is None or negative < lowest):
+            lowest = negative
+        return lowest
+
 
 @implementer(ILogFilterPredicate)
 class LogLevelFilterPredicate:
@@ -139,6 +174,7 @@ class LogLevelFilterPredicate:
         @param defaultLogLevel: The default minimum log level.
         """
         self._logLevelsByNamespace: Dict[str, NamedConstant] = {}
+        self._levelCache: Dict[str, NamedConstant] = {}
         self.defaultLogLevel = defaultLogLevel
         self.clearLogLevels()
 
@@ -154,6 +190,25 @@ class LogLevelFilterPredicate:
         @param namespace: A logging namespace.  Use C{""} for the default
             namespace.
 
+        @return: The log level for the specified namespace.
+        """
+        try:
+            return self._levelCache[namespace]
+        except KeyError:
+            pass
+
+        level = self._logLevelForNamespace(namespace)
+        if len(self._levelCache) < _MAX_CACHED_LEVELS:
+            self._levelCache[namespace] = level
+        return level
+
+    def _logLevelForNamespace(self, namespace: str) -> NamedConstant:
+        """
+        Determine an appropriate log level for the given namespace, without
+        looking in the cache.
+
+        @param namespace: A logging namespace.
+
         @return: The log level for the specified namespace.
         """
         if not namespace:
@@ -187,6 +242,8 @@ class LogLevelFilterPredicate:
             self._logLevelsByNamespace[namespace] = level
         else:
             self._logLevelsByNamespace[""] = level
+        self._levelCache.clear()
+        _observersChanged()
 
     def clearLogLevels(self) -> None:
         """
@@ -194,6 +251,8 @@ class LogLevelFilterPredicate:
         """
         self._logLevelsByNamespace.clear()
         self._logLevelsByNamespace[""] = self.defaultLogLevel
+        self._levelCache.clear()
+        _observersChanged()
 
     def __call__(self, event: LogEvent) -> NamedConstant:
         eventLevel = event.get("log_level", None)
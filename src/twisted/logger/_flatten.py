@@ -10,12 +10,16 @@ examination.
 
 from collections import defaultdict
 from string import Formatter
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ._interfaces import LogEvent
 
 aFormatter = Formatter()
 
+# Format strings are parsed once and kept, up to this many of them; log
+# formats are normally literals in the code, so few different ones are seen.
+_MAX_CACHED_FORMATS = 1000
+
 
 class KeyFlattener:
     """
@@ -61,6 +65,102 @@ class KeyFlattener:
         return result
 
 
+class _ParsedFormat:
+    """
+    A format string parsed by L{aFormatter}, with what L{flattenEvent},
+    L{flatFormat} and L{twisted.logger._format.formatWithCall} work out from
+    its fields, so that it is only parsed once.
+
+    @ivar fields: The result of parsing the format string with
+        L{Formatter.parse}.
+    @ivar flattenFields: For L{flattenEvent}, a C{(flattenedKey,
+        structuredKey, fieldName, simple, callit, conversion)} tuple for each
+        field, where C{fieldName} has had any C{"()"} suffix removed,
+        C{simple} is whether it is a plain key in the event and C{conversion}
+        is L{str} or L{repr}.
+    @ivar flatKeys: For L{flatFormat}, a C{(literalText, key)} tuple for each
+        field, where C{key} is the key of its value in C{"log_flattened"}, or
+        L{None} for literal text with no field.
+    @ivar simple: Whether every field has a name and a format spec without
+        fields of its own, so that L{twisted.logger._format.formatWithCall}
+        may format the fields itself rather than by L{Formatter.vformat}.
+    """
+
+    def __init__(self, formatString: str) -> None:
+        """
+        @param formatString: A PEP-3101 format string.
+        """
+        self.fields = list(aFormatter.parse(formatString))
+        self.flattenFields: List[
+            Tuple[str, str, str, bool, bool, Callable[[object], str]]
+        ] = []
+        self.flatKeys: List[Tuple[str, Optional[str]]] = []
+        self.simple = True
+
+        keyFlattener = KeyFlattener()
+        formatKeyFlattener = KeyFlattener()
+
+        for literalText, fieldName, formatSpec, conversion in self.fields:
+            if fieldName is None:
+                self.flatKeys.append((literalText, None))
+                continue
+
+            self.flatKeys.append(
+                (
+                    literalText,
+                    formatKeyFlattener.flatKey(
+                        fieldName, formatSpec, conversion or "s"
+                    ),
+                )
+            )
+
+            firstName = fieldName.split(".", 1)[0].split("[", 1)[0]
+            if not firstName or firstName.isdigit() or "{" in formatSpec:
+                self.simple = False
+
+            if conversion != "r":
+                conversion = "s"
+
+            flattenedKey = keyFlattener.flatKey(fieldName, formatSpec, conversion)
+            structuredKey = keyFlattener.flatKey(fieldName, formatSpec, "")
+
+            if fieldName.endswith("()"):
+                fieldName = fieldName[:-2]
+                callit = True
+            else:
+                callit = False
+
+            self.flattenFields.append(
+                (
+                    flattenedKey,
+                    structuredKey,
+                    fieldName,
+                    fieldName.isidentifier(),
+                    callit,
+                    repr if conversion == "r" else str,
+                )
+            )
+
+
+_parsedFormats: Dict[str, _ParsedFormat] = {}
+
+
+def _parseFormat(formatString: str) -> _ParsedFormat:
+    """
+    Parse a format string, or find it already parsed.
+
+    @param formatString: A PEP-3101 format string.
+
+    @return: The parsed format string.
+    """
+    parsed = _parsedFormats.get(formatString)
+    if parsed is None:
+        parsed = _ParsedFormat(formatString)
+        if len(_parsedFormats) < _MAX_CACHED_FORMATS:
+            _parsedFormats[formatString] = parsed
+    return parsed
+
+
 def flattenEvent(event: LogEvent) -> None:
     """
     Flatten the given event by pre-associating format fields with specific
@@ -77,37 +177,22 @@ def flattenEvent(event: LogEvent) -> None:
     else:
         fields = {}
 
-    keyFlattener = KeyFlattener()
-
-    for literalText, fieldName, formatSpec, conversion in aFormatter.parse(
-        event["log_format"]
-    ):
-        if fieldName is None:
-            continue
-
-        if conversion != "r":
-            conversion = "s"
-
-        flattenedKey = keyFlattener.flatKey(fieldName, formatSpec, conversion)
-        structuredKey = keyFlattener.flatKey(fieldName, formatSpec, "")
-
+    for (
+        flattenedKey,
+        structuredKey,
+        fieldName,
+        simple,
+        callit,
+        conversionFunction,
+    ) in _parseFormat(event["log_format"]).flattenFields:
         if flattenedKey in fields:
             # We've already seen and handled this key
             continue
 
-        if fieldName.endswith("()"):
-            fieldName = fieldName[:-2]
-            callit = True
+        if simple:
+            fieldValue = event[fieldName]
         else:
-            callit = False
-
-        field = aFormatter.get_field(fieldName, (), event)
-        fieldValue = field[0]
-
-        if conversion == "r":
-            conversionFunction = repr
-        else:  # Above: if conversion is not "r", it's "s"
-            conversionFunction = str
+            fieldValue = aFormatter.get_field(fieldName, (), event)[0]
 
         if callit:
             fieldValue = fieldValue()
@@ -160,16 +245,12 @@ def flatFormat(event: LogEvent) -> str:
     @return: A formatted string.
     """
     fieldValues = event["log_flattened"]
-    keyFlattener = KeyFlattener()
     s = []
 
-    for literalText, fieldName, formatSpec, conversion in aFormatter.parse(
-        event["log_format"]
-    ):
+    for literalText, key in _parseFormat(event["log_format"]).flatKeys:
         s.append(literalText)
 
-        if fieldName is not None:
-            key = keyFlattener.flatKey(fieldName, formatSpec, conversion or "s")
+        if key is not None:
             s.append(str(fieldValues[key]))
 
     return "".join(s)
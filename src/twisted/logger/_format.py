@@ -16,7 +16,7 @@ from constantly import NamedConstant
 from twisted.python._tzhelper import FixedOffsetTimeZone
 from twisted.python.failure import Failure
 from twisted.python.reflect import safe_repr
-from ._flatten import aFormatter, flatFormat
+from ._flatten import _parseFormat, aFormatter, flatFormat
 from ._interfaces import LogEvent
 
 timeFormatRFC3339 = "%Y-%m-%dT%H:%M:%S%z"
@@ -269,7 +269,20 @@ def formatWithCall(formatString: str, mapping: Mapping[str, Any]) -> str:
 
     @return: The string with formatted values interpolated.
     """
-    return str(aFormatter.vformat(formatString, (), CallMapping(mapping)))
+    parsed = _parseFormat(formatString)
+    if not parsed.simple:
+        return str(aFormatter.vformat(formatString, (), CallMapping(mapping)))
+
+    # The same as vformat, without parsing the format string again.
+    callMapping = CallMapping(mapping)
+    s = []
+    for literalText, fieldName, formatSpec, conversion in parsed.fields:
+        s.append(literalText)
+        if fieldName is not None:
+            value = aFormatter.get_field(fieldName, (), callMapping)[0]
+            value = aFormatter.convert_field(value, conversion)
+            s.append(aFormatter.format_field(value, formatSpec))
+    return "".join(s)
 
 
 def _formatEvent(event: LogEvent) -> str:
@@ -6,7 +6,7 @@
 Tools for saving and loading log events in a structured format.
 """
 
-from json import dumps, loads
+from json import JSONEncoder, loads
 from typing import IO, Any, AnyStr, Dict, Iterable, Optional, Union, cast
 from uuid import UUID
 
@@ -118,6 +118,24 @@ def objectSaveHook(pythonObject: object) -> JSONDict:
     return {"unpersistable": True}
 
 
+def _objectOrBytesSaveHook(unencodable: object) -> Union[JSONDict, str]:
+    """
+    Serialize an object not otherwise serializable by L{json.dumps}.
+
+    @param unencodable: An unencodable object.
+
+    @return: C{unencodable}, serialized
+    """
+    if isinstance(unencodable, bytes):
+        return unencodable.decode("charmap")
+    return objectSaveHook(unencodable)
+
+
+# json.dumps makes a new encoder for each call when given any options; this one
+# is made once, with the options L{eventAsJSON} needs.
+_eventEncoder = JSONEncoder(default=_objectOrBytesSaveHook, skipkeys=True)
+
+
 def eventAsJSON(event: LogEvent) -> str:
     """
     Encode an event as JSON, flattening it if necessary to preserve as much
@@ -132,21 +150,8 @@ def eventAsJSON(event: LogEvent) -> str:
         newline characters, and may thus safely be stored in a line-delimited
         file.
     """
-
-    def default(unencodable: object) -> Union[JSONDict, str]:
-        """
-        Serialize an object not otherwise serializable by L{dumps}.
-
-        @param unencodable: An unencodable object.
-
-        @return: C{unencodable}, serialized
-        """
-        if isinstance(unencodable, bytes):
-            return unencodable.decode("charmap")
-        return objectSaveHook(unencodable)
-
     flattenEvent(event)
-    return dumps(event, default=default, skipkeys=True)
+    return _eventEncoder.encode(event)
 
 
 def eventFromJSON(eventText: str) -> JSONDict:
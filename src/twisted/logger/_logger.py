@@ -14,6 +14,8 @@ from twisted.python.failure import Failure
 from ._interfaces import ILogObserver, LogTrace
 from ._levels import InvalidLogLevelError, LogLevel
 
+_logLevels = frozenset(LogLevel.iterconstants())
+
 
 class Logger:
     """
@@ -117,7 +119,7 @@ class Logger:
             non-deterministic behavior from observers that schedule work for
             later execution.
         """
-        if level not in LogLevel.iterconstants():
+        if level not in _logLevels:
             self.failure(
                 "Got invalid log level {invalidLevel!r} in {logger}.emit().",
                 Failure(InvalidLogLevelError(level)),
@@ -126,6 +128,13 @@ class Logger:
             )
             return
 
+        minimumLevel = getattr(self.observer, "_minimumLevel", None)
+        if minimumLevel is not None and "log_trace" not in kwargs:
+            # Don't bother making an event which no observer would use.
+            lowest = minimumLevel(self.namespace)
+            if lowest is None or level < lowest:
+                return
+
         event = kwargs
         event.update(
             log_logger=self,
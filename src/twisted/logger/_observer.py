@@ -6,18 +6,61 @@
 Basic log observers.
 """
 
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional, cast
 
 from zope.interface import implementer
 
+from constantly import NamedConstant
+
 from twisted.python.failure import Failure
 from ._interfaces import ILogObserver, LogEvent
+from ._levels import LogLevel
 from ._logger import Logger
 
 OBSERVER_DISABLED = (
     "Temporarily disabling observer {observer} due to exception: {log_failure}"
 )
 
+# Counts changes to which events observers want, so that levels worked out
+# by _minimumLevel may be cached until the next change.
+_observersGeneration = 0
+
+# At most this many namespaces have their levels cached by a LogPublisher.
+_MAX_CACHED_LEVELS = 10_000
+
+
+def _observersChanged() -> None:
+    """
+    Note that which events some observer wants may have changed, so levels
+    cached from L{_minimumLevel} must be worked out again.
+    """
+    global _observersGeneration
+    _observersGeneration += 1
+
+
+def _minimumLevel(observer: ILogObserver, namespace: str) -> Optional[NamedConstant]:
+    """
+    Find the lowest level of the events from a namespace which an observer may
+    do anything with, so that L{Logger.emit} can drop events below it without
+    making them.
+
+    Observers which can tell have a C{_minimumLevel} method which does this;
+    any other observer is assumed to want every event, apart from
+    L{bitbucketLogObserver}, which wants none.
+
+    @param observer: An observer.
+    @param namespace: A logging namespace.
+
+    @return: That level, or L{None} if the observer ignores every event from
+        the namespace.
+    """
+    if observer is bitbucketLogObserver:
+        return None
+    minimumLevel = getattr(observer, "_minimumLevel", None)
+    if minimumLevel is None:
+        return LogLevel.debug
+    return cast(Optional[NamedConstant], minimumLevel(namespace))
+
 
 @implementer(ILogObserver)
 class LogPublisher:
@@ -30,6 +73,8 @@ class LogPublisher:
 
     def __init__(self, *observers: ILogObserver) -> None:
         self._observers = list(observers)
+        self._levelCache: Dict[str, Optional[NamedConstant]] = {}
+        self._levelCacheGeneration = _observersGeneration
         self.log = Logger(observer=self)
 
     def addObserver(self, observer: ILogObserver) -> None:
@@ -42,6 +87,7 @@ class LogPublisher:
             raise TypeError(f"Observer is not callable: {observer!r}")
         if observer not in self._observers:
             self._observers.append(observer)
+            _observersChanged()
 
     def removeObserver(self, observer: ILogObserver) -> None:
         """
@@ -53,6 +99,37 @@ class LogPublisher:
             self._observers.remove(observer)
         except ValueError:
             pass
+        else:
+            _observersChanged()
+
+    def _minimumLevel(self, namespace: str) -> Optional[NamedConstant]:
+        """
+        Find the lowest level of the events from a namespace which any of the
+        observers may do anything with.
+
+        @see: L{_minimumLevel}
+
+        @param namespace: A logging namespace.
+
+        @return: That level, or L{None} if every observer ignores every event
+            from the namespace.
+        """
+        if self._levelCacheGeneration != _observersGeneration:
+            self._levelCache.clear()
+            self._levelCacheGeneration = _observersGeneration
+        try:
+            return self._levelCache[namespace]
+        except KeyError:
+            pass
+
+        lowest = None
+        for observer in self._observers:
+            level = _minimumLevel(observer, namespace)
+            if level is not None and (lowest is None or level < lowest):
+                lowest = level
+        if len(self._levelCache) < _MAX_CACHED_LEVELS:
+            self._levelCache[namespace] = lowest
+        return lowest
 
     def __call__(self, event: LogEvent) -> None:
         """
@@ -6,15 +6,18 @@ Test cases for L{twisted.logger._file}.
 """
 
 from io import StringIO
+from threading import Thread
 from types import TracebackType
 from typing import IO, Any, AnyStr, Optional, Type, cast
 
 from zope.interface.exceptions import BrokenMethodImplementation
 from zope.interface.verify import verifyObject
 
+from twisted._threads import AlreadyQuit, createMemoryWorker
+from twisted.internet.testing import MemoryReactor
 from twisted.python.failure import Failure
 from twisted.trial.unittest import TestCase
-from .._file import FileLogObserver, textFileLogObserver
+from .._file import FileLogObserver, ThreadedFileLogObserver, textFileLogObserver
 from .._interfaces import ILogObserver
 
 
@@ -149,6 +152,140 @@ class TextFileLogObserverTests(TestCase):
             self.assertIn(expected, output)
 
 
+class ThreadedFileLogObserverTests(TestCase):
+    """
+    Tests for L{ThreadedFileLogObserver}.
+    """
+
+    def setUp(self) -> None:
+        self.worker, self.perform = createMemoryWorker()
+        self.fileHandle = StringIO()
+        self.addCleanup(self.fileHandle.close)
+
+    def observer(self, **kwargs: Any) -> ThreadedFileLogObserver:
+        """
+        Make a L{ThreadedFileLogObserver} writing to C{self.fileHandle} with
+        C{self.worker}.
+        """
+        return ThreadedFileLogObserver(
+            self.fileHandle, lambda e: f"{e['x']}\n", worker=self.worker, **kwargs
+        )
+
+    def test_interface(self) -> None:
+        """
+        L{ThreadedFileLogObserver} is an L{ILogObserver}.
+        """
+        try:
+            verifyObject(ILogObserver, self.observer())
+        except BrokenMethodImplementation as e:
+            self.fail(e)
+
+    def test_writesInBatches(self) -> None:
+        """
+        Events are written by the worker, all those waiting at once, with one
+        write and one flush.
+        """
+        with DummyFile() as fileHandle:
+            observer = ThreadedFileLogObserver(
+                cast(IO[Any], fileHandle), lambda e: str(e), worker=self.worker
+            )
+            observer(dict(x=1))
+            observer(dict(x=2))
+            self.assertEqual(fileHandle.writes, 0)
+            self.assertTrue(self.perform())
+            self.assertFalse(self.perform())
+            self.assertEqual((fileHandle.writes, fileHandle.flushes), (1, 1))
+
+    def test_observeWrites(self) -> None:
+        """
+        The formatted events are written in the order they were observed.
+        """
+        observer = self.observer()
+        for x in range(3):
+            observer(dict(x=x))
+        self.perform()
+        observer(dict(x=3))
+        self.perform()
+        self.assertEqual(self.fileHandle.getvalue(), "0\n1\n2\n3\n")
+
+    def test_dropOldest(self) -> None:
+        """
+        When the buffer is full, the oldest event in it is dropped to make
+        room for a new one, and counted in C{dropped}.
+        """
+        observer = self.observer(bufferSize=2)
+        for x in range(3):
+            observer(dict(x=x))
+        self.perform()
+        self.assertEqual(self.fileHandle.getvalue(), "1\n2\n")
+        self.assertEqual(observer.dropped, 1)
+
+    def test_blockWhenFull(self) -> None:
+        """
+        With C{blockWhenFull=True}, observing an event when the buffer is full
+        waits until the worker has made room for it.
+        """
+        observer = self.observer(bufferSize=1, blockWhenFull=True)
+        observer(dict(x=0))
+        emitter = Thread(target=observer, args=(dict(x=1),))
+        emitter.start()
+        emitter.join(0.1)
+        self.assertTrue(emitter.is_alive())
+        self.perform()
+        emitter.join(10)
+        self.assertFalse(emitter.is_alive())
+        self.perform()
+        self.assertEqual(self.fileHandle.getvalue(), "0\n1\n")
+        self.assertEqual(observer.dropped, 0)
+
+    def test_formatFailure(self) -> None:
+        """
+        An event which cannot be formatted is counted in C{dropped}, and the
+        rest of its batch is written.
+        """
+        observer = self.observer()
+        observer(dict(x=0))
+        observer(dict())
+        observer(dict(x=2))
+        self.perform()
+        self.assertEqual(self.fileHandle.getvalue(), "0\n2\n")
+        self.assertEqual(observer.dropped, 1)
+
+    def test_stop(self) -> None:
+        """
+        L{ThreadedFileLogObserver.stop} writes the events in the buffer and
+        stops the worker, after which events are written as they are observed.
+        """
+        observer = self.observer()
+        observer(dict(x=0))
+        observer.stop()
+        self.assertEqual(self.fileHandle.getvalue(), "0\n")
+        self.assertRaises(AlreadyQuit, self.worker.do, lambda: None)
+        observer(dict(x=1))
+        self.assertEqual(self.fileHandle.getvalue(), "0\n1\n")
+
+    def test_stopOnShutdown(self) -> None:
+        """
+        If a reactor is given, L{ThreadedFileLogObserver.stop} is called after
+        it shuts down.
+        """
+        reactor = MemoryReactor()
+        observer = self.observer(reactor=reactor)
+        self.assertEqual(
+            reactor.triggers["after"]["shutdown"], [(observer.stop, (), {})]
+        )
+
+    def test_thread(self) -> None:
+        """
+        By default, events are written by a thread of the observer's own.
+        """
+        observer = ThreadedFileLogObserver(self.fileHandle, lambda e: f"{e['x']}\n")
+        observer(dict(x=0))
+        observer(dict(x=1))
+        observer.stop()
+        self.assertEqual(self.fileHandle.getvalue(), "0\n1\n")
+
+
 class DummyFile:
     """
     File that counts writes and flushes.
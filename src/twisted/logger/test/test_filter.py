@@ -254,6 +254,50 @@ class FilteringLogObserverTests(unittest.TestCase):
         publisher = LogPublisher(yesFilter, noFilter, testObserver)
         publisher(event)
 
+    def test_minimumLevel(self) -> None:
+        """
+        L{FilteringLogObserver._minimumLevel} is the highest level set by its
+        leading L{LogLevelFilterPredicate}s, or lower if its observer wants
+        events at a lower level.
+        """
+        warn = LogLevelFilterPredicate(LogLevel.warn)
+        error = LogLevelFilterPredicate(LogLevel.error)
+        self.assertEqual(
+            FilteringLogObserver(lambda e: None, [warn])._minimumLevel("ns"),
+            LogLevel.warn,
+        )
+        self.assertEqual(
+            FilteringLogObserver(lambda e: None, [warn, error])._minimumLevel("ns"),
+            LogLevel.error,
+        )
+        self.assertIsNone(
+            FilteringLogObserver(bitbucketLogObserver, [warn])._minimumLevel("ns")
+        )
+
+    def test_minimumLevelOtherPredicate(self) -> None:
+        """
+        L{LogLevelFilterPredicate}s after any other predicate do not count
+        towards L{FilteringLogObserver._minimumLevel}, since the other
+        predicate may let events of any level through.
+        """
+        warn = LogLevelFilterPredicate(LogLevel.warn)
+        other = cast(ILogFilterPredicate, lambda e: PredicateResult.yes)
+        self.assertEqual(
+            FilteringLogObserver(lambda e: None, [other, warn])._minimumLevel("ns"),
+            LogLevel.debug,
+        )
+
+    def test_minimumLevelNegativeObserver(self) -> None:
+        """
+        L{FilteringLogObserver._minimumLevel} counts events going to its
+        negative observer.
+        """
+        warn = LogLevelFilterPredicate(LogLevel.warn)
+        observer = FilteringLogObserver(
+            lambda e: None, [warn], negativeObserver=lambda e: None
+        )
+        self.assertEqual(observer._minimumLevel("ns"), LogLevel.debug)
+
 
 class LogLevelFilterPredicateTests(unittest.TestCase):
     """
@@ -391,3 +435,16 @@ class LogLevelFilterPredicateTests(unittest.TestCase):
         checkPredicate("", LogLevel.critical, PredicateResult.no)
         checkPredicate(cast(str, None), LogLevel.critical, PredicateResult.no)
         checkPredicate("twext.web2", None, PredicateResult.no)
+
+    def test_levelCache(self) -> None:
+        """
+        L{LogLevelFilterPredicate.logLevelForNamespace} keeps the levels it
+        works out until the levels are set or cleared.
+        """
+        predicate = LogLevelFilterPredicate()
+        self.assertEqual(predicate.logLevelForNamespace("a.b"), LogLevel.info)
+        self.assertEqual(predicate._levelCache, {"a.b": LogLevel.info})
+        predicate.setLogLevelForNamespace("a", LogLevel.error)
+        self.assertEqual(predicate.logLevelForNamespace("a.b"), LogLevel.error)
+        predicate.clearLogLevels()
+        self.assertEqual(predicate.logLevelForNamespace("a.b"), LogLevel.info)
@@ -15,6 +15,7 @@ except ImportError:
     tzset = None  # type: ignore[assignment]
 
 from twisted.trial import unittest
+from .. import _flatten
 from .._flatten import KeyFlattener, aFormatter, extractField, flattenEvent
 from .._format import formatEvent
 from .._interfaces import LogEvent
@@ -324,3 +325,35 @@ class FlatFormattingTests(unittest.TestCase):
                 "log_format": None,
             },
         )
+
+    def test_formatParsedOnce(self) -> None:
+        """
+        A format string is parsed once, however many events are flattened and
+        formatted with it.
+        """
+        self.patch(_flatten, "_parsedFormats", {})
+        parsed = []
+
+        def parse(formatString: str) -> Any:
+            parsed.append(formatString)
+            return aFormatter.__class__.parse(aFormatter, formatString)
+
+        self.patch(aFormatter, "parse", parse)
+        for n in range(3):
+            event = dict(log_format="{n} {n!r} {x.real}", n=n, x=n)
+            flattenEvent(event)
+            self.assertEqual(formatEvent(event), f"{n} {n!r} {n}")
+        self.assertEqual(parsed, ["{n} {n!r} {x.real}"])
+
+    def test_parsedFormatsLimit(self) -> None:
+        """
+        At most C{_MAX_CACHED_FORMATS} parsed format strings are kept; others
+        are parsed each time they are used.
+        """
+        self.patch(_flatten, "_parsedFormats", {})
+        self.patch(_flatten, "_MAX_CACHED_FORMATS", 1)
+        for format in ["{a}", "{b}"]:
+            event = dict(log_format=format, a="A", b="B")
+            flattenEvent(event)
+            self.assertEqual(formatEvent(event), format[1].upper())
+        self.assertEqual(list(_flatten._parsedFormats), ["{a}"])
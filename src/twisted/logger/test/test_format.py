@@ -421,6 +421,38 @@ class FormatFieldTests(unittest.TestCase):
             "Hello, 'repr'.",
         )
 
+    def test_formatWithCallNested(self) -> None:
+        """
+        L{formatWithCall} fills in fields in format specs, and attribute and
+        item lookups, as L{str.format} does.
+        """
+        self.assertEqual(
+            formatWithCall(
+                "{value:>{width}} {point.x} {items[1]} {point.double()}",
+                dict(value=1, width=3, point=Point(), items=["a", "b"]),
+            ),
+            "  1 1 b 2",
+        )
+
+    def test_formatWithCallPositional(self) -> None:
+        """
+        L{formatWithCall} takes no positional arguments, so a format with
+        positional fields raises L{IndexError}, as L{str.format} does.
+        """
+        self.assertRaises(IndexError, formatWithCall, "{0}", {})
+        self.assertRaises(IndexError, formatWithCall, "{}", {})
+
+
+class Point:
+    """
+    An object with an attribute and a method to format.
+    """
+
+    x = 1
+
+    def double(self) -> int:
+        return self.x * 2
+
 
 class Unformattable:
     """
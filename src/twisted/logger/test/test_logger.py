@@ -274,3 +274,48 @@ class LoggerTests(unittest.TestCase):
 
         log = TestLogger(observer=publisher)
         log.info("Hello.", log_trace=[])
+
+    def test_belowMinimumLevel(self) -> None:
+        """
+        L{Logger.emit} drops events below the level its observer's
+        C{_minimumLevel} gives for its namespace, and every event if that is
+        L{None}, without calling the observer.
+        """
+        events: List[LogEvent] = []
+        levels: List[str] = []
+
+        class MinimumLevelObserver:
+            minimumLevel: Optional[NamedConstant] = LogLevel.warn
+
+            def __call__(self, event: LogEvent) -> None:
+                events.append(event)
+
+            def _minimumLevel(self, namespace: str) -> Optional[NamedConstant]:
+                levels.append(namespace)
+                return self.minimumLevel
+
+        observer = MinimumLevelObserver()
+        log = Logger(namespace="ns", observer=cast(ILogObserver, observer))
+        log.info("dropped")
+        log.warn("kept")
+        observer.minimumLevel = None
+        log.critical("dropped")
+        self.assertEqual([e["log_format"] for e in events], ["kept"])
+        self.assertEqual(levels, ["ns", "ns", "ns"])
+
+    def test_traceBelowMinimumLevel(self) -> None:
+        """
+        Events being traced are emitted whatever their level.
+        """
+        events: List[LogEvent] = []
+
+        class NothingObserver:
+            def __call__(self, event: LogEvent) -> None:
+                events.append(event)
+
+            def _minimumLevel(self, namespace: str) -> None:
+                return None
+
+        log = Logger(observer=cast(ILogObserver, NothingObserver()))
+        log.debug("traced", log_trace=[])
+        self.assertEqual(len(events), 1)
@@ -12,9 +12,11 @@ from zope.interface.exceptions import BrokenMethodImplementation
 from zope.interface.verify import verifyObject
 
 from twisted.trial import unittest
+from .._filter import FilteringLogObserver, LogLevelFilterPredicate
 from .._interfaces import ILogObserver, LogEvent
+from .._levels import LogLevel
 from .._logger import Logger
-from .._observer import LogPublisher
+from .._observer import LogPublisher, bitbucketLogObserver
 
 
 class LogPublisherTests(unittest.TestCase):
@@ -190,3 +192,40 @@ class LogPublisherTests(unittest.TestCase):
 
         self.assertEqual(traces[1], ((publisher, o1),))
         self.assertEqual(traces[2], ((publisher, o1), (publisher, o2)))
+
+    def test_minimumLevel(self) -> None:
+        """
+        L{LogPublisher._minimumLevel} is the lowest level that any of its
+        observers wants events at, or L{None} if none want any.
+        """
+        warn = LogLevelFilterPredicate(LogLevel.warn)
+        info = LogLevelFilterPredicate(LogLevel.info)
+        publisher = LogPublisher(
+            FilteringLogObserver(bitbucketLogObserver, [info]),
+            FilteringLogObserver(lambda e: None, [warn]),
+        )
+        self.assertEqual(publisher._minimumLevel("ns"), LogLevel.warn)
+        publisher.addObserver(FilteringLogObserver(lambda e: None, [info]))
+        self.assertEqual(publisher._minimumLevel("ns"), LogLevel.info)
+        publisher.addObserver(lambda e: None)
+        self.assertEqual(publisher._minimumLevel("ns"), LogLevel.debug)
+        self.assertIsNone(LogPublisher()._minimumLevel("ns"))
+
+    def test_minimumLevelChanges(self) -> None:
+        """
+        The levels that L{LogPublisher._minimumLevel} works out are worked out
+        again when observers are added or removed, or the levels of
+        L{LogLevelFilterPredicate}s are changed.
+        """
+        predicate = LogLevelFilterPredicate(LogLevel.warn)
+        filtering = FilteringLogObserver(lambda e: None, [predicate])
+        publisher = LogPublisher(filtering)
+        self.assertEqual(publisher._minimumLevel("a.b"), LogLevel.warn)
+        predicate.setLogLevelForNamespace("a", LogLevel.info)
+        self.assertEqual(publisher._minimumLevel("a.b"), LogLevel.info)
+        publisher.removeObserver(filtering)
+        self.assertIsNone(publisher._minimumLevel("a.b"))
+        publisher.addObserver(filtering)
+        self.assertEqual(publisher._minimumLevel("a.b"), LogLevel.info)
+        predicate.clearLogLevels()
+        self.assertEqual(publisher._minimumLevel("a.b"), LogLevel.warn)
@@ -9,6 +9,7 @@ Authoritative resolvers.
 
 import os
 import time
+from functools import lru_cache
 
 from twisted.internet import defer
 from twisted.names import common, dns, error
@@ -16,6 +17,27 @@ from twisted.python import failure
 from twisted.python.compat import execfile, nativeString
 from twisted.python.filepath import FilePath
 
+# The names of record classes, and of record classes and types, which tell
+# where the fields of a line of a zone file are.
+_QUERY_CLASSES = frozenset(qc.encode("ascii") for qc in dns.QUERY_CLASSES.values())
+_MARKERS = _QUERY_CLASSES | frozenset(
+    qt.encode("ascii") for qt in dns.QUERY_TYPES.values()
+)
+_NATIVE_MARKERS = {marker: nativeString(marker) for marker in _MARKERS}
+
+
+@lru_cache(maxsize=None)
+def _recordClass(type):
+    """
+    Find the class of records of a type.
+
+    @param type: The name of the type, such as C{"A"}.
+    @type type: L{str}
+
+    @return: The L{dns.IRecord} implementation, or L{None} if there is none.
+    """
+    return getattr(dns, f"Record_{nativeString(type)}", None)
+
 
 def getSerial(filename="/tmp/twisted-names.serial"):
     """
@@ -56,6 +78,147 @@ def getSerial(filename="/tmp/twisted-names.serial"):
     return serial
 
 
+class _ZoneNode:
+    """
+    A name in a L{_ZoneIndex}, and the names below it.
+
+    @ivar records: The records of this name, the same L{list} as in
+        L{FileAuthority.records}, or L{None} if the name only exists because
+        names below it do.
+
+    @ivar children: The nodes of the names one label longer, keyed by their
+        first label, or L{None} if there are none.
+    @type children: L{dict} or L{None}
+
+    @ivar _rrsets: C{records} by type, or L{None} until they are needed.
+
+    @ivar _rrsetsFrom: A copy of C{records} as it was when C{_rrsets} was
+        made, so that they are made again if C{records} is changed.
+    """
+
+    __slots__ = ("records", "children", "_rrsets", "_rrsetsFrom")
+
+    def __init__(self, records=None):
+        self.records = records
+        self.children = None
+        self._rrsets = None
+        self._rrsetsFrom = None
+
+    def child(self, label):
+        """
+        Find the node of the name one label longer.
+
+        @param label: The first label of the longer name, lowercased.
+        @type label: L{bytes}
+
+        @return: The L{_ZoneNode}, or L{None} if there is no such name.
+        """
+        if self.children is None:
+            return None
+        return self.children.get(label)
+
+    def rrsets(self):
+        """
+        Find the records of each type.
+
+        @return: A L{dict} mapping record types to L{list}s of the records of
+            that type, in the order they appear in C{records}.  It must not
+            be changed.
+        """
+        records = self.records
+        if not records:
+            return {}
+        # Comparing the lists compares records by identity first, so this
+        # is cheap unless they have changed.
+        if self._rrsets is None or records != self._rrsetsFrom:
+            rrsets = {}
+            for record in records:
+                rrsets.setdefault(record.TYPE, []).append(record)
+            self._rrsets = rrsets
+            self._rrsetsFrom = records[:]
+        return self._rrsets
+
+
+class _ZoneIndex:
+    """
+    An index of the names of a zone, as a tree of their labels from the zone
+    apex down.  Finding the node of a name also finds the closest enclosing
+    name which exists, and the delegation, if any, the name falls under, in
+    one pass over its labels.
+
+    @ivar origin: The name of the zone apex, lowercased.
+    @type origin: L{bytes}
+
+    @ivar apex: The L{_ZoneNode} of C{origin}.
+
+    @ivar records: The mapping of names to records this indexes.
+    @type records: L{dict}
+
+    @ivar size: The number of names in C{records} when it was indexed.
+    @type size: L{int}
+    """
+
+    def __init__(self, origin, records):
+        """
+        @param origin: See L{_ZoneIndex.origin}.
+
+        @param records: See L{_ZoneIndex.records}.  Names which are not in the
+            zone are left out.
+        """
+        self.origin = origin = origin.lower()
+        self.records = records
+        self.size = len(records)
+        self.apex = _ZoneNode(records.get(origin))
+        suffix = b"." + origin
+        for name, nameRecords in records.items():
+            if not name.endswith(suffix):
+                continue
+            node = self.apex
+            for label in reversed(name[: -len(suffix)].split(b".")):
+                if node.children is None:
+                    node.children = {}
+                child = node.children.get(label)
+                if child is None:
+                    child = node.children[label] = _ZoneNode()
+                node = child
+            node.records = nameRecords
+
+    def find(self, name):
+        """
+        Find a name in the zone.
+
+        @param name: The name, lowercased.
+        @type name: L{bytes}
+
+        @return: L{None} if C{name} is not in the zone, or a 3-tuple of the
+            L{_ZoneNode} of C{name}, or L{None} if it does not exist; the
+            name and node of the closest enclosing name which does exist, or
+            the name and node of the delegation C{name} is at or below,
+            whichever is closest to the apex; and a L{bool} which is true if
+            that is a delegation.
+        """
+        origin = self.origin
+        if name == origin:
+            return self.apex, (origin, self.apex), False
+        if not name.endswith(b"." + origin):
+            return None
+        labels = name[: -len(origin) - 1].split(b".")
+        node = self.apex
+        for i in range(len(labels) - 1, -1, -1):
+            children = node.children
+            child = None if children is None else children.get(labels[i])
+            if child is None:
+                return None, (b".".join(labels[i + 1 :] + [origin]), node), False
+            node = child
+            if dns.NS in node.rrsets():
+                return (
+                    node if i == 0 else None,
+                    (b".".join(labels[i:] + [origin]), node),
+                    True,
+                )
+        return node, (name, node), False
+
+
 class FileAuthority(common.ResolverBase):
     """
     An Authority that is loaded from a file.
@@ -74,6 +237,13 @@ class FileAuthority(common.ResolverBase):
 
     @ivar records: A mapping of domains (as lowercased L{bytes}) to records.
     @type records: L{dict} with L{bytes} keys
+
+    @ivar _index: The L{_ZoneIndex} of the names in C{records} which are in
+        the zone, by which names below a delegation, names matched by a
+        wildcard and names with no records but names below them are found.
+        It is made again when C{records} is replaced, when names are added to
+        or removed from it, and when a lookup finds that the records of the
+        name it was answered from have been replaced.
     """
 
     # See https://twistedmatrix.com/trac/ticket/6650
@@ -82,11 +252,19 @@ class FileAuthority(common.ResolverBase):
 
     soa = None
     records = None
+    _index = None
 
     def __init__(self, filename):
         common.ResolverBase.__init__(self)
         self.loadFile(filename)
         self._cache = {}
+        if self.soa is not None:
+            self._zoneIndex()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_index", None)
+        return state
 
     def __setstate__(self, state):
         self.__dict__ = state
@@ -158,70 +336,218 @@ class FileAuthority(common.ResolverBase):
             I{additional} sections of a DNS response) or with a L{Failure} if
             there is a problem processing the query.
         """
-        cnames = []
-        results = []
-        authority = []
-        additional = []
         default_ttl = max(self.soa[1].minimum, self.soa[1].expire)
+        lowerName = name.lower()
+        found = self._zoneIndex().find(lowerName)
+        if found is not None and not self._indexCurrent(lowerName, found):
+            self._index = None
+            found = self._zoneIndex().find(lowerName)
+        if found is None:
+            # The name is not in the zone, but there may be records for it
+            # anyway.
+            domain_records = self.records.get(lowerName)
+            if domain_records:
+                return defer.succeed(
+                    self._recordsResponse(
+                        name, _ZoneNode(domain_records), type, default_ttl
+                    )
+                )
+        else:
+            node, (closestName, closest), delegated = found
+            if node is None and delegated:
+                # The name is in a child zone: refer the client to it.
+                return defer.succeed(self._referral(closestName, closest, default_ttl))
+            if node is None:
+                # Synthesize records from a wildcard, RFC 4592.
+                node = closest.child(b"*")
+            if node is not None and node.records:
+                return defer.succeed(
+                    self._recordsResponse(name, node, type, default_ttl)
+                )
+            if node is not None and node.children:
+                # The name only exists because names below it do, so it has
+                # no records of any type.  RFC 4592, section 2.2.2.
+                return defer.succeed(([], [self._soaRecord(default_ttl)], []))
+
+        if dns._isSubdomainOf(name, self.soa[0]):
+            # We are the authority and we didn't find it.
+            return defer.fail(failure.Failure(dns.AuthoritativeDomainError(name)))
+        else:
+            # The QNAME is not a descendant of this zone. Fail with
+            # DomainError so that the next chained authority or
+            # resolver will be queried.
+            return defer.fail(failure.Failure(error.DomainError(name)))
 
-        domain_records = self.records.get(name.lower())
+    def _zoneIndex(self):
+        """
+        Get the index of the names in the zone, indexing C{records} if it has
+        not been indexed, or has been replaced or had names added to or
+        removed from it since it was.
 
-        if domain_records:
-            for record in domain_records:
-                if record.ttl is not None:
-                    ttl = record.ttl
-                else:
-                    ttl = default_ttl
-
-                if record.TYPE == dns.NS and name.lower() != self.soa[0].lower():
-                    # NS record belong to a child zone: this is a referral.  As
-                    # NS records are authoritative in the child zone, ours here
-                    # are not.  RFC 2181, section 6.1.
-                    authority.append(
-                        dns.RRHeader(name, record.TYPE, dns.IN, ttl, record, auth=False)
-                    )
-                elif record.TYPE == type or type == dns.ALL_RECORDS:
-                    results.append(
-                        dns.RRHeader(name, record.TYPE, dns.IN, ttl, record, auth=True)
-                    )
-                if record.TYPE == dns.CNAME:
-                    cnames.append(
-                        dns.RRHeader(name, record.TYPE, dns.IN, ttl, record, auth=True)
-                    )
-            if not results:
-                results = cnames
+        @return: A L{_ZoneIndex} of C{records}.
+        """
+        index = self._index
+        if (
+            index is None
+            or index.records is not self.records
+            or index.size != len(self.records)
+            or index.origin != self.soa[0].lower()
+        ):
+            index = self._index = _ZoneIndex(self.soa[0], self.records)
+        return index
+
+    def _indexCurrent(self, name, found):
+        """
+        Check that what the index found for a name agrees with C{records},
+        which may have been changed in place since it was indexed.
+
+        @param name: The name looked up, lowercased.
+        @type name: L{bytes}
+
+        @param found: What L{_ZoneIndex.find} found for C{name}.
+
+        @return: C{True} if the records of C{name}, or of the delegation or
+            wildcard it would be answered from, are those in C{records}.
+        """
+        node, (closestName, closest), delegated = found
+        records = self.records
+        if node is not None:
+            return node.records is records.get(name)
+        if delegated:
+            return closest.records is records.get(closestName)
+        if name in records:
+            return False
+        wildcard = closest.child(b"*")
+        return (wildcard and wildcard.records) is records.get(b"*." + closestName)
+
+    def _soaRecord(self, ttl):
+        """
+        Make the record of the SOA of this zone, for a negative response.
+
+        @param ttl: The TTL of the record.
+
+        @return: A L{dns.RRHeader}.
+        """
+        return dns.RRHeader(self.soa[0], dns.SOA, dns.IN, ttl, self.soa[1], auth=True)
+
+    def _referral(self, name, cut, ttl):
+        """
+        Make the response referring a client to a child zone.
+
+        @param name: The name of the child zone.
+        @type name: L{bytes}
+
+        @param cut: The L{_ZoneNode} of C{name}, which has I{NS} records.
+
+        @param ttl: The default TTL for records for which this is not otherwise
+            specified.
+
+        @return: A L{tuple} of the I{answer}, I{authority} and I{additional}
+            sections of the response.
+        """
+        # As NS records are authoritative in the child zone, ours here are
+        # not.  RFC 2181, section 6.1.
+        authority = [
+            dns.RRHeader(
+                name,
+                dns.NS,
+                dns.IN,
+                ttl if record.ttl is None else record.ttl,
+                record,
+                auth=False,
+            )
+            for record in cut.rrsets()[dns.NS]
+        ]
+        return [], authority, list(self._additionalRecords([], authority, ttl))
+
+    def _recordsResponse(self, name, node, type, default_ttl):
+        """
+        Make the response to a query for a name which has records.
+
+        @param name: The name which is being queried.
+        @type name: L{bytes}
+
+        @param node: The L{_ZoneNode} holding the records of C{name}.
 
-            # Sort of https://tools.ietf.org/html/rfc1034#section-4.3.2 .
-            # See https://twistedmatrix.com/trac/ticket/6732
-            additionalInformation = self._additionalRecords(
-                results, authority, default_ttl
+        @param type: The type of records being queried.
+
+        @param default_ttl: The default TTL for records for which this is not
+            otherwise specified.
+
+        @return: A L{tuple} of the I{answer}, I{authority} and I{additional}
+            sections of the response.
+        """
+
+        rrsets = node.rrsets()
+        atApex = node is self._index.apex
+        if type == dns.ALL_RECORDS:
+            records = [
+                record for record in node.records if atApex or record.TYPE != dns.NS
+            ]
+        elif type == dns.NS and not atApex:
+            records = ()
+        else:
+            records = rrsets.get(type, ())
+        results = [
+            dns.RRHeader(
+                name,
+                record.TYPE,
+                dns.IN,
+                default_ttl if record.ttl is None else record.ttl,
+                record,
+                auth=True,
             )
-            if cnames:
-                results.extend(additionalInformation)
-            else:
-                additional.extend(additionalInformation)
-
-            if not results and not authority:
-                # Empty response. Include SOA record to allow clients to cache
-                # this response. RFC 1034, sections 3.7 and 4.3.4, and RFC 2181
-                # section 7.1.
-                authority.append(
-                    dns.RRHeader(
-                        self.soa[0], dns.SOA, dns.IN, ttl, self.soa[1], auth=True
-                    )
+            for record in records
+        ]
+        cnames = [
+            dns.RRHeader(
+                name,
+                dns.CNAME,
+                dns.IN,
+                default_ttl if record.ttl is None else record.ttl,
+                record,
+                auth=True,
+            )
+            for record in rrsets.get(dns.CNAME, ())
+        ]
+        if not results:
+            results = cnames
+        additional = []
+        if atApex:
+            authority = []
+        else:
+            # NS records belong to a child zone: this is a referral.  As NS
+            # records are authoritative in the child zone, ours here are not.
+            # RFC 2181, section 6.1.
+            authority = [
+                dns.RRHeader(
+                    name,
+                    dns.NS,
+                    dns.IN,
+                    default_ttl if record.ttl is None else record.ttl,
+                    record,
+                    auth=False,
                 )
-            return defer.succeed((results, authority, additional))
+                for record in rrsets.get(dns.NS, ())
+            ]
+
+        # Sort of https://tools.ietf.org/html/rfc1034#section-4.3.2 .
+        # See https://twistedmatrix.com/trac/ticket/6732
+        additionalInformation = self._additionalRecords(results, authority, default_ttl)
+        if cnames:
+            results.extend(additionalInformation)
         else:
-            if dns._isSubdomainOf(name, self.soa[0]):
-                # We may be the authority and we didn't find it.
-                # XXX: The QNAME may also be in a delegated child zone. See
-                # #6581 and #6580
-                return defer.fail(failure.Failure(dns.AuthoritativeDomainError(name)))
-            else:
-                # The QNAME is not a descendant of this zone. Fail with
-                # DomainError so that the next chained authority or
-                # resolver will be queried.
-                return defer.fail(failure.Failure(error.DomainError(name)))
+            additional.extend(additionalInformation)
+
+        if not results and not authority:
+            # Empty response. Include SOA record to allow clients to cache
+            # this response. RFC 1034, sections 3.7 and 4.3.4, and RFC 2181
+            # section 7.1.
+            last = node.records[-1]
+            authority.append(
+                self._soaRecord(default_ttl if last.ttl is None else last.ttl)
+            )
+        return results, authority, additional
 
     def lookupZone(self, name, timeout=10):
         name = dns.domainString(name)
@@ -434,7 +760,7 @@ class BindAuthority(FileAuthority):
         @param rdata:
         @type rdata: bytes
         """
-        record = getattr(dns, f"Record_{nativeString(type)}", None)
+        record = _recordClass(type)
         if record:
             r = record(*rdata)
             r.ttl = ttl
@@ -462,10 +788,8 @@ class BindAuthority(FileAuthority):
         @param line: zone file line to parse; split by word
         @type line: L{list} of L{bytes}
         """
-        queryClasses = {qc.encode("ascii") for qc in dns.QUERY_CLASSES.values()}
-        queryTypes = {qt.encode("ascii") for qt in dns.QUERY_TYPES.values()}
-
-        markers = queryClasses | queryTypes
+        queryClasses = _QUERY_CLASSES
+        markers = _MARKERS
 
         cls = b"IN"
         owner = origin
@@ -500,4 +824,11 @@ class BindAuthority(FileAuthority):
         type = line[0]
         rdata = line[1:]
 
-        self.addRecord(owner, ttl, nativeString(type), domain, nativeString(cls), rdata)
+        self.addRecord(
+            owner,
+            ttl,
+            _NATIVE_MARKERS.get(type) or nativeString(type),
+            domain,
+            _NATIVE_MARKERS.get(cls) or nativeString(cls),
+            rdata,
+        )
@@ -6,9 +6,12 @@
 An in-memory caching resolver.
 """
 
+import heapq
+from collections import OrderedDict
+from itertools import count
 
 from twisted.internet import defer
-from twisted.names import common, dns
+from twisted.names import common, dns, error
 from twisted.python import failure, log
 
 
@@ -16,41 +19,141 @@ class CacheResolver(common.ResolverBase):
     """
     A resolver that serves records from a local, memory cache.
 
+    Entries expire after the smallest TTL of their records.  A single timer,
+    for the earliest expiry, removes expired entries; the expiry times of
+    every entry are kept in a heap.
+
+    @ivar cache: An L{OrderedDict} mapping L{dns.Query} instances to a
+        2-tuple of the time they were cached and their result, least recently
+        used first.
+
+    @ivar maxSize: The most entries to keep; when there are more, the least
+        recently used are evicted.  L{None} for no limit.
+    @type maxSize: L{int} or L{None}
+
+    @ivar staleTTL: The number of seconds entries are kept after they expire,
+        for L{CacheResolver.staleResult} to serve if the upstream servers
+        cannot be reached (RFC 8767).
+    @type staleTTL: L{int}
+
+    @ivar prefetchResolver: An L{interfaces.IResolver} used to refresh an
+        entry when it is looked up after less than C{prefetchRatio} of its
+        TTL is left, so that popular entries do not expire, or L{None} to not
+        refresh entries.
+
+    @ivar prefetchRatio: The fraction of an entry's TTL under which looking
+        it up refreshes it.
+    @type prefetchRatio: L{float}
+
     @ivar _reactor: A provider of L{interfaces.IReactorTime}.
+
+    @ivar _expires: A L{dict} mapping the queries in C{cache} to the time
+        they expire.
+
+    @ivar _nameErrors: The queries in C{cache} whose name does not exist.
+
+    @ivar _prefetching: The queries being refreshed by C{prefetchResolver}.
+
+    @ivar _removals: A heap of C{(time, n, query)} tuples: the times at which
+        entries stop being served, even as stale.  A tuple whose time no
+        longer matches its query's entry is left in place and skipped, until
+        there are so many of those that the heap is made again from
+        C{_expires}.
+
+    @ivar _removalCall: The L{IDelayedCall} which removes the earliest
+        expiring entries, if any.
     """
 
     cache = None
 
-    def __init__(self, cache=None, verbose=0, reactor=None):
+    _STALE_TTL = 30
+
+    def __init__(
+        self,
+        cache=None,
+        verbose=0,
+        reactor=None,
+        maxSize=None,
+        staleTTL=0,
+        prefetchResolver=None,
+        prefetchRatio=0.1,
+    ):
+        """
+        @param cache: A L{dict} mapping L{dns.Query} instances to a 2-tuple of
+            the time they were cached and their result, to start with.
+
+        @param verbose: How much to log: 1 for cache hits, 2 for cache misses
+            and additions too.
+
+        @param reactor: A provider of L{interfaces.IReactorTime}.
+
+        @param maxSize: The value for L{CacheResolver.maxSize}.
+
+        @param staleTTL: The value for L{CacheResolver.staleTTL}.
+
+        @param prefetchResolver: The value for
+            L{CacheResolver.prefetchResolver}.
+
+        @param prefetchRatio: The value for L{CacheResolver.prefetchRatio}.
+        """
         common.ResolverBase.__init__(self)
 
-        self.cache = {}
+        self.cache = OrderedDict()
         self.verbose = verbose
-        self.cancel = {}
+        self.maxSize = maxSize
+        self.staleTTL = staleTTL
+        self.prefetchResolver = prefetchResolver
+        self.prefetchRatio = prefetchRatio
         if reactor is None:
             from twisted.internet import reactor
         self._reactor = reactor
+        self._expires = {}
+        self._nameErrors = set()
+        self._prefetching = set()
+        self._removals = []
+        self._removalCount = count()
+        self._removalCall = None
 
         if cache:
             for query, (seconds, payload) in cache.items():
                 self.cacheResult(query, payload, seconds)
 
     def __setstate__(self, state):
+        # A CacheResolver pickled by an older version of Twisted has a plain
+        # dict for its cache and none of the attributes added since.
+        state.pop("cancel", None)
+        for name, default in [
+            ("maxSize", None),
+            ("staleTTL", 0),
+            ("prefetchResolver", None),
+            ("prefetchRatio", 0.1),
+            ("_nameErrors", set()),
+            ("_removalCall", None),
+        ]:
+            state.setdefault(name, default)
         self.__dict__ = state
 
         now = self._reactor.seconds()
-        for k, (when, (ans, add, ns)) in self.cache.items():
-            diff = now - when
-            for rec in ans + add + ns:
-                if rec.ttl < diff:
-                    del self.cache[k]
-                    break
+        entries = list(self.cache.items())
+        self.cache = OrderedDict()
+        self._expires = {}
+        self._nameErrors, nameErrors = set(), self._nameErrors
+        self._prefetching = set()
+        self._removals = []
+        self._removalCount = count()
+        for query, (when, payload) in entries:
+            if when + self._ttl(payload) > now:
+                self._add(query, when, payload)
+                if query in nameErrors:
+                    self._nameErrors.add(query)
 
     def __getstate__(self):
-        for c in self.cancel.values():
-            c.cancel()
-        self.cancel.clear()
-        return self.__dict__
+        if self._removalCall is not None:
+            self._removalCall.cancel()
+            self._removalCall = None
+        state = self.__dict__.copy()
+        del state["_removalCount"]
+        return state
 
     def _lookup(self, name, cls, type, timeout):
         now = self._reactor.seconds()
@@ -61,44 +164,75 @@ class CacheResolver(common.ResolverBase):
             if self.verbose > 1:
                 log.msg("Cache miss for " + repr(name))
             return defer.fail(failure.Failure(dns.DomainError(name)))
-        else:
-            if self.verbose:
-                log.msg("Cache hit for " + repr(name))
-            diff = now - when
-
-            try:
-                result = (
-                    [
-                        dns.RRHeader(
-                            r.name.name, r.type, r.cls, r.ttl - diff, r.payload
-                        )
-                        for r in ans
-                    ],
-                    [
-                        dns.RRHeader(
-                            r.name.name, r.type, r.cls, r.ttl - diff, r.payload
-                        )
-                        for r in auth
-                    ],
-                    [
-                        dns.RRHeader(
-                            r.name.name, r.type, r.cls, r.ttl - diff, r.payload
-                        )
-                        for r in add
-                    ],
-                )
-            except ValueError:
-                return defer.fail(failure.Failure(dns.DomainError(name)))
-            else:
-                return defer.succeed(result)
+        expires = self._expires[q]
+        if now > expires and (ans or auth or add):
+            # Only stale: leave it for staleResult.
+            return defer.fail(failure.Failure(dns.DomainError(name)))
+        if self.verbose:
+            log.msg("Cache hit for " + repr(name))
+        self.cache.move_to_end(q)
+        if (
+            self.prefetchResolver is not None
+            and expires - now < (expires - when) * self.prefetchRatio
+        ):
+            self._prefetch(q)
+        if q in self._nameErrors:
+            return defer.fail(failure.Failure(error.AuthoritativeDomainError(name)))
+        diff = now - when
+        return defer.succeed(
+            (
+                [
+                    dns.RRHeader(r.name.name, r.type, r.cls, r.ttl - diff, r.payload)
+                    for r in ans
+                ],
+                [
+                    dns.RRHeader(r.name.name, r.type, r.cls, r.ttl - diff, r.payload)
+                    for r in auth
+                ],
+                [
+                    dns.RRHeader(r.name.name, r.type, r.cls, r.ttl - diff, r.payload)
+                    for r in add
+                ],
+            )
+        )
 
     def lookupAllRecords(self, name, timeout=None):
         return defer.fail(failure.Failure(dns.DomainError(name)))
 
+    def staleResult(self, query):
+        """
+        Find an expired result for a query, to serve when no fresh one can be
+        found (RFC 8767).
+
+        @param query: a L{dns.Query} instance.
+
+        @return: The cached 3-tuple of lists of L{dns.RRHeader} records, with a
+            TTL of 30 seconds, if an entry for C{query} expired less than
+            C{staleTTL} seconds ago and its name exists; otherwise L{None}.
+        """
+        entry = self.cache.get(query)
+        if entry is None or query in self._nameErrors:
+            return None
+        now = self._reactor.seconds()
+        if now > self._expires[query] + self.staleTTL:
+            return None
+        if self.verbose:
+            log.msg("Serving stale %r" % (query,))
+        return tuple(
+            [
+                dns.RRHeader(r.name.name, r.type, r.cls, self._STALE_TTL, r.payload)
+                for r in section
+            ]
+            for section in entry[1]
+        )
+
     def cacheResult(self, query, payload, cacheTime=None):
         """
         Cache a DNS entry.
 
+        If there are no answers, the entry is cached for the negative caching
+        TTL of the SOA record in the authority section, as RFC 2308 says.
+
         @param query: a L{dns.Query} instance.
 
         @param payload: a 3-tuple of lists of L{dns.RRHeader} records, the
@@ -111,21 +245,132 @@ class CacheResolver(common.ResolverBase):
         if self.verbose > 1:
             log.msg("Adding %r to cache" % query)
 
-        self.cache[query] = (cacheTime or self._reactor.seconds(), payload)
+        self._nameErrors.discard(query)
+        self._add(query, cacheTime or self._reactor.seconds(), payload)
 
-        if query in self.cancel:
-            self.cancel[query].cancel()
+    def cacheNameError(self, query, authority, cacheTime=None):
+        """
+        Cache the fact that the name of a query does not exist, for the
+        negative caching TTL of the SOA record in the authority section of
+        the response which said so (RFC 2308).  Looking the name up then fails
+        with L{error.AuthoritativeDomainError}.
+
+        Nothing is cached if there is no SOA record.
 
-        s = list(payload[0]) + list(payload[1]) + list(payload[2])
-        if s:
-            m = s[0].ttl
-            for r in s:
-                m = min(m, r.ttl)
-        else:
-            m = 0
+        @param query: a L{dns.Query} instance.
 
-        self.cancel[query] = self._reactor.callLater(m, self.clearEntry, query)
+        @param authority: The L{list} of L{dns.RRHeader} records in the
+            authority section of the response.
+
+        @param cacheTime: The time (seconds since epoch) at which the entry is
+            considered to have been added to the cache. If L{None} is given,
+            the current time is used.
+        """
+        if not any(r.type == dns.SOA for r in authority):
+            return
+        if self.verbose > 1:
+            log.msg("Adding name error %r to cache" % query)
+
+        self._add(query, cacheTime or self._reactor.seconds(), ([], authority, []))
+        self._nameErrors.add(query)
 
     def clearEntry(self, query):
+        """
+        Remove an entry from the cache.
+
+        @param query: a L{dns.Query} instance.
+        """
         del self.cache[query]
-        del self.cancel[query]
+        del self._expires[query]
+        self._nameErrors.discard(query)
+
+    def _ttl(self, payload):
+        """
+        Find how long to cache a result for.
+
+        @param payload: a 3-tuple of lists of L{dns.RRHeader} records.
+
+        @return: The smallest TTL of the records, or, if there are no answers,
+            the smallest negative caching TTL of the SOA records in the
+            authority section.
+        """
+        ans, auth, add = payload
+        if not ans:
+            negative = [
+                min(r.ttl, r.payload.minimum) for r in auth if r.type == dns.SOA
+            ]
+            if negative:
+                return min(negative)
+        return min((r.ttl for section in payload for r in section), default=0)
+
+    def _add(self, query, when, payload):
+        """
+        Add an entry to the cache, evicting the least recently used entry if
+        it is full, and arrange for it to be removed once it has expired.
+        """
+        expires = when + self._ttl(payload)
+        self.cache[query] = (when, payload)
+        self.cache.move_to_end(query)
+        self._expires[query] = expires
+        if self.maxSize is not None and len(self.cache) > self.maxSize:
+            self.clearEntry(next(iter(self.cache)))
+        removeAt = expires + self.staleTTL
+        heapq.heappush(self._removals, (removeAt, next(self._removalCount), query))
+        if len(self._removals) > 2 * len(self.cache) + 64:
+            # Most of the heap is for entries which have since been evicted
+            # or cached again: make it again from the entries there are.
+            self._removals = [
+                (expires + self.staleTTL, next(self._removalCount), query)
+                for query, expires in self._expires.items()
+            ]
+            heapq.heapify(self._removals)
+        if self._removalCall is None or not self._removalCall.active():
+            self._scheduleRemoval()
+        elif removeAt < self._removalCall.getTime():
+            self._removalCall.cancel()
+            self._scheduleRemoval()
+
+    def _scheduleRemoval(self):
+        """
+        Schedule a call to L{CacheResolver._removeExpired} for when the
+        earliest entry should be removed.
+        """
+        self._removalCall = None
+        if self._removals:
+            delay = self._removals[0][0] - self._reactor.seconds()
+            self._removalCall = self._reactor.callLater(
+                max(delay, 0), self._removeExpired
+            )
+
+    def _removeExpired(self):
+        """
+        Remove the entries which should no longer be served, even as stale.
+        """
+        now = self._reactor.seconds()
+        removals = self._removals
+        while removals and removals[0][0] <= now:
+            removeAt, _, query = heapq.heappop(removals)
+            expires = self._expires.get(query)
+            if expires is not None and expires + self.staleTTL == removeAt:
+                self.clearEntry(query)
+        self._scheduleRemoval()
+
+    def _prefetch(self, query):
+        """
+        Refresh an entry from C{prefetchResolver}.
+
+        @param query: a L{dns.Query} instance.
+        """
+        if query in self._prefetching:
+            return
+        self._prefetching.add(query)
+
+        def done(result):
+            self._prefetching.discard(query)
+            if isinstance(result, failure.Failure):
+                if self.verbose:
+                    log.msg(f"Prefetch of {query!r} failed: {result.value!r}")
+            elif any(result):
+                self.cacheResult(query, result)
+
+        self.prefetchResolver.query(query).addBoth(done)
@@ -37,13 +37,22 @@ moduleProvides(interfaces.IResolver)
 
 class Resolver(common.ResolverBase):
     """
+    @ivar queriesIssued: The number of lookups for which a query was sent.
+    @type queriesIssued: L{int}
+
+    @ivar queriesCoalesced: The number of lookups which waited for the result
+        of an identical query which was already outstanding rather than
+        sending another.
+    @type queriesCoalesced: L{int}
+
     @ivar _waiting: A C{dict} mapping tuple keys of query name/type/class to
-        Deferreds which will be called back with the result of those queries.
-        This is used to avoid issuing the same query more than once in
-        parallel.  This is more efficient on the network and helps avoid a
-        "birthday paradox" attack by keeping the number of outstanding requests
-        for a particular query fixed at one instead of allowing the attacker to
-        raise it to an arbitrary number.
+        the L{Deferred} of the query sent for them and a list of the Deferreds
+        which will be called back with the result of that query.  This is used
+        to avoid issuing the same query more than once in parallel.  This is
+        more efficient on the network and helps avoid a "birthday paradox"
+        attack by keeping the number of outstanding requests for a particular
+        query fixed at one instead of allowing the attacker to raise it to an
+        arbitrary number.
 
     @ivar _reactor: A provider of L{IReactorTCP}, L{IReactorUDP}, and
         L{IReactorTime} which will be used to set up network resources and
@@ -59,6 +68,9 @@ class Resolver(common.ResolverBase):
     pending = None
     connections = None
 
+    queriesIssued = 0
+    queriesCoalesced = 0
+
     resolv = None
     _lastResolvTime = None
     _resolvReadInterval = 60
@@ -385,7 +397,8 @@ class Resolver(common.ResolverBase):
 
         If this query is already outstanding, it will not be re-issued.
         Instead, when the outstanding query receives a response, that response
-        will be re-used for this query as well.
+        will be re-used for this query as well.  Cancelling the L{Deferred}
+        returned only cancels the query once nothing else is waiting for it.
 
         @type name: C{str}
         @type type: C{int}
@@ -396,23 +409,53 @@ class Resolver(common.ResolverBase):
             a L{Failure} if the response code is anything other than C{dns.OK}.
         """
         key = (name, type, cls)
-        waiting = self._waiting.get(key)
-        if waiting is None:
-            self._waiting[key] = []
-            d = self.queryUDP([dns.Query(name, type, cls)], timeout)
-
-            def cbResult(result):
-                for d in self._waiting.pop(key):
-                    d.callback(result)
-                return result
-
-            d.addCallback(self.filterAnswers)
-            d.addBoth(cbResult)
+        outstanding = self._waiting.get(key)
+        if outstanding is None:
+            self.queriesIssued += 1
+            query = self.queryUDP([dns.Query(name, type, cls)], timeout)
+            outstanding = self._waiting[key] = (query, [])
         else:
-            d = defer.Deferred()
-            waiting.append(d)
+            self.queriesCoalesced += 1
+            query = None
+        d = defer.Deferred(lambda d: self._cancelWaiting(key, outstanding, d))
+        outstanding[1].append(d)
+        if query is not None:
+            query.addCallback(self.filterAnswers)
+            query.addBoth(self._cbWaiting, key, outstanding)
         return d
 
+    def _cbWaiting(self, result, key, outstanding):
+        """
+        Give the result of a query to everything waiting for it.
+
+        @param result: The result, or a L{Failure}.
+
+        @param key: The key of the query in C{_waiting}.
+
+        @param outstanding: The value of C{key} in C{_waiting} for this query.
+        """
+        if self._waiting.get(key) is outstanding:
+            del self._waiting[key]
+        for d in outstanding[1]:
+            d.callback(result)
+
+    def _cancelWaiting(self, key, outstanding, d):
+        """
+        Stop waiting for the result of a query, and cancel the query if
+        nothing else is waiting for it.
+
+        @param key: The key of the query in C{_waiting}.
+
+        @param outstanding: The value of C{key} in C{_waiting} for this query.
+
+        @param d: The L{Deferred} being cancelled.
+        """
+        query, waiting = outstanding
+        waiting.remove(d)
+        if not waiting and self._waiting.get(key) is outstanding:
+            del self._waiting[key]
+            query.cancel()
+
     # This one doesn't ever belong on UDP
     def lookupZone(self, name, timeout=10):
         address = self.pickServer()
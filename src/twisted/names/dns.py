@@ -15,6 +15,7 @@ import inspect
 import random
 import socket
 import struct
+from collections import OrderedDict
 from io import BytesIO
 from itertools import chain
 from typing import Optional, Sequence, SupportsInt, Union, overload
@@ -22,7 +23,7 @@ from typing import Optional, Sequence, SupportsInt, Union, overload
 from zope.interface import Attribute, Interface, implementer
 
 # Twisted imports
-from twisted.internet import defer, protocol
+from twisted.internet import defer, interfaces, protocol
 from twisted.internet.error import CannotListenError
 from twisted.python import failure, log, randbytes, util as tputil
 from twisted.python.compat import cmp, comparable, nativeString
@@ -572,13 +573,20 @@ class Name:
         of reducing the message size).
         """
         name = self.name
+        # Collect the labels and write them all at once, keeping track of
+        # where each suffix of the name will be for the compression
+        # dictionary.
+        encoded = []
+        if compDict is not None:
+            position = strio.tell() + Message.headerSize
         while name:
             if compDict is not None:
                 if name in compDict:
-                    strio.write(struct.pack("!H", 0xC000 | compDict[name]))
+                    encoded.append(struct.pack("!H", 0xC000 | compDict[name]))
+                    strio.write(b"".join(encoded))
                     return
                 else:
-                    compDict[name] = strio.tell() + Message.headerSize
+                    compDict[name] = position
             ind = name.find(b".")
             if ind > 0:
                 label, name = name[:ind], name[ind + 1 :]
@@ -587,9 +595,12 @@ class Name:
                 label = name
                 name = None
                 ind = len(label)
-            strio.write(_ord2bytes(ind))
-            strio.write(label)
-        strio.write(b"\x00")
+            encoded.append(_ord2bytes(ind))
+            encoded.append(label)
+            if compDict is not None:
+                position += ind + 1
+        encoded.append(b"\x00")
+        strio.write(b"".join(encoded))
 
     def decode(self, strio, length=None):
         """
@@ -2449,6 +2460,398 @@ def _compactRepr(
     return "".join(out)
 
 
+def _decodeName(data, offset, names):
+    """
+    Decode a domain name, which may be compressed, from a message.
+
+    @param data: The whole message.
+    @type data: L{bytes}
+
+    @param offset: The position of the name in C{data}.
+    @type offset: L{int}
+
+    @param names: The names already decoded from C{data}, as 2-tuples of the
+        name and the position just after it, keyed by position.  The name
+        decoded is added to it, and a compression pointer to any name in it
+        is not followed again.
+    @type names: L{dict}
+
+    @return: A 2-tuple of the name, as L{bytes}, and the position in C{data}
+        just after it.
+
+    @raise EOFError: Raised when C{data} ends before the name does.
+
+    @raise ValueError: Raised when the name cannot be decoded (for example,
+        because it contains a loop).
+    """
+    cached = names.get(offset)
+    if cached is not None:
+        return cached
+    size = len(data)
+    labels = []
+    end = None
+    visited = None
+    position = offset
+    try:
+        while True:
+            length = data[position]
+            if length == 0:
+                if end is None:
+                    end = position + 1
+                break
+            if length >= 0xC0:
+                pointer = (length & 0x3F) << 8 | data[position + 1]
+                if end is None:
+                    end = position + 2
+                cached = names.get(pointer)
+                if cached is not None:
+                    labels.append(cached[0])
+                    break
+                if visited is None:
+                    visited = set()
+                if pointer in visited:
+                    raise ValueError("Compression loop in encoded name")
+                visited.add(pointer)
+                position = pointer
+                continue
+            start = position + 1
+            position = start + length
+            if position > size:
+                raise EOFError
+            labels.append(data[start:position])
+    except IndexError:
+        raise EOFError
+
+    if labels and not labels[-1]:
+        # A pointer to the root name.
+        del labels[-1]
+    result = names[offset] = (b".".join(labels), end)
+    return result
+
+
+def _newRecord(recordType, ttl):
+    """
+    Create a record of a class with a payload decoder, without setting the
+    attributes the payload decoder sets.
+
+    @param recordType: The record class.
+
+    @param ttl: The TTL of the record.
+    @type ttl: L{int}
+
+    @return: An instance of C{recordType}.
+    """
+    record = recordType.__new__(recordType)
+    record.ttl = ttl
+    return record
+
+
+def _decodeAddress(decoder, recordType, ttl, position, length):
+    """
+    Decode an I{A} or I{AAAA} record.
+
+    @return: The record, or L{None} if C{length} is not the size of an
+        address.
+    """
+    if length != (4 if recordType is Record_A else 16):
+        return None
+    record = _newRecord(recordType, ttl)
+    record.address = decoder.data[position : position + length]
+    return record
+
+
+def _decodeSimpleRecord(decoder, recordType, ttl, position, length):
+    """
+    Decode a L{SimpleRecord}.
+
+    @return: The record.
+    """
+    record = _newRecord(recordType, ttl)
+    record.name = Name(decoder.name(position)[0])
+    return record
+
+
+def _decodeMX(decoder, recordType, ttl, position, length):
+    """
+    Decode a L{Record_MX}.
+
+    @return: The record, or L{None} if C{length} is too short for one.
+    """
+    if length < 3:
+        return None
+    record = _newRecord(recordType, ttl)
+    data = decoder.data
+    record.preference = data[position] << 8 | data[position + 1]
+    record.name = Name(decoder.name(position + 2)[0])
+    return record
+
+
+def _decodeUnknownRecord(decoder, recordType, ttl, position, length):
+    """
+    Decode an L{UnknownRecord}, such as the I{OPT} record of an I{EDNS}
+    message.
+
+    @return: The record.
+    """
+    record = _newRecord(recordType, ttl)
+    record.data = decoder.data[position : position + length]
+    return record
+
+
+class _MessageDecoder:
+    """
+    Decode a message in the format described by RFC 1035 by reading directly
+    from it at the position of each field, a section at a time.
+
+    The record sections need not be decoded in order: those in front of the
+    one asked for are skipped over without decoding their records.
+
+    @cvar _payloadDecoders: Functions decoding common kinds of record without
+        copying their data into a file first, keyed by the record class.
+        Each is called with this decoder, the record class, the TTL, and the
+        position and length of the record data, and returns the record, or
+        L{None} to leave it to the record's own C{decode} method.
+
+    @ivar data: The message.
+    @type data: L{bytes}
+
+    @ivar _names: The names decoded so far.  See L{_decodeName}.
+
+    @ivar _strio: A file over C{data}, for records which have no payload
+        decoder, or L{None} until one is needed.
+
+    @ivar _counts: The number of records in the answer, authority and
+        additional sections.
+
+    @ivar _starts: The position of each record section which has been found,
+        L{None} for a section which cannot be found because the message is
+        truncated before it.
+    """
+
+    _payloadDecoders = {
+        Record_A: _decodeAddress,
+        Record_AAAA: _decodeAddress,
+        Record_MX: _decodeMX,
+        Record_NS: _decodeSimpleRecord,
+        Record_MD: _decodeSimpleRecord,
+        Record_MF: _decodeSimpleRecord,
+        Record_CNAME: _decodeSimpleRecord,
+        Record_MB: _decodeSimpleRecord,
+        Record_MG: _decodeSimpleRecord,
+        Record_MR: _decodeSimpleRecord,
+        Record_PTR: _decodeSimpleRecord,
+        Record_DNAME: _decodeSimpleRecord,
+        UnknownRecord: _decodeUnknownRecord,
+    }
+
+    _strio = None
+
+    def __init__(self, data):
+        """
+        @param data: The message.
+        @type data: L{bytes}, or another bytes-like object
+        """
+        if not isinstance(data, bytes):
+            data = bytes(data)
+        self.data = data
+        self._names = {}
+        self._counts = (0, 0, 0)
+        self._starts = [None]
+
+    def name(self, position):
+        """
+        Decode a name.
+
+        @param position: The position of the name.
+
+        @return: See L{_decodeName}.
+        """
+        return _decodeName(self.data, position, self._names)
+
+    def header(self):
+        """
+        Decode the header.
+
+        @return: The tuple of the fields of L{Message.headerFmt}.
+
+        @raise EOFError: Raised when the message is shorter than a header.
+        """
+        if len(self.data) < Message.headerSize:
+            raise EOFError
+        return struct.unpack_from(Message.headerFmt, self.data)
+
+    def queries(self, header):
+        """
+        Decode the question section.
+
+        @param header: The fields decoded by L{_MessageDecoder.header}.
+
+        @return: A L{list} of L{Query}, holding those before the end of the
+            message if it is truncated.
+
+        @raise ValueError: Raised when a name cannot be decoded.
+        """
+        nqueries, nans, nns, nadd = header[3:]
+        self._counts = (nans, nns, nadd)
+        data = self.data
+        size = len(data)
+        queries = []
+        position = Message.headerSize
+        try:
+            for i in range(nqueries):
+                name, position = self.name(position)
+                if position + 4 > size:
+                    raise EOFError
+                queries.append(
+                    Query(
+                        name,
+                        data[position] << 8 | data[position + 1],
+                        data[position + 2] << 8 | data[position + 3],
+                    )
+                )
+                position += 4
+        except EOFError:
+            position = None
+        self._starts = [position]
+        return queries
+
+    def _record(self, position):
+        """
+        Decode the fixed fields of the record at a position.
+
+        @return: A 3-tuple of the name, the fixed fields, as decoded by
+            L{RRHeader.fmt}, and the position of the record data.
+
+        @raise EOFError: Raised when the record is truncated.
+        """
+        name, position = self.name(position)
+        if position + 10 > len(self.data):
+            raise EOFError
+        fields = struct.unpack_from(RRHeader.fmt, self.data, position)
+        position += 10
+        if position + fields[3] > len(self.data):
+            raise EOFError
+        return name, fields, position
+
+    def _start(self, index):
+        """
+        Find the position of a record section, skipping over the records in
+        front of it.
+
+        @param index: 0 for the answer section, 1 for the authority section
+            and 2 for the additional section, or 3 for the end of the last
+            section.
+
+        @return: The position, or L{None} if the message ends before it.
+        """
+        starts = self._starts
+        while len(starts) <= index:
+            position = starts[-1]
+            if position is not None:
+                try:
+                    for i in range(self._counts[len(starts) - 1]):
+                        name, fields, position = self._record(position)
+                        position += fields[3]
+                except EOFError:
+                    position = None
+            starts.append(position)
+        return starts[index]
+
+    def findSections(self):
+        """
+        Find every record section, skipping over the records in them, so that
+        a message whose record names cannot be decoded is found out before
+        the records are decoded.
+
+        @raise ValueError: Raised when a name cannot be decoded.
+        """
+        self._start(3)
+
+    def records(self, index, message):
+        """
+        Decode a record section.
+
+        @param index: 0, 1 or 2.  See L{_MessageDecoder._start}.
+
+        @param message: The L{Message} being decoded, whose C{auth} flag the
+            records are marked with and whose C{lookupRecordType} finds their
+            classes.
+
+        @return: A L{list} of L{RRHeader}, holding those before the end of
+            the message if it is truncated.
+
+        @raise ValueError: Raised when a name cannot be decoded.
+        """
+        position = self._start(index)
+        records = []
+        if position is None:
+            return records
+        auth = message.auth
+        try:
+            for i in range(self._counts[index]):
+                name, (type, cls, ttl, rdlength), position = self._record(position)
+                end = position + rdlength
+                t = message.lookupRecordType(type)
+                if t:
+                    payload = None
+                    decodePayload = self._payloadDecoders.get(t)
+                    if decodePayload is not None:
+                        payload = decodePayload(self, t, ttl, position, rdlength)
+                    if payload is None:
+                        if self._strio is None:
+                            self._strio = BytesIO(self.data)
+                        self._strio.seek(position)
+                        payload = t(ttl=ttl)
+                        payload.decode(self._strio, rdlength)
+                    # Every field is known to be valid, so skip the checks
+                    # RRHeader.__init__ makes.
+                    header = RRHeader.__new__(RRHeader)
+                    header.name = Name(name)
+                    header.type = type
+                    header.cls = cls
+                    header.ttl = ttl
+                    header.rdlength = rdlength
+                    header.payload = payload
+                    header.auth = auth
+                    records.append(header)
+                position = end
+        except EOFError:
+            position = None
+        if len(self._starts) == index + 1:
+            self._starts.append(position)
+        return records
+
+
+class _LazySection:
+    """
+    A record section of a L{Message}, which is decoded the first time it is
+    used if the message was decoded with C{lazy=True}.
+
+    Once decoded, or assigned, the section is an ordinary attribute of the
+    message.
+    """
+
+    def __init__(self, index):
+        """
+        @param index: See L{_MessageDecoder._start}.
+        """
+        self._index = index
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, message, owner=None):
+        if message is None:
+            return self
+        decoder = message._decoder
+        if decoder is None:
+            return None
+        records = message.__dict__[self._name] = decoder.records(self._index, message)
+        if all(name in message.__dict__ for name in Message._recordSections):
+            del message._decoder
+        return records
+
+
 class Message(tputil.FancyEqMixin):
     """
     L{Message} contains all the information represented by a single
@@ -2512,7 +2915,19 @@ class Message(tputil.FancyEqMixin):
     headerSize = struct.calcsize(headerFmt)
 
     # Question, answer, additional, and nameserver lists
-    queries = answers = add = ns = None
+    queries = add = ns = None
+    answers = _LazySection(0)
+    authority = _LazySection(1)
+    additional = _LazySection(2)
+
+    _recordSections = ("answers", "authority", "additional")
+
+    # The decoder of the record sections not decoded yet, if this message was
+    # decoded lazily.
+    _decoder = None
+
+    # The _SectionEncodingCache to encode the sections with, if any.
+    _encodingCache = None
 
     def __init__(
         self,
@@ -2646,17 +3061,20 @@ class Message(tputil.FancyEqMixin):
         self.queries.append(Query(name, type, cls))
 
     def encode(self, strio):
-        compDict = {}
-        body_tmp = BytesIO()
-        for q in self.queries:
-            q.encode(body_tmp, compDict)
-        for q in self.answers:
-            q.encode(body_tmp, compDict)
-        for q in self.authority:
-            q.encode(body_tmp, compDict)
-        for q in self.additional:
-            q.encode(body_tmp, compDict)
-        body = body_tmp.getvalue()
+        if self._encodingCache is not None:
+            body = self._encodingCache.encode(self)
+        else:
+            compDict = {}
+            body_tmp = BytesIO()
+            for q in self.queries:
+                q.encode(body_tmp, compDict)
+            for q in self.answers:
+                q.encode(body_tmp, compDict)
+            for q in self.authority:
+                q.encode(body_tmp, compDict)
+            for q in self.additional:
+                q.encode(body_tmp, compDict)
+            body = body_tmp.getvalue()
         size = len(body) + self.headerSize
         if self.maxSize and size > self.maxSize:
             self.trunc = 1
@@ -2694,15 +3112,7 @@ class Message(tputil.FancyEqMixin):
         header = readPrecisely(strio, self.headerSize)
         r = struct.unpack(self.headerFmt, header)
         self.id, byte3, byte4, nqueries, nans, nns, nadd = r
-        self.answer = (byte3 >> 7) & 1
-        self.opCode = (byte3 >> 3) & 0xF
-        self.auth = (byte3 >> 2) & 1
-        self.trunc = (byte3 >> 1) & 1
-        self.recDes = byte3 & 1
-        self.recAv = (byte4 >> 7) & 1
-        self.authenticData = (byte4 >> 5) & 1
-        self.checkingDisabled = (byte4 >> 4) & 1
-        self.rCode = byte4 & 0xF
+        self._decodeFlags(byte3, byte4)
 
         self.queries = []
         for i in range(nqueries):
@@ -2718,6 +3128,27 @@ class Message(tputil.FancyEqMixin):
         for l, n in items:
             self.parseRecords(l, n, strio)
 
+    def _decodeFlags(self, byte3, byte4):
+        """
+        Set the flags and codes of this L{Message} from the two bytes of the
+        header which hold them.
+
+        @param byte3: The first of the two bytes.
+        @type byte3: L{int}
+
+        @param byte4: The second of the two bytes.
+        @type byte4: L{int}
+        """
+        self.answer = (byte3 >> 7) & 1
+        self.opCode = (byte3 >> 3) & 0xF
+        self.auth = (byte3 >> 2) & 1
+        self.trunc = (byte3 >> 1) & 1
+        self.recDes = byte3 & 1
+        self.recAv = (byte4 >> 7) & 1
+        self.authenticData = (byte4 >> 5) & 1
+        self.checkingDisabled = (byte4 >> 4) & 1
+        self.rCode = byte4 & 0xF
+
     def parseRecords(self, list, num, strio):
         for i in range(num):
             header = RRHeader(auth=self.auth)
@@ -2772,15 +3203,144 @@ class Message(tputil.FancyEqMixin):
         self.encode(strio)
         return strio.getvalue()
 
-    def fromStr(self, str):
+    def fromStr(self, str, lazy=False):
         """
         Decode a byte string in the format described by RFC 1035 into this
         L{Message}.
 
+        The byte string is read in place, and each name in it is only
+        decompressed once.
+
         @param str: L{bytes}
+
+        @param lazy: If C{True}, only decode the header and C{queries} now,
+            and each of C{answers}, C{authority} and C{additional} the first
+            time it is used, so that a message of which only the question is
+            wanted is cheap to decode.  The records are still skipped over
+            now, so a message with an owner name which cannot be decoded is
+            rejected straight away, but an error decoding the data of a
+            record is raised by using its section, so only decode lazily
+            where that use is guarded too.
+        @type lazy: L{bool}
+
+        @raise EOFError: Raised when C{str} is shorter than a header.
+
+        @raise ValueError: Raised when a name cannot be decoded.
+        """
+        decoder = _MessageDecoder(str)
+        header = decoder.header()
+        self.maxSize = 0
+        self.id, byte3, byte4 = header[:3]
+        self._decodeFlags(byte3, byte4)
+        self.queries = decoder.queries(header)
+        if lazy:
+            decoder.findSections()
+            for name in self._recordSections:
+                self.__dict__.pop(name, None)
+            self._decoder = decoder
+        else:
+            self.answers = decoder.records(0, self)
+            self.authority = decoder.records(1, self)
+            self.additional = decoder.records(2, self)
+
+    def _decodeRecords(self):
+        """
+        Decode whichever record sections of this L{Message} have not been
+        decoded yet, if it was decoded lazily.
+
+        @raise ValueError: Raised when a name cannot be decoded.
+        """
+        for name in self._recordSections:
+            getattr(self, name)
+
+    def __getstate__(self):
+        """
+        Decode the record sections before this L{Message} is pickled.
+
+        @return: The state of this L{Message}.
+        @rtype: L{dict}
+        """
+        self._decodeRecords()
+        return self.__dict__
+
+
+class _SectionEncodingCache:
+    """
+    Remember how the question and record sections of messages were encoded,
+    so that a response which is sent many times, such as an answer from
+    static zone data, is only encoded once.  Each time it is sent, only the
+    header, with the message ID and flags, is encoded again.
+
+    An encoding is remembered for each question, along with the owner name,
+    type, class, TTL and payload of each record it was made from; it is only
+    used for a message whose records are the same.  Zone data hands out the
+    same payload objects every time, which makes comparing them quick.
+
+    Records which are not L{RRHeader}s, such as the I{OPT} record of an
+    I{EDNS} message, and any records after them are encoded each time,
+    after the remembered part.
+
+    @ivar _maxSize: The number of questions to remember encodings for.
+    @type _maxSize: L{int}
+
+    @ivar _encodings: For each question, as a L{tuple} of name, type and
+        class for each query, a 3-tuple of the records, the encoding, and the
+        compression dictionary after encoding them, least recently used
+        first.
+    @type _encodings: L{OrderedDict}
+    """
+
+    def __init__(self, maxSize=1000):
+        """
+        @param maxSize: See L{_SectionEncodingCache._maxSize}.
         """
-        strio = BytesIO(str)
-        self.decode(strio)
+        self._maxSize = maxSize
+        self._encodings = OrderedDict()
+
+    def encode(self, message):
+        """
+        Encode the question and record sections of a message.
+
+        @param message: The L{Message} to encode.
+
+        @return: The encoded sections, as L{bytes}.
+        """
+        records = list(chain(message.answers, message.authority, message.additional))
+        remembered = 0
+        for record in records:
+            if type(record) is not RRHeader:
+                break
+            remembered += 1
+
+        question = tuple((q.name.name, q.type, q.cls) for q in message.queries)
+        recordKey = tuple(
+            (r.name.name, r.type, r.cls, r.ttl, r.payload) for r in records[:remembered]
+        )
+        encoding = self._encodings.get(question)
+        if encoding is not None and encoding[0] == recordKey:
+            self._encodings.move_to_end(question)
+            body, compDict = encoding[1:]
+        else:
+            strio = BytesIO()
+            compDict = {}
+            for q in message.queries:
+                q.encode(strio, compDict)
+            for record in records[:remembered]:
+                record.encode(strio, compDict)
+            body = strio.getvalue()
+            self._encodings[question] = (recordKey, body, compDict)
+            self._encodings.move_to_end(question)
+            if len(self._encodings) > self._maxSize:
+                self._encodings.popitem(last=False)
+
+        if remembered == len(records):
+            return body
+        strio = BytesIO()
+        strio.write(body)
+        compDict = compDict.copy()
+        for record in records[remembered:]:
+            record.encode(strio, compDict)
+        return strio.getvalue()
 
 
 class _EDNSMessage(tputil.FancyEqMixin):
@@ -2821,6 +3381,9 @@ class _EDNSMessage(tputil.FancyEqMixin):
 
     @ivar _messageFactory: A constructor of L{Message} instances. Called by
         C{_toMessage} and C{_fromMessage}.
+
+    @ivar _encodingCache: The L{_SectionEncodingCache} to encode the sections
+        of this message with, or L{None} to encode them from scratch.
     """
 
     compareAttributes = (
@@ -2844,6 +3407,7 @@ class _EDNSMessage(tputil.FancyEqMixin):
     )
 
     _messageFactory = Message
+    _encodingCache = None
 
     def __init__(
         self,
@@ -3031,6 +3595,7 @@ class _EDNSMessage(tputil.FancyEqMixin):
         m.answers = self.answers[:]
         m.authority = self.authority[:]
         m.additional = self.additional[:]
+        m._encodingCache = self._encodingCache
 
         if self.ednsVersion is not None:
             o = _OPTHeader(
@@ -3191,7 +3756,13 @@ class DNSMixin:
         except BaseException:
             return defer.fail()
 
-        resultDeferred = defer.Deferred()
+        def cancel(deferred):
+            if self.liveMessages.get(id, (None,))[0] is deferred:
+                del self.liveMessages[id]
+            if cancelCall.active():
+                cancelCall.cancel()
+
+        resultDeferred = defer.Deferred(cancel)
         cancelCall = self.callLater(timeout, self._clearFailed, resultDeferred, id)
         self.liveMessages[id] = (resultDeferred, cancelCall)
 
@@ -3208,12 +3779,19 @@ class DNSMixin:
         deferred.errback(failure.Failure(DNSQueryTimeoutError(id)))
 
 
+@implementer(interfaces.IBatchDatagramProtocol)
 class DNSDatagramProtocol(DNSMixin, protocol.DatagramProtocol):
     """
     DNS protocol over UDP.
+
+    @ivar _batchedWrites: While a batch of datagrams is being handled, a list
+        of the C{(datagram, address)} pairs written in the meantime, to be
+        sent with one C{writeBatch} call once it has been handled; otherwise
+        L{None}.
     """
 
     resends = None
+    _batchedWrites = None
 
     def stopProtocol(self):
         """
@@ -3236,7 +3814,10 @@ class DNSDatagramProtocol(DNSMixin, protocol.DatagramProtocol):
 
         @type message: L{Message}
         """
-        self.transport.write(message.toStr(), address)
+        if self._batchedWrites is not None:
+            self._batchedWrites.append((message.toStr(), address))
+        else:
+            self.transport.write(message.toStr(), address)
 
     def startListening(self):
         self._reactor.listenUDP(0, self, maxPacketSize=512)
@@ -3276,6 +3857,32 @@ class DNSDatagramProtocol(DNSMixin, protocol.DatagramProtocol):
             if m.id not in self.resends:
                 self.controller.messageReceived(m, self, addr)
 
+    def datagramsReceived(self, datagrams):
+        """
+        Handle a batch of datagrams as L{datagramReceived} handles each one.
+
+        If the transport can send batches of datagrams, messages written while
+        handling them (such as the replies of a server which answers
+        synchronously) are sent together once they have all been handled.
+        """
+        if interfaces.IBatchUDPTransport.providedBy(self.transport):
+            self._batchedWrites = batched = []
+        else:
+            batched = None
+        try:
+            for data, addr in datagrams:
+                try:
+                    self.datagramReceived(data, addr)
+                except BaseException:
+                    log.err()
+        finally:
+            self._batchedWrites = None
+            if batched and self.transport is not None:
+                try:
+                    self.transport.writeBatch(batched)
+                except BaseException:
+                    log.err()
+
     def removeResend(self, id):
         """
         Mark message ID as no longer having duplication suppression.
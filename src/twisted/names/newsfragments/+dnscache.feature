@@ -0,0 +1 @@
+twisted.names.cache.CacheResolver now takes maxSize, staleTTL, prefetchResolver and prefetchRatio arguments to bound its size, serve expired records when upstream servers fail, and refresh popular records before they expire; it also caches negative responses as described by RFC 2308, using a single timer for expiry.
@@ -0,0 +1 @@
+twisted.names.client.Resolver now counts the lookups it sends queries for and those which share an identical outstanding query in queriesIssued and queriesCoalesced, and cancelling one of several identical lookups no longer cancels the query the others are waiting for.
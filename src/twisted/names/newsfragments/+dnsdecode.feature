@@ -0,0 +1 @@
+twisted.names.dns.Message.fromStr now decodes messages in place without copying them into a file, decompresses each name only once, and accepts lazy=True to decode the answer, authority and additional sections only when they are first used.
@@ -0,0 +1 @@
+twisted.names.server.DNSServerFactory now remembers how authoritative responses were encoded and reuses the encoding when the same response is sent again, encoding only the message header for each reply.
@@ -0,0 +1 @@
+twisted.names.authority.FileAuthority now indexes the names of its zone, answers queries for names below a delegation with a referral, for names matched by a wildcard from the wildcard's records (RFC 4592), and for names which only have names below them with no records; BindAuthority also loads large zones faster.
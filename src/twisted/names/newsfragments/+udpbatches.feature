@@ -0,0 +1 @@
+twisted.names.dns.DNSDatagramProtocol now handles received datagrams in batches and sends the replies written while handling a batch together, when its transport supports it.
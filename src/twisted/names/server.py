@@ -21,6 +21,7 @@ import time
 
 from twisted.internet import protocol
 from twisted.names import dns, resolve
+from twisted.names.error import DNSNameError
 from twisted.python import log
 
 
@@ -59,12 +60,17 @@ class DNSServerFactory(protocol.ServerFactory):
     @ivar _messageFactory: A response message constructor with an initializer
          signature matching L{dns.Message.__init__}.
     @type _messageFactory: C{callable}
+
+    @ivar _encodingCache: Remembers how authoritative responses were encoded,
+        so that the same response sent again is not encoded from scratch.
+    @type _encodingCache: L{dns._SectionEncodingCache} or L{None}
     """
 
     # Type is wrong.  See: https://twistedmatrix.com/trac/ticket/10004#ticket
     protocol = dns.DNSProtocol  # type: ignore[assignment]
     cache = None
     _messageFactory = dns.Message
+    _encodingCache = None
 
     def __init__(self, authorities=None, caches=None, clients=None, verbose=0):
         """
@@ -100,6 +106,7 @@ class DNSServerFactory(protocol.ServerFactory):
         if caches:
             self.cache = caches[-1]
         self.connections = []
+        self._encodingCache = dns._SectionEncodingCache()
 
     def _verboseLog(self, *args, **kwargs):
         """
@@ -252,6 +259,11 @@ class DNSServerFactory(protocol.ServerFactory):
         response.authority = authority
         response.additional = additional
 
+        if authoritativeAnswer:
+            # Answers from zone data are the same every time they are asked
+            # for, so only encode them once.
+            response._encodingCache = self._encodingCache
+
         return response
 
     def gotResolverResponse(self, response, protocol, message, address):
@@ -303,6 +315,10 @@ class DNSServerFactory(protocol.ServerFactory):
         Constructs a response message from the original query message by
         assigning a suitable error code to C{rCode}.
 
+        If the name does not exist, C{self.cache} is told so, for negative
+        caching.  If the failure is a server error and C{self.cache} has an
+        expired result for the query, that is sent instead.
+
         An error message will be logged if C{DNSServerFactory.verbose} is C{>1}.
 
         @param failure: The reason for the failed resolution (as reported by
@@ -323,7 +339,24 @@ class DNSServerFactory(protocol.ServerFactory):
         """
         if failure.check(dns.DomainError, dns.AuthoritativeDomainError):
             rCode = dns.ENAME
+            if self.cache and message.queries and failure.check(DNSNameError):
+                self._cacheNameError(message.queries[0], failure.value)
         else:
+            stale = None
+            if self.cache and message.queries:
+                stale = self._staleResult(message.queries[0])
+            if stale is not None:
+                ans, auth, add = stale
+                response = self._responseFromMessage(
+                    message=message,
+                    rCode=dns.OK,
+                    answers=ans,
+                    authority=auth,
+                    additional=add,
+                )
+                self.sendReply(protocol, response, address)
+                self._verboseLog("Lookup failed, serving stale records")
+                return
             rCode = dns.ESERVER
             log.err(failure)
 
@@ -332,6 +365,36 @@ class DNSServerFactory(protocol.ServerFactory):
         self.sendReply(protocol, response, address)
         self._verboseLog("Lookup failed")
 
+    def _cacheNameError(self, query, nameError):
+        """
+        Tell C{self.cache} that the name of a query does not exist, if it
+        supports negative caching and the error carries the response which
+        said so.
+
+        @param query: The L{dns.Query} which failed.
+
+        @param nameError: The L{DNSNameError} it failed with.
+        """
+        cacheNameError = getattr(self.cache, "cacheNameError", None)
+        if cacheNameError is not None and nameError.args:
+            response = nameError.args[0]
+            if isinstance(response, dns.Message):
+                cacheNameError(query, response.authority)
+
+    def _staleResult(self, query):
+        """
+        Find an expired result for a query in C{self.cache}, if it supports
+        serving stale results.
+
+        @param query: The L{dns.Query} which could not be resolved.
+
+        @return: A 3-tuple of lists of L{dns.RRHeader} records, or L{None}.
+        """
+        staleResult = getattr(self.cache, "staleResult", None)
+        if staleResult is None:
+            return None
+        return staleResult(query)
+
     def handleQuery(self, message, protocol, address):
         """
         Called by L{DNSServerFactory.messageReceived} when a query message is
@@ -10,8 +10,8 @@ import time
 
 from zope.interface.verify import verifyClass
 
-from twisted.internet import interfaces, task
-from twisted.names import cache, dns
+from twisted.internet import defer, interfaces, task
+from twisted.names import cache, dns, error
 from twisted.trial import unittest
 
 
@@ -188,3 +188,237 @@ class CachingTests(unittest.TestCase):
         clock.advance(60.1)
 
         return self.assertFailure(c.lookupAddress(b"example.com"), dns.DomainError)
+
+
+def _soa(ttl=300, minimum=60):
+    """
+    Make an SOA record for the authority section of a negative response.
+
+    @param ttl: The TTL of the record.
+
+    @param minimum: The negative caching TTL of the zone.
+
+    @return: A L{dns.RRHeader} holding a L{dns.Record_SOA}.
+    """
+    return dns.RRHeader(
+        b"example.com",
+        dns.SOA,
+        dns.IN,
+        ttl,
+        dns.Record_SOA(b"ns1.example.com", b"admin.example.com", minimum=minimum),
+    )
+
+
+def _answer(name=b"example.com", ttl=60):
+    """
+    Make a result with a single A record.
+
+    @param name: The name of the record.
+
+    @param ttl: The TTL of the record.
+
+    @return: A 3-tuple of lists of L{dns.RRHeader} records.
+    """
+    return (
+        [dns.RRHeader(name, dns.A, dns.IN, ttl, dns.Record_A("127.0.0.1", ttl))],
+        [],
+        [],
+    )
+
+
+class FakeResolver:
+    """
+    A resolver which answers every query with the same result.
+
+    @ivar queries: The queries made.
+    """
+
+    def __init__(self, result):
+        self.result = result
+        self.queries = []
+
+    def query(self, query, timeout=None):
+        self.queries.append(query)
+        return defer.succeed(self.result)
+
+
+class CacheManagementTests(unittest.SynchronousTestCase):
+    """
+    Tests for the size limit, expiry, negative caching, serving of stale
+    results and prefetching of L{cache.CacheResolver}.
+    """
+
+    def setUp(self):
+        self.clock = task.Clock()
+
+    def query(self, name=b"example.com", type=dns.A):
+        return dns.Query(name=name, type=type, cls=dns.IN)
+
+    def test_singleTimer(self):
+        """
+        However many entries are cached, there is one timer, for the earliest
+        expiry.
+        """
+        c = cache.CacheResolver(reactor=self.clock)
+        for i in range(10):
+            name = b"host%d.example.com" % (i,)
+            c.cacheResult(self.query(name), _answer(name, ttl=60 - i))
+        calls = self.clock.getDelayedCalls()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0].getTime(), 51)
+        self.clock.advance(55)
+        self.assertEqual(len(c.cache), 5)
+        self.clock.advance(5)
+        self.assertEqual(len(c.cache), 0)
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+
+    def test_recacheReschedules(self):
+        """
+        Caching a result for a query again replaces the old entry and its
+        expiry.
+        """
+        c = cache.CacheResolver(reactor=self.clock)
+        c.cacheResult(self.query(), _answer(ttl=10))
+        c.cacheResult(self.query(), _answer(ttl=100))
+        self.clock.advance(50)
+        self.assertIn(self.query(), c.cache)
+        self.clock.advance(50)
+        self.assertNotIn(self.query(), c.cache)
+
+    def test_maxSize(self):
+        """
+        When there are more than C{maxSize} entries, the least recently used
+        is evicted.
+        """
+        c = cache.CacheResolver(reactor=self.clock, maxSize=2)
+        names = [b"a.example.com", b"b.example.com", b"c.example.com"]
+        c.cacheResult(self.query(names[0]), _answer(names[0]))
+        c.cacheResult(self.query(names[1]), _answer(names[1]))
+        self.successResultOf(c.lookupAddress(names[0]))
+        c.cacheResult(self.query(names[2]), _answer(names[2]))
+        self.assertEqual(list(c.cache), [self.query(names[0]), self.query(names[2])])
+
+    def test_removalsBounded(self):
+        """
+        The removal times of entries which have been evicted or cached again
+        do not pile up while they are waiting to pass.
+        """
+        c = cache.CacheResolver(reactor=self.clock, maxSize=10)
+        for i in range(1000):
+            name = b"host%d.example.com" % (i,)
+            c.cacheResult(self.query(name), _answer(name, ttl=86400))
+        for i in range(1000):
+            c.cacheResult(self.query(), _answer(ttl=86400))
+        self.assertEqual(len(c.cache), 10)
+        self.assertLessEqual(len(c._removals), 2 * 10 + 64 + 1)
+        self.clock.advance(86400)
+        self.assertEqual(len(c.cache), 0)
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+
+    def test_unpickleOlderVersion(self):
+        """
+        A L{cache.CacheResolver} pickled by an older version of Twisted, with
+        none of the attributes added since, can be unpickled and used.
+        """
+        c = cache.CacheResolver.__new__(cache.CacheResolver)
+        c.__setstate__(
+            {
+                "cache": {self.query(): (0, _answer(ttl=60))},
+                "verbose": 0,
+                "cancel": {},
+                "_reactor": self.clock,
+            }
+        )
+        self.assertNotIn("cancel", c.__dict__)
+        self.assertEqual(
+            len(self.successResultOf(c.lookupAddress(b"example.com"))[0]), 1
+        )
+        name = b"other.example.com"
+        c.cacheResult(self.query(name), _answer(name))
+        self.clock.advance(60)
+        self.assertEqual(c.cache, {})
+
+    def test_noData(self):
+        """
+        A result with no answers is cached for the negative caching TTL of
+        the SOA record in its authority section.
+        """
+        c = cache.CacheResolver(reactor=self.clock)
+        c.cacheResult(self.query(), ([], [_soa(ttl=300, minimum=60)], []))
+        self.clock.advance(59)
+        answers, authority, additional = self.successResultOf(
+            c.lookupAddress(b"example.com")
+        )
+        self.assertEqual((answers, len(authority)), ([], 1))
+        self.clock.advance(1)
+        self.assertNotIn(self.query(), c.cache)
+
+    def test_nameError(self):
+        """
+        After L{cache.CacheResolver.cacheNameError}, looking up the name fails
+        with L{error.AuthoritativeDomainError} until the negative caching TTL
+        has passed.
+        """
+        c = cache.CacheResolver(reactor=self.clock)
+        c.cacheNameError(self.query(), [_soa(ttl=30, minimum=600)])
+        self.failureResultOf(
+            c.lookupAddress(b"example.com"), error.AuthoritativeDomainError
+        )
+        self.clock.advance(30)
+        self.failureResultOf(c.lookupAddress(b"example.com"), error.DomainError)
+
+    def test_nameErrorWithoutSOA(self):
+        """
+        A name error without an SOA record is not cached.
+        """
+        c = cache.CacheResolver(reactor=self.clock)
+        c.cacheNameError(self.query(), [])
+        self.assertEqual(c.cache, {})
+
+    def test_nameErrorReplaced(self):
+        """
+        Caching a result for a query which was a name error makes it succeed.
+        """
+        c = cache.CacheResolver(reactor=self.clock)
+        c.cacheNameError(self.query(), [_soa()])
+        c.cacheResult(self.query(), _answer())
+        self.successResultOf(c.lookupAddress(b"example.com"))
+
+    def test_staleResult(self):
+        """
+        An expired entry is not looked up, but L{cache.CacheResolver.staleResult}
+        returns it, with a TTL of 30 seconds, until C{staleTTL} seconds after
+        it expired.
+        """
+        c = cache.CacheResolver(reactor=self.clock, staleTTL=100)
+        c.cacheResult(self.query(), _answer(ttl=60))
+        self.assertIsNone(c.staleResult(self.query(b"other.example.com")))
+        self.clock.advance(61)
+        self.failureResultOf(c.lookupAddress(b"example.com"), error.DomainError)
+        answers, authority, additional = c.staleResult(self.query())
+        self.assertEqual([r.ttl for r in answers], [30])
+        self.clock.advance(99)
+        self.assertNotIn(self.query(), c.cache)
+        self.assertIsNone(c.staleResult(self.query()))
+
+    def test_prefetch(self):
+        """
+        Looking up an entry with less than C{prefetchRatio} of its TTL left
+        refreshes it from C{prefetchResolver}.
+        """
+        resolver = FakeResolver(_answer(ttl=120))
+        c = cache.CacheResolver(
+            reactor=self.clock, prefetchResolver=resolver, prefetchRatio=0.25
+        )
+        c.cacheResult(self.query(), _answer(ttl=60))
+        self.clock.advance(44)
+        self.successResultOf(c.lookupAddress(b"example.com"))
+        self.assertEqual(resolver.queries, [])
+        self.clock.advance(2)
+        self.successResultOf(c.lookupAddress(b"example.com"))
+        self.assertEqual(resolver.queries, [self.query()])
+        self.clock.advance(100)
+        answers, authority, additional = self.successResultOf(
+            c.lookupAddress(b"example.com")
+        )
+        self.assertEqual([r.ttl for r in answers], [20])
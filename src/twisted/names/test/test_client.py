@@ -453,6 +453,79 @@ class ResolverTests(unittest.TestCase):
             ]
         )
 
+    def test_concurrentRequestsCounted(self):
+        """
+        L{client.Resolver.queriesIssued} counts the requests made for
+        lookups, and L{client.Resolver.queriesCoalesced} the lookups which
+        waited for an identical request already made instead.
+        """
+        protocol = StubDNSDatagramProtocol()
+        resolver = client.Resolver(servers=[("example.com", 53)])
+        resolver._connectedProtocol = lambda: protocol
+
+        query = dns.Query(b"foo.example.com", dns.A)
+        for i in range(3):
+            resolver.query(query)
+        resolver.query(dns.Query(b"bar.example.com", dns.A))
+        self.assertEqual(len(protocol.queries), 2)
+        self.assertEqual((resolver.queriesIssued, resolver.queriesCoalesced), (2, 2))
+
+    def test_cancelConcurrentRequest(self):
+        """
+        Cancelling the L{Deferred} of one of several concurrent identical
+        lookups fails it with L{defer.CancelledError}, and the others still
+        get the result of the request.
+        """
+        protocol = StubDNSDatagramProtocol()
+        resolver = client.Resolver(servers=[("example.com", 53)])
+        resolver._connectedProtocol = lambda: protocol
+
+        query = dns.Query(b"foo.example.com", dns.A)
+        first = resolver.query(query)
+        second = resolver.query(query)
+        first.cancel()
+        self.failureResultOf(first, defer.CancelledError)
+        request = protocol.queries.pop()[-1]
+        self.assertNoResult(request)
+
+        request.callback(dns.Message())
+        self.assertEqual(self.successResultOf(second), ([], [], []))
+
+    def test_cancelAllConcurrentRequests(self):
+        """
+        Once the L{Deferred}s of all concurrent identical lookups are
+        cancelled, the request made for them is cancelled too, and another
+        identical lookup makes a new request.
+        """
+        protocol = StubDNSDatagramProtocol()
+        resolver = client.Resolver(servers=[("example.com", 53)])
+        resolver._connectedProtocol = lambda: protocol
+
+        query = dns.Query(b"foo.example.com", dns.A)
+        first = resolver.query(query)
+        second = resolver.query(query)
+        first.cancel()
+        second.cancel()
+        self.failureResultOf(first, defer.CancelledError)
+        self.failureResultOf(second, defer.CancelledError)
+        self.assertTrue(protocol.queries.pop()[-1].called)
+        self.assertTrue(protocol.transport.disconnected)
+        self.assertEqual(resolver._waiting, {})
+
+        resolver.query(query)
+        self.assertEqual(len(protocol.queries), 1)
+
+    def test_requestFailsImmediately(self):
+        """
+        If the request for a lookup fails before it is returned, the
+        L{Deferred} of the lookup fails with the same error.
+        """
+        resolver = client.Resolver(servers=[("example.com", 53)])
+        resolver.servers = []
+        d = resolver.query(dns.Query(b"foo.example.com", dns.A))
+        self.failureResultOf(d, IOError)
+        self.assertEqual(resolver._waiting, {})
+
     def test_connectedProtocol(self):
         """
         L{client.Resolver._connectedProtocol} returns a new
@@ -7,12 +7,14 @@ Tests for twisted.names.dns.
 """
 
 
+import pickle
 import struct
 from io import BytesIO
 
+from zope.interface import implementer
 from zope.interface.verify import verifyClass
 
-from twisted.internet import address, task
+from twisted.internet import address, defer, interfaces, task
 from twisted.internet.error import CannotListenError, ConnectionDone
 from twisted.names import dns
 from twisted.python.failure import Failure
@@ -994,6 +996,274 @@ class MessageTests(unittest.SynchronousTestCase):
         self.assertTrue(message.answers[0].auth)
 
 
+class MessageDecodingTests(unittest.SynchronousTestCase):
+    """
+    Tests for decoding a L{dns.Message} with L{dns.Message.fromStr}, lazily
+    and otherwise.
+    """
+
+    def message(self):
+        """
+        Make a response with records in every section, using name
+        compression.
+
+        @return: The L{dns.Message}.
+        """
+        m = dns.Message(id=10, answer=1, auth=1)
+        m.addQuery(b"www.example.com", dns.A)
+        m.answers = [
+            dns.RRHeader(
+                b"www.example.com",
+                dns.CNAME,
+                ttl=60,
+                payload=dns.Record_CNAME(b"host.example.com", 60),
+            ),
+            dns.RRHeader(
+                b"host.example.com", ttl=60, payload=dns.Record_A("10.0.0.1", 60)
+            ),
+            dns.RRHeader(
+                b"host.example.com",
+                dns.TXT,
+                ttl=60,
+                payload=dns.Record_TXT(b"some", b"text", ttl=60),
+            ),
+        ]
+        m.authority = [
+            dns.RRHeader(
+                b"example.com",
+                dns.MX,
+                ttl=30,
+                payload=dns.Record_MX(10, b"mail.example.com", 30),
+            ),
+        ]
+        m.additional = [
+            dns.RRHeader(
+                b"mail.example.com",
+                dns.AAAA,
+                ttl=30,
+                payload=dns.Record_AAAA("::1", 30),
+            ),
+        ]
+        for header in m.answers + m.authority + m.additional:
+            header.auth = True
+        return m
+
+    def test_roundtrip(self):
+        """
+        Decoding an encoded message gives back the same records.
+        """
+        original = self.message()
+        m = dns.Message()
+        m.fromStr(original.toStr())
+        original.maxSize = 0
+        self.assertEqual(m, original)
+        self.assertIsNone(m._decoder)
+
+    def test_lazy(self):
+        """
+        With C{lazy=True}, only the header and queries are decoded straight
+        away, and each record section the first time it is used.
+        """
+        original = self.message()
+        m = dns.Message()
+        m.fromStr(original.toStr(), lazy=True)
+        self.assertEqual((m.id, m.answer, m.auth), (10, 1, 1))
+        self.assertEqual(m.queries, original.queries)
+        self.assertNotIn("answers", m.__dict__)
+        self.assertEqual(m.additional, original.additional)
+        self.assertNotIn("answers", m.__dict__)
+        self.assertEqual(m.answers, original.answers)
+        self.assertIsNotNone(m._decoder)
+        self.assertEqual(m.authority, original.authority)
+        self.assertIsNone(m._decoder)
+
+    def test_lazyAssigned(self):
+        """
+        A section of a lazily decoded message which is assigned to before
+        being used is not decoded.
+        """
+        m = dns.Message()
+        m.fromStr(self.message().toStr(), lazy=True)
+        m.answers = []
+        self.assertEqual(m.answers, [])
+        self.assertEqual(m.authority, self.message().authority)
+
+    def test_lazyPickle(self):
+        """
+        A lazily decoded message can be pickled.
+        """
+        original = self.message()
+        m = dns.Message()
+        m.fromStr(original.toStr(), lazy=True)
+        copy = pickle.loads(pickle.dumps(m))
+        original.maxSize = 0
+        self.assertEqual(copy, original)
+
+    def test_truncated(self):
+        """
+        If the message ends in the middle of a section, that section holds
+        the records before the end, and the sections after it are empty.
+        """
+        original = self.message()
+        data = original.toStr()[:-10]
+        for lazy in (False, True):
+            m = dns.Message()
+            m.fromStr(data, lazy=lazy)
+            self.assertEqual(
+                (m.answers, m.authority, m.additional),
+                (original.answers, original.authority, []),
+            )
+            m = dns.Message()
+            m.fromStr(data[:40], lazy=lazy)
+            self.assertEqual(
+                (m.queries, m.answers, m.authority, m.additional),
+                (original.queries, [], [], []),
+            )
+
+    def test_compressionLoop(self):
+        """
+        A name which contains a compression loop cannot be decoded.  If it is
+        the name of a record, even a lazily decoded message is rejected
+        straight away; if it is in the data of a record, a lazily decoded
+        message only raises L{ValueError} when that section is used.
+        """
+        header = b"\x00\x01\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00"
+        ownerLoop = header + b"\xc0\x0c\x00\x01\x00\x01\x00\x00\x00\x3c\x00\x00"
+        for lazy in (False, True):
+            self.assertRaises(ValueError, dns.Message().fromStr, ownerLoop, lazy)
+
+        dataLoop = header + b"\x00\x00\x05\x00\x01\x00\x00\x00\x3c\x00\x02\xc0\x17"
+        self.assertRaises(ValueError, dns.Message().fromStr, dataLoop)
+        m = dns.Message()
+        m.fromStr(dataLoop, lazy=True)
+        self.assertRaises(ValueError, getattr, m, "answers")
+        self.assertEqual(m.additional, [])
+
+    def test_nameCache(self):
+        """
+        L{dns._decodeName} follows compression pointers, and remembers each
+        name it decodes by its position, with the position after it.
+        """
+        data = b"\x03www\x07example\x03com\x00\x04mail\xc0\x04\xc0\x11"
+        names = {}
+        self.assertEqual(dns._decodeName(data, 0, names), (b"www.example.com", 17))
+        self.assertEqual(dns._decodeName(data, 17, names), (b"mail.example.com", 24))
+        self.assertEqual(dns._decodeName(data, 24, names), (b"mail.example.com", 26))
+        self.assertEqual(
+            names,
+            {
+                0: (b"www.example.com", 17),
+                17: (b"mail.example.com", 24),
+                24: (b"mail.example.com", 26),
+            },
+        )
+        self.assertRaises(EOFError, dns._decodeName, data[:10], 0, {})
+
+
+class SectionEncodingCacheTests(unittest.SynchronousTestCase):
+    """
+    Tests for L{dns._SectionEncodingCache}.
+    """
+
+    def message(self, id=1, address="10.0.0.1"):
+        """
+        Make a response with records in every section.
+
+        @param id: The message ID.
+
+        @param address: The address in the answer.
+
+        @return: The L{dns.Message}.
+        """
+        m = dns.Message(id=id, answer=1, auth=1)
+        m.addQuery(b"www.example.com", dns.A)
+        m.answers = [
+            dns.RRHeader(b"www.example.com", ttl=60, payload=dns.Record_A(address, 60))
+        ]
+        m.authority = [
+            dns.RRHeader(
+                b"example.com",
+                dns.NS,
+                ttl=60,
+                payload=dns.Record_NS(b"ns.example.com", 60),
+            )
+        ]
+        m.additional = [
+            dns.RRHeader(b"ns.example.com", ttl=60, payload=dns.Record_A("10.0.0.2"))
+        ]
+        return m
+
+    def test_sameEncoding(self):
+        """
+        A message encoded with the cache is encoded the same as without it,
+        whether its sections have been encoded before or not.
+        """
+        cache = dns._SectionEncodingCache()
+        for id in (1, 2):
+            m = self.message(id)
+            expected = m.toStr()
+            m._encodingCache = cache
+            self.assertEqual(m.toStr(), expected)
+
+    def test_reused(self):
+        """
+        The encoding of the sections of a message is reused for a later
+        message with the same question and records, even if the records are
+        new L{dns.RRHeader} instances.
+        """
+        cache = dns._SectionEncodingCache()
+        first = cache.encode(self.message())
+        self.assertIs(cache.encode(self.message(2)), first)
+
+    def test_differentRecords(self):
+        """
+        A message with the same question as one encoded before but different
+        records is encoded from scratch, and its encoding replaces the other.
+        """
+        cache = dns._SectionEncodingCache()
+        first = cache.encode(self.message())
+        m = self.message(address="10.0.0.3")
+        second = cache.encode(m)
+        self.assertNotEqual(first, second)
+        m._encodingCache = None
+        self.assertEqual(second, m.toStr()[m.headerSize :])
+        self.assertEqual(len(cache._encodings), 1)
+
+    def test_extraRecords(self):
+        """
+        Records which are not L{dns.RRHeader}s, and those after them, are
+        encoded after the remembered sections every time.
+        """
+        cache = dns._SectionEncodingCache()
+        m = dns._EDNSMessage(id=1, answer=True, ednsVersion=0)
+        m.queries = [dns.Query(b"www.example.com")]
+        m.answers = self.message().answers
+        expected = m.toStr()
+        m._encodingCache = cache
+        self.assertEqual(m.toStr(), expected)
+        self.assertEqual(m.toStr(), expected)
+        [(records, body, compDict)] = cache._encodings.values()
+        self.assertEqual(len(records), 1)
+
+    def test_maxSize(self):
+        """
+        At most C{maxSize} encodings are remembered, for the questions most
+        recently encoded.
+        """
+        cache = dns._SectionEncodingCache(maxSize=2)
+        for name in [b"a.example.com", b"b.example.com", b"a.example.com"]:
+            m = dns.Message()
+            m.addQuery(name)
+            cache.encode(m)
+        m = dns.Message()
+        m.addQuery(b"c.example.com")
+        cache.encode(m)
+        self.assertEqual(
+            [question[0][0] for question in cache._encodings],
+            [b"a.example.com", b"c.example.com"],
+        )
+
+
 class MessageComparisonTests(ComparisonTestsMixin, unittest.SynchronousTestCase):
     """
     Tests for the rich comparison of L{dns.Message} instances.
@@ -1243,6 +1513,35 @@ class TestController:
         self.messages.append((msg, proto, addr))
 
 
+class ReplyingController(TestController):
+    """
+    Pretend to be a DNS server, which replies to each message as soon as it
+    is received.
+    """
+
+    def messageReceived(self, msg, proto, addr=None):
+        TestController.messageReceived(self, msg, proto, addr)
+        msg.answer = 1
+        proto.writeMessage(msg, addr)
+
+
+@implementer(interfaces.IBatchUDPTransport)
+class BatchDatagramTransport(proto_helpers.FakeDatagramTransport):
+    """
+    A fake datagram transport which can also write batches of datagrams.
+
+    @ivar batches: A list of the lists of C{(datagram, address)} pairs passed
+        to C{writeBatch}.
+    """
+
+    def __init__(self):
+        proto_helpers.FakeDatagramTransport.__init__(self)
+        self.batches = []
+
+    def writeBatch(self, datagrams):
+        self.batches.append(list(datagrams))
+
+
 class DatagramProtocolTests(unittest.TestCase):
     """
     Test various aspects of L{dns.DNSDatagramProtocol}.
@@ -1287,6 +1586,17 @@ class DatagramProtocolTests(unittest.TestCase):
         )
         self.assertEqual(self.controller.messages, [])
 
+    def test_cancelQuery(self):
+        """
+        Cancelling the L{Deferred} of a query forgets the query and stops its
+        timeout.
+        """
+        d = self.proto.query(("127.0.0.1", 21345), [dns.Query(b"foo")])
+        d.cancel()
+        self.failureResultOf(d, defer.CancelledError)
+        self.assertEqual(self.proto.liveMessages, {})
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+
     def test_simpleQuery(self):
         """
         Test content received after a query.
@@ -1304,6 +1614,27 @@ class DatagramProtocolTests(unittest.TestCase):
         self.proto.datagramReceived(m.toStr(), ("127.0.0.1", 21345))
         return d
 
+    def test_malformedRecordData(self):
+        """
+        A message with a record whose data cannot be decoded is dropped with
+        a log message rather than given to the controller, whose use of the
+        record sections would otherwise fail.
+        """
+        m = dns.Message(id=1)
+        m.addQuery(b"example.com")
+        header = bytearray(m.toStr())
+        header[11] = 1
+        # An NS record in the additional section whose name points at itself.
+        pointer = struct.pack("!H", 0xC000 | (len(header) + 11))
+        data = (
+            bytes(header)
+            + b"\x00"
+            + struct.pack("!HHIH", dns.NS, dns.IN, 60, len(pointer))
+            + pointer
+        )
+        self.proto.datagramReceived(data, ("127.0.0.1", 21345))
+        self.assertEqual(self.controller.messages, [])
+
     def test_queryTimeout(self):
         """
         Test that query timeouts after some seconds.
@@ -1359,6 +1690,62 @@ class DatagramProtocolTests(unittest.TestCase):
         self.proto.datagramReceived(message.toStr(), ("127.0.0.1", 21345))
         self.assertEqual(self.controller.messages[-1][0].toStr(), message.toStr())
 
+    def test_datagramsReceived(self):
+        """
+        L{DNSDatagramProtocol.datagramsReceived} handles each datagram in a
+        batch as L{DNSDatagramProtocol.datagramReceived} does, including those
+        given as L{memoryview}s.
+        """
+        messages = [dns.Message(id=i) for i in range(3)]
+        self.proto.datagramsReceived(
+            [
+                (memoryview(message.toStr()), ("127.0.0.1", 21345 + i))
+                for i, message in enumerate(messages)
+            ]
+            + [(memoryview(b"\x00"), ("127.0.0.1", 21345))]
+        )
+        self.assertEqual(
+            [(i, ("127.0.0.1", 21345 + i)) for i in range(3)],
+            [(m.id, addr) for (m, proto, addr) in self.controller.messages],
+        )
+
+    def test_datagramsReceivedRepliesIndividually(self):
+        """
+        Messages written while L{DNSDatagramProtocol.datagramsReceived} is
+        handling a batch are written one at a time if the transport cannot
+        write batches.
+        """
+        self.proto.controller = ReplyingController()
+        addresses = [("127.0.0.1", 21345), ("127.0.0.2", 21345)]
+        self.proto.datagramsReceived(
+            [(memoryview(dns.Message(id=1).toStr()), addr) for addr in addresses]
+        )
+        reply = dns.Message(id=1, answer=1).toStr()
+        self.assertEqual(
+            [(reply, addr) for addr in addresses], self.proto.transport.written
+        )
+
+    def test_datagramsReceivedBatchesReplies(self):
+        """
+        Messages written while L{DNSDatagramProtocol.datagramsReceived} is
+        handling a batch are written together after the whole batch has been
+        handled, if the transport provides L{interfaces.IBatchUDPTransport}.
+        """
+        self.proto = dns.DNSDatagramProtocol(ReplyingController())
+        transport = BatchDatagramTransport()
+        self.proto.makeConnection(transport)
+        addresses = [("127.0.0.1", 21345), ("127.0.0.2", 21345)]
+        self.proto.datagramsReceived(
+            [(memoryview(dns.Message(id=1).toStr()), addr) for addr in addresses]
+        )
+        reply = dns.Message(id=1, answer=1).toStr()
+        self.assertEqual([], transport.written)
+        self.assertEqual([[(reply, addr) for addr in addresses]], transport.batches)
+
+        # Outside of a batch, messages are written immediately.
+        self.proto.writeMessage(dns.Message(id=2), addresses[0])
+        self.assertEqual([(dns.Message(id=2).toStr(), addresses[0])], transport.written)
+
 
 class TestTCPController(TestController):
     """
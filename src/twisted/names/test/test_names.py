@@ -8,6 +8,7 @@ Test cases for twisted.names.
 
 import copy
 import operator
+import pickle
 import socket
 from functools import partial, reduce
 from io import BytesIO
@@ -735,6 +736,190 @@ class AuthorityTests(unittest.TestCase):
         """
         self._referralTest("lookupAllRecords")
 
+    def _zoneAuthority(self):
+        """
+        Create an authority for a zone with a delegation, a wildcard and a
+        name with no records but names below it.
+        """
+        zone = soa_record.mname.name
+        return NoFileAuthority(
+            soa=(zone, soa_record),
+            records={
+                zone: [soa_record, dns.Record_NS(b"ns." + zone)],
+                b"ns." + zone: [dns.Record_A("10.0.0.1")],
+                b"child." + zone: [dns.Record_NS(b"ns.child." + zone)],
+                b"ns.child." + zone: [dns.Record_A("10.0.0.2")],
+                b"*.wild." + zone: [dns.Record_A("10.0.0.3")],
+                b"host.empty." + zone: [dns.Record_A("10.0.0.4")],
+            },
+        )
+
+    def test_referralBelowDelegation(self):
+        """
+        A query for a name below a name with I{NS} records is answered with a
+        referral to the child zone, with the addresses of its name servers in
+        the additional section.
+        """
+        zone = soa_record.mname.name
+        child = b"child." + zone
+        answer, authority, additional = self.successResultOf(
+            self._zoneAuthority().lookupAddress(b"www." + child)
+        )
+        self.assertEqual(answer, [])
+        self.assertEqual(
+            authority,
+            [
+                dns.RRHeader(
+                    child,
+                    dns.NS,
+                    ttl=soa_record.expire,
+                    payload=dns.Record_NS(b"ns." + child),
+                    auth=False,
+                )
+            ],
+        )
+        self.assertEqual(
+            additional,
+            [
+                dns.RRHeader(
+                    b"ns." + child,
+                    dns.A,
+                    ttl=soa_record.expire,
+                    payload=dns.Record_A("10.0.0.2"),
+                    auth=True,
+                )
+            ],
+        )
+
+    def test_wildcard(self):
+        """
+        A query for a name which does not exist is answered from a wildcard
+        record at the closest enclosing name which does, as if the records
+        were those of the name queried.  RFC 4592, section 3.3.
+        """
+        name = b"a.wild." + soa_record.mname.name
+        answer, authority, additional = self.successResultOf(
+            self._zoneAuthority().lookupAddress(name)
+        )
+        self.assertEqual(
+            answer,
+            [
+                dns.RRHeader(
+                    name,
+                    dns.A,
+                    ttl=soa_record.expire,
+                    payload=dns.Record_A("10.0.0.3"),
+                    auth=True,
+                )
+            ],
+        )
+
+    def test_wildcardNotBelowClosestEncloser(self):
+        """
+        A wildcard only matches names for which its parent is the closest
+        enclosing name which exists.  RFC 4592, section 2.2.1.
+        """
+        authority = self._zoneAuthority()
+        f = self.failureResultOf(
+            authority.lookupAddress(b"a.b.host.empty." + soa_record.mname.name)
+        )
+        self.assertIsInstance(f.value, dns.AuthoritativeDomainError)
+
+    def test_emptyNonTerminal(self):
+        """
+        A query for a name which has no records but has names below it which
+        do is answered with no records rather than a name error.  RFC 4592,
+        section 2.2.2.
+        """
+        answer, authority, additional = self.successResultOf(
+            self._zoneAuthority().lookupAddress(b"empty." + soa_record.mname.name)
+        )
+        self.assertEqual(answer, [])
+        self.assertEqual(
+            authority,
+            [
+                dns.RRHeader(
+                    soa_record.mname.name,
+                    dns.SOA,
+                    ttl=soa_record.expire,
+                    payload=soa_record,
+                    auth=True,
+                )
+            ],
+        )
+
+    def test_recordsReplaced(self):
+        """
+        When C{records} is replaced, later lookups are answered from the new
+        records, even if it has as many names as before.
+        """
+        authority = self._zoneAuthority()
+        zone = soa_record.mname.name
+        self.successResultOf(authority.lookupAddress(b"ns." + zone))
+        records = dict(authority.records)
+        del records[b"ns." + zone]
+        records[b"*.new." + zone] = [dns.Record_A("10.0.0.5")]
+        records[b"host.empty." + zone] = [dns.Record_A("10.0.0.6")]
+        authority.records = records
+
+        self.failureResultOf(
+            authority.lookupAddress(b"ns." + zone), dns.AuthoritativeDomainError
+        )
+        answer = self.successResultOf(authority.lookupAddress(b"x.new." + zone))[0]
+        self.assertEqual([r.payload for r in answer], [dns.Record_A("10.0.0.5")])
+        answer = self.successResultOf(authority.lookupAddress(b"host.empty." + zone))[0]
+        self.assertEqual([r.payload for r in answer], [dns.Record_A("10.0.0.6")])
+
+    def test_recordsChangedInPlace(self):
+        """
+        Names and records added to, removed from or replaced in C{records} in
+        place after a lookup are seen by later lookups.
+        """
+        authority = self._zoneAuthority()
+        zone = soa_record.mname.name
+        name = b"new." + zone
+        self.failureResultOf(authority.lookupAddress(name))
+        authority.records[name] = [dns.Record_TXT(b"text")]
+        self.assertEqual(self.successResultOf(authority.lookupAddress(name))[0], [])
+        authority.records[name].append(dns.Record_A("10.0.0.5"))
+        answer = self.successResultOf(authority.lookupAddress(name))[0]
+        self.assertEqual([r.payload for r in answer], [dns.Record_A("10.0.0.5")])
+        authority.records[name][1] = dns.Record_A("10.0.0.6")
+        answer = self.successResultOf(authority.lookupAddress(name))[0]
+        self.assertEqual([r.payload for r in answer], [dns.Record_A("10.0.0.6")])
+
+        # Replace one name with another, keeping the number of names.
+        del authority.records[name]
+        authority.records[b"ns." + zone] = [dns.Record_A("10.0.0.7")]
+        self.failureResultOf(
+            authority.lookupAddress(name), dns.AuthoritativeDomainError
+        )
+        answer = self.successResultOf(authority.lookupAddress(b"ns." + zone))[0]
+        self.assertEqual([r.payload for r in answer], [dns.Record_A("10.0.0.7")])
+        del authority.records[b"ns." + zone]
+        authority.records[name] = [dns.Record_A("10.0.0.8")]
+        answer = self.successResultOf(authority.lookupAddress(name))[0]
+        self.assertEqual([r.payload for r in answer], [dns.Record_A("10.0.0.8")])
+
+        authority.records[b"*.wild." + zone] = [dns.Record_A("10.0.0.9")]
+        answer = self.successResultOf(authority.lookupAddress(b"x.wild." + zone))[0]
+        self.assertEqual([r.payload for r in answer], [dns.Record_A("10.0.0.9")])
+
+    def test_pickleWithoutIndex(self):
+        """
+        The index of the zone is not pickled with a L{FileAuthority}, and is
+        made again when the unpickled authority is used.
+        """
+        original = self._zoneAuthority()
+        self.successResultOf(original.lookupAddress(soa_record.mname.name))
+        self.assertIsNotNone(original._index)
+        unpickled = pickle.loads(pickle.dumps(original))
+        self.assertNotIn("_index", unpickled.__dict__)
+        answer = self.successResultOf(
+            unpickled.lookupAddress(b"x.wild." + soa_record.mname.name)
+        )[0]
+        self.assertEqual([r.payload for r in answer], [dns.Record_A("10.0.0.3")])
+
 
 class AdditionalProcessingTests(unittest.TestCase):
     """
@@ -1229,6 +1414,22 @@ class BindAuthorityTests(unittest.TestCase):
     def setUp(self):
         self.auth = self.loadBindString(sampleBindZone)
 
+    def test_addRecord(self):
+        """
+        Records added with L{authority.BindAuthority.addRecord} after the zone
+        is loaded are found by later lookups.
+        """
+        self.successResultOf(self.auth.lookupAddress(b"example.com"))
+        origin = b"example.com."
+        self.auth.addRecord(origin, 60, "A", b"new", "IN", [b"10.0.0.7"])
+        self.auth.addRecord(origin, 60, "A", origin, "IN", [b"10.0.0.8"])
+        [[rr], [], []] = self.successResultOf(
+            self.auth.lookupAddress(b"new.example.com")
+        )
+        self.assertEqual(rr.payload, dns.Record_A("10.0.0.7", 60))
+        answer = self.successResultOf(self.auth.lookupAddress(b"example.com"))[0]
+        self.assertIn(dns.Record_A("10.0.0.8", 60), [r.payload for r in answer])
+
     def test_ttl(self):
         """
         Loads the default $TTL and applies it to all records.
@@ -7,9 +7,9 @@ Test cases for L{twisted.names.server}.
 
 from zope.interface.verify import verifyClass
 
-from twisted.internet import defer
+from twisted.internet import defer, task
 from twisted.internet.interfaces import IProtocolFactory
-from twisted.names import dns, error, resolve, server
+from twisted.names import cache, dns, error, resolve, server
 from twisted.python import failure, log
 from twisted.trial import unittest
 
@@ -858,6 +858,25 @@ class DNSServerFactoryTests(unittest.TestCase):
             (response1.auth, response2.auth),
         )
 
+    def test_responseFromMessageEncodingCache(self):
+        """
+        L{server.DNSServerFactory._responseFromMessage} has authoritative
+        responses encoded with the factory's L{dns._SectionEncodingCache}, and
+        others encoded from scratch.
+        """
+        factory = server.DNSServerFactory()
+        response1 = factory._responseFromMessage(
+            message=dns.Message(), answers=[dns.RRHeader(auth=True)]
+        )
+        response2 = factory._responseFromMessage(
+            message=dns.Message(), answers=[dns.RRHeader(auth=False)]
+        )
+        self.assertIsInstance(factory._encodingCache, dns._SectionEncodingCache)
+        self.assertEqual(
+            (factory._encodingCache, None),
+            (response1._encodingCache, response2._encodingCache),
+        )
+
     def test_gotResolverResponseLogging(self):
         """
         L{server.DNSServerFactory.gotResolverResponse} logs the total number of
@@ -983,6 +1002,57 @@ class DNSServerFactoryTests(unittest.TestCase):
         e = self.flushLoggedErrors(KeyError)
         self.assertEqual(len(e), 1)
 
+    def test_gotResolverErrorCachesNameError(self):
+        """
+        L{server.DNSServerFactory.gotResolverError} passes the authority
+        section of the response carried by a L{error.DNSNameError} to the
+        C{cacheNameError} method of the cache, for negative caching.
+        """
+        c = cache.CacheResolver(reactor=task.Clock())
+        f = NoResponseDNSServerFactory(caches=[c])
+        request = dns.Message()
+        request.addQuery(b"example.com", dns.A)
+        response = dns.Message(rCode=dns.ENAME)
+        response.authority = [
+            dns.RRHeader(b"example.com", dns.SOA, dns.IN, 60, dns.Record_SOA())
+        ]
+        f.gotResolverError(
+            failure.Failure(error.DNSNameError(response)),
+            protocol=NoopProtocol(),
+            message=request,
+            address=None,
+        )
+        self.failureResultOf(
+            c.lookupAddress(b"example.com"), error.AuthoritativeDomainError
+        )
+
+    def test_gotResolverErrorServesStale(self):
+        """
+        L{server.DNSServerFactory.gotResolverError} responds with an expired
+        result from the cache, if it has one, instead of L{dns.ESERVER}.
+        """
+        clock = task.Clock()
+        c = cache.CacheResolver(reactor=clock, staleTTL=60)
+        query = dns.Query(b"example.com")
+        answers = [dns.RRHeader(b"example.com", ttl=10, payload=dns.Record_A())]
+        c.cacheResult(query, (answers, [], []))
+        clock.advance(20)
+        f = server.DNSServerFactory(caches=[c])
+        request = dns.Message()
+        request.addQuery(b"example.com", dns.A)
+        e = self.assertRaises(
+            RaisingProtocol.WriteMessageArguments,
+            f.gotResolverError,
+            failure.Failure(KeyError()),
+            protocol=RaisingProtocol(),
+            message=request,
+            address=None,
+        )
+        (message,), kwargs = e.args
+        self.assertEqual(message.rCode, dns.OK)
+        self.assertEqual([r.name for r in message.answers], [dns.Name(b"example.com")])
+        self.assertEqual(self.flushLoggedErrors(KeyError), [])
+
     def test_gotResolverErrorLogging(self):
         """
         L{server.DNSServerFactory.gotResolver} logs a message if C{verbose > 0}.
@@ -0,0 +1 @@
+twisted.enterprise.adbapi.ConnectionPool accepts cp_max_age, cp_idle_timeout and cp_ping_interval to replace old, idle or failed connections before they are used, and has a statistics() method reporting how long interactions wait for a connection.
@@ -0,0 +1 @@
+twisted.enterprise.adbapi.ConnectionPool has a runOperationMany method, which runs executemany in one transaction, and a runQueryStream method, which returns an asynchronous iterator of batches of rows fetched with fetchmany as they are asked for.
@@ -0,0 +1 @@
+twisted.internet.interfaces.IBufferedProtocol lets a protocol provide its own receive buffer; TCP, UNIX stream and TLS transports read directly into it instead of allocating a new bytes object for every read.
@@ -0,0 +1 @@
+twisted.internet.processpool.deferToProcess calls a picklable function in a pool of worker processes, started with reactor.spawnProcess and driven over AMP; ProcessPool supports replacing workers after a number of calls or once they use too much memory, and cancelling calls.
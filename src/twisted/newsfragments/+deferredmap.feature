@@ -0,0 +1 @@
+twisted.internet.defer.deferredMap calls a function on each item of an iterable or asynchronous iterable with a bounded number of calls in progress, and iterates asynchronously over the results, in order or as they complete.
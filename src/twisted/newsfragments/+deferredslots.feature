@@ -0,0 +1 @@
+twisted.internet.defer.Deferred now keeps its attributes in __slots__, and adding and running callbacks without extra arguments is faster.
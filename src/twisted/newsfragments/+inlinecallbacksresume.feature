@@ -0,0 +1 @@
+twisted.internet.defer.inlineCallbacks and Deferred.fromCoroutine now resume straight away when the yielded Deferred already has a result, and reuse the callback which resumes them rather than adding a new one for each yield.
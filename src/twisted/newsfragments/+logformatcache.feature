@@ -0,0 +1 @@
+twisted.logger now parses each log format string once, rather than for every event flattened or formatted with it, and eventAsJSON reuses one JSON encoder.
@@ -0,0 +1 @@
+twisted.logger.Logger.emit now returns without making an event when the level of the event is below the levels that twisted.logger.LogLevelFilterPredicate lets through to every observer.
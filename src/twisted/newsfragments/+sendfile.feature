@@ -0,0 +1 @@
+twisted.internet.interfaces.ISendfileTransport is a new interface, provided by TCP connections on platforms with os.sendfile, for sending part of a file on the connection without copying it through the process; twisted.protocols.basic.FileSender uses it when it can.
@@ -0,0 +1 @@
+twisted.logger.ThreadedFileLogObserver buffers events and formats and writes them in batches from a worker thread, dropping the oldest or blocking when its buffer is full, and writes what is left when the reactor shuts down.
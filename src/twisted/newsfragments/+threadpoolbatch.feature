@@ -0,0 +1 @@
+twisted.python.threadpool.ThreadPool now accepts batchResults=True, which makes twisted.internet.threads.deferToThreadPool wake the reactor once for many completed calls, and has a statistics() method reporting its backlog and histograms of how long work waited for a thread and ran.
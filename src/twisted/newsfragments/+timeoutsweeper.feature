@@ -0,0 +1 @@
+twisted.protocols.policies.TimeoutSweeper tracks the timeouts of many twisted.protocols.policies.TimeoutMixin protocols with a single timed call, so that resetting a timeout only records its new deadline.  Protocols use it by setting their timeoutSweeper attribute.
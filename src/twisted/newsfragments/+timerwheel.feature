@@ -0,0 +1 @@
+twisted.internet.base.ReactorBase.useTimerWheel switches a reactor to keeping its timed calls in a hierarchical timer wheel, which makes scheduling, cancelling and rescheduling a DelayedCall take constant time no matter how many calls are pending.
@@ -0,0 +1 @@
+twist now accepts --workers N to run the plugin in N supervised worker processes, restarting any which exit and restarting them all one at a time on SIGHUP; TCP server endpoint descriptions accept reuseport=yes so that the workers can share a listening port.
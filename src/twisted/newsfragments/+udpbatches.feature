@@ -0,0 +1 @@
+UDP ports now provide twisted.internet.interfaces.IBatchUDPTransport, whose writeBatch method sends several datagrams at once, and pass received datagrams in batches to protocols which provide the new twisted.internet.interfaces.IBatchDatagramProtocol.
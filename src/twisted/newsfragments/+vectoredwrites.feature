@@ -0,0 +1 @@
+TCP and UNIX stream transports now send queued data with sendmsg where it is available, so chunks passed to write() and writeSequence() are no longer copied into a single buffer before being sent.
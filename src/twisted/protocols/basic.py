@@ -9,9 +9,11 @@ Basic protocols, such as line-oriented, netstring, and int prefixed strings.
 
 
 import math
+import os
 
 # System imports
 import re
+import stat
 from io import BytesIO
 from struct import calcsize, pack, unpack
 
@@ -877,15 +879,68 @@ class FileSender:
         @return: A deferred whose callback will be invoked when the file has
         been completely written to the consumer. The last byte written to the
         consumer is passed to the callback.
+
+        If there is no C{transform}, C{file} is a regular file, and
+        C{consumer} provides L{interfaces.ISendfileTransport}, the rest of the
+        file is sent with C{consumer.sendfile} instead of being read into
+        memory, and the deferred fails if the connection is lost before it
+        has all been sent.
         """
         self.file = file
         self.consumer = consumer
         self.transform = transform
 
         self.deferred = deferred = defer.Deferred()
+        if transform is None and interfaces.ISendfileTransport.providedBy(consumer):
+            span = self._fileSpan(file)
+            if span is not None:
+                offset, count = span
+                d = consumer.sendfile(file, offset, count)
+                d.addCallbacks(self._sent, self._sendfileFailed, callbackArgs=(offset,))
+                return deferred
         self.consumer.registerProducer(self, False)
         return deferred
 
+    def _fileSpan(self, file):
+        """
+        Find the part of C{file} which remains to be sent.
+
+        @return: A C{(offset, count)} tuple giving the current position in the
+            file and the number of bytes after it, or L{None} if C{file} is not
+            a regular file.
+        """
+        try:
+            status = os.fstat(file.fileno())
+            offset = file.tell()
+        except (AttributeError, OSError, ValueError):
+            return None
+        if not stat.S_ISREG(status.st_mode):
+            return None
+        return offset, max(status.st_size - offset, 0)
+
+    def _sent(self, count, offset):
+        """
+        The rest of the file was sent with L{interfaces.ISendfileTransport}.
+        Leave the file positioned at the end of what was sent, as reading it
+        would have, and fire the deferred with the last byte sent.
+        """
+        if count:
+            self.file.seek(offset + count - 1)
+            self.lastSent = self.file.read(1)
+        self.file = None
+        if self.deferred:
+            self.deferred.callback(self.lastSent)
+            self.deferred = None
+
+    def _sendfileFailed(self, reason):
+        """
+        The connection was lost before the rest of the file could be sent.
+        """
+        self.file = None
+        if self.deferred:
+            self.deferred.errback(reason)
+            self.deferred = None
+
     def resumeProducing(self):
         chunk = ""
         if self.file:
@@ -11,12 +11,12 @@ Resource limiting policies.
 
 # system imports
 import sys
-from typing import Optional, Type
+from typing import Callable, Dict, List, Optional, Type
 
 from zope.interface import directlyProvides, providedBy
 
 from twisted.internet import error, interfaces
-from twisted.internet.interfaces import ILoggingContext
+from twisted.internet.interfaces import IDelayedCall, ILoggingContext, IReactorTime
 
 # twisted imports
 from twisted.internet.protocol import ClientFactory, Protocol, ServerFactory
@@ -617,6 +617,212 @@ class TrafficLoggingFactory(WrappingFactory):
         self._counter = 0
 
 
+class _SweptTimeout:
+    """
+    A timeout tracked by a L{TimeoutSweeper}.
+
+    This supports the parts of L{IDelayedCall} which L{TimeoutMixin} uses.
+    Resetting it only records the new deadline; the sweeper notices the change
+    when it next looks at the timeout.
+
+    @ivar deadline: The time at which the timeout expires.
+    @ivar slot: The key of the sweeper bucket holding this timeout, or
+        L{None} if it is not in one.
+    """
+
+    slot: Optional[int] = None
+    cancelled = called = False
+
+    def __init__(
+        self, sweeper: "TimeoutSweeper", deadline: float, func: Callable[[], object]
+    ) -> None:
+        self.sweeper = sweeper
+        self.deadline = deadline
+        self.func = func
+
+    def getTime(self) -> float:
+        """
+        See L{IDelayedCall.getTime}.
+        """
+        return self.deadline
+
+    def active(self) -> bool:
+        """
+        See L{IDelayedCall.active}.
+        """
+        return not (self.cancelled or self.called)
+
+    def reset(self, secondsFromNow: float) -> None:
+        """
+        See L{IDelayedCall.reset}.
+        """
+        if self.cancelled:
+            raise error.AlreadyCancelled
+        elif self.called:
+            raise error.AlreadyCalled
+        deadline = self.sweeper.clock.seconds() + secondsFromNow
+        if deadline < self.deadline:
+            # The sweeper might not look at this timeout again until it is too
+            # late, so move it now.
+            self.sweeper._remove(self)
+            self.deadline = deadline
+            self.sweeper._add(self)
+        else:
+            self.deadline = deadline
+
+    def cancel(self) -> None:
+        """
+        See L{IDelayedCall.cancel}.
+        """
+        if self.cancelled:
+            raise error.AlreadyCancelled
+        elif self.called:
+            raise error.AlreadyCalled
+        self.cancelled = True
+        self.sweeper._remove(self)
+
+
+class TimeoutSweeper:
+    """
+    Track the timeouts of many L{TimeoutMixin} protocols with a single timed
+    call.
+
+    By default, L{TimeoutMixin.resetTimeout} reschedules a L{DelayedCall
+    <twisted.internet.base.DelayedCall>} every time it is called, which for
+    busy protocols is every time some data is received.  A protocol whose
+    C{timeoutSweeper} is set instead records the deadline of its timeout, and
+    the sweeper periodically expires every timeout whose deadline has passed
+    in one batch.  Each timeout is looked at by the sweeper at most once per
+    timeout period, no matter how often it is reset.
+
+    Timeouts tracked by a sweeper never expire early, but expire up to
+    C{granularity} seconds late.
+
+    @ivar granularity: The interval, in seconds, between sweeps.
+    @ivar clock: The L{IReactorTime} provider used to schedule sweeps.
+
+    @ivar _buckets: Timeouts, in dictionaries keyed on the number of the
+        sweep which will look at them.
+    @ivar _sweepCall: The L{IDelayedCall} for the next sweep, or L{None}.
+    @ivar _sweepSlot: The number of the next sweep.
+    """
+
+    _sweepCall: Optional[IDelayedCall] = None
+    _sweepSlot = 0
+    _sweeping = False
+
+    def __init__(
+        self, granularity: float = 1.0, clock: Optional[IReactorTime] = None
+    ) -> None:
+        """
+        @param granularity: See L{TimeoutSweeper.granularity}.
+        @param clock: See L{TimeoutSweeper.clock}.  Defaults to the global
+            reactor.
+        """
+        if clock is None:
+            from twisted.internet import reactor
+
+            clock = reactor  # type: ignore[assignment]
+        self.granularity = granularity
+        self.clock = clock
+        self._buckets: Dict[int, Dict[_SweptTimeout, None]] = {}
+
+    def callLater(self, period: float, func: Callable[[], object]) -> _SweptTimeout:
+        """
+        Start tracking a timeout.
+
+        @param period: The number of seconds after which the timeout expires.
+        @param func: A callable to call with no arguments when the timeout
+            expires.
+
+        @return: An object with the C{reset}, C{cancel}, C{active} and
+            C{getTime} methods of an L{IDelayedCall}.
+        """
+        timeout = _SweptTimeout(self, self.clock.seconds() + period, func)
+        self._add(timeout)
+        return timeout
+
+    def _add(self, timeout: _SweptTimeout, after: int = -1) -> None:
+        """
+        Put a timeout in the bucket for the first sweep at or after its
+        deadline, and make sure that sweep is scheduled.
+
+        @param after: A sweep which the timeout must be looked at later than.
+        """
+        slot = max(int(-(-timeout.deadline // self.granularity)), after + 1)
+        bucket = self._buckets.get(slot)
+        if bucket is None:
+            bucket = self._buckets[slot] = {}
+        bucket[timeout] = None
+        timeout.slot = slot
+        if not self._sweeping and (self._sweepCall is None or slot < self._sweepSlot):
+            self._schedule(slot)
+
+    def _remove(self, timeout: _SweptTimeout) -> None:
+        """
+        Take a timeout out of its bucket, if it is in one.
+        """
+        slot = timeout.slot
+        if slot is not None:
+            timeout.slot = None
+            bucket = self._buckets[slot]
+            del bucket[timeout]
+            if not bucket:
+                del self._buckets[slot]
+                if not self._buckets and self._sweepCall is not None:
+                    self._sweepCall.cancel()
+                    self._sweepCall = None
+
+    def _schedule(self, slot: int) -> None:
+        """
+        Schedule the next sweep.
+        """
+        if self._sweepCall is not None:
+            self._sweepCall.cancel()
+        self._sweepSlot = slot
+        delay = max(0, slot * self.granularity - self.clock.seconds())
+        self._sweepCall = self.clock.callLater(delay, self._sweep)
+
+    def _sweep(self) -> None:
+        """
+        Expire the timeouts whose deadlines have passed, and move the rest to
+        the buckets for their current deadlines.
+        """
+        self._sweepCall = None
+        now = self.clock.seconds()
+        # The sweep which was scheduled is due even if, due to rounding, the
+        # time is a little short of it.
+        current = max(int(now // self.granularity), self._sweepSlot)
+        expired: List[_SweptTimeout] = []
+        self._sweeping = True
+        try:
+            for slot in sorted(slot for slot in self._buckets if slot <= current):
+                for timeout in self._buckets.pop(slot):
+                    timeout.slot = None
+                    if timeout.deadline <= now:
+                        expired.append(timeout)
+                    else:
+                        self._add(timeout, current)
+        finally:
+            self._sweeping = False
+
+        # Schedule the next sweep before expiring anything, so that timeouts
+        # started by the expired ones are only swept early, never late.
+        if self._buckets:
+            self._schedule(min(self._buckets))
+
+        for timeout in expired:
+            # An earlier timeout in this batch may have cancelled or reset
+            # this one.
+            if timeout.cancelled or timeout.slot is not None:
+                continue
+            timeout.called = True
+            try:
+                timeout.func()
+            except BaseException:
+                log.err(None, "Unhandled error in timeout")
+
+
 class TimeoutMixin:
     """
     Mixin for protocols which wish to timeout connections.
@@ -626,10 +832,17 @@ class TimeoutMixin:
     default, closes the connection.
 
     @cvar timeOut: The number of seconds after which to timeout the connection.
+
+    @cvar timeoutSweeper: If not L{None}, a L{TimeoutSweeper} which tracks
+        this protocol's timeout, instead of a timed call scheduled with
+        L{callLater}.  This makes L{resetTimeout} cheaper, in exchange for a
+        coarser timeout.
     """
 
     timeOut: Optional[int] = None
 
+    timeoutSweeper: Optional[TimeoutSweeper] = None
+
     __timeoutCall = None
 
     def callLater(self, period, func):
@@ -679,7 +892,12 @@ class TimeoutMixin:
             else:
                 self.__timeoutCall.reset(period)
         elif period is not None:
-            self.__timeoutCall = self.callLater(period, self.__timedOut)
+            if self.timeoutSweeper is not None:
+                self.__timeoutCall = self.timeoutSweeper.callLater(
+                    period, self.__timedOut
+                )
+            else:
+                self.__timeoutCall = self.callLater(period, self.__timedOut)
 
         return prev
 
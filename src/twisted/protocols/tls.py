@@ -47,6 +47,7 @@ from OpenSSL.SSL import Connection, Error, SysCallError, WantReadError, ZeroRetu
 from twisted.internet._producer_helpers import _PullToPush
 from twisted.internet._sslverify import _setAcceptableProtocols
 from twisted.internet.interfaces import (
+    IBufferedProtocol,
     IDelayedCall,
     IHandshakeListener,
     ILoggingContext,
@@ -279,9 +280,14 @@ class TLSMemoryBIOProtocol(ProtocolWrapper):
         # close the connection.  Looping is necessary to make sure we
         # process all of the data which was put into the receive BIO, as
         # there is no guarantee that a single recv call will do it all.
+        bufferedProtocol = IBufferedProtocol.providedBy(self.wrappedProtocol)
         while not self._lostTLSConnection:
             try:
-                bytes = self._tlsConnection.recv(2**15)
+                if bufferedProtocol:
+                    buffer = self.wrappedProtocol.getBuffer(2**15)
+                    count = self._tlsConnection.recv_into(buffer)
+                else:
+                    bytes = self._tlsConnection.recv(2**15)
             except WantReadError:
                 # The newly received bytes might not have been enough to produce
                 # any application data.
@@ -301,7 +307,11 @@ class TLSMemoryBIOProtocol(ProtocolWrapper):
                 failure = Failure()
                 self._tlsShutdownFinished(failure)
             else:
-                if not self._aborted:
+                if self._aborted:
+                    pass
+                elif bufferedProtocol:
+                    self.wrappedProtocol.bufferUpdated(count)
+                else:
                     ProtocolWrapper.dataReceived(self, bytes)
 
         # The received bytes might have generated a response which needs to be
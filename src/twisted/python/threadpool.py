@@ -11,12 +11,13 @@ instead of creating a thread pool directly.
 
 from __future__ import annotations
 
-from threading import Thread, current_thread
-from typing import Any, Callable, List, Optional, TypeVar
+from threading import Lock, Thread, current_thread
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 from typing_extensions import ParamSpec, Protocol, TypedDict
 
 from twisted._threads import pool as _pool
+from twisted._threads._team import Statistics
 from twisted.python import context, log
 from twisted.python.deprecate import deprecated
 from twisted.python.failure import Failure
@@ -39,6 +40,53 @@ class _State(TypedDict):
 WorkerStop = object()
 
 
+class _ResultBatch:
+    """
+    Results of work done by a L{ThreadPool} on their way to a reactor thread,
+    delivered together so that the reactor wakes once for as many of them as
+    complete before it gets around to running them.
+
+    @ivar _reactor: The reactor results are delivered to.
+
+    @ivar _lock: A L{Lock} guarding C{_pending}.
+
+    @ivar _pending: The C{(f, result)} pairs not yet delivered.
+    """
+
+    def __init__(self, reactor: Any) -> None:
+        self._reactor = reactor
+        self._lock = Lock()
+        self._pending: List[Tuple[Callable[[Any], object], object]] = []
+
+    def deliver(self, f: Callable[[Any], object], result: object) -> None:
+        """
+        Call C{f} with C{result} in the reactor thread.  This may be called
+        from any thread.
+
+        @param f: A 1-argument callable, such as L{Deferred.callback}.
+
+        @param result: The argument to call C{f} with.
+        """
+        with self._lock:
+            self._pending.append((f, result))
+            wake = len(self._pending) == 1
+        if wake:
+            self._reactor.callFromThread(self._deliverPending)
+
+    def _deliverPending(self) -> None:
+        """
+        Call every pending C{f} with its result, in the order they were
+        passed to L{_ResultBatch.deliver}.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for f, result in pending:
+            try:
+                f(result)
+            except BaseException:
+                log.err()
+
+
 class ThreadPool:
     """
     This class (hopefully) generalizes the functionality of a pool of threads
@@ -52,6 +100,12 @@ class ThreadPool:
     @ivar threads: List of workers currently running in this thread pool.
     @type threads: L{list}
 
+    @ivar batchResults: Whether L{twisted.internet.threads.deferToThreadPool}
+        delivers the results of work done in this pool to the reactor in
+        batches, waking the reactor once for many completions, rather than
+        once per completion.
+    @type batchResults: L{bool}
+
     @ivar _pool: A hook for testing.
     @type _pool: callable compatible with L{_pool}
     """
@@ -61,6 +115,7 @@ class ThreadPool:
     joined = False
     started = False
     name = None
+    batchResults = False
 
     threadFactory = Thread
     currentThread = staticmethod(
@@ -72,7 +127,11 @@ class ThreadPool:
     _pool = staticmethod(_pool)
 
     def __init__(
-        self, minthreads: int = 5, maxthreads: int = 20, name: Optional[str] = None
+        self,
+        minthreads: int = 5,
+        maxthreads: int = 20,
+        name: Optional[str] = None,
+        batchResults: bool = False,
     ):
         """
         Create a new threadpool.
@@ -85,13 +144,18 @@ class ThreadPool:
 
         @param name: The name to give this threadpool; visible in log messages.
         @type name: native L{str}
+
+        @param batchResults: The value for L{ThreadPool.batchResults}.
+        @type batchResults: L{bool}
         """
         assert minthreads >= 0, "minimum is negative"
         assert minthreads <= maxthreads, "minimum is greater than maximum"
         self.min = minthreads
         self.max = maxthreads
         self.name = name
+        self.batchResults = batchResults
         self.threads: List[Thread] = []
+        self._resultBatches: Dict[Any, _ResultBatch] = {}
 
         def trackingThreadFactory(*a: Any, **kw: Any) -> Thread:
             thread = self.threadFactory(  # type: ignore[misc]
@@ -165,6 +229,30 @@ class ThreadPool:
 
         return NotAQueue()
 
+    def statistics(self) -> Statistics:
+        """
+        Describe the current state of this pool.
+
+        @return: the number of idle and busy workers, the amount of work
+            waiting for a worker, and histograms of how long completed work
+            waited for a worker and then ran.
+        """
+        return self._team.statistics()
+
+    def _resultBatch(self, reactor: Any) -> _ResultBatch:
+        """
+        Get the batch which delivers results of work done in this pool to the
+        given reactor.
+
+        @param reactor: The reactor results will be delivered to.
+
+        @return: The L{_ResultBatch} for C{reactor}.
+        """
+        batch = self._resultBatches.get(reactor)
+        if batch is None:
+            batch = self._resultBatches.setdefault(reactor, _ResultBatch(reactor))
+        return batch
+
     q = _queue  # Yes, twistedchecker, I want a single-letter
     # attribute name.
 
@@ -338,3 +426,12 @@ class ThreadPool:
         log.msg(f"waiters: {self.waiters}")
         log.msg(f"workers: {self.working}")
         log.msg(f"total: {self.threads}")
+        stats = self.statistics()
+        log.msg(f"backlog: {stats.backloggedWorkCount}")
+        for label, histogram in [
+            ("wait", stats.waitTimes),
+            ("run", stats.runTimes),
+        ]:
+            if histogram.count:
+                mean = histogram.total / histogram.count
+                log.msg(f"{label}: {histogram.count} tasks, mean {mean:.6f}s")
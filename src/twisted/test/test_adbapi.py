@@ -867,3 +867,267 @@ class ConnectionPoolTests(unittest.TestCase):
         pool.close()
         # But not anymore.
         self.assertFalse(reactor.triggers)
+
+
+class ConnectionHealthTests(unittest.TestCase):
+    """
+    Tests for the C{cp_max_age}, C{cp_idle_timeout} and C{cp_ping_interval}
+    options of L{ConnectionPool}.
+    """
+
+    if requireModule("sqlite3") is None:
+        skip = "sqlite3 is not available"
+
+    def makePool(self, **kw):
+        """
+        Create a L{ConnectionPool} of in-memory SQLite databases whose clock
+        is C{self.now}.
+
+        @param kw: Extra arguments for L{ConnectionPool}.
+
+        @return: The new L{ConnectionPool}.
+        """
+        pool = ConnectionPool(
+            "sqlite3",
+            ":memory:",
+            check_same_thread=False,
+            cp_reactor=EventReactor(False),
+            **kw,
+        )
+        self.now = 0.0
+        pool._seconds = lambda: self.now
+        self.addCleanup(pool.close)
+        return pool
+
+    def test_maxAge(self):
+        """
+        A connection older than C{cp_max_age} is closed and replaced when it is
+        next used.
+        """
+        pool = self.makePool(cp_max_age=10)
+        first = pool.connect()
+        self.now = 10.0
+        self.assertIs(pool.connect(), first)
+        self.now = 10.5
+        second = pool.connect()
+        self.assertIsNot(second, first)
+        self.assertRaises(pool.dbapi.ProgrammingError, first.cursor)
+        self.assertEqual(list(pool.connections.values()), [second])
+
+    def test_idleTimeout(self):
+        """
+        A connection unused for longer than C{cp_idle_timeout} is closed and
+        replaced when it is next used.
+        """
+        pool = self.makePool(cp_idle_timeout=5)
+        first = pool.connect()
+        self.now = 4.0
+        pool._connectionUsed()
+        self.now = 9.0
+        self.assertIs(pool.connect(), first)
+        pool._connectionUsed()
+        self.now = 15.0
+        self.assertIsNot(pool.connect(), first)
+
+    def test_idleTimeoutUpdatedByInteraction(self):
+        """
+        Running an interaction counts as using the connection.
+        """
+        pool = self.makePool(cp_idle_timeout=5)
+        first = pool.connect()
+
+        def interaction(transaction):
+            self.now = 20.0
+
+        pool._runInteraction(interaction)
+        self.now = 24.0
+        self.assertIs(pool.connect(), first)
+
+    def test_pingInterval(self):
+        """
+        A connection unused for longer than C{cp_ping_interval} is checked with
+        C{cp_good_sql} when it is next used, and replaced if that fails.
+        """
+        pool = self.makePool(cp_ping_interval=5)
+        first = pool.connect()
+        self.now = 6.0
+        self.assertIs(pool.connect(), first)
+        first.close()
+        self.now = 10.0
+        self.assertIs(pool.connect(), first)
+        self.now = 11.5
+        second = pool.connect()
+        self.assertIsNot(second, first)
+        second.execute("select 1")
+
+    def test_persistence(self):
+        """
+        The health check options survive pickling.
+        """
+        pool = self.makePool(cp_max_age=1, cp_idle_timeout=2, cp_ping_interval=3)
+        state = pool.__getstate__()
+        self.assertEqual(
+            (state["max_age"], state["idle_timeout"], state["ping_interval"]),
+            (1, 2, 3),
+        )
+
+
+class StreamingTests(unittest.TestCase):
+    """
+    Tests for L{ConnectionPool.runOperationMany} and
+    L{ConnectionPool.runQueryStream}.
+    """
+
+    if requireModule("sqlite3") is None:
+        skip = "sqlite3 is not available"
+    elif interfaces.IReactorThreads(reactor, None) is None:
+        skip = "ADB-API requires threads, no way to test without them"
+
+    def setUp(self):
+        """
+        Create a started L{ConnectionPool} with one SQLite connection, and a
+        table in its database.
+        """
+        self.dbpool = ConnectionPool(
+            "sqlite3",
+            database=self.mktemp(),
+            cp_min=1,
+            cp_max=1,
+            check_same_thread=False,
+        )
+        self.dbpool.start()
+        return self.dbpool.runOperation(simple_table_schema)
+
+    def tearDown(self):
+        if self.dbpool.running:
+            self.dbpool.close()
+
+    def insert(self, count):
+        """
+        Insert rows into the table.
+
+        @param count: The number of rows to insert, with values from 0.
+
+        @return: A L{Deferred} which fires when they have been inserted.
+        """
+        return self.dbpool.runOperationMany(
+            "insert into simple(x) values(?)", [(i,) for i in range(count)]
+        )
+
+    def collect(self, stream):
+        """
+        Consume a stream of batches.
+
+        @return: A L{Deferred} which fires with the L{list} of batches.
+        """
+
+        async def collect():
+            return [rows async for rows in stream]
+
+        return defer.Deferred.fromCoroutine(collect())
+
+    @defer.inlineCallbacks
+    def test_runOperationMany(self):
+        """
+        L{ConnectionPool.runOperationMany} runs a statement for each of a
+        sequence of parameters.
+        """
+        yield self.insert(5)
+        rows = yield self.dbpool.runQuery("select x from simple order by x")
+        self.assertEqual(rows, [(i,) for i in range(5)])
+
+    @defer.inlineCallbacks
+    def test_runOperationManyRollback(self):
+        """
+        If any statement run by L{ConnectionPool.runOperationMany} fails, none
+        of them take effect.
+        """
+        d = self.dbpool.runOperationMany(
+            "insert into simple(x) values(?)", [(1,), ("a", "b")]
+        )
+        yield self.assertFailure(d, self.dbpool.dbapi.Error)
+        rows = yield self.dbpool.runQuery("select count(*) from simple")
+        self.assertEqual(rows, [(0,)])
+
+    @defer.inlineCallbacks
+    def test_runQueryStream(self):
+        """
+        L{ConnectionPool.runQueryStream} returns an asynchronous iterator of
+        batches of at most C{batchSize} rows.
+        """
+        yield self.insert(10)
+        batches = yield self.collect(
+            self.dbpool.runQueryStream("select x from simple order by x", batchSize=3)
+        )
+        self.assertEqual(
+            batches,
+            [[(0,), (1,), (2,)], [(3,), (4,), (5,)], [(6,), (7,), (8,)], [(9,)]],
+        )
+
+    @defer.inlineCallbacks
+    def test_runQueryStreamExactBatches(self):
+        """
+        When the rows fill the last batch exactly, the stream ends after it.
+        """
+        yield self.insert(4)
+        batches = yield self.collect(
+            self.dbpool.runQueryStream("select x from simple order by x", batchSize=2)
+        )
+        self.assertEqual(batches, [[(0,), (1,)], [(2,), (3,)]])
+
+    @defer.inlineCallbacks
+    def test_runQueryStreamEmpty(self):
+        """
+        A query with no rows gives a stream with no batches.
+        """
+        batches = yield self.collect(self.dbpool.runQueryStream("select x from simple"))
+        self.assertEqual(batches, [])
+
+    @defer.inlineCallbacks
+    def test_runQueryStreamFailure(self):
+        """
+        If the query fails, the stream fails with its error.
+        """
+        d = self.collect(self.dbpool.runQueryStream("select * from NOTABLE"))
+        yield self.assertFailure(d, self.dbpool.dbapi.Error)
+
+    @defer.inlineCallbacks
+    def test_runQueryStreamOnDemand(self):
+        """
+        A batch is only fetched when it is asked for.
+        """
+        yield self.insert(10)
+        stream = self.dbpool.runQueryStream("select x from simple", batchSize=2)
+        first = yield stream.__anext__()
+        self.assertEqual(len(first), 2)
+        self.assertEqual(stream._requests.qsize(), 0)
+        stream.cancel()
+
+    @defer.inlineCallbacks
+    def test_runQueryStreamCancel(self):
+        """
+        Cancelling a stream fails the L{Deferred}s waiting for batches with
+        L{CancelledError}, ends it, and gives its connection back to the
+        pool.
+        """
+        yield self.insert(10)
+        stream = self.dbpool.runQueryStream("select x from simple", batchSize=2)
+        yield stream.__anext__()
+        d = stream.__anext__()
+        stream.cancel()
+        self.failureResultOf(d, defer.CancelledError)
+        self.failureResultOf(stream.__anext__(), StopAsyncIteration)
+        rows = yield self.dbpool.runQuery("select count(*) from simple")
+        self.assertEqual(rows, [(10,)])
+
+    @defer.inlineCallbacks
+    def test_closeStopsStreams(self):
+        """
+        Closing the pool stops streams which are still running, rather than
+        waiting for them to be consumed.
+        """
+        yield self.insert(10)
+        stream = self.dbpool.runQueryStream("select x from simple", batchSize=2)
+        yield stream.__anext__()
+        self.dbpool.close()
+        self.failureResultOf(stream.__anext__(), StopAsyncIteration)
@@ -24,6 +24,8 @@ from asyncio import (
 )
 from typing import (
     Any,
+    AsyncGenerator,
+    AsyncIterator,
     Callable,
     Coroutine,
     Dict,
@@ -231,6 +233,36 @@ class DeferredTests(unittest.SynchronousTestCase, ImmediateFailureMixin):
         self.assertEqual(self.callbackResults, (("hello",), {}))
         self.assertEqual(self.callback2Results, (("hello",), {}))
 
+    def test_errbackWithArgs(self) -> None:
+        """
+        L{Deferred.addErrback} passes its extra arguments to the errback, and
+        lets a result other than a L{Failure} pass it by.
+        """
+        deferred: Deferred[str] = Deferred()
+        deferred.addErrback(self._errback, "world", extra="!")
+        deferred.addCallback(self._callback)
+        deferred.callback("hello")
+        self.assertIsNone(self.errbackResults)
+        self.assertEqual(self.callbackResults, (("hello",), {}))
+
+        failing: Deferred[str] = Deferred()
+        failing.addErrback(self._errback, "world", extra="!")
+        failing.errback(GenericError("oopsie"))
+        assert self.errbackResults is not None
+        self.assertEqual(self.errbackResults[0][1:], ("world",))
+        self.assertEqual(self.errbackResults[1], {"extra": "!"})
+
+    def test_slots(self) -> None:
+        """
+        The attributes a L{Deferred} needs to be created, have a callback
+        added and be fired are all kept in slots, so it does not need an
+        instance dictionary.
+        """
+        deferred: Deferred[str] = Deferred()
+        deferred.addCallback(self._callback)
+        deferred.callback("hello")
+        self.assertEqual({}, vars(deferred))
+
     def test_addCallbacksNoneErrback(self) -> None:
         """
         If given None for an errback, addCallbacks uses a pass-through.
@@ -2025,6 +2057,197 @@ class RaceTests(unittest.SynchronousTestCase):
         self.failureResultOf(raceResult, FailureGroup)
 
 
+def _collect(results: AsyncIterator[_T]) -> Deferred[List[_T]]:
+    """
+    Consume an asynchronous iterator.
+
+    @return: A L{Deferred} which fires with a list of its items.
+    """
+
+    async def collect() -> List[_T]:
+        return [result async for result in results]
+
+    return Deferred.fromCoroutine(collect())
+
+
+class DeferredMapTests(unittest.SynchronousTestCase):
+    """
+    Tests for L{defer.deferredMap}.
+    """
+
+    def setUp(self) -> None:
+        self.pulled: List[int] = []
+        self.calls: Dict[int, Deferred[str]] = {}
+        self.cancelled: List[int] = []
+
+    def items(self, count: int) -> Generator[int, None, None]:
+        """
+        Generate C{count} items, recording in C{self.pulled} which have been
+        taken.
+        """
+        for item in range(count):
+            self.pulled.append(item)
+            yield item
+
+    def call(self, item: int) -> Deferred[str]:
+        """
+        Start an operation on C{item} which completes when the test fires its
+        L{Deferred}, in C{self.calls}, and records in C{self.cancelled} if it
+        is cancelled.
+        """
+        d: Deferred[str] = Deferred(lambda d: self.cancelled.append(item))
+        self.calls[item] = d
+        return d
+
+    def test_ordered(self) -> None:
+        """
+        By default, results are given in the order of the items, whatever
+        order the operations complete in.
+        """
+        collected = _collect(defer.deferredMap(self.call, self.items(3), 3))
+        for item in [2, 0, 1]:
+            self.calls[item].callback(str(item))
+        self.assertEqual(self.successResultOf(collected), ["0", "1", "2"])
+
+    def test_unordered(self) -> None:
+        """
+        With C{ordered=False}, results are given in the order the operations
+        complete in.
+        """
+        collected = _collect(
+            defer.deferredMap(self.call, self.items(3), 3, ordered=False)
+        )
+        for item in [2, 0, 1]:
+            self.calls[item].callback(str(item))
+        self.assertEqual(self.successResultOf(collected), ["2", "0", "1"])
+
+    def test_concurrency(self) -> None:
+        """
+        Items are taken lazily, and no more than C{concurrency} operations are
+        in progress at once.
+        """
+        collected = _collect(
+            defer.deferredMap(self.call, self.items(5), 2, ordered=False)
+        )
+        self.assertEqual(self.pulled, [0, 1])
+        self.calls[1].callback("1")
+        self.assertEqual(self.pulled, [0, 1, 2])
+        self.calls[0].callback("0")
+        self.calls[2].callback("2")
+        self.assertEqual(self.pulled, [0, 1, 2, 3, 4])
+        self.calls[4].callback("4")
+        self.calls[3].callback("3")
+        self.assertEqual(self.successResultOf(collected), ["1", "0", "2", "4", "3"])
+
+    def test_backpressure(self) -> None:
+        """
+        An operation keeps its place until its result is consumed, so no more
+        operations are started while results are waiting for the consumer.
+        """
+        results = defer.deferredMap(self.call, self.items(5), 2)
+        self.calls[0].callback("0")
+        self.calls[1].callback("1")
+        self.assertEqual(self.pulled, [0, 1])
+        self.assertEqual(self.successResultOf(results.__anext__()), "0")
+        self.assertEqual(self.pulled, [0, 1, 2])
+
+    def test_synchronousResults(self) -> None:
+        """
+        Operations which complete synchronously do not use up the stack.
+        """
+        collected = _collect(defer.deferredMap(defer.succeed, range(10000), 3))
+        self.assertEqual(self.successResultOf(collected), list(range(10000)))
+
+    def test_coroutineFunction(self) -> None:
+        """
+        The function may be a coroutine function.
+        """
+
+        async def call(item: int) -> str:
+            return await self.call(item)
+
+        collected = _collect(defer.deferredMap(call, self.items(2), 2))
+        self.calls[1].callback("1")
+        self.calls[0].callback("0")
+        self.assertEqual(self.successResultOf(collected), ["0", "1"])
+
+    def test_asyncIterable(self) -> None:
+        """
+        Items may come from an asynchronous iterable, which is only asked for
+        the next item once the previous one has arrived.
+        """
+        arrivals: List[Deferred[None]] = []
+
+        async def items() -> AsyncGenerator[int, None]:
+            for item in range(3):
+                arrival: Deferred[None] = Deferred()
+                arrivals.append(arrival)
+                await arrival
+                yield item
+
+        collected = _collect(defer.deferredMap(self.call, items(), 2))
+        self.assertEqual(len(arrivals), 1)
+        arrivals[0].callback(None)
+        self.assertEqual(list(self.calls), [0])
+        arrivals[1].callback(None)
+        self.assertEqual(list(self.calls), [0, 1])
+        self.assertEqual(len(arrivals), 2)
+        self.calls[0].callback("0")
+        arrivals[2].callback(None)
+        self.calls[1].callback("1")
+        self.calls[2].callback("2")
+        self.assertEqual(self.successResultOf(collected), ["0", "1", "2"])
+
+    def test_failure(self) -> None:
+        """
+        The failure of an operation is given in place of its result, after
+        which no more operations are started, those in progress are cancelled
+        and iteration ends.
+        """
+        results = defer.deferredMap(self.call, self.items(5), 3)
+        first = results.__anext__()
+        second = results.__anext__()
+        self.calls[1].errback(GenericError("failed"))
+        self.calls[0].callback("0")
+        self.assertEqual(self.successResultOf(first), "0")
+        self.failureResultOf(second, GenericError)
+        self.assertEqual(self.cancelled, [2])
+        self.failureResultOf(results.__anext__(), StopAsyncIteration)
+        self.assertEqual(self.pulled, [0, 1, 2])
+
+    def test_sourceFailure(self) -> None:
+        """
+        An exception raised by the iterable of items is given in place of the
+        next result, after the results of the operations already started.
+        """
+
+        def items() -> Generator[int, None, None]:
+            yield 0
+            raise GenericError("no more")
+
+        collected = _collect(defer.deferredMap(self.call, items(), 3))
+        self.calls[0].callback("0")
+        self.failureResultOf(collected, GenericError)
+
+    def test_cancel(self) -> None:
+        """
+        Cancelling the L{Deferred} for the next result cancels the operations
+        in progress, and no more are started.
+        """
+        collected = _collect(defer.deferredMap(self.call, self.items(5), 2))
+        collected.cancel()
+        self.failureResultOf(collected, defer.CancelledError)
+        self.assertEqual(self.cancelled, [0, 1])
+        self.assertEqual(self.pulled, [0, 1])
+
+    def test_invalidConcurrency(self) -> None:
+        """
+        L{defer.deferredMap} raises L{ValueError} if C{concurrency} is less
+        than 1.
+        """
+        self.assertRaises(ValueError, defer.deferredMap, self.call, [], 0)
+
+
 class FirstErrorTests(unittest.SynchronousTestCase):
     """
     Tests for L{FirstError}.
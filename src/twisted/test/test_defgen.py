@@ -5,6 +5,7 @@
 Tests for L{twisted.internet.defer.deferredGenerator} and related APIs.
 """
 
+import gc
 import traceback
 
 from twisted.internet import defer, reactor, task
@@ -412,6 +413,40 @@ class InlineCallbacksTests(BaseDefgenTests, unittest.TestCase):
         # Our targeted exception is in the traceback
         self.assertIn("test_defgen.TerminalException: boom normal return", tb)
 
+    def test_yieldFiredDeferred(self):
+        """
+        Yielding a L{Deferred} which already has a result resumes the generator
+        with that result, leaving the L{Deferred} with a result of L{None}.
+        """
+        fired = defer.succeed(6)
+
+        @inlineCallbacks
+        def _yields():
+            result = yield fired
+            return result * 7
+
+        self.assertEqual(self.successResultOf(_yields()), 42)
+        self.assertIsNone(fired.result)
+
+    def test_yieldFailedDeferred(self):
+        """
+        Yielding a L{Deferred} which has already failed throws the exception
+        into the generator, and the failure is not logged as unhandled once
+        the L{Deferred} is garbage collected.
+        """
+        failed = [defer.fail(TerminalException("already failed"))]
+
+        @inlineCallbacks
+        def _yields():
+            try:
+                yield failed.pop()
+            except TerminalException as e:
+                return str(e)
+
+        self.assertEqual(self.successResultOf(_yields()), "already failed")
+        gc.collect()
+        self.assertEqual(self.flushLoggedErrors(TerminalException), [])
+
 
 class DeprecateDeferredGeneratorTests(unittest.SynchronousTestCase):
     """
@@ -827,6 +827,164 @@ class TimeoutMixinTests(unittest.TestCase):
         self.assertIsNone(self.proto.timeOut)
 
 
+class TimeoutMixinSweeperTests(unittest.TestCase):
+    """
+    Tests for L{policies.TimeoutMixin} with a L{policies.TimeoutSweeper}.
+    """
+
+    def setUp(self):
+        """
+        Create a testable, deterministic clock, a sweeper using it, and a
+        C{TimeoutTester} instance using the sweeper.
+        """
+        self.clock = task.Clock()
+        self.sweeper = policies.TimeoutSweeper(1.0, self.clock)
+        self.proto = TimeoutTester(self.clock)
+        self.proto.timeoutSweeper = self.sweeper
+
+    def test_timeout(self):
+        """
+        The protocol times out at the first sweep at or after the time
+        specified by its C{timeOut} attribute.
+        """
+        self.clock.advance(0.5)
+        self.proto.makeConnection(StringTransport())
+        self.clock.advance(2.9)
+        self.assertFalse(self.proto.timedOut)
+        self.clock.advance(0.6)
+        self.assertTrue(self.proto.timedOut)
+
+    def test_noTimeout(self):
+        """
+        Receiving data delays the timeout of the connection, without
+        scheduling any more timed calls.
+        """
+        self.proto.makeConnection(StringTransport())
+        self.clock.advance(2)
+        for i in range(10):
+            self.proto.dataReceived(b"hello there")
+        self.assertEqual(len(self.clock.getDelayedCalls()), 1)
+        self.clock.advance(2)
+        self.assertFalse(self.proto.timedOut)
+        self.clock.advance(1)
+        self.assertTrue(self.proto.timedOut)
+
+    def test_resetSooner(self):
+        """
+        Setting a shorter timeout takes effect at the next sweep after it.
+        """
+        self.proto.timeOut = 60
+        self.proto.makeConnection(StringTransport())
+        self.proto.setTimeout(2)
+        self.clock.advance(1)
+        self.assertFalse(self.proto.timedOut)
+        self.clock.advance(1)
+        self.assertTrue(self.proto.timedOut)
+
+    def test_cancelTimeout(self):
+        """
+        Setting the timeout to L{None} stops tracking it, and the sweeper
+        schedules no more sweeps once it is tracking nothing.
+        """
+        self.proto.makeConnection(StringTransport())
+        self.proto.setTimeout(None)
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+        self.clock.pump([0, 5, 5, 5])
+        self.assertFalse(self.proto.timedOut)
+
+    def test_batch(self):
+        """
+        The timeouts of many protocols are expired by the same sweep, leaving
+        those which have been reset more recently.
+        """
+        protos = [TimeoutTester(self.clock) for i in range(5)]
+        for proto in protos:
+            proto.timeoutSweeper = self.sweeper
+            proto.makeConnection(StringTransport())
+        self.assertEqual(len(self.clock.getDelayedCalls()), 1)
+        self.clock.advance(1)
+        protos[0].dataReceived(b"x")
+        self.clock.advance(2)
+        self.assertEqual([p.timedOut for p in protos], [False] + [True] * 4)
+        self.clock.advance(1)
+        self.assertTrue(protos[0].timedOut)
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+
+    def test_cancelFromTimeout(self):
+        """
+        A timeout which is cancelled by another expiring in the same sweep is
+        not expired.
+        """
+        other = TimeoutTester(self.clock)
+        other.timeoutSweeper = self.sweeper
+        self.proto.timeoutConnection = lambda: other.setTimeout(None)
+        self.proto.makeConnection(StringTransport())
+        other.makeConnection(StringTransport())
+        self.clock.advance(3)
+        self.assertFalse(other.timedOut)
+
+    def test_setTimeoutCancelAlreadyCancelled(self):
+        """
+        Setting the timeout to L{None} after it was cancelled elsewhere does
+        not raise an exception.
+        """
+        self.proto.setTimeout(3)
+        self.proto._TimeoutMixin__timeoutCall.cancel()
+        self.proto.setTimeout(None)
+        self.assertIsNone(self.proto.timeOut)
+
+    def test_timeoutError(self):
+        """
+        An exception raised when a timeout expires is logged, and does not stop
+        other timeouts from expiring.
+        """
+        other = TimeoutTester(self.clock)
+        other.timeoutSweeper = self.sweeper
+        self.proto.timeoutConnection = lambda: 1 / 0
+        self.proto.makeConnection(StringTransport())
+        other.makeConnection(StringTransport())
+        self.clock.advance(3)
+        self.assertTrue(other.timedOut)
+        self.assertEqual(len(self.flushLoggedErrors(ZeroDivisionError)), 1)
+
+    def test_timeoutStartedByExpiredTimeout(self):
+        """
+        A timeout which was reset to a later deadline and moved by a sweep
+        still expires on time when a timeout expiring in the same sweep
+        starts another, much later, one.
+        """
+        fired = []
+
+        def expire(name):
+            fired.append((name, self.clock.seconds()))
+
+        def expireAndStart():
+            expire("b")
+            self.sweeper.callLater(300, lambda: expire("n"))
+
+        a = self.sweeper.callLater(10, lambda: expire("a"))
+        self.sweeper.callLater(10, expireAndStart)
+        self.clock.advance(5)
+        a.reset(20)
+        self.clock.pump([1] * 320)
+        self.assertEqual(fired, [("b", 10.0), ("a", 25.0), ("n", 310.0)])
+
+    def test_inexactGranularity(self):
+        """
+        A sweep expires the timeouts it was scheduled for even if, because
+        the granularity is not exactly representable, the time it runs at is
+        a little short of its slot by floor division.
+        """
+        sweeper = policies.TimeoutSweeper(0.7, self.clock)
+        calls = []
+        sweeper.callLater(2.05, lambda: calls.append(self.clock.seconds()))
+        # The sweep is scheduled for 3 * 0.7, which is a little less than
+        # 2.1, and which floor divides by 0.7 to 2.
+        self.clock.advance(3 * 0.7)
+        self.assertEqual(calls, [3 * 0.7])
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+
+
 class LimitTotalConnectionsFactoryTests(unittest.TestCase):
     """Tests for policies.LimitTotalConnectionsFactory"""
 
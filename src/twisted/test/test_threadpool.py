@@ -708,3 +708,113 @@ class MemoryBackedTests(unittest.SynchronousTestCase):
         helper.threadpool.start()
         helper.performAllCoordination()
         self.assertEqual(len(helper.workers), helper.threadpool.max)
+
+    def test_statistics(self):
+        """
+        L{ThreadPool.statistics} describes the pool's workers, its backlog and
+        the latency of the work it has done.
+        """
+        helper = PoolHelper(self, 0, 1)
+        helper.threadpool.start()
+        helper.threadpool.callInThread(lambda: None)
+        helper.threadpool.callInThread(lambda: None)
+        helper.performAllCoordination()
+        stats = helper.threadpool.statistics()
+        self.assertEqual(stats.busyWorkerCount, 1)
+        self.assertEqual(stats.backloggedWorkCount, 1)
+        self.assertEqual(stats.runTimes.count, 0)
+        worker, performer = helper.workers[0]
+        performer()
+        helper.performAllCoordination()
+        performer()
+        helper.performAllCoordination()
+        stats = helper.threadpool.statistics()
+        self.assertEqual(stats.idleWorkerCount, 1)
+        self.assertEqual(stats.backloggedWorkCount, 0)
+        self.assertEqual(stats.waitTimes.count, 2)
+        self.assertEqual(stats.runTimes.count, 2)
+
+
+class FakeReactorFromThreads:
+    """
+    A reactor which queues the calls made with C{callFromThread}.
+
+    @ivar calls: The callables passed to C{callFromThread}, with their
+        arguments.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def callFromThread(self, f, *args, **kwargs):
+        self.calls.append((f, args, kwargs))
+
+    def runCalls(self):
+        """
+        Run the queued calls.
+        """
+        calls, self.calls = self.calls, []
+        for f, args, kwargs in calls:
+            f(*args, **kwargs)
+
+
+class ResultBatchTests(unittest.SynchronousTestCase):
+    """
+    Tests for L{threadpool._ResultBatch}.
+    """
+
+    def setUp(self):
+        self.reactor = FakeReactorFromThreads()
+        self.batch = threadpool._ResultBatch(self.reactor)
+
+    def test_oneWakeUp(self):
+        """
+        Results delivered before the reactor runs the first of them are all
+        delivered, in order, by a single call in the reactor thread.
+        """
+        results = []
+        self.batch.deliver(results.append, 1)
+        self.batch.deliver(results.append, 2)
+        self.batch.deliver(results.append, 3)
+        self.assertEqual(len(self.reactor.calls), 1)
+        self.assertEqual(results, [])
+        self.reactor.runCalls()
+        self.assertEqual(results, [1, 2, 3])
+
+    def test_wakeUpAgain(self):
+        """
+        A result delivered after the reactor has run the previous batch wakes
+        the reactor again.
+        """
+        results = []
+        self.batch.deliver(results.append, 1)
+        self.reactor.runCalls()
+        self.batch.deliver(results.append, 2)
+        self.assertEqual(len(self.reactor.calls), 1)
+        self.reactor.runCalls()
+        self.assertEqual(results, [1, 2])
+
+    def test_exceptionLogged(self):
+        """
+        An exception raised while delivering a result is logged, and the rest
+        of the batch is still delivered.
+        """
+        results = []
+        self.batch.deliver(lambda result: 1 // 0, None)
+        self.batch.deliver(results.append, 2)
+        self.reactor.runCalls()
+        self.assertEqual(results, [2])
+        self.assertEqual(len(self.flushLoggedErrors(ZeroDivisionError)), 1)
+
+    def test_batchPerReactor(self):
+        """
+        L{ThreadPool._resultBatch} returns the same batch for the same reactor
+        and a different one for a different reactor.
+        """
+        pool = threadpool.ThreadPool(batchResults=True)
+        self.assertTrue(pool.batchResults)
+        self.assertIs(pool._resultBatch(self.reactor), pool._resultBatch(self.reactor))
+        self.assertIsNot(
+            pool._resultBatch(self.reactor),
+            pool._resultBatch(FakeReactorFromThreads()),
+        )
@@ -347,6 +347,30 @@ class DeferToThreadPoolTests(TestCase):
         return self.assertFailure(d, NewError)
 
 
+class BatchedDeferToThreadPoolTests(DeferToThreadPoolTests):
+    """
+    Test L{twisted.internet.threads.deferToThreadPool} with a thread pool which
+    delivers results in batches.
+    """
+
+    def setUp(self):
+        self.tp = threadpool.ThreadPool(0, 8, batchResults=True)
+        self.tp.start()
+
+    def test_manyResults(self):
+        """
+        Every result of many calls made at once is delivered to its own
+        L{defer.Deferred}.
+        """
+        ds = [
+            threads.deferToThreadPool(reactor, self.tp, lambda x: x * 2, i)
+            for i in range(50)
+        ]
+        d = defer.gatherResults(ds)
+        d.addCallback(self.assertEqual, [i * 2 for i in range(50)])
+        return d
+
+
 _callBeforeStartupProgram = """
 import time
 import %(reactor)s
@@ -3,9 +3,14 @@
 
 
 from io import BytesIO
+from typing import BinaryIO, List
 
-from twisted.internet import abstract, defer, protocol
+from zope.interface import implementer
+
+from twisted.internet import abstract, defer, error, interfaces, protocol
+from twisted.internet.testing import StringTransport
 from twisted.protocols import basic, loopback
+from twisted.python.filepath import FilePath
 from twisted.trial import unittest
 
 
@@ -27,6 +32,25 @@ class FileSendingClient(protocol.Protocol):
         d.addCallback(lambda r: self.transport.loseConnection())
 
 
+@implementer(interfaces.ISendfileTransport)
+class SendfileTransport(StringTransport):
+    """
+    A L{StringTransport} which records calls to C{sendfile}.
+
+    @ivar sendfileCalls: A list of C{(file, offset, count, deferred)} tuples,
+        one for each call to C{sendfile}.
+    """
+
+    def __init__(self) -> None:
+        StringTransport.__init__(self)
+        self.sendfileCalls: List[tuple[BinaryIO, int, int, defer.Deferred[int]]] = []
+
+    def sendfile(self, file: BinaryIO, offset: int, count: int) -> defer.Deferred[int]:
+        d: defer.Deferred[int] = defer.Deferred()
+        self.sendfileCalls.append((file, offset, count, d))
+        return d
+
+
 class FileSenderTests(unittest.TestCase):
     def testSendingFile(self) -> defer.Deferred[None]:
         testStr = b"xyz" * 100 + b"abc" * 100 + b"123" * 100
@@ -54,3 +78,81 @@ class FileSenderTests(unittest.TestCase):
 
         # Which means the Deferred from FileSender should have been called
         self.assertTrue(d.called, "producer unregistered with deferred being called")
+
+    def test_sendfile(self) -> None:
+        """
+        Without a transform, a regular file is sent to a consumer which
+        provides L{interfaces.ISendfileTransport} with its C{sendfile} method,
+        from the file's current position to its end.  Once it has been sent,
+        the file is positioned at its end and the L{defer.Deferred} fires
+        with the last byte.
+        """
+        path = FilePath(self.mktemp())
+        path.setContent(b"0123456789")
+        consumer = SendfileTransport()
+        with path.open() as f:
+            f.seek(3)
+            d = basic.FileSender().beginFileTransfer(f, consumer)
+            [(sentFile, offset, count, sent)] = consumer.sendfileCalls
+            self.assertEqual((sentFile, offset, count), (f, 3, 7))
+            self.assertIsNone(consumer.producer)
+            self.assertNoResult(d)
+            sent.callback(count)
+            self.assertEqual(self.successResultOf(d), b"9")
+            self.assertEqual(f.tell(), 10)
+
+    def test_sendfileFailed(self) -> None:
+        """
+        If C{sendfile} fails, so does the L{defer.Deferred} returned by
+        L{basic.FileSender.beginFileTransfer}.
+        """
+        path = FilePath(self.mktemp())
+        path.setContent(b"0123456789")
+        consumer = SendfileTransport()
+        with path.open() as f:
+            d = basic.FileSender().beginFileTransfer(f, consumer)
+            consumer.sendfileCalls[0][3].errback(error.ConnectionLost())
+            self.failureResultOf(d, error.ConnectionLost)
+
+    def test_sendfileNotUsed(self) -> None:
+        """
+        A file without a file descriptor, or any file with a transform, is
+        read and written to the consumer as usual, even if it provides
+        L{interfaces.ISendfileTransport}.
+        """
+        path = FilePath(self.mktemp())
+        path.setContent(b"0123456789")
+        consumers = [SendfileTransport(), SendfileTransport()]
+        basic.FileSender().beginFileTransfer(BytesIO(b"abc"), consumers[0])
+        with path.open() as f:
+            basic.FileSender().beginFileTransfer(f, consumers[1], lambda x: x)
+        for consumer in consumers:
+            self.assertEqual(consumer.sendfileCalls, [])
+            self.assertIsNotNone(consumer.producer)
+
+    def test_sendfileOverTCP(self) -> defer.Deferred[None]:
+        """
+        L{basic.FileSender} sends a real file over a real TCP connection.
+        """
+        testStr = b"xyz" * 100000
+        path = FilePath(self.mktemp())
+        path.setContent(testStr)
+        f = path.open()
+        self.addCleanup(f.close)
+        results = []
+
+        class Client(protocol.Protocol):
+            def connectionMade(self) -> None:
+                assert self.transport is not None
+                d = basic.FileSender().beginFileTransfer(f, self.transport)
+                d.addCallback(results.append)
+                d.addCallback(lambda r: self.transport.loseConnection())
+
+        s = BufferingServer()
+        d: defer.Deferred[None] = loopback.loopbackTCP(s, Client())
+
+        def callback(x: object) -> None:
+            self.assertEqual(s.buffer, testStr)
+            self.assertEqual(results, [b"z"])
+
+        return d.addCallback(callback)
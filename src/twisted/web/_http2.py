@@ -1267,14 +1267,8 @@ def _addHeaderToRequest(request, header):
     @return: If the header being added was the C{Content-Length} header.
     @rtype: L{bool}
     """
-    requestHeaders = request.requestHeaders
     name, value = header
-    values = requestHeaders.getRawHeaders(name)
-
-    if values is not None:
-        values.append(value)
-    else:
-        requestHeaders.setRawHeaders(name, [value])
+    request.requestHeaders.addRawHeader(name, value)
 
     if name == b"content-length":
         request.gotLength(int(value))
@@ -204,6 +204,15 @@ the condition."""
 # backwards compatibility
 responses = RESPONSES
 
+# Complete status lines for every known response code and its standard
+# reason phrase, keyed by (version, code, reason) as they are passed to
+# HTTPChannel.writeHeaders.
+_statusLines = {
+    (version, b"%d" % (code,), reason): b"%s %d %s\r\n" % (version, code, reason)
+    for version in (b"HTTP/1.0", b"HTTP/1.1")
+    for code, reason in RESPONSES.items()
+}
+
 
 # datetime parsing and formatting
 weekdayname = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
@@ -2656,15 +2665,17 @@ class HTTPChannel(basic.LineReceiver, policies.TimeoutMixin):
         for name, value in headers:
             sanitizedHeaders.addRawHeader(name, value)
 
-        responseLine = version + b" " + code + b" " + reason + b"\r\n"
+        responseLine = _statusLines.get((version, code, reason))
+        if responseLine is None:
+            responseLine = version + b" " + code + b" " + reason + b"\r\n"
         headerSequence = [responseLine]
-        headerSequence.extend(
-            name + b": " + value + b"\r\n"
-            for name, values in sanitizedHeaders.getAllRawHeaders()
-            for value in values
-        )
+        for name, values in sanitizedHeaders.getAllRawHeaders():
+            for value in values:
+                headerSequence += (name, b": ", value, b"\r\n")
         headerSequence.append(b"\r\n")
-        self.transport.writeSequence(headerSequence)
+        # The head is usually small: send it as one buffer, to be coalesced
+        # with the start of the body rather than written as many pieces.
+        self.transport.write(b"".join(headerSequence))
 
     def write(self, data):
         """
@@ -2857,6 +2868,195 @@ class HTTPChannel(basic.LineReceiver, policies.TimeoutMixin):
         self.loseConnection()
 
 
+class _FastHeadHTTPChannel(HTTPChannel):
+    """
+    A L{HTTPChannel} which parses each request head in one pass once it has
+    all been received, rather than line by line.
+
+    Instead of handing each line to L{HTTPChannel.lineReceived}, it waits for
+    the blank line ending the head, splits the whole head into lines at once
+    and adds the headers to the L{Request} directly, only sanitizing their
+    values when the head contains a bare carriage return or line feed.  The
+    resulting requests, and the responses to invalid ones, are the same.
+
+    Only L{HTTPChannel.totalHeadersSize} limits the size of the head;
+    C{MAX_LENGTH} does not apply to its lines.  If the head arrives in
+    pieces, its request line is still handled as soon as it is complete, so
+    that an invalid one is rejected without waiting for the headers.
+
+    @ivar _blankLineEaten: Whether an empty line preceding the current
+        request has been discarded.
+    @type _blankLineEaten: L{bool}
+
+    @ivar _gotRequestLine: Whether the request line of the current request
+        has already been handled.
+    @type _gotRequestLine: L{bool}
+    """
+
+    _blankLineEaten = False
+    _gotRequestLine = False
+
+    def dataReceived(self, data):
+        self.resetTimeout()
+        if self._busyReceiving:
+            self._buffer += data
+            return
+
+        try:
+            self._busyReceiving = True
+            self._buffer += data
+            while self._buffer and not self.paused:
+                if self.line_mode:
+                    buffer = self._buffer
+                    if buffer[:2] == b"\r\n" and not self._blankLineEaten:
+                        # See HTTPChannel.lineReceived: eat up one empty line
+                        # sent before a request.
+                        self._blankLineEaten = True
+                        self._buffer = buffer[2:]
+                        continue
+                    end = buffer.find(b"\r\n\r\n")
+                    if end == -1:
+                        size = len(buffer) - 2 * buffer.count(b"\r\n")
+                        if buffer[-1:] == b"\r":
+                            size -= 1
+                        if size > self.totalHeadersSize:
+                            self._respondToBadRequestAndDisconnect()
+                        elif not self._gotRequestLine:
+                            lineEnd = buffer.find(b"\r\n")
+                            if lineEnd != -1:
+                                self._requestLineReceived(buffer[:lineEnd])
+                        return
+                    self._buffer = buffer[end + 4 :]
+                    self._blankLineEaten = False
+                    if not self._headReceived(buffer[:end]):
+                        return
+                    if self.transport and self.transport.disconnecting:
+                        return
+                else:
+                    data = self._buffer
+                    self._buffer = b""
+                    self.rawDataReceived(data)
+        finally:
+            self._busyReceiving = False
+
+    def _headReceived(self, head):
+        """
+        Parse the head of a request and dispatch it like
+        L{HTTPChannel.lineReceived} would have.
+
+        @param head: The request line and header lines of the request,
+            excluding the empty line which ends them.
+        @type head: L{bytes}
+
+        @return: Whether the request was valid.
+        @rtype: L{bool}
+        """
+        lines = head.split(b"\r\n")
+        lineCount = len(lines)
+        if len(head) - 2 * (lineCount - 1) > self.totalHeadersSize:
+            self._respondToBadRequestAndDisconnect()
+            return False
+
+        if not self._gotRequestLine and not self._requestLineReceived(lines[0]):
+            return False
+        self._gotRequestLine = False
+        request = self.requests[-1]
+
+        if lineCount > 1:
+            headerLines = lines[1:]
+            if b"\r\n " in head or b"\r\n\t" in head:
+                headerLines = _joinContinuationLines(headerLines)
+            if len(headerLines) > self.maxHeaders:
+                self._respondToBadRequestAndDisconnect()
+                return False
+
+            # Header values need sanitizing only if they contain a carriage
+            # return or line feed which is not part of a line delimiter.
+            sanitize = (
+                head.count(b"\r") != lineCount - 1 or head.count(b"\n") != lineCount - 1
+            )
+            headers = request.requestHeaders
+            canonicalNames = Headers._canonicalHeaderCache
+            for line in headerLines:
+                name, colon, value = line.partition(b":")
+                if not colon or not name or name[-1:].isspace():
+                    self._respondToBadRequestAndDisconnect()
+                    return False
+                value = value.strip(b" \t")
+                if sanitize:
+                    name = name.lower()
+                    if not self._maybeChooseTransferDecoder(name, value):
+                        return False
+                    headers.addRawHeader(name, value)
+                    continue
+                canonical = canonicalNames.get(name)
+                if canonical is None:
+                    canonical = headers._encodeName(name)
+                if canonical == b"Content-Length" or canonical == b"Transfer-Encoding":
+                    if not self._maybeChooseTransferDecoder(canonical.lower(), value):
+                        return False
+                headers._addCanonicalRawHeader(canonical, value)
+
+        self.allHeadersReceived()
+        if self.length == 0:
+            self.allContentReceived()
+        else:
+            self.setRawMode()
+        return True
+
+    def _requestLineReceived(self, line):
+        """
+        Create the L{Request} for a request line, like
+        L{HTTPChannel.lineReceived} does.
+
+        @param line: The request line.
+        @type line: L{bytes}
+
+        @return: Whether the request line was valid.
+        @rtype: L{bool}
+        """
+        if not self.persistent:
+            # See HTTPChannel.lineReceived: drop any data sent after the last
+            # request.
+            self.dataReceived = lambda data: None
+            return False
+
+        if INonQueuedRequestFactory.providedBy(self.requestFactory):
+            request = self.requestFactory(self)
+        else:
+            request = self.requestFactory(self, len(self.requests))
+        self.requests.append(request)
+
+        parts = line.split()
+        if len(parts) != 3 or not parts[0].isascii():
+            self._respondToBadRequestAndDisconnect()
+            return False
+        self._command, self._path, self._version = parts
+        self._gotRequestLine = True
+        return True
+
+
+def _joinContinuationLines(lines):
+    """
+    Join the continuation lines of multi-line headers onto the lines they
+    continue, as L{HTTPChannel.lineReceived} does.
+
+    @param lines: The header lines of a request.
+    @type lines: L{list} of L{bytes}
+
+    @return: One line per header.
+    @rtype: L{list} of L{bytes}
+    """
+    joined = []
+    for line in lines:
+        if line[:1] in (b" ", b"\t"):
+            continued = joined.pop() if joined else b""
+            joined.append(continued + b" " + line.lstrip(b" \t"))
+        else:
+            joined.append(line)
+    return joined
+
+
 def _escape(s):
     """
     Return a string like python repr, but always escaped as if surrounding
@@ -3022,6 +3222,10 @@ class _GenericHTTPChannelProtocol(proxyForInterface(IProtocol, "_channel")):  #
 
     @ivar _callLater: A value for the C{callLater} callback.
     @type _callLater: L{callable}
+
+    @ivar _timeoutSweeper: A timeout sweeper to pass to the backing channel.
+    @type _timeoutSweeper: L{twisted.protocols.policies.TimeoutSweeper} or
+        L{None}
     """
 
     _negotiatedProtocol = None
@@ -3030,6 +3234,7 @@ class _GenericHTTPChannelProtocol(proxyForInterface(IProtocol, "_channel")):  #
     _site = None
     _timeOut = None
     _callLater = None
+    _timeoutSweeper = None
 
     @property
     def factory(self):
@@ -3130,6 +3335,28 @@ class _GenericHTTPChannelProtocol(proxyForInterface(IProtocol, "_channel")):  #
         self._callLater = value
         self._channel.callLater = value
 
+    @property
+    def timeoutSweeper(self):
+        """
+        The L{twisted.protocols.policies.TimeoutSweeper} used by the
+        L{twisted.protocols.policies.TimeoutMixin} of the backing channel, if
+        any.
+        """
+        return self._channel.timeoutSweeper
+
+    @timeoutSweeper.setter
+    def timeoutSweeper(self, value):
+        """
+        Sets the L{twisted.protocols.policies.TimeoutSweeper} on both the
+        backing channel and stores it for propagation to any new backing
+        channel.
+
+        @param value: The sweeper to use, or L{None}.
+        @type value: L{twisted.protocols.policies.TimeoutSweeper}
+        """
+        self._timeoutSweeper = value
+        self._channel.timeoutSweeper = value
+
     def dataReceived(self, data):
         """
         An override of L{IProtocol.dataReceived} that checks what protocol we're
@@ -3163,6 +3390,7 @@ class _GenericHTTPChannelProtocol(proxyForInterface(IProtocol, "_channel")):  #
                 self._channel.factory = self._factory
                 self._channel.timeOut = self._timeOut
                 self._channel.callLater = self._callLater
+                self._channel.timeoutSweeper = self._timeoutSweeper
                 self._channel.makeConnection(transport)
 
                 # Register the H2Connection as the transport's
@@ -3184,6 +3412,8 @@ def _genericHTTPChannelProtocolFactory(self):
     """
     Returns an appropriately initialized _GenericHTTPChannelProtocol.
     """
+    if getattr(self, "fastHeadParser", False):
+        return _GenericHTTPChannelProtocol(_FastHeadHTTPChannel())
     return _GenericHTTPChannelProtocol(HTTPChannel())
 
 
@@ -3199,6 +3429,10 @@ class HTTPFactory(protocol.ServerFactory):
         log datetime string.
     @type _logDateTimeCall: L{IDelayedCall} provided
 
+    @ivar _dateHeader: A cached I{Date} header value for responses, updated
+        along with C{_logDateTime}, or L{None} if the factory is not running.
+    @type _dateHeader: L{bytes} or L{None}
+
     @ivar _logFormatter: See the C{logFormatter} parameter to L{__init__}
 
     @ivar _nativeize: A flag that indicates whether the log file being written
@@ -3208,6 +3442,15 @@ class HTTPFactory(protocol.ServerFactory):
 
     @ivar reactor: An L{IReactorTime} provider used to manage connection
         timeouts and compute logging timestamps.
+
+    @ivar _timeoutSweeper: The L{twisted.protocols.policies.TimeoutSweeper}
+        shared by the channels built by this factory, or L{None} if each uses
+        its own timed call.
+
+    @ivar fastHeadParser: Whether the HTTP/1.1 channels built by this factory
+        parse each request head in one pass rather than line by line.  See
+        the C{fastHeadParser} parameter to L{__init__}.
+    @type fastHeadParser: L{bool}
     """
 
     # We need to ignore the mypy error here, because
@@ -3220,8 +3463,16 @@ class HTTPFactory(protocol.ServerFactory):
 
     timeOut = _REQUEST_TIMEOUT
 
+    fastHeadParser = False
+
     def __init__(
-        self, logPath=None, timeout=_REQUEST_TIMEOUT, logFormatter=None, reactor=None
+        self,
+        logPath=None,
+        timeout=_REQUEST_TIMEOUT,
+        logFormatter=None,
+        reactor=None,
+        timeoutGranularity=None,
+        fastHeadParser=False,
     ):
         """
         @param logPath: File path to which access log messages will be written
@@ -3240,28 +3491,54 @@ class HTTPFactory(protocol.ServerFactory):
         @param reactor: An L{IReactorTime} provider used to manage connection
             timeouts and compute logging timestamps. Defaults to the global
             reactor.
+
+        @param timeoutGranularity: If not C{None}, track the idle timeouts of
+            all connections with a single
+            L{twisted.protocols.policies.TimeoutSweeper} which expires
+            them in batches every this many seconds, rather than rescheduling
+            a timed call per connection on every read.  Connections then time
+            out up to this many seconds late.
+        @type timeoutGranularity: L{float}
+
+        @param fastHeadParser: If C{True}, HTTP/1.1 connections wait for the
+            whole head of each request and parse it in a single pass, instead
+            of parsing it line by line as it arrives.  This is cheaper for
+            small requests, especially pipelined ones, and produces the same
+            requests.
+        @type fastHeadParser: L{bool}
         """
         if not reactor:
             from twisted.internet import reactor
         self.reactor = reactor
 
+        if timeoutGranularity is not None:
+            self._timeoutSweeper = policies.TimeoutSweeper(timeoutGranularity, reactor)
+        else:
+            self._timeoutSweeper = None
+
         if logPath is not None:
             logPath = os.path.abspath(logPath)
         self.logPath = logPath
         self.timeOut = timeout
+        self.fastHeadParser = fastHeadParser
         if logFormatter is None:
             logFormatter = combinedLogFormatter
         self._logFormatter = logFormatter
 
-        # For storing the cached log datetime and the callback to update it
+        # For storing the cached log and Date header datetimes and the
+        # callback to update them
         self._logDateTime = None
+        self._dateHeader = None
         self._logDateTimeCall = None
 
     def _updateLogDateTime(self):
         """
-        Update log datetime periodically, so we aren't always recalculating it.
+        Update log datetime and the I{Date} header value periodically, so we
+        aren't always recalculating them.
         """
-        self._logDateTime = datetimeToLogString(self.reactor.seconds())
+        now = self.reactor.seconds()
+        self._logDateTime = datetimeToLogString(now)
+        self._dateHeader = datetimeToString(now)
         self._logDateTimeCall = self.reactor.callLater(1, self._updateLogDateTime)
 
     def buildProtocol(self, addr):
@@ -3273,6 +3550,8 @@ class HTTPFactory(protocol.ServerFactory):
         # HTTPChannel, but that won't work for the TimeoutMixin until we fix
         # https://twistedmatrix.com/trac/ticket/8488
         p.callLater = self.reactor.callLater
+        if self._timeoutSweeper is not None:
+            p.timeoutSweeper = self._timeoutSweeper
 
         # timeOut needs to be on the Protocol instance cause
         # TimeoutMixin expects it there
@@ -3300,6 +3579,7 @@ class HTTPFactory(protocol.ServerFactory):
         if self._logDateTimeCall is not None and self._logDateTimeCall.active():
             self._logDateTimeCall.cancel()
             self._logDateTimeCall = None
+        self._dateHeader = None
 
     def _openLogFile(self, path):
         """
@@ -35,9 +35,79 @@ def _sanitizeLinearWhitespace(headerComponent: bytes) -> bytes:
 
     @return: The sanitized header key or value.
     """
+    if b"\n" not in headerComponent and b"\r" not in headerComponent:
+        return headerComponent
     return b" ".join(headerComponent.splitlines())
 
 
+# The lowercase names of well-known headers, after the HPACK static table
+# (RFC 7541, Appendix A) plus other common ones.  Their canonical names are
+# interned in Headers._canonicalHeaderCache, so encoding them is a single
+# dictionary lookup which never misses.
+_staticHeaderNames = [
+    b"accept",
+    b"accept-charset",
+    b"accept-encoding",
+    b"accept-language",
+    b"accept-ranges",
+    b"access-control-allow-origin",
+    b"age",
+    b"allow",
+    b"authorization",
+    b"cache-control",
+    b"connection",
+    b"content-disposition",
+    b"content-encoding",
+    b"content-language",
+    b"content-length",
+    b"content-location",
+    b"content-md5",
+    b"content-range",
+    b"content-type",
+    b"cookie",
+    b"date",
+    b"dnt",
+    b"etag",
+    b"expect",
+    b"expires",
+    b"from",
+    b"host",
+    b"if-match",
+    b"if-modified-since",
+    b"if-none-match",
+    b"if-range",
+    b"if-unmodified-since",
+    b"keep-alive",
+    b"last-modified",
+    b"link",
+    b"location",
+    b"max-forwards",
+    b"origin",
+    b"pragma",
+    b"proxy-authenticate",
+    b"proxy-authorization",
+    b"range",
+    b"referer",
+    b"refresh",
+    b"retry-after",
+    b"server",
+    b"set-cookie",
+    b"strict-transport-security",
+    b"te",
+    b"trailer",
+    b"transfer-encoding",
+    b"upgrade",
+    b"user-agent",
+    b"vary",
+    b"via",
+    b"www-authenticate",
+    b"x-forwarded-for",
+    b"x-forwarded-host",
+    b"x-forwarded-proto",
+    b"x-requested-with",
+]
+
+
 @comparable
 class Headers:
     """
@@ -58,7 +128,9 @@ class Headers:
         capitalization.
 
     @cvar _canonicalHeaderCache: A L{dict} that maps header names to their
-        canonicalized representation.
+        canonicalized representation.  It always holds the lowercase and
+        canonical spellings, as L{bytes} and L{str}, of the well-known headers
+        in C{_staticHeaderNames}.
 
     @ivar _rawHeaders: A L{dict} mapping header names as L{bytes} to L{list}s of
         header values as L{bytes}.
@@ -124,9 +196,10 @@ class Headers:
 
         bytes_name = name.encode("iso-8859-1") if isinstance(name, str) else name
 
-        if bytes_name.lower() in self._caseMappings:
+        lower_name = bytes_name.lower()
+        if lower_name in self._caseMappings:
             # Some headers have special capitalization:
-            result = self._caseMappings[bytes_name.lower()]
+            result = self._caseMappings[lower_name]
         else:
             result = _sanitizeLinearWhitespace(
                 b"-".join([word.capitalize() for word in bytes_name.split(b"-")])
@@ -148,7 +221,12 @@ class Headers:
 
         @return: A new L{Headers}
         """
-        return self.__class__(self._rawHeaders)
+        # The names and values here are already encoded and sanitized.
+        copied = self.__class__()
+        copied._rawHeaders = {
+            name: list(values) for name, values in self._rawHeaders.items()
+        }
+        return copied
 
     def hasHeader(self, name: AnyStr) -> bool:
         """
@@ -211,6 +289,19 @@ class Headers:
             )
         )
 
+    def _addCanonicalRawHeader(self, name: bytes, value: bytes) -> None:
+        """
+        Add a new raw value for a header without encoding or sanitizing it,
+        for parsers which have already done so.
+
+        @param name: The canonical name of the header, as returned by
+            L{Headers._encodeName}.
+
+        @param value: The value to add, which must not contain linear
+            whitespace.
+        """
+        self._rawHeaders.setdefault(name, []).append(value)
+
     @overload
     def getRawHeaders(self, name: AnyStr) -> Optional[Sequence[AnyStr]]:
         ...
@@ -252,4 +343,20 @@ class Headers:
         return iter(self._rawHeaders.items())
 
 
+def _internStaticHeaderNames() -> None:
+    """
+    Add the well-known headers in C{_staticHeaderNames} to
+    L{Headers._canonicalHeaderCache}.
+    """
+    encoder = Headers()
+    for lowerName in _staticHeaderNames:
+        canonicalName = encoder._encodeName(lowerName)
+        for spelling in (lowerName, canonicalName):
+            Headers._canonicalHeaderCache[spelling] = canonicalName
+            Headers._canonicalHeaderCache[spelling.decode("ascii")] = canonicalName
+
+
+_internStaticHeaderNames()
+
+
 __all__ = ["Headers"]
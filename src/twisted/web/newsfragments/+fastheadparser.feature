@@ -0,0 +1 @@
+twisted.web.http.HTTPFactory now accepts fastHeadParser=True to parse each HTTP/1.1 request head in a single pass once it has been received, rather than line by line.
@@ -0,0 +1 @@
+twisted.web.http_headers.Headers now interns the canonical names of well-known headers, skips sanitizing values without line breaks, and copies without re-encoding; HTTP/2 requests add their headers through it directly.
@@ -0,0 +1 @@
+twisted.web.server.Site now caches the Date response header once per second, and twisted.web.http.HTTPChannel writes each response head as a single buffer using precomputed status lines.
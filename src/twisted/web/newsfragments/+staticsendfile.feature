@@ -0,0 +1 @@
+twisted.web.static.File now sends files, and single byte ranges of them, with sendfile when the connection supports it and the response body is not otherwise encoded.
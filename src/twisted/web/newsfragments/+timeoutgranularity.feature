@@ -0,0 +1 @@
+twisted.web.http.HTTPFactory and twisted.web.server.Site accept a new timeoutGranularity argument which makes all their connections share one twisted.protocols.policies.TimeoutSweeper for their idle timeouts.
@@ -186,7 +186,10 @@ class Request(Copyable, http.Request, components.Componentized):
 
         # set various default headers
         self.setHeader(b"server", version)
-        self.setHeader(b"date", http.datetimeToString())
+        date = getattr(self.site, "_dateHeader", None)
+        if date is None:
+            date = http.datetimeToString()
+        self.setHeader(b"date", date)
 
         # Resource Identification
         self.prepath = []
@@ -596,19 +596,25 @@ class File(resource.Resource, filepath.FilePath[str]):
         if byteRange is None:
             self._setContentHeaders(request)
             request.setResponseCode(http.OK)
-            return NoRangeStaticProducer(request, fileForReading)
+            return _sendfileProducer(
+                request, fileForReading, 0, self.getFileSize()
+            ) or NoRangeStaticProducer(request, fileForReading)
         try:
             parsedRanges = self._parseRangeHeader(byteRange)
         except ValueError:
             log.msg(f"Ignoring malformed Range header {byteRange.decode()!r}")
             self._setContentHeaders(request)
             request.setResponseCode(http.OK)
-            return NoRangeStaticProducer(request, fileForReading)
+            return _sendfileProducer(
+                request, fileForReading, 0, self.getFileSize()
+            ) or NoRangeStaticProducer(request, fileForReading)
 
         if len(parsedRanges) == 1:
             offset, size = self._doSingleRangeRequest(request, parsedRanges[0])
             self._setContentHeaders(request, size)
-            return SingleRangeStaticProducer(request, fileForReading, offset, size)
+            return _sendfileProducer(
+                request, fileForReading, offset, size
+            ) or SingleRangeStaticProducer(request, fileForReading, offset, size)
         else:
             rangeInfo = self._doMultipleRangeRequest(request, parsedRanges)
             return MultipleRangeStaticProducer(request, fileForReading, rangeInfo)
@@ -855,6 +861,88 @@ class MultipleRangeStaticProducer(StaticProducer):
             self.stopProducing()
 
 
+class _SendfileStaticProducer(StaticProducer):
+    """
+    A L{StaticProducer} that has the request's transport send a chunk of the
+    file straight from the file, with L{interfaces.ISendfileTransport}.
+
+    @ivar transport: The L{interfaces.ISendfileTransport} provider to send the
+        file with.
+    """
+
+    def __init__(self, request, fileObject, offset, size, transport):
+        """
+        Initialize the instance.
+
+        @param request: See L{StaticProducer}.
+        @param fileObject: See L{StaticProducer}.
+        @param offset: The offset into the file of the chunk to be written.
+        @param size: The size of the chunk to write.
+        @param transport: See C{transport}.
+        """
+        StaticProducer.__init__(self, request, fileObject)
+        self.offset = offset
+        self.size = size
+        self.transport = transport
+
+    def start(self):
+        # Write the response headers, then the file.
+        self.request.write(b"")
+        d = self.transport.sendfile(self.fileObject, self.offset, self.size)
+        d.addCallbacks(self._sent, self._failed)
+
+    def _sent(self, count):
+        """
+        The whole chunk of the file has been sent, so finish the request.
+        """
+        request = self.request
+        request.sentLength += count
+        self.stopProducing()
+        request.finish()
+
+    def _failed(self, reason):
+        """
+        The connection was lost, which the request has also been told about,
+        so just clean up.
+        """
+        self.stopProducing()
+
+
+def _sendfileProducer(request, fileObject, offset, size):
+    """
+    Make a L{_SendfileStaticProducer} to write a chunk of a file as the body
+    of a response, if the response's headers are set and its body can be sent
+    straight from the file.
+
+    That is only possible if the request's transport provides
+    L{interfaces.ISendfileTransport}, the file has a file descriptor, and the
+    request will not transform the body (by compressing it, chunking it, or
+    discarding it).
+
+    @param request: The L{twisted.web.http.Request} object.
+    @param fileObject: The file object containing the resource.
+    @param offset: The offset into the file of the chunk to be written.
+    @param size: The size of the chunk to write.
+
+    @return: A L{_SendfileStaticProducer}, or L{None} if a producer which
+        writes to the request is needed instead.
+    """
+    transport = getattr(request, "transport", None)
+    if not interfaces.ISendfileTransport.providedBy(transport):
+        return None
+    if (
+        getattr(request, "_encoder", None) is not None
+        or getattr(request, "_inFakeHead", False)
+        or not request.responseHeaders.hasHeader(b"content-length")
+    ):
+        return None
+    try:
+        fileObject.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+    return _SendfileStaticProducer(request, fileObject, offset, size, transport)
+
+
 class ASISProcessor(resource.Resource):
     """
     Serve files exactly as responses without generating a status-line or any
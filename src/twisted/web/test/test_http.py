@@ -944,6 +944,17 @@ class GenericHTTPChannelTests(unittest.TestCase):
         # ...it should have the new H2 channel as its producer
         self.assertIs(transport.producer, genericProtocol._channel)
 
+    def test_fastHeadParser(self):
+        """
+        L{HTTPFactory} builds protocols backed by L{http._FastHeadHTTPChannel}
+        if it is passed C{fastHeadParser=True}, and by L{http.HTTPChannel}
+        otherwise.
+        """
+        protocol = http.HTTPFactory(fastHeadParser=True).buildProtocol(None)
+        self.assertIsInstance(protocol._channel, http._FastHeadHTTPChannel)
+        protocol = http.HTTPFactory().buildProtocol(None)
+        self.assertIs(type(protocol._channel), http.HTTPChannel)
+
 
 class HTTPLoopbackTests(unittest.TestCase):
     expectedHeaders = {
@@ -1653,8 +1664,12 @@ abasdfg
 class ParsingTests(unittest.TestCase):
     """
     Tests for protocol parsing in L{HTTPChannel}.
+
+    @ivar channelFactory: The L{HTTPChannel} subclass to test.
     """
 
+    channelFactory = http.HTTPChannel
+
     def setUp(self):
         self.didRequest = False
 
@@ -1679,7 +1694,7 @@ class ParsingTests(unittest.TestCase):
         @rtype: L{HTTPChannel}
         """
         if not channel:
-            channel = http.HTTPChannel()
+            channel = self.channelFactory()
 
         if requestFactory:
             channel.requestFactory = _makeRequestProxyFactory(requestFactory)
@@ -2028,7 +2043,7 @@ class ParsingTests(unittest.TestCase):
                 processed.append(self)
                 self.finish()
 
-        channel = http.HTTPChannel()
+        channel = self.channelFactory()
         channel.totalHeadersSize = 10
         httpRequest = b"GET /path/longer/than/10 HTTP/1.1\n"
 
@@ -2055,7 +2070,7 @@ class ParsingTests(unittest.TestCase):
                 processed.append(self)
                 self.finish()
 
-        channel = http.HTTPChannel()
+        channel = self.channelFactory()
         channel.totalHeadersSize = 40
         httpRequest = b"GET /less/than/40 HTTP/1.1\n" b"Some-Header: less-than-40\n"
 
@@ -2079,7 +2094,7 @@ class ParsingTests(unittest.TestCase):
             def process(self):
                 self.finish()
 
-        channel = http.HTTPChannel()
+        channel = self.channelFactory()
         channel.totalHeadersSize = 60
         channel.requestFactory = SimpleRequest
         httpRequest = (
@@ -2622,6 +2637,84 @@ ok
         )
 
 
+class FastHeadParsingTests(ParsingTests):
+    """
+    Tests for protocol parsing in L{http._FastHeadHTTPChannel}.
+    """
+
+    channelFactory = http._FastHeadHTTPChannel
+
+    def requestsFrom(self, data):
+        """
+        Deliver some data to a L{http._FastHeadHTTPChannel} all at once.
+
+        @param data: The data to deliver.
+        @type data: L{bytes}
+
+        @return: The requests which were processed, and the channel.
+        @rtype: L{tuple} of L{list} of L{http.Request} and
+            L{http._FastHeadHTTPChannel}
+        """
+        processed = []
+
+        class MyRequest(http.Request):
+            def process(self):
+                self.body = self.content.read()
+                processed.append(self)
+                self.finish()
+
+        channel = http._FastHeadHTTPChannel()
+        channel.requestFactory = _makeRequestProxyFactory(MyRequest)
+        channel.makeConnection(StringTransport())
+        channel.dataReceived(data)
+        return processed, channel
+
+    def test_pipelinedRequests(self):
+        """
+        All of the requests pipelined in the data received at once are
+        processed, along with their bodies.
+        """
+        processed, channel = self.requestsFrom(
+            b"GET /a HTTP/1.1\r\nHost: example.com\r\n\r\n"
+            b"GET /b HTTP/1.1\r\n\r\n"
+            b"POST /c HTTP/1.1\r\nContent-Length: 3\r\n\r\nabc"
+        )
+        self.assertEqual([b"/a", b"/b", b"/c"], [r.uri for r in processed])
+        self.assertEqual(b"abc", processed[2].body)
+        self.assertEqual(
+            [b"example.com"], processed[0].requestHeaders.getRawHeaders(b"host")
+        )
+        self.assertFalse(channel.transport.disconnecting)
+
+    def test_headerNamesCanonicalized(self):
+        """
+        Header names are stored in their canonical form, whatever their case
+        on the wire and whether or not they are common.
+        """
+        [request], channel = self.requestsFrom(
+            b"GET / HTTP/1.1\r\n"
+            b"content-type: text/plain\r\n"
+            b"HOST: example.com\r\n"
+            b"x-custom-header: value\r\n"
+            b"etag: 1\r\n"
+            b"\r\n"
+        )
+        self.assertEqual(
+            [b"Content-Type", b"ETag", b"Host", b"X-Custom-Header"],
+            sorted(name for name, values in request.requestHeaders.getAllRawHeaders()),
+        )
+
+    def test_bareLineFeedSanitized(self):
+        """
+        A line feed which is not part of a line delimiter is replaced in
+        header values as L{http_headers.Headers.addRawHeader} would.
+        """
+        [request], channel = self.requestsFrom(
+            b"GET / HTTP/1.1\r\nFoo: bar\nbaz\r\n\r\n"
+        )
+        self.assertEqual([b"bar baz"], request.requestHeaders.getRawHeaders(b"foo"))
+
+
 class QueryArgumentsTests(unittest.TestCase):
     def test_urlparse(self):
         """
@@ -3631,6 +3724,37 @@ class RequestTests(unittest.TestCase, ResponseTestMixin):
         clock.advance(2)
         self.assertTrue(transport.disconnecting)
 
+    def test_requestBodyTimeoutWithGranularity(self):
+        """
+        L{HTTPChannel}s built by an L{HTTPFactory} with a C{timeoutGranularity}
+        share one timed call for their idle timeouts, which time out no
+        earlier than they otherwise would and at most C{timeoutGranularity}
+        seconds later.
+        """
+        clock = Clock()
+        factory = http.HTTPFactory(timeout=100, reactor=clock, timeoutGranularity=5)
+        first = factory.buildProtocol(None)
+        second = factory.buildProtocol(None)
+        firstTransport = StringTransport()
+        secondTransport = StringTransport()
+        first.makeConnection(firstTransport)
+        second.makeConnection(secondTransport)
+        self.assertEqual(len(clock.getDelayedCalls()), 1)
+
+        for protocol in first, second:
+            protocol.dataReceived(b"POST / HTTP/1.0\r\nContent-Length: 2\r\n\r\n")
+        clock.advance(50)
+        second.dataReceived(b"x")
+        self.assertEqual(len(clock.getDelayedCalls()), 1)
+
+        clock.advance(50)
+        self.assertTrue(firstTransport.disconnecting)
+        self.assertFalse(secondTransport.disconnecting)
+        clock.advance(49)
+        self.assertFalse(secondTransport.disconnecting)
+        clock.advance(5)
+        self.assertTrue(secondTransport.disconnecting)
+
     def test_finishCleansConnection(self):
         """
         L{http.Request.finish} will notify the channel that it is finished, and
@@ -4407,6 +4531,47 @@ class HTTPChannelSanitizationTests(unittest.SynchronousTestCase):
             )
 
 
+class HTTPChannelWriteHeadersTests(unittest.SynchronousTestCase):
+    """
+    Tests for L{HTTPChannel.writeHeaders}.
+    """
+
+    def writeHeaders(self, version, code, reason):
+        """
+        Write a response head with one header to a new L{HTTPChannel}.
+
+        @return: What was written to the channel's transport.
+        @rtype: L{list} of L{bytes}
+        """
+        transport = StringTransport()
+        channel = http.HTTPChannel()
+        channel.makeConnection(transport)
+        writes = []
+        self.patch(transport, "write", writes.append)
+        channel.writeHeaders(version, code, reason, [(b"content-length", b"0")])
+        return writes
+
+    def test_knownStatus(self):
+        """
+        The head of a response with a standard reason phrase is written to
+        the transport as one buffer.
+        """
+        self.assertEqual(
+            [b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n"],
+            self.writeHeaders(b"HTTP/1.1", b"404", b"Not Found"),
+        )
+
+    def test_customStatus(self):
+        """
+        The status line of a response with a nonstandard code or reason
+        phrase is built from them.
+        """
+        self.assertEqual(
+            [b"HTTP/1.0 299 Fine\r\nContent-Length: 0\r\n\r\n"],
+            self.writeHeaders(b"HTTP/1.0", b"299", b"Fine"),
+        )
+
+
 class HTTPClientSanitizationTests(unittest.SynchronousTestCase):
     """
     Test that L{http.HTTPClient} sanitizes its output.
@@ -194,6 +194,18 @@ class BytesHeadersTests(TestCase):
         self.assertEqual(h._encodeName(b"Www-Authenticate"), b"WWW-Authenticate")
         self.assertEqual(h._encodeName(b"x-xss-protection"), b"X-XSS-Protection")
 
+    def test_encodeNameStatic(self) -> None:
+        """
+        L{Headers._encodeName} returns the same interned canonical name for
+        the lowercase and canonical spellings of a well-known header, whether
+        given as L{bytes} or L{str}.
+        """
+        h = Headers()
+        canonical = h._encodeName(b"content-type")
+        self.assertEqual(canonical, b"Content-Type")
+        for spelling in ("content-type", "Content-Type", b"Content-Type"):
+            self.assertIs(h._encodeName(spelling), canonical)
+
     def test_getAllRawHeaders(self) -> None:
         """
         L{Headers.getAllRawHeaders} returns an iterable of (k, v) pairs, where
@@ -14,10 +14,13 @@ import warnings
 from io import BytesIO as StringIO
 from unittest import skipIf
 
+from zope.interface import implementer
 from zope.interface.verify import verifyObject
 
-from twisted.internet import abstract, interfaces
-from twisted.python import compat, log
+from twisted.internet import abstract, error, interfaces
+from twisted.internet.defer import Deferred
+from twisted.internet.testing import StringTransport
+from twisted.python import compat, failure, log
 from twisted.python.compat import networkString
 from twisted.python.filepath import FilePath
 from twisted.python.runtime import platform
@@ -564,6 +567,36 @@ class StaticFileTests(TestCase):
         self.assertTrue(fakeFile.closed)
 
 
+@implementer(interfaces.ISendfileTransport)
+class SendfileTransport(StringTransport):
+    """
+    A L{StringTransport} which records calls to C{sendfile}.
+
+    @ivar sendfileCalls: A list of C{(file, offset, count, deferred)} tuples,
+        one for each call to C{sendfile}.
+    """
+
+    def __init__(self):
+        StringTransport.__init__(self)
+        self.sendfileCalls = []
+
+    def sendfile(self, file, offset, count):
+        d = Deferred()
+        self.sendfileCalls.append((file, offset, count, d))
+        return d
+
+
+def sendfileRequest():
+    """
+    Make a L{DummyRequest} whose transport provides
+    L{interfaces.ISendfileTransport}.
+    """
+    request = DummyRequest([])
+    request.transport = SendfileTransport()
+    request.sentLength = 0
+    return request
+
+
 class StaticMakeProducerTests(TestCase):
     """
     Tests for L{File.makeProducer}.
@@ -873,6 +906,73 @@ class StaticMakeProducerTests(TestCase):
             resource.makeProducer(request, file)
             self.assertEqual(http.PARTIAL_CONTENT, request.responseCode)
 
+    def test_sendfileNoRange(self):
+        """
+        makeProducer when no Range header is set and the request's transport
+        provides L{interfaces.ISendfileTransport} returns a producer which
+        sends the whole file with it.
+        """
+        resource = self.makeResourceWithContent(b"abcdef")
+        request = sendfileRequest()
+        with resource.openForReading() as file:
+            producer = resource.makeProducer(request, file)
+            self.assertIsInstance(producer, static._SendfileStaticProducer)
+            self.assertEqual((0, 6), (producer.offset, producer.size))
+            self.assertIs(request.transport, producer.transport)
+            self.assertEqual(http.OK, request.responseCode)
+
+    def test_sendfileSingleRange(self):
+        """
+        makeProducer when the Range header requests a single byte range and
+        the request's transport provides L{interfaces.ISendfileTransport}
+        returns a producer which sends just that range with it.
+        """
+        resource = self.makeResourceWithContent(b"abcdef")
+        request = sendfileRequest()
+        request.requestHeaders.addRawHeader(b"range", b"bytes=1-3")
+        with resource.openForReading() as file:
+            producer = resource.makeProducer(request, file)
+            self.assertIsInstance(producer, static._SendfileStaticProducer)
+            self.assertEqual((1, 3), (producer.offset, producer.size))
+            self.assertEqual(http.PARTIAL_CONTENT, request.responseCode)
+
+    def test_sendfileNotUsedForMultipleRanges(self):
+        """
+        makeProducer when the Range header requests multiple byte ranges
+        returns a L{MultipleRangeStaticProducer}, even if the request's
+        transport provides L{interfaces.ISendfileTransport}.
+        """
+        resource = self.makeResourceWithContent(b"abcdef")
+        request = sendfileRequest()
+        request.requestHeaders.addRawHeader(b"range", b"bytes=1-3,4-5")
+        with resource.openForReading() as file:
+            producer = resource.makeProducer(request, file)
+            self.assertIsInstance(producer, static.MultipleRangeStaticProducer)
+
+    def test_sendfileNotUsedWithEncoder(self):
+        """
+        makeProducer returns a L{NoRangeStaticProducer} when the request
+        encodes its body, even if the request's transport provides
+        L{interfaces.ISendfileTransport}.
+        """
+        resource = self.makeResourceWithContent(b"abcdef")
+        request = sendfileRequest()
+        request._encoder = object()
+        with resource.openForReading() as file:
+            producer = resource.makeProducer(request, file)
+            self.assertIsInstance(producer, static.NoRangeStaticProducer)
+
+    def test_sendfileNotUsedWithoutFileDescriptor(self):
+        """
+        makeProducer returns a L{NoRangeStaticProducer} when the file has no
+        file descriptor, even if the request's transport provides
+        L{interfaces.ISendfileTransport}.
+        """
+        resource = self.makeResourceWithContent(b"abcdef")
+        request = sendfileRequest()
+        producer = resource.makeProducer(request, StringIO(b"abcdef"))
+        self.assertIsInstance(producer, static.NoRangeStaticProducer)
+
 
 class StaticProducerTests(TestCase):
     """
@@ -1026,6 +1126,53 @@ class SingleRangeStaticProducerTests(TestCase):
         self.assertEqual([None], callbackList)
 
 
+class SendfileStaticProducerTests(TestCase):
+    """
+    Tests for L{_SendfileStaticProducer}.
+    """
+
+    def setUp(self):
+        self.request = sendfileRequest()
+        self.fileObject = StringIO(b"abcdef")
+        self.producer = static._SendfileStaticProducer(
+            self.request, self.fileObject, 1, 3, self.request.transport
+        )
+
+    def test_startSendsFile(self):
+        """
+        L{_SendfileStaticProducer.start} writes the response headers to the
+        request, then has the transport send the chunk of the file.
+        """
+        self.producer.start()
+        self.assertEqual([b""], self.request.written)
+        [(file, offset, count, d)] = self.request.transport.sendfileCalls
+        self.assertEqual((self.fileObject, 1, 3), (file, offset, count))
+        self.assertFalse(self.request.finished)
+
+    def test_finishCalledWhenSent(self):
+        """
+        L{_SendfileStaticProducer} finishes the request and closes the file
+        once the transport has sent the chunk, and counts it as sent.
+        """
+        self.producer.start()
+        [(_, _, _, d)] = self.request.transport.sendfileCalls
+        d.callback(3)
+        self.assertEqual(1, self.request.finished)
+        self.assertEqual(3, self.request.sentLength)
+        self.assertTrue(self.fileObject.closed)
+
+    def test_fileClosedWhenFailed(self):
+        """
+        L{_SendfileStaticProducer} closes the file without finishing the
+        request if the connection is lost before the chunk is sent.
+        """
+        self.producer.start()
+        [(_, _, _, d)] = self.request.transport.sendfileCalls
+        d.errback(failure.Failure(error.ConnectionLost()))
+        self.assertFalse(self.request.finished)
+        self.assertTrue(self.fileObject.closed)
+
+
 class MultipleRangeStaticProducerTests(TestCase):
     """
     Tests for L{MultipleRangeStaticProducer}.
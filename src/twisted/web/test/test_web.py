@@ -510,6 +510,22 @@ class RequestTests(unittest.TestCase):
         request = server.Request(DummyChannel(), True)
         hash(request)
 
+    def test_dateHeaderFromSite(self):
+        """
+        L{server.Request.process} sets the I{Date} header to the value cached
+        by a running L{Site}.
+        """
+        channel = DummyChannel()
+        channel.site = Site(Data(b"", "text/plain"), reactor=Clock())
+        channel.site.startFactory()
+        self.addCleanup(channel.site.stopFactory)
+        request = server.Request(channel, 1)
+        request.gotLength(0)
+        request.requestReceived(b"GET", b"/", b"HTTP/1.0")
+        self.assertEqual(
+            [http.datetimeToString(0)], request.responseHeaders.getRawHeaders(b"date")
+        )
+
     def testChildLink(self):
         request = server.Request(DummyChannel(), 1)
         request.gotLength(0)
@@ -1808,6 +1824,42 @@ class ExplicitHTTPFactoryReactor(unittest.TestCase):
         self.assertIs(factory.reactor, reactor)
 
 
+class HTTPFactoryDateHeaderTests(unittest.TestCase):
+    """
+    L{http.HTTPFactory} caches the value of the I{Date} header for responses.
+    """
+
+    def test_updatedEverySecond(self):
+        """
+        While the factory is running, L{http.HTTPFactory._dateHeader} holds
+        the current time from its reactor, updated every second.
+        """
+        reactor = Clock()
+        reactor.advance(1234567890)
+        factory = http.HTTPFactory(reactor=reactor)
+        self.assertIsNone(factory._dateHeader)
+        factory.startFactory()
+        self.assertEqual(b"Fri, 13 Feb 2009 23:31:30 GMT", factory._dateHeader)
+        reactor.advance(1)
+        self.assertEqual(b"Fri, 13 Feb 2009 23:31:31 GMT", factory._dateHeader)
+        factory.stopFactory()
+        self.assertIsNone(factory._dateHeader)
+
+    def test_restarted(self):
+        """
+        A factory which is stopped and started again resumes updating
+        L{http.HTTPFactory._dateHeader}.
+        """
+        reactor = Clock()
+        factory = http.HTTPFactory(reactor=reactor)
+        factory.startFactory()
+        factory.stopFactory()
+        factory.startFactory()
+        self.addCleanup(factory.stopFactory)
+        reactor.advance(2)
+        self.assertEqual(http.datetimeToString(2), factory._dateHeader)
+
+
 class QueueResource(Resource):
     """
     Add all requests to an internal queue,